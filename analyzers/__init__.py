@@ -1,7 +1,22 @@
 """Analysis components."""
 
+from .batch_evaluator import BatchEvaluator
 from .opportunity_scorer import calculate_tier
+from .paper_resolver import PaperResolver
+from .signal_batch import SignalBatch
 from .signal_extractor import SignalExtractor
+from .token_ledger import SpendLimit, TokenLedger
+from .triage import TriageScorer
 from .value_evaluator import ValueEvaluator
 
-__all__ = ["SignalExtractor", "ValueEvaluator", "calculate_tier"]
+__all__ = [
+    "BatchEvaluator",
+    "PaperResolver",
+    "SignalBatch",
+    "SignalExtractor",
+    "SpendLimit",
+    "TokenLedger",
+    "TriageScorer",
+    "ValueEvaluator",
+    "calculate_tier",
+]
@@ -0,0 +1,132 @@
+"""Process pool for CPU-bound paper analysis.
+
+Quality filtering and signal extraction are pure CPU work. Running them on
+the event loop thread delays scraping and LLM I/O, so with an
+``AnalysisPool`` the pipeline ships chunks of papers to worker processes
+instead. Each worker compiles the heuristics keyword matcher once at
+start-up and returns compact per-paper results. With NumPy installed a
+worker filters its chunk as a ``PaperBatch`` with ``filter_batch`` and
+scores the passing papers with ``extract_batch``.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from models.paper import Paper
+from models.paper_batch import PaperBatch
+
+from .quality_filter import FilterConfig, filter_batch, passes_quality_filter
+from .signal_batch import NUMPY_AVAILABLE
+from .signal_extractor import SignalExtractor
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Per-process state set by _init_worker
+_extractor: SignalExtractor | None = None
+_quality_config: FilterConfig | None = None
+
+
+@dataclass
+class PaperAnalysis:
+    """Result of filtering and scoring one paper.
+
+    Attributes:
+        rejection: Quality filter reason if the paper was rejected
+        max_signal: Strongest signal score (0.0 if rejected)
+        signals: Full signal dicts, only for papers at or above the minimum signal score
+    """
+
+    rejection: str | None = None
+    max_signal: float = 0.0
+    signals: dict[str, dict] | None = None
+
+
+def _init_worker(heuristics: dict, quality_config: FilterConfig) -> None:
+    """Build the extractor once per worker process."""
+    global _extractor, _quality_config  # noqa: PLW0603
+    _extractor = SignalExtractor(heuristics)
+    _quality_config = quality_config
+
+
+def analyze_chunk(papers: list[Paper], min_signal_score: float) -> list[PaperAnalysis]:
+    """Filter and score a chunk of papers in a worker process.
+
+    Args:
+        papers: Papers to analyze
+        min_signal_score: Signals are only returned for papers whose strongest
+            signal reaches this score
+
+    Returns:
+        One result per paper, in input order
+    """
+    if _extractor is None or _quality_config is None:
+        raise RuntimeError("analyze_chunk called outside an initialized worker")
+
+    results = [PaperAnalysis() for _ in papers]
+    rejections = _filter_chunk(papers, _quality_config)
+    for i, reason in rejections.items():
+        results[i].rejection = reason
+    passed = [i for i in range(len(papers)) if i not in rejections]
+
+    if NUMPY_AVAILABLE and passed:
+        # Score the whole chunk at once; dicts are only built for strong papers
+        batch = _extractor.extract_batch([papers[i] for i in passed])
+        strongest = batch.scores.max(axis=1)
+        for row, i in enumerate(passed):
+            results[i].max_signal = float(strongest[row])
+            if results[i].max_signal >= min_signal_score:
+                results[i].signals = batch[row]
+    else:
+        for i in passed:
+            signals = _extractor.extract(papers[i])
+            results[i].max_signal = max((s["score"] for s in signals.values()), default=0.0)
+            if results[i].max_signal >= min_signal_score:
+                results[i].signals = signals
+
+    return results
+
+
+def _filter_chunk(papers: list[Paper], config: FilterConfig) -> dict[int, str]:
+    """Apply the quality filter to a chunk; return the rejection reason by row."""
+    now = datetime.now(UTC)
+    if not NUMPY_AVAILABLE:
+        checks = (passes_quality_filter(paper, config, now) for paper in papers)
+        return {i: reason for i, (passes, reason) in enumerate(checks) if not passes}
+
+    decisions = filter_batch(PaperBatch.from_papers(papers), config, now)
+    return {i: decisions.reason(i) for i in np.flatnonzero(~decisions.passed).tolist()}
+
+
+class AnalysisPool:
+    """Worker processes running ``analyze_chunk``."""
+
+    def __init__(self, heuristics: dict, quality_config: FilterConfig, *, workers: int, chunk_size: int = 64) -> None:
+        """Start the worker processes.
+
+        Args:
+            heuristics: Heuristics configuration for the signal extractor
+            quality_config: Quality filter configuration
+            workers: Number of worker processes
+            chunk_size: Maximum papers sent to a worker at once
+        """
+        self.workers = max(1, workers)
+        self.chunk_size = max(1, chunk_size)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker, initargs=(heuristics, quality_config)
+        )
+        logger.info(f"Started {self.workers} analysis worker processes (chunk size {self.chunk_size})")
+
+    async def analyze(self, papers: list[Paper], min_signal_score: float) -> list[PaperAnalysis]:
+        """Analyze a chunk of papers in a worker process."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, analyze_chunk, papers, min_signal_score)
+
+    def close(self) -> None:
+        """Stop the worker processes, dropping chunks that have not started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,217 @@
+"""Bulk evaluation through the Anthropic Message Batches API."""
+
+import asyncio
+import json
+import logging
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from anthropic import APIConnectionError
+
+from models.opportunity import OpportunityAssessment
+from models.paper import Paper
+
+from .token_ledger import BATCH_DISCOUNT
+from .value_evaluator import ValueEvaluator
+
+logger = logging.getLogger(__name__)
+
+# The Message Batches API accepts at most 100,000 requests per batch
+MAX_BATCH_REQUESTS = 100_000
+
+
+class BatchEvaluator:
+    """Evaluate many papers in one Message Batch.
+
+    Prompts and response parsing are shared with ``ValueEvaluator``; only the
+    transport differs. Every submitted batch is recorded in ``state_dir``
+    together with the papers it contains, so a restarted process can collect
+    the results with ``collect(batch_id)`` instead of paying for them twice.
+    """
+
+    def __init__(
+        self,
+        evaluator: ValueEvaluator,
+        state_dir: str | Path,
+        *,
+        poll_interval_seconds: float = 60.0,
+        max_batch_size: int = 10_000,
+    ) -> None:
+        """Initialize batch evaluator.
+
+        Args:
+            evaluator: Evaluator providing the client, prompts and parsing
+            state_dir: Directory where submitted batches are recorded
+            poll_interval_seconds: Delay between batch status checks
+            max_batch_size: Maximum number of papers per batch
+        """
+        self.evaluator = evaluator
+        self.state_dir = Path(state_dir)
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_batch_size = max(1, min(max_batch_size, MAX_BATCH_REQUESTS))
+
+    def pending_batch_ids(self) -> list[str]:
+        """Return ids of submitted batches whose results were not collected."""
+        if not self.state_dir.exists():
+            return []
+        return sorted(path.stem for path in self.state_dir.glob("*.json"))
+
+    async def evaluate_many(
+        self, items: list[tuple[Paper, dict[str, dict]]]
+    ) -> list[tuple[Paper, OpportunityAssessment | None]]:
+        """Submit papers as one batch and wait for the assessments.
+
+        Papers with a cached response are not submitted.
+
+        Args:
+            items: Papers with their extracted signals
+
+        Returns:
+            Each paper with its assessment (None if evaluation failed)
+        """
+        outcomes: list[tuple[Paper, OpportunityAssessment | None]] = []
+        uncached = []
+        for paper, signals in items:
+            cached = self.evaluator.cached_response(paper)
+            if cached is None:
+                uncached.append((paper, signals))
+                continue
+            signal_scores = {category: data["score"] for category, data in signals.items()}
+            self.evaluator.ledger.record_cache_hit()
+            outcomes.append((paper, self.evaluator.build_assessment(paper, signal_scores, cached)))
+
+        if uncached:
+            batch_id = await self.submit(uncached)
+            outcomes.extend(await self.collect(batch_id))
+        return outcomes
+
+    async def submit(self, items: list[tuple[Paper, dict[str, dict]]]) -> str:
+        """Submit papers as one batch and record it for resumption.
+
+        Returns:
+            Message Batch id
+
+        Raises:
+            APIConnectionError: If creating the batch timed out or lost its
+                connection; this is not retried because the batch may exist
+        """
+        requests = []
+        entries = {}
+        for index, (paper, signals) in enumerate(items):
+            # custom_id is limited to 64 characters, so paper ids are kept in the state file
+            custom_id = f"paper-{index}"
+            signal_scores = {category: data["score"] for category, data in signals.items()}
+            prompt = self.evaluator._create_paper_prompt(paper, signals, signal_scores)
+            requests.append({"custom_id": custom_id, "params": self.evaluator.build_request_params(prompt)})
+            entries[custom_id] = {"paper": paper.to_dict(), "signal_scores": signal_scores}
+
+        # Each created batch is billed, so a create that may have reached the server is not repeated
+        try:
+            batch = await self.evaluator._call_with_retry(
+                lambda: self.evaluator.client.messages.batches.create(requests=requests),  # type: ignore[arg-type]
+                description=f"batch of {len(requests)}",
+                idempotent=False,
+            )
+        except APIConnectionError:
+            logger.error(
+                f"Submitting a batch of {len(requests)} papers failed without a response; "
+                "it may still have been created, check the Message Batches list before resubmitting"
+            )
+            raise
+        self._save_state(batch.id, {"batch_id": batch.id, "submitted_at": _now(), "requests": entries})
+        logger.info(f"Submitted message batch {batch.id} with {len(requests)} papers")
+        return batch.id
+
+    async def collect(self, batch_id: str) -> list[tuple[Paper, OpportunityAssessment | None]]:
+        """Wait for a submitted batch to end and map its results to assessments.
+
+        Args:
+            batch_id: Id of a batch recorded in ``state_dir``
+
+        Returns:
+            Each paper of the batch with its assessment (None if evaluation failed)
+
+        Raises:
+            FileNotFoundError: If the batch was not submitted from this state directory
+        """
+        state = self._load_state(batch_id)
+        await self._wait_until_ended(batch_id)
+
+        results: dict[str, Any] = {}
+        decoder = await self.evaluator._call_with_retry(
+            lambda: self.evaluator.client.messages.batches.results(batch_id), description=batch_id
+        )
+        async for entry in decoder:
+            results[entry.custom_id] = entry.result
+
+        outcomes: list[tuple[Paper, OpportunityAssessment | None]] = []
+        for custom_id, request in state["requests"].items():
+            paper = Paper.from_dict(request["paper"])
+            outcomes.append((paper, self._build_assessment(paper, request["signal_scores"], results.get(custom_id))))
+
+        failed = sum(1 for _, assessment in outcomes if assessment is None)
+        logger.info(f"Collected message batch {batch_id}: {len(outcomes) - failed} evaluated, {failed} failed")
+        self._state_path(batch_id).unlink(missing_ok=True)
+        return outcomes
+
+    async def _wait_until_ended(self, batch_id: str) -> None:
+        """Poll a batch until processing has ended."""
+        while True:
+            batch = await self.evaluator._call_with_retry(
+                lambda: self.evaluator.client.messages.batches.retrieve(batch_id), description=batch_id
+            )
+            if batch.processing_status == "ended":
+                return
+            counts = batch.request_counts
+            logger.info(
+                f"Message batch {batch_id} {batch.processing_status}: "
+                f"{counts.processing} processing, {counts.succeeded} succeeded, {counts.errored} errored"
+            )
+            await asyncio.sleep(self.poll_interval_seconds)
+
+    def _build_assessment(
+        self, paper: Paper, signal_scores: dict[str, float], result: Any
+    ) -> OpportunityAssessment | None:
+        """Map one batch result to an assessment."""
+        if result is None:
+            logger.warning(f"No batch result for paper {paper.id}")
+            return None
+        if result.type != "succeeded":
+            error = getattr(result, "error", None)
+            logger.warning(f"Batch evaluation {result.type} for paper {paper.id}: {error}")
+            return None
+        self.evaluator.ledger.record(result.message.usage, source=paper.source, discount=BATCH_DISCOUNT)
+        try:
+            result_text = self.evaluator.response_text(result.message)
+            assessment = self.evaluator.build_assessment(paper, signal_scores, result_text)
+        except Exception as e:
+            logger.error(f"Error evaluating paper {paper.id}: {e}")
+            return None
+        if assessment is not None:
+            self.evaluator.cache_response(paper, result_text)
+        return assessment
+
+    def _state_path(self, batch_id: str) -> Path:
+        """Return the state file of a batch."""
+        return self.state_dir / f"{batch_id}.json"
+
+    def _save_state(self, batch_id: str, state: dict) -> None:
+        """Record a submitted batch."""
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        path = self._state_path(batch_id)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(state), encoding="utf-8")
+        tmp.replace(path)
+
+    def _load_state(self, batch_id: str) -> dict:
+        """Load a recorded batch."""
+        path = self._state_path(batch_id)
+        if not path.exists():
+            raise FileNotFoundError(f"No recorded state for message batch {batch_id} in {self.state_dir}")
+        return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _now() -> str:
+    """Return the current time as ISO string."""
+    return datetime.now(UTC).isoformat()
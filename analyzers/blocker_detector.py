@@ -1,9 +1,9 @@
 """Blocker detection for opportunity assessments."""
 
-import re
-
 from models.opportunity import Blocker, BlockerCategory, BlockerSeverity
 
+from .patterns import PatternGroup
+
 
 class BlockerDetector:
     """Extracts commercialization blockers from evaluation text."""
@@ -95,6 +95,12 @@ class BlockerDetector:
         },
     }
 
+    # Compiled once at import; ``.*`` gaps span at most ``MAX_GAP_CHARS`` characters
+    BLOCKER_GROUPS: dict[BlockerCategory, dict[BlockerSeverity, PatternGroup]] = {
+        category: {severity: PatternGroup(patterns) for severity, patterns in severity_patterns.items()}
+        for category, severity_patterns in BLOCKER_PATTERNS.items()
+    }
+
     def detect_from_text(self: "BlockerDetector", concerns: str) -> list[Blocker]:
         """Extract blockers from concern text using pattern matching.
 
@@ -107,15 +113,14 @@ class BlockerDetector:
         blockers: list[Blocker] = []
         concerns_lower = concerns.lower()
 
-        for category, severity_patterns in self.BLOCKER_PATTERNS.items():
-            for severity, patterns in severity_patterns.items():
-                for pattern in patterns:
-                    if re.search(pattern, concerns_lower):
-                        # Extract sentence containing the match
-                        matching_sentence = self._extract_matching_sentence(concerns, pattern)
+        for category, severity_groups in self.BLOCKER_GROUPS.items():
+            for severity, group in severity_groups.items():
+                index = group.first(concerns_lower)
+                if index is not None:
+                    # Extract sentence containing the match; one blocker per severity level per category
+                    matching_sentence = self._extract_matching_sentence(concerns, group, index)
 
-                        blockers.append(Blocker(category=category, severity=severity, description=matching_sentence))
-                        break  # One blocker per severity level per category
+                    blockers.append(Blocker(category=category, severity=severity, description=matching_sentence))
 
         return blockers
 
@@ -145,19 +150,21 @@ class BlockerDetector:
 
         return blockers
 
-    def _extract_matching_sentence(self: "BlockerDetector", text: str, pattern: str) -> str:
+    def _extract_matching_sentence(self: "BlockerDetector", text: str, group: PatternGroup, index: int) -> str:
         """Extract the sentence containing the pattern match.
 
         Args:
             text: Full text to search
-            pattern: Regex pattern that matched
+            group: Compiled patterns of one category and severity
+            index: Index of the pattern that matched
 
         Returns:
             Sentence containing the match, or the pattern itself as fallback
         """
+        compiled, pattern = group.compiled[index], group.patterns[index]
         sentences = text.split(".")
         for sentence in sentences:
-            if re.search(pattern, sentence.lower()):
+            if compiled.search(sentence.lower()):
                 return sentence.strip()
 
         # Fallback to pattern if sentence extraction fails
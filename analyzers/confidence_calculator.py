@@ -4,6 +4,8 @@ import re
 
 from models.opportunity import UncertaintySource
 
+from .patterns import PatternGroup
+
 
 class ConfidenceCalculator:
     """Calculates confidence scores based on uncertainty sources."""
@@ -39,10 +41,10 @@ class ConfidenceCalculator:
             r"possibly beneficial",
         ],
         "severe_concerns_understated": [
-            r"(?i)however.*significant",
-            r"(?i)but.*critical",
-            r"(?i)although.*major",
-            r"(?i)despite.*serious",
+            r"however.*significant",
+            r"but.*critical",
+            r"although.*major",
+            r"despite.*serious",
         ],
         "synthetic_data_only": [
             r"synthetic data",
@@ -81,6 +83,11 @@ class ConfidenceCalculator:
         ],
     }
 
+    # Compiled once at import; ``.*`` gaps span at most ``MAX_GAP_CHARS`` characters
+    UNCERTAINTY_GROUPS: dict[str, PatternGroup] = {
+        source_type: PatternGroup(patterns, re.IGNORECASE) for source_type, patterns in UNCERTAINTY_INDICATORS.items()
+    }
+
     def calculate(self: "ConfidenceCalculator", evaluation_data: dict) -> tuple[float, list[UncertaintySource]]:
         """Calculate confidence and identify uncertainty sources.
 
@@ -112,12 +119,12 @@ class ConfidenceCalculator:
         )
 
         # Scan for uncertainty indicators
-        for source_type, patterns in self.UNCERTAINTY_INDICATORS.items():
-            if self._matches_any_pattern(text_to_scan, patterns):
+        for source_type, group in self.UNCERTAINTY_GROUPS.items():
+            if self._matches_any_pattern(text_to_scan, group):
                 penalty = self.UNCERTAINTY_PENALTIES[source_type]
 
                 # Extract matching sentence for description
-                matching_sentence = self._extract_matching_text(text_to_scan, patterns)
+                matching_sentence = self._extract_matching_text(text_to_scan, group)
 
                 uncertainty_sources.append(UncertaintySource(description=matching_sentence, penalty=penalty))
                 total_penalty += penalty
@@ -127,37 +134,34 @@ class ConfidenceCalculator:
 
         return confidence, uncertainty_sources
 
-    def _matches_any_pattern(self: "ConfidenceCalculator", text: str, patterns: list[str]) -> bool:
+    def _matches_any_pattern(self: "ConfidenceCalculator", text: str, group: PatternGroup) -> bool:
         """Check if text matches any of the given patterns.
 
         Args:
             text: Text to search
-            patterns: List of regex patterns
+            group: Compiled patterns of one uncertainty source
 
         Returns:
             True if any pattern matches
         """
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return group.search(text)
 
-    def _extract_matching_text(self: "ConfidenceCalculator", text: str, patterns: list[str]) -> str:
+    def _extract_matching_text(self: "ConfidenceCalculator", text: str, group: PatternGroup) -> str:
         """Extract sentence or phrase containing pattern match.
 
         Args:
             text: Full text to search
-            patterns: List of regex patterns
+            group: Compiled patterns of one uncertainty source
 
         Returns:
             Sentence containing the match, or generic description
         """
         sentences = text.split(".")
 
-        for pattern in patterns:
+        for pattern in group.compiled:
             for sentence in sentences:
-                if re.search(pattern, sentence, re.IGNORECASE):
+                if pattern.search(sentence):
                     return sentence.strip()
 
         # Fallback to first pattern as description
-        return patterns[0].replace(r"\s?", " ").replace("?", "").replace(r"(?i)", "")
+        return group.patterns[0].replace(r"\s?", " ").replace("?", "")
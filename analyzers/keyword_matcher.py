@@ -0,0 +1,103 @@
+"""Single-pass multi-keyword matching."""
+
+import importlib.util
+from collections import defaultdict
+
+# The optional ``pyahocorasick`` package provides a C Aho–Corasick automaton;
+# without it every keyword is searched for separately with the same results
+AHOCORASICK_AVAILABLE = importlib.util.find_spec("ahocorasick") is not None
+
+if AHOCORASICK_AVAILABLE:
+    import ahocorasick
+
+
+class KeywordMatches:
+    """Keyword hits found in one text."""
+
+    def __init__(self, groups: dict[str, list[tuple[str, str]]], positions: dict[str, list[int]]) -> None:
+        """Initialize from matcher groups and the start positions of every found keyword.
+
+        Args:
+            groups: Group name to (keyword, lowercased keyword) pairs
+            positions: Lowercased keyword to sorted start offsets in the text
+        """
+        self._groups = groups
+        self._positions = positions
+
+    def __contains__(self, keyword: str) -> bool:
+        """Return True if the keyword occurs in the text."""
+        return keyword.lower() in self._positions
+
+    def found(self) -> list[str]:
+        """Return the lowercased keywords that occur in the text."""
+        return list(self._positions)
+
+    def positions(self, keyword: str) -> list[int]:
+        """Return start offsets of every occurrence of a keyword, including overlapping ones."""
+        return self._positions.get(keyword.lower(), [])
+
+    def present(self, group: str) -> list[str]:
+        """Return keywords of a group that occur in the text, in group order."""
+        return [kw for kw, lowered in self._groups.get(group, ()) if lowered in self._positions]
+
+    def count(self, group: str) -> int:
+        """Return number of keywords of a group that occur in the text."""
+        return sum(lowered in self._positions for _, lowered in self._groups.get(group, ()))
+
+    def any(self, group: str) -> bool:
+        """Return True if any keyword of a group occurs in the text."""
+        return any(lowered in self._positions for _, lowered in self._groups.get(group, ()))
+
+
+class KeywordMatcher:
+    """Find all keywords of all groups in one pass over a text.
+
+    Matching has the same semantics as ``keyword.lower() in text`` for each
+    keyword: case-insensitive on the keyword side, substring based, and
+    overlapping occurrences are all reported. The automaton is compiled once,
+    so per-text cost no longer grows with the number of keywords.
+    """
+
+    def __init__(self, groups: dict[str, list[str]]) -> None:
+        """Compile the matcher.
+
+        Args:
+            groups: Group name to keywords; a keyword may appear in several groups
+        """
+        self.groups = {name: list(keywords) for name, keywords in groups.items()}
+        self.keywords = sorted({kw.lower() for keywords in self.groups.values() for kw in keywords if kw})
+        self._lowered = {name: [(kw, kw.lower()) for kw in keywords] for name, keywords in self.groups.items()}
+
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._automaton.add_word(keyword, keyword)
+            if self.keywords:
+                self._automaton.make_automaton()
+
+    def match(self, text: str) -> KeywordMatches:
+        """Find every keyword occurrence in ``text``.
+
+        Args:
+            text: Lowercased text to search
+
+        Returns:
+            Matches with start positions per keyword
+        """
+        positions: dict[str, list[int]] = defaultdict(list)
+        if not self.keywords:
+            return KeywordMatches(self._lowered, positions)
+
+        if AHOCORASICK_AVAILABLE:
+            for end, keyword in self._automaton.iter(text):
+                positions[keyword].append(end - len(keyword) + 1)
+            for offsets in positions.values():
+                offsets.sort()
+        else:
+            for keyword in self.keywords:
+                idx = text.find(keyword)
+                while idx != -1:
+                    positions[keyword].append(idx)
+                    idx = text.find(keyword, idx + 1)
+
+        return KeywordMatches(self._lowered, positions)
@@ -0,0 +1,442 @@
+"""Local stand-in for the Anthropic Messages API.
+
+``MockMessagesServer`` is a plain ASGI application that answers
+``POST /v1/messages`` and the Message Batches endpoints with schema-valid
+evaluation JSON, so ``ValueEvaluator`` and ``BatchEvaluator`` can be
+load-tested offline. Point the evaluator at it with ``base_url``.
+
+Every answer is derived from a hash of the prompt, so the same paper gets
+the same scores on every run regardless of request order. Latency, HTTP
+429 and 529 (overloaded) responses and malformed JSON are injected at
+configurable rates; whether a given attempt fails depends only on the
+prompt and the attempt number, so retries behave the same on every run.
+Token usage is estimated from text length, and prompt caching is emulated
+for system blocks marked with ``cache_control`` that reach the requested
+model's minimum cacheable length.
+
+Usage:
+    python -m research_data_analyzer.analyzers.mock_messages_server [--port 8766] \\
+        [--latency lognormal --latency-median-ms 800] [--overload-rate 0.05] [--malformed-rate 0.01]
+
+Running the server needs uvicorn (``research-data-analyzer[replay]``); the
+application itself can also be used in-process with ``httpx.ASGITransport``.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import importlib.util
+import json
+import logging
+import math
+import random
+from collections.abc import Awaitable, Callable, MutableMapping
+from dataclasses import dataclass
+from typing import Any
+
+from .token_ledger import estimate_tokens, min_cacheable_tokens
+
+logger = logging.getLogger(__name__)
+
+UVICORN_AVAILABLE = importlib.util.find_spec("uvicorn") is not None
+
+# Building blocks of generated evaluations, picked by the prompt hash
+_BLOCKERS = [
+    ("legal", "Collecting the data requires consent from identifiable individuals"),
+    ("technical", "Results are only validated on synthetic data"),
+    ("market", "Buyers are limited to a handful of specialised labs"),
+    ("economic", "Expert annotation makes collection cost prohibitive at scale"),
+]
+_SEVERITIES = ["low", "medium", "high"]
+_FEASIBILITY = ["low", "medium", "high"]
+_FORMATS = ["annotated images", "dialogue transcripts", "sensor time series", "labelled documents"]
+
+Scope = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[MutableMapping[str, Any]]]
+Send = Callable[[MutableMapping[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class LatencyModel:
+    """Response time distribution.
+
+    Attributes:
+        distribution: ``fixed``, ``uniform`` (0 to twice the median) or ``lognormal``
+        median_seconds: Median response time
+        sigma: Shape of the lognormal distribution; larger values give a longer tail
+    """
+
+    distribution: str = "fixed"
+    median_seconds: float = 0.0
+    sigma: float = 0.5
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one response time."""
+        if self.median_seconds <= 0:
+            return 0.0
+        if self.distribution == "uniform":
+            return rng.uniform(0, 2 * self.median_seconds)
+        if self.distribution == "lognormal":
+            return rng.lognormvariate(math.log(self.median_seconds), self.sigma)
+        return self.median_seconds
+
+
+@dataclass
+class MockStats:
+    """Requests handled by a mock server.
+
+    Attributes:
+        requests: Message requests received, including batch items
+        succeeded: Answered with an evaluation
+        malformed: Evaluations deliberately returned as invalid JSON
+        overloaded: Answered 529 (or errored in a batch)
+        rate_limited: Answered 429
+        batches: Message batches created
+        input_tokens: Uncached input tokens reported
+        cache_read_input_tokens: Input tokens reported as read from the prompt cache
+        cache_creation_input_tokens: Input tokens reported as written to the prompt cache
+        output_tokens: Output tokens reported
+    """
+
+    requests: int = 0
+    succeeded: int = 0
+    malformed: int = 0
+    overloaded: int = 0
+    rate_limited: int = 0
+    batches: int = 0
+    input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    output_tokens: int = 0
+
+    def to_dict(self) -> dict:
+        """Serialize to JSON-compatible dict."""
+        return dict(self.__dict__)
+
+
+def _text(content: Any) -> str:
+    """Return the text of a string or a list of content blocks."""
+    if isinstance(content, str):
+        return content
+    return "\n".join(block.get("text", "") for block in content or [] if isinstance(block, dict))
+
+
+def _paper_title(prompt: str) -> str:
+    """Return the paper title from an evaluation prompt, if present."""
+    for line in prompt.splitlines():
+        if line.startswith("Title:"):
+            return line.removeprefix("Title:").strip()
+    return "Untitled"
+
+
+def generate_evaluation(prompt: str) -> dict:
+    """Return a schema-valid evaluation determined by the prompt text."""
+    rng = random.Random(hashlib.sha256(prompt.encode("utf-8")).digest())
+    title = _paper_title(prompt)
+    subject = " ".join(title.split()[:4]) or "Research"
+    data_format = rng.choice(_FORMATS)
+    feasibility = rng.choice(_FEASIBILITY)
+    return {
+        "technical_contribution_score": round(rng.uniform(2.0, 9.5), 1),
+        "commercial_viability_score": round(rng.uniform(2.0, 9.5), 1),
+        "blockers": [
+            {"category": category, "severity": rng.choice(_SEVERITIES), "description": description}
+            for category, description in rng.sample(_BLOCKERS, rng.randint(0, 2))
+        ],
+        "data_type_name": subject if subject.lower().endswith(("dataset", "corpus")) else f"{subject} Dataset",
+        "data_needed": (
+            f"{data_format.capitalize()} covering the tasks studied in '{title}'. Each example needs expert "
+            f"labels, provenance metadata and coverage of rare edge cases. Target scale is "
+            f"{rng.choice(['10K', '100K', '1M+'])} examples across at least 20 distinct scenarios."
+        ),
+        "scale_impact": (
+            "At 10K examples models handle the common cases reported in the paper. At 100K they learn the "
+            "long tail of rare conditions that currently cause most failures. At 1M+ they generalise to new "
+            "deployment settings without per-customer fine-tuning."
+        ),
+        "business_context": (
+            f"Teams building products around {subject.lower()} lack {data_format} at this quality. The paper "
+            "shows measurable gains from better data rather than larger models. Buyers pay for curated "
+            "collections that shorten their evaluation cycles."
+        ),
+        "market_gap": f"No licensed collection of {data_format} with expert labels for this task",
+        "target_customers": rng.choice(["Healthcare AI vendors", "Robotics OEMs", "Enterprise search providers"]),
+        "concerns": "Annotation consistency and licensing terms need validation before collection starts.",
+        "data_efficiency": round(rng.uniform(3.0, 9.5), 1),
+        "source_quality": round(rng.uniform(3.0, 9.5), 1),
+        "generalizability": round(rng.uniform(3.0, 9.5), 1),
+        "dataset_description": f"{rng.randint(500, 50_000)} {data_format} collected by the authors",
+        "data_collection_method": rng.choice(["Manual annotation by domain experts", "Web scraping", "Sensor logs"]),
+        "replication_feasibility": (
+            f"{feasibility} feasibility: the collection protocol is described in the paper. Access to "
+            "comparable sources and annotators determines the cost of replicating it."
+        ),
+    }
+
+
+class MockMessagesServer:
+    """ASGI application emulating the Messages and Message Batches endpoints."""
+
+    def __init__(
+        self,
+        *,
+        latency: LatencyModel | None = None,
+        overload_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        malformed_rate: float = 0.0,
+        retry_after_seconds: float = 1.0,
+        min_cacheable_tokens: int | None = None,
+        batch_polls: int = 1,
+        seed: int = 0,
+    ) -> None:
+        """Configure injected behaviour.
+
+        Args:
+            latency: Response time distribution (default: no delay)
+            overload_rate: Fraction of attempts answered 529 overloaded_error
+            rate_limit_rate: Fraction of attempts answered 429 rate_limit_error
+            malformed_rate: Fraction of prompts whose evaluation is truncated, invalid JSON
+            retry_after_seconds: Retry-After sent with 429 responses
+            min_cacheable_tokens: Smallest system prefix emulated as prompt-cacheable
+                (default: the requested model's minimum)
+            batch_polls: Status checks before a message batch reports ``ended``
+            seed: Salt of all random decisions
+        """
+        self.latency = latency or LatencyModel()
+        self.overload_rate = overload_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.malformed_rate = malformed_rate
+        self.retry_after_seconds = retry_after_seconds
+        self.min_cacheable_tokens = min_cacheable_tokens
+        self.batch_polls = batch_polls
+        self.seed = seed
+        self.stats = MockStats()
+        self._attempts: dict[str, int] = {}
+        self._cached_prefixes: set[str] = set()
+        self._batches: dict[str, dict] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one ASGI connection."""
+        if scope["type"] == "lifespan":
+            while (await receive())["type"] != "lifespan.shutdown":
+                await send({"type": "lifespan.startup.complete"})
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+        if scope["type"] != "http":
+            return
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        status, headers, payload = await self.route(scope["method"], scope["path"], body)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(name.encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()],
+            }
+        )
+        await send({"type": "http.response.body", "body": payload})
+
+    async def route(self, method: str, path: str, body: bytes) -> tuple[int, dict[str, str], bytes]:
+        """Dispatch a request to its endpoint."""
+        if method == "POST" and path == "/v1/messages":
+            status, headers, payload = await self.create_message(json.loads(body))
+        elif method == "POST" and path == "/v1/messages/batches":
+            status, headers, payload = 200, {}, self.create_batch(json.loads(body)["requests"])
+        elif method == "GET" and path.startswith("/v1/messages/batches/") and path.endswith("/results"):
+            batch_id = path.split("/")[-2]
+            return 200, {"content-type": "application/binary"}, self.batch_results(batch_id).encode("utf-8")
+        elif method == "GET" and path.startswith("/v1/messages/batches/"):
+            status, headers, payload = 200, {}, self.retrieve_batch(path.rsplit("/", 1)[-1])
+        else:
+            status, headers, payload = 404, {}, _error("not_found_error", f"{method} {path} is not emulated")
+        return status, {"content-type": "application/json", **headers}, json.dumps(payload).encode("utf-8")
+
+    async def create_message(self, params: dict) -> tuple[int, dict[str, str], dict]:
+        """Answer a Messages API request, possibly with an injected error."""
+        self.stats.requests += 1
+        prompt = _text(params.get("system")) + "\n" + "\n".join(_text(m["content"]) for m in params["messages"])
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        attempt = self._attempts.get(digest, 0)
+        self._attempts[digest] = attempt + 1
+        rng = random.Random(f"{self.seed}:{digest}:{attempt}")
+
+        delay = self.latency.sample(rng)
+        if delay:
+            await asyncio.sleep(delay)
+
+        roll = rng.random()
+        if roll < self.rate_limit_rate:
+            self.stats.rate_limited += 1
+            headers = {"retry-after": f"{self.retry_after_seconds:g}"}
+            return 429, headers, _error("rate_limit_error", "Number of requests has exceeded your rate limit")
+        if roll < self.rate_limit_rate + self.overload_rate:
+            self.stats.overloaded += 1
+            return 529, {}, _error("overloaded_error", "Overloaded")
+        return 200, {}, self._message(params, prompt, digest)
+
+    def _message(self, params: dict, prompt: str, digest: str) -> dict:
+        """Build a message carrying the prompt's evaluation and its token usage."""
+        text = json.dumps(generate_evaluation(prompt), indent=2)
+        if random.Random(f"{self.seed}:{digest}:malformed").random() < self.malformed_rate:
+            self.stats.malformed += 1
+            text = text[: len(text) // 2]
+        else:
+            self.stats.succeeded += 1
+
+        usage = self._usage(params, prompt, text)
+        return {
+            "id": f"msg_mock_{digest[:24]}",
+            "type": "message",
+            "role": "assistant",
+            "model": params.get("model", ""),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": usage,
+        }
+
+    def _usage(self, params: dict, prompt: str, output: str) -> dict:
+        """Estimate token usage, emulating the prompt cache for marked system blocks."""
+        system = params.get("system")
+        cached_prefix = ""
+        if isinstance(system, list) and any(isinstance(b, dict) and b.get("cache_control") for b in system):
+            cached_prefix = _text(system)
+        prefix_tokens = estimate_tokens(cached_prefix) if cached_prefix else 0
+
+        cache_read = cache_creation = 0
+        minimum = self.min_cacheable_tokens
+        if minimum is None:
+            minimum = min_cacheable_tokens(params.get("model", ""))
+        if prefix_tokens >= minimum:
+            if cached_prefix in self._cached_prefixes:
+                cache_read = prefix_tokens
+            else:
+                self._cached_prefixes.add(cached_prefix)
+                cache_creation = prefix_tokens
+        input_tokens = estimate_tokens(prompt) - cache_read - cache_creation
+        output_tokens = estimate_tokens(output)
+
+        self.stats.input_tokens += input_tokens
+        self.stats.cache_read_input_tokens += cache_read
+        self.stats.cache_creation_input_tokens += cache_creation
+        self.stats.output_tokens += output_tokens
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cache_read_input_tokens": cache_read,
+            "cache_creation_input_tokens": cache_creation,
+        }
+
+    def create_batch(self, requests: list[dict]) -> dict:
+        """Store a message batch."""
+        self.stats.batches += 1
+        batch_id = f"msgbatch_mock_{self.stats.batches}"
+        self._batches[batch_id] = {"requests": requests, "polls": 0}
+        return self._batch(batch_id)
+
+    def retrieve_batch(self, batch_id: str) -> dict:
+        """Return a batch's status, counting the poll."""
+        self._batches[batch_id]["polls"] += 1
+        return self._batch(batch_id)
+
+    def batch_results(self, batch_id: str) -> str:
+        """Return a batch's results as JSON lines."""
+        return "\n".join(json.dumps(line) for line in self._results(batch_id))
+
+    def _results(self, batch_id: str) -> list[dict]:
+        """Answer a batch's requests once; overloaded attempts become errored results."""
+        state = self._batches[batch_id]
+        if "results" in state:
+            return state["results"]
+        lines = []
+        for request in state["requests"]:
+            params = request["params"]
+            self.stats.requests += 1
+            prompt = _text(params.get("system")) + "\n" + "\n".join(_text(m["content"]) for m in params["messages"])
+            digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+            if random.Random(f"{self.seed}:{digest}:batch").random() < self.overload_rate:
+                self.stats.overloaded += 1
+                result = {"type": "errored", "error": _error("overloaded_error", "Overloaded")}
+            else:
+                result = {"type": "succeeded", "message": self._message(params, prompt, digest)}
+            lines.append({"custom_id": request["custom_id"], "result": result})
+        state["results"] = lines
+        return lines
+
+    def _batch(self, batch_id: str) -> dict:
+        """Return the Message Batch object for a stored batch."""
+        state = self._batches[batch_id]
+        ended = state["polls"] >= self.batch_polls
+        counts = {"processing": 0, "succeeded": 0, "errored": 0, "canceled": 0, "expired": 0}
+        if ended:
+            for line in self._results(batch_id):
+                counts[line["result"]["type"]] += 1
+        else:
+            counts["processing"] = len(state["requests"])
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": counts,
+            "created_at": "2025-01-01T00:00:00Z",
+            "expires_at": "2025-01-02T00:00:00Z",
+            "ended_at": "2025-01-01T00:00:01Z" if ended else None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": f"/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+
+def _error(error_type: str, message: str) -> dict:
+    """Return an API error body."""
+    return {"type": "error", "error": {"type": error_type, "message": message}}
+
+
+def main() -> None:
+    """Run the mock server."""
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for the Anthropic Messages API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--latency", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--latency-median-ms", type=float, default=800)
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Lognormal shape; larger means longer tail")
+    parser.add_argument("--overload-rate", type=float, default=0.0, help="Fraction of attempts answered 529")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of attempts answered 429")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="Fraction of prompts answered invalid JSON")
+    parser.add_argument("--retry-after-seconds", type=float, default=1.0)
+    parser.add_argument(
+        "--min-cacheable-tokens", type=int, default=None, help="Prompt cache minimum (default: per requested model)"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    if not UVICORN_AVAILABLE:
+        raise ImportError("The mock server requires uvicorn; install research-data-analyzer[replay]")
+    # Imported here, not at module level, so the server classes work without the extra
+    uvicorn = importlib.import_module("uvicorn")
+
+    app = MockMessagesServer(
+        latency=LatencyModel(args.latency, args.latency_median_ms / 1000, args.latency_sigma),
+        overload_rate=args.overload_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        malformed_rate=args.malformed_rate,
+        retry_after_seconds=args.retry_after_seconds,
+        min_cacheable_tokens=args.min_cacheable_tokens,
+        seed=args.seed,
+    )
+    logger.info(f"Set ANTHROPIC_BASE_URL=http://{args.host}:{args.port} (any ANTHROPIC_API_KEY is accepted)")
+    try:
+        uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+    finally:
+        logger.info(f"Mock statistics: {app.stats.to_dict()}")
+
+
+if __name__ == "__main__":
+    main()
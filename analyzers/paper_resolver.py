@@ -0,0 +1,211 @@
+"""Cross-source identity resolution for papers.
+
+The same paper is typically returned by several sources, each with its own
+prefixed ``Paper.id`` (``arxiv_…``, ``s2_…``, ``openalex_…``, ``pwc_…``,
+``dblp_…``). ``PaperResolver`` groups such records by exact identifiers
+(paper id, DOI, arXiv id) and, for records without a shared identifier,
+by MinHash/LSH over the normalized title. Every lookup is a dict access or
+a handful of LSH bucket probes, so resolving a corpus takes near-linear time.
+"""
+
+import hashlib
+import importlib.util
+import logging
+import random
+import re
+import unicodedata
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from typing import TypeVar
+
+from models.paper import Paper, PaperRecord
+
+logger = logging.getLogger(__name__)
+
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+# Signature size and banding: 16 bands of 4 rows make titles with a Jaccard
+# similarity around 0.5 and above likely to share a bucket
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+SHINGLE_SIZE = 4
+# Titles this short ("Introduction", "Editorial") are too generic to fuzzy-match
+MIN_TITLE_CHARS = 20
+
+AnyPaper = TypeVar("AnyPaper", Paper, PaperRecord)
+
+_MASKS = [random.Random(20240601 + i).getrandbits(64) for i in range(NUM_PERM)]
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase, strip accents and punctuation, and collapse whitespace."""
+    text = unicodedata.normalize("NFKD", title).encode("ascii", "ignore").decode("ascii").lower()
+    return _NON_ALNUM.sub(" ", text).strip()
+
+
+def minhash_signature(normalized_title: str) -> tuple[int, ...]:
+    """Return the MinHash signature of a normalized title's character shingles.
+
+    Each shingle is hashed once; the ``NUM_PERM`` hash functions are derived
+    by XOR with fixed random masks, so signatures are stable across runs.
+    """
+    shingles = {normalized_title[i : i + SHINGLE_SIZE] for i in range(max(1, len(normalized_title) - SHINGLE_SIZE + 1))}
+    hashes = [int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "little") for s in shingles]
+    if NUMPY_AVAILABLE:
+        mins = np.bitwise_xor.outer(np.array(hashes, dtype=np.uint64), np.array(_MASKS, dtype=np.uint64)).min(axis=0)
+        return tuple(int(value) for value in mins)
+    return tuple(min(h ^ mask for h in hashes) for mask in _MASKS)
+
+
+def signature_similarity(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+    """Return the estimated Jaccard similarity of two signatures."""
+    return sum(x == y for x, y in zip(a, b, strict=True)) / NUM_PERM
+
+
+def merge_papers(primary: AnyPaper, other: Paper | PaperRecord) -> AnyPaper:
+    """Merge a duplicate record into ``primary``.
+
+    The primary record keeps its id, source and class. The longer abstract
+    and the highest citation count win; missing fields are filled from ``other``.
+    """
+    citation_counts = [c for c in (primary.citation_count, other.citation_count) if c is not None]
+    return replace(
+        primary,
+        abstract=other.abstract if len(other.abstract or "") > len(primary.abstract or "") else primary.abstract,
+        authors=primary.authors or other.authors,
+        citation_count=max(citation_counts) if citation_counts else None,
+        venue=primary.venue or other.venue,
+        full_text=primary.full_text or other.full_text,
+        dataset_mentions=list(dict.fromkeys([*primary.dataset_mentions, *other.dataset_mentions])),
+        doi=primary.doi or other.doi,
+        arxiv_id=primary.arxiv_id or other.arxiv_id,
+    )
+
+
+def _surnames(authors: Sequence[str]) -> set[str]:
+    """Return normalized last names."""
+    return {parts[-1] for name in authors if (parts := normalize_title(name).split())}
+
+
+@dataclass
+class _Cluster:
+    """Records resolved to one paper, kept as a compact record."""
+
+    paper: PaperRecord
+    signature: tuple[int, ...] | None
+    forwarded_without_abstract: bool = False
+
+
+class PaperResolver:
+    """Incrementally resolve papers from several sources to unique records.
+
+    Use ``add`` in a streaming pipeline, or ``resolve`` for a complete list.
+    Title matches are only accepted when the estimated title similarity
+    reaches ``title_similarity``, the publication years differ by at most
+    one, and, if both records list authors, they share a surname.
+    """
+
+    def __init__(self, *, title_similarity: float = 0.8) -> None:
+        """Initialize an empty resolver.
+
+        Args:
+            title_similarity: Minimum estimated Jaccard similarity of title shingles
+        """
+        self.title_similarity = title_similarity
+        self._clusters: list[_Cluster] = []
+        self._by_key: dict[str, int] = {}
+        self._buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+
+    def __len__(self) -> int:
+        """Return number of distinct papers seen."""
+        return len(self._clusters)
+
+    def add(self, paper: Paper) -> Paper | None:
+        """Resolve one record.
+
+        Returns:
+            The paper to process: the record itself if it is new, the merged
+            record if the version handed out before had no abstract and this
+            duplicate supplies one, otherwise None
+        """
+        keys = self._keys(paper)
+        index = next((self._by_key[key] for key in keys if key in self._by_key), None)
+        normalized = normalize_title(paper.title)
+        signature = minhash_signature(normalized) if len(normalized) >= MIN_TITLE_CHARS else None
+        if index is None and signature is not None:
+            index = self._find_similar(paper, signature)
+
+        if index is None:
+            index = len(self._clusters)
+            self._clusters.append(_Cluster(paper.compact(), signature, forwarded_without_abstract=not paper.abstract))
+            self._register(index, keys, signature)
+            return paper
+
+        cluster = self._clusters[index]
+        cluster.paper = merge_papers(cluster.paper, paper)
+        self._register(index, keys, signature if cluster.signature is None else None)
+        if cluster.signature is None:
+            cluster.signature = signature
+        logger.debug(f"Duplicate of {cluster.paper.id}: {paper.id}")
+
+        if cluster.forwarded_without_abstract and cluster.paper.abstract:
+            cluster.forwarded_without_abstract = False
+            return cluster.paper.to_paper()
+        return None
+
+    def resolve(self, papers: list[Paper]) -> list[Paper]:
+        """Return one merged record per distinct paper, in first-seen order."""
+        for paper in papers:
+            self.add(paper)
+        return [cluster.paper.to_paper() for cluster in self._clusters]
+
+    def _keys(self, paper: Paper) -> list[str]:
+        """Return the exact identifiers of a record."""
+        keys = [f"id:{paper.id}"]
+        if paper.doi:
+            keys.append(f"doi:{paper.doi}")
+        if paper.arxiv_id:
+            keys.append(f"arxiv:{paper.arxiv_id}")
+        return keys
+
+    def _register(self, index: int, keys: list[str], signature: tuple[int, ...] | None) -> None:
+        """Index a cluster under new identifiers and, once, its LSH bands."""
+        for key in keys:
+            self._by_key.setdefault(key, index)
+        if signature is not None:
+            for band in range(BANDS):
+                self._buckets.setdefault((band, signature[band * ROWS : (band + 1) * ROWS]), []).append(index)
+
+    def _find_similar(self, paper: Paper, signature: tuple[int, ...]) -> int | None:
+        """Return the cluster whose title is a near-duplicate, if any."""
+        seen: set[int] = set()
+        for band in range(BANDS):
+            for index in self._buckets.get((band, signature[band * ROWS : (band + 1) * ROWS]), ()):
+                if index in seen:
+                    continue
+                seen.add(index)
+                if self._is_same_paper(paper, signature, self._clusters[index]):
+                    return index
+        return None
+
+    def _is_same_paper(self, paper: Paper, signature: tuple[int, ...], cluster: _Cluster) -> bool:
+        """Verify an LSH candidate."""
+        other = cluster.paper
+        if cluster.signature is None or signature_similarity(signature, cluster.signature) < self.title_similarity:
+            return False
+        if abs(paper.published_date.year - other.published_date.year) > 1:
+            return False
+        # Different identifiers of the same kind mean different papers
+        if paper.doi and other.doi and paper.doi != other.doi:
+            return False
+        if paper.arxiv_id and other.arxiv_id and paper.arxiv_id != other.arxiv_id:
+            return False
+        if paper.authors and other.authors:
+            return bool(_surnames(paper.authors) & _surnames(other.authors))
+        return True
@@ -0,0 +1,96 @@
+"""Precompiled regex patterns shared by the analyzers."""
+
+import functools
+import re
+
+# Upper bound on the characters an unbounded ``.*`` gap may span. A greedy
+# gap rescans the rest of the line for every candidate start, which is
+# quadratic on long texts with many near misses; a bounded lazy gap keeps
+# each attempt constant. 100 characters covers a typical sentence.
+MAX_GAP_CHARS = 100
+
+
+def bound_gaps(pattern: str) -> str:
+    """Rewrite unbounded ``.*`` gaps as lazy gaps of at most ``MAX_GAP_CHARS``."""
+    return pattern.replace(".*", f".{{0,{MAX_GAP_CHARS}}}?")
+
+
+class PatternGroup:
+    """Ordered regex patterns compiled once.
+
+    ``search`` and ``first`` keep the semantics of calling ``re.search`` for
+    each pattern in order. CPython's backtracking engine tries every
+    alternative at every offset, so for rejecting text separate compiled
+    patterns are much faster than one alternation; the alternation is only
+    built on demand for callers that want every hit in a single scan.
+    """
+
+    def __init__(self, patterns: list[str] | tuple[str, ...], flags: int = 0) -> None:
+        """Compile the patterns.
+
+        Args:
+            patterns: Regex sources in priority order; ``.*`` gaps are bounded
+            flags: ``re`` flags applied to every pattern
+        """
+        self.patterns = tuple(patterns)
+        self.flags = flags
+        self.compiled = tuple(re.compile(bound_gaps(pattern), flags) for pattern in self.patterns)
+
+    def search(self, text: str) -> bool:
+        """Return True if any pattern matches ``text``."""
+        return any(pattern.search(text) for pattern in self.compiled)
+
+    def first(self, text: str) -> int | None:
+        """Return index of the first pattern, in priority order, that matches ``text``."""
+        for index, pattern in enumerate(self.compiled):
+            if pattern.search(text):
+                return index
+        return None
+
+    @functools.cached_property
+    def combined(self) -> re.Pattern[str]:
+        """Alternation of all patterns; the named group ``p<index>`` tells which one matched."""
+        alternatives = (f"(?P<p{index}>{bound_gaps(pattern)})" for index, pattern in enumerate(self.patterns))
+        return re.compile("|".join(alternatives), self.flags)
+
+    def finditer(self, text: str) -> list[tuple[int, re.Match[str]]]:
+        """Scan ``text`` once and return (pattern index, match) for each non-overlapping hit."""
+        return [(int(match.lastgroup[1:]), match) for match in self.combined.finditer(text) if match.lastgroup]
+
+
+# Signal extraction patterns, matched against lowercased title and abstract
+SIZE_LIMITATION = PatternGroup(
+    [
+        r"only \d+[km]? samples",
+        r"limited to \d+[km]? examples",
+        r"small dataset",
+        r"insufficient.*data",
+    ]
+)
+
+COMPARATIVE_EFFICIENCY = PatternGroup(
+    [
+        r"(\d+)%\s*(improvement|better|gain)",
+        r"only\s+\d+[km]?\s*(samples|examples)",
+        r"outperform.*\d+[km]?\s*(samples|examples)",
+        r"achieve.*with.*fewer",
+        r"despite.*smaller",
+        r"fraction of.*data",
+    ],
+    re.IGNORECASE,
+)
+
+QUANTIFIED_IMPROVEMENT = PatternGroup(
+    [
+        r"(\d+)%\s*improvement",
+        r"(\d+)%\s*better",
+        r"(\d+)%\s*gain",
+        r"state-of-the-art",
+        r"outperform.*baseline",
+    ],
+    re.IGNORECASE,
+)
+
+AGREEMENT_METRIC = PatternGroup([r"(kappa|agreement|correlation).*\d+\.\d+"], re.IGNORECASE)
+
+CROSS_DOMAIN = PatternGroup([r"(across|multiple|various)\s+(domains|tasks|datasets)"], re.IGNORECASE)
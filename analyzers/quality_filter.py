@@ -3,16 +3,55 @@
 This module filters papers based on age-adjusted citation thresholds and
 author publication history. Designed to work with both recent papers
 (3-month lookback) and historical papers (1+ year lookback).
+
+``filter_batch`` applies the same rules to a whole ``PaperBatch`` with
+array operations; its decisions match ``passes_quality_filter`` paper for
+paper, and reason strings are only formatted for the rows asked about.
 """
 
+import bisect
 import logging
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from enum import IntEnum
+
+from models.paper import Paper
+from models.paper_batch import NUMPY_AVAILABLE, PaperBatch, epoch_micros
 
-from research_data_analyzer.models import Paper
+if NUMPY_AVAILABLE:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Age bins of FilterConfig.citation_thresholds: a paper younger than
+# AGE_BIN_EDGES[i] years (and not younger than the edge before) falls in
+# AGE_BIN_KEYS[i]; older papers fall in the last bin
+AGE_BIN_EDGES = (1.0, 2.0, 5.0)
+AGE_BIN_KEYS = ("0-1", "1-2", "2-5", "5+")
+DEFAULT_CITATION_THRESHOLDS = (3, 10, 20, 30)
+
+_DAY_MICROSECONDS = 86_400_000_000
+
+
+class QualityOutcome(IntEnum):
+    """Why a paper passed or failed the quality filter.
+
+    Outcomes below ``CITATIONS_UNAVAILABLE`` pass.
+    """
+
+    DISABLED = 0
+    ARXIV_UNKNOWN_CITATIONS = 1
+    UNKNOWN_CITATIONS_ALLOWED = 2
+    MEETS_THRESHOLD = 3
+    CITATIONS_UNAVAILABLE = 4
+    BELOW_ABSOLUTE_MINIMUM = 5
+    BELOW_AGE_THRESHOLD = 6
+
+    @property
+    def passes(self) -> bool:
+        """Whether papers with this outcome pass."""
+        return self < QualityOutcome.CITATIONS_UNAVAILABLE
+
 
 @dataclass
 class FilterConfig:
@@ -48,16 +87,17 @@ class FilterConfig:
             }
 
 
-def calculate_paper_age_years(paper: Paper) -> float:
+def calculate_paper_age_years(paper: Paper, now: datetime | None = None) -> float:
     """Calculate paper age in years from published date.
 
     Args:
         paper: Paper to calculate age for
+        now: Reference time (default: current time)
 
     Returns:
         Age in years (fractional)
     """
-    now = datetime.now(UTC)
+    now = now or datetime.now(UTC)
 
     # Ensure paper.published_date is timezone-aware for comparison
     # Some sources (arXiv) return naive dates, others (OpenAlex) return aware dates
@@ -80,94 +120,213 @@ def get_citation_threshold(age_years: float, config: FilterConfig) -> int:
     Returns:
         Minimum citation count required for this age
     """
+    return _threshold_table(config)[bisect.bisect_right(AGE_BIN_EDGES, age_years)]
+
+
+def _threshold_table(config: FilterConfig) -> list[int]:
+    """Return the minimum citations of each age bin."""
     thresholds = config.citation_thresholds or {}
+    return [
+        thresholds.get(key, default) for key, default in zip(AGE_BIN_KEYS, DEFAULT_CITATION_THRESHOLDS, strict=True)
+    ]
 
-    if age_years < 1:
-        return thresholds.get("0-1", 3)
-    elif age_years < 2:
-        return thresholds.get("1-2", 10)
-    elif age_years < 5:
-        return thresholds.get("2-5", 20)
-    else:
-        return thresholds.get("5+", 30)
 
+_REASONS = {
+    QualityOutcome.DISABLED: "Quality filtering disabled",
+    QualityOutcome.ARXIV_UNKNOWN_CITATIONS: "arXiv paper accepted (citation data not available from arXiv API)",
+    QualityOutcome.UNKNOWN_CITATIONS_ALLOWED: "Unknown citation count allowed by config",
+    QualityOutcome.CITATIONS_UNAVAILABLE: "Citation count unavailable",
+    QualityOutcome.BELOW_ABSOLUTE_MINIMUM: "Below absolute minimum ({citations} < {minimum})",
+    QualityOutcome.BELOW_AGE_THRESHOLD: "Below age-adjusted threshold for {age:.1f}yr paper ({citations} < {required})",
+    QualityOutcome.MEETS_THRESHOLD: "Passes: {citations} citations for {age:.1f}yr paper (threshold: {required})",
+}
 
-def passes_quality_filter(paper: Paper, config: FilterConfig) -> tuple[bool, str]:
-    """Determine if paper passes quality filter.
 
-    Source-aware filtering:
-    - arXiv papers: Accepted without citations (arXiv API doesn't provide citation data)
-    - Semantic Scholar papers: Must meet citation thresholds
+def quality_reason(
+    config: FilterConfig, outcome: QualityOutcome, citation_count: int = 0, age_years: float = 0.0, required: int = 0
+) -> str:
+    """Format the human-readable reason for a quality filter outcome."""
+    return _REASONS[outcome].format(
+        citations=citation_count, minimum=config.min_citations_absolute, age=age_years, required=required
+    )
 
-    Args:
-        paper: Paper to evaluate
-        config: Filter configuration
 
-    Returns:
-        (passes, reason) tuple:
-            - passes: True if paper meets quality standards
-            - reason: Human-readable explanation
+def _assess(
+    paper: Paper, config: FilterConfig, now: datetime | None, thresholds: list[int]
+) -> tuple[QualityOutcome, int, float, int]:
+    """Return a paper's outcome and the citation count, age and threshold its reason quotes.
+
+    ``thresholds`` is ``_threshold_table(config)``, computed once by the caller.
     """
     if not config.enabled:
-        return True, "Quality filtering disabled"
+        return QualityOutcome.DISABLED, 0, 0.0, 0
 
     # Handle unknown citation count (source-aware)
     if paper.citation_count is None or paper.citation_count == "Unknown":
         # arXiv API doesn't provide citations, so accept arXiv papers without them
         # For other sources, respect the allow_unknown_citations config
         if paper.source == "arxiv":
-            reason = "arXiv paper accepted (citation data not available from arXiv API)"
+            outcome = QualityOutcome.ARXIV_UNKNOWN_CITATIONS
         elif config.allow_unknown_citations:
-            reason = "Unknown citation count allowed by config"
+            outcome = QualityOutcome.UNKNOWN_CITATIONS_ALLOWED
         else:
-            return False, "Citation count unavailable"
-        return True, reason
+            outcome = QualityOutcome.CITATIONS_UNAVAILABLE
+        return outcome, 0, 0.0, 0
 
     citation_count = int(paper.citation_count) if isinstance(paper.citation_count, str) else paper.citation_count
 
     # Check absolute minimum
     if citation_count < config.min_citations_absolute:
-        return False, f"Below absolute minimum ({citation_count} < {config.min_citations_absolute})"
+        return QualityOutcome.BELOW_ABSOLUTE_MINIMUM, citation_count, 0.0, 0
 
     # Calculate age and get threshold
-    age_years = calculate_paper_age_years(paper)
-    required_citations = get_citation_threshold(age_years, config)
+    age_years = calculate_paper_age_years(paper, now)
+    required_citations = thresholds[bisect.bisect_right(AGE_BIN_EDGES, age_years)]
 
     # Check age-adjusted threshold
     if citation_count < required_citations:
-        return (
-            False,
-            f"Below age-adjusted threshold for {age_years:.1f}yr paper ({citation_count} < {required_citations})",
+        return QualityOutcome.BELOW_AGE_THRESHOLD, citation_count, age_years, required_citations
+    return QualityOutcome.MEETS_THRESHOLD, citation_count, age_years, required_citations
+
+
+def passes_quality_filter(paper: Paper, config: FilterConfig, now: datetime | None = None) -> tuple[bool, str]:
+    """Determine if paper passes quality filter.
+
+    Source-aware filtering:
+    - arXiv papers: Accepted without citations (arXiv API doesn't provide citation data)
+    - Semantic Scholar papers: Must meet citation thresholds
+
+    Args:
+        paper: Paper to evaluate
+        config: Filter configuration
+        now: Reference time for the paper's age (default: current time)
+
+    Returns:
+        (passes, reason) tuple:
+            - passes: True if paper meets quality standards
+            - reason: Human-readable explanation
+    """
+    assessment = _assess(paper, config, now, _threshold_table(config))
+    return assessment[0].passes, quality_reason(config, *assessment)
+
+
+class QualityDecisions:
+    """Quality filter outcomes for every row of a ``PaperBatch``.
+
+    Attributes:
+        outcomes: ``QualityOutcome`` value per row (int8)
+        passed: True for rows that pass
+    """
+
+    def __init__(
+        self,
+        config: FilterConfig,
+        outcomes: "np.ndarray",
+        citations: "np.ndarray",
+        ages: "np.ndarray",
+        required: "np.ndarray",
+    ) -> None:
+        """Hold the per-row outcomes and the values their reasons quote."""
+        self.config = config
+        self.outcomes = outcomes
+        self.passed = outcomes < QualityOutcome.CITATIONS_UNAVAILABLE
+        self._citations = citations
+        self._ages = ages
+        self._required = required
+
+    def __len__(self) -> int:
+        """Return number of rows."""
+        return len(self.outcomes)
+
+    def reason(self, row: int) -> str:
+        """Format the reason for one row, as ``passes_quality_filter`` would."""
+        return quality_reason(
+            self.config,
+            QualityOutcome(int(self.outcomes[row])),
+            int(self._citations[row]),
+            float(self._ages[row]),
+            int(self._required[row]),
         )
 
-    # Passed all checks
-    return True, f"Passes: {citation_count} citations for {age_years:.1f}yr paper (threshold: {required_citations})"
 
+def filter_batch(batch: PaperBatch, config: FilterConfig, now: datetime | None = None) -> QualityDecisions:
+    """Apply the quality filter to a whole batch with array operations.
+
+    Ages are computed from a single reference time and mapped to their
+    citation thresholds with ``searchsorted`` over ``AGE_BIN_EDGES``.
+
+    Args:
+        batch: Papers to evaluate
+        config: Filter configuration
+        now: Reference time for paper ages (default: current time)
+
+    Returns:
+        Outcome per row; decisions equal ``passes_quality_filter`` at the same ``now``
+    """
+    # Whole days, floored like timedelta.days
+    ages = ((epoch_micros(now or datetime.now(UTC)) - batch.published) // _DAY_MICROSECONDS) / 365.25
+    required = np.array(_threshold_table(config))[np.searchsorted(AGE_BIN_EDGES, ages, side="right")]
+    citations = batch.citations
 
-def filter_papers(papers: list[Paper], config: FilterConfig) -> tuple[list[Paper], list[tuple[Paper, str]]]:
+    if not config.enabled:
+        outcomes = np.full(len(batch), QualityOutcome.DISABLED, dtype=np.int8)
+    else:
+        if config.allow_unknown_citations:
+            unknown = QualityOutcome.UNKNOWN_CITATIONS_ALLOWED
+        else:
+            unknown = QualityOutcome.CITATIONS_UNAVAILABLE
+        outcomes = np.select(
+            [
+                ~batch.citations_known & batch.sources.equals("arxiv"),
+                ~batch.citations_known,
+                citations < config.min_citations_absolute,
+                citations < required,
+            ],
+            [
+                QualityOutcome.ARXIV_UNKNOWN_CITATIONS,
+                unknown,
+                QualityOutcome.BELOW_ABSOLUTE_MINIMUM,
+                QualityOutcome.BELOW_AGE_THRESHOLD,
+            ],
+            QualityOutcome.MEETS_THRESHOLD,
+        ).astype(np.int8)
+    return QualityDecisions(config, outcomes, citations, ages, required)
+
+
+def filter_papers(
+    papers: list[Paper], config: FilterConfig, now: datetime | None = None
+) -> tuple[list[Paper], list[tuple[Paper, str]]]:
     """Filter papers by quality criteria.
 
+    All ages are measured from one reference time, and reasons are only
+    formatted for rejected papers (or for every paper at DEBUG level).
+    For papers already held in a ``PaperBatch``, use ``filter_batch``.
+
     Args:
         papers: List of papers to filter
         config: Filter configuration
+        now: Reference time for paper ages (default: current time)
 
     Returns:
         (passed_papers, rejected_papers) tuple:
             - passed_papers: Papers that passed quality filter
             - rejected_papers: List of (paper, rejection_reason) tuples
     """
-    passed: list[Paper] = []
-    rejected: list[tuple[Paper, str]] = []
-
-    for paper in papers:
-        passes, reason = passes_quality_filter(paper, config)
-
-        if passes:
-            passed.append(paper)
-            logger.debug(f"✓ {paper.title[:60]}... - {reason}")
-        else:
-            rejected.append((paper, reason))
-            logger.debug(f"✗ {paper.title[:60]}... - {reason}")
+    now = now or datetime.now(UTC)
+    thresholds = _threshold_table(config)
+    assessments = [_assess(paper, config, now, thresholds) for paper in papers]
+    verdicts = [assessment[0] < QualityOutcome.CITATIONS_UNAVAILABLE for assessment in assessments]
+
+    passed = [paper for paper, passes in zip(papers, verdicts, strict=True) if passes]
+    rejected = [
+        (paper, quality_reason(config, *assessment))
+        for paper, assessment, passes in zip(papers, assessments, verdicts, strict=True)
+        if not passes
+    ]
+
+    if logger.isEnabledFor(logging.DEBUG):
+        for paper, assessment, passes in zip(papers, assessments, verdicts, strict=True):
+            logger.debug(f"{'✓' if passes else '✗'} {paper.title[:60]}... - {quality_reason(config, *assessment)}")
 
     # Summary logging
     logger.info(f"Quality Filter Results: {len(passed)} passed, {len(rejected)} rejected")
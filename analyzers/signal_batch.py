@@ -0,0 +1,242 @@
+"""Vectorized signal scoring over paper corpora."""
+
+import importlib.util
+import math
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from models.paper import Paper
+
+from .patterns import AGREEMENT_METRIC, COMPARATIVE_EFFICIENCY, CROSS_DOMAIN, QUANTIFIED_IMPROVEMENT, SIZE_LIMITATION
+
+# NumPy is an optional dependency; only batch extraction needs it
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+if TYPE_CHECKING:
+    from .signal_extractor import SignalExtractor
+
+# Category order of SignalExtractor.extract and of SignalBatch.scores columns
+CATEGORIES = (
+    "demand",
+    "scarcity",
+    "novelty",
+    "quality",
+    "data_efficiency",
+    "performance",
+    "scale",
+    "commercial",
+    "trend",
+    "quality_indicators",
+    "scaling_potential",
+)
+
+# Categories whose dicts also carry sample phrases of their per-keyword terms
+PHRASE_CATEGORIES = ("quality_indicators", "scaling_potential")
+
+CATEGORY_CAP = 10.0
+
+
+@dataclass(frozen=True)
+class ScoreTerm:
+    """One capped term of a category score: ``min(count * weight, cap)``.
+
+    Attributes:
+        category: Category the term adds to
+        source: Keyword group counted, or name of a per-paper feature flag
+        weight: Points per matched keyword (or for a set flag)
+        cap: Maximum contribution of the term
+        label: Detected label; ``{each}`` expands to every matched keyword of
+            the group and ``{first}`` to the first one, in group order
+    """
+
+    category: str
+    source: str
+    weight: float
+    cap: float
+    label: str
+
+    def labels(self, present: list[str]) -> list[str]:
+        """Return the detected labels, given the matched keywords of the group in group order."""
+        if "{first}" in self.label:
+            present = present[:1]
+        elif "{each}" not in self.label:
+            return [self.label]
+        return [self.label.format(each=kw.replace(" ", "_"), first=kw.replace(" ", "_")) for kw in present]
+
+
+# Per-paper flags computed from the lowercased title and abstract
+PATTERN_FEATURES = {
+    "size_limitation": SIZE_LIMITATION,
+    "comparative_efficiency": COMPARATIVE_EFFICIENCY,
+    "quantified_impact": QUANTIFIED_IMPROVEMENT,
+    "quantified_agreement": AGREEMENT_METRIC,
+    "cross_domain": CROSS_DOMAIN,
+}
+
+# Per-paper flags computed from metadata by SignalExtractor._paper_features
+PAPER_FEATURES = ("high_citation", "moderate_citation", "major_venue")
+
+# The scoring rules of SignalExtractor.extract and extract_batch, in the order
+# they add to the score. A source is a keyword group or one of the flags above;
+# flags count 0 or 1, so their cap is the weight.
+SCORE_TERMS = (
+    ScoreTerm("demand", "scarcity", 2.5, 8.0, "scarcity_complaint"),
+    ScoreTerm("demand", "synthetic", 2.0, 6.0, "synthetic_workaround"),
+    ScoreTerm("scarcity", "collection_cost", 3.0, 9.0, "collection_cost"),
+    ScoreTerm("scarcity", "privacy", 3.5, 9.0, "privacy_restriction"),
+    ScoreTerm("scarcity", "size_limitation", 3.0, 3.0, "size_limitation"),
+    ScoreTerm("novelty", "novelty", 2.0, 7.0, "novelty_markers"),
+    ScoreTerm("novelty", "_multimodal", 4.0, 4.0, "multimodal"),
+    ScoreTerm("novelty", "_emerging_domains", 3.0, 3.0, "emerging_{first}"),
+    ScoreTerm("quality", "quality", 2.5, 8.0, "quality_emphasis"),
+    ScoreTerm("quality", "_expert", 4.0, 4.0, "expert_involvement"),
+    ScoreTerm("quality", "_methodology", 3.0, 3.0, "methodology_emphasis"),
+    ScoreTerm("quality", "_quality_focus", 4.0, 4.0, "explicit_quality_focus"),
+    ScoreTerm("data_efficiency", "data_efficiency", 3.0, 9.0, "efficiency_emphasis"),
+    ScoreTerm("data_efficiency", "comparative_efficiency", 5.0, 5.0, "comparative_efficiency"),
+    ScoreTerm("performance", "performance_impact", 2.0, 6.0, "performance_claims"),
+    ScoreTerm("performance", "quantified_impact", 5.0, 5.0, "quantified_impact"),
+    ScoreTerm("scale", "scale", 3.0, 9.0, "scale_opportunity"),
+    ScoreTerm("scale", "_pretraining", 5.0, 5.0, "pretraining_gap"),
+    ScoreTerm("commercial", "industry", 3.0, 9.0, "industry_mention"),
+    ScoreTerm("commercial", "_regulatory", 4.0, 4.0, "regulatory_need"),
+    ScoreTerm("trend", "high_citation", 6.0, 6.0, "high_citation"),
+    ScoreTerm("trend", "moderate_citation", 4.0, 4.0, "moderate_citation"),
+    ScoreTerm("trend", "major_venue", 5.0, 5.0, "major_venue"),
+    ScoreTerm("quality_indicators", "quality_indicators", 2.5, math.inf, "quality_kw_{each}"),
+    ScoreTerm("quality_indicators", "quantified_agreement", 4.0, 4.0, "quantified_agreement"),
+    ScoreTerm("quality_indicators", "_multi_stage", 3.0, 3.0, "multi_stage_validation"),
+    ScoreTerm("scaling_potential", "scaling_potential", 2.0, math.inf, "scaling_kw_{each}"),
+    ScoreTerm("scaling_potential", "_transfer", 4.0, 4.0, "transfer_learning"),
+    ScoreTerm("scaling_potential", "cross_domain", 5.0, 5.0, "cross_domain"),
+)
+
+TERMS_BY_CATEGORY = {
+    category: tuple(term for term in SCORE_TERMS if term.category == category) for category in CATEGORIES
+}
+
+
+class SignalBatch:
+    """Signals of many papers held as arrays.
+
+    Keyword hits are kept as a sparse paper×keyword matrix in CSR form
+    (``indptr``/``indices``). Term counts and category scores are computed
+    for all papers at once; the per-paper dict that ``SignalExtractor.extract``
+    returns is only built when a paper is indexed.
+
+    Attributes:
+        papers: Papers in row order
+        term_counts: (papers, SCORE_TERMS) matched keyword or flag counts
+        scores: (papers, CATEGORIES) category scores
+    """
+
+    def __init__(
+        self,
+        extractor: "SignalExtractor",
+        papers: list[Paper],
+        indptr: "np.ndarray",
+        indices: "np.ndarray",
+        features: dict[str, "np.ndarray"],
+    ) -> None:
+        """Score a corpus from its keyword matrix and feature flags.
+
+        Args:
+            extractor: Extractor whose matcher produced the matrix
+            papers: Papers in row order
+            indptr: CSR row pointers, length ``len(papers) + 1``
+            indices: CSR column indices into ``extractor.matcher.keywords``
+            features: Per-paper 0/1 flags for the non-keyword term sources
+        """
+        self.papers = papers
+        self.indptr = indptr
+        self.indices = indices
+        self._extractor = extractor
+        self._groups = extractor.matcher.groups
+        self.term_counts = self._count_terms(features)
+        self.scores = self._score_categories()
+
+    def __len__(self) -> int:
+        """Return number of papers."""
+        return len(self.papers)
+
+    def __getitem__(self, row: int) -> dict[str, dict]:
+        """Build the signal dict of one paper."""
+        found = {self._extractor.matcher.keywords[i] for i in self.indices[self.indptr[row] : self.indptr[row + 1]]}
+        signals: dict[str, dict] = {}
+        for column, category in enumerate(CATEGORIES):
+            signals[category] = {"score": float(self.scores[row, column]), "detected": []}
+
+        phrase_keywords: dict[str, list[str]] = {category: [] for category in PHRASE_CATEGORIES}
+        for term, count in zip(SCORE_TERMS, self.term_counts[row], strict=True):
+            if count == 0:
+                continue
+            present = [kw for kw in self._groups.get(term.source, ()) if kw.lower() in found]
+            signals[term.category]["detected"].extend(term.labels(present))
+            if term.category in phrase_keywords and "{each}" in term.label:
+                phrase_keywords[term.category].extend(present)
+
+        paper = self.papers[row]
+        text = f"{paper.title} {paper.abstract}".lower()
+        for category, keywords in phrase_keywords.items():
+            phrases = [
+                phrase
+                for kw in keywords
+                for phrase in self._extractor._extract_sample_phrases(text, kw, context_window=30)
+            ]
+            signals[category]["sample_phrases"] = phrases[:3]
+
+        return signals
+
+    def __iter__(self) -> Iterator[dict[str, dict]]:
+        """Build the signal dict of every paper, one at a time."""
+        return (self[row] for row in range(len(self)))
+
+    def score(self, category: str) -> "np.ndarray":
+        """Return the scores of one category for all papers."""
+        return self.scores[:, CATEGORIES.index(category)]
+
+    def _count_terms(self, features: dict[str, "np.ndarray"]) -> "np.ndarray":
+        """Count matched keywords per keyword term and copy flags per feature term."""
+        keywords = self._extractor.matcher.keywords
+        column = {kw: i for i, kw in enumerate(keywords)}
+        counts = np.zeros((len(self.papers), len(SCORE_TERMS)), dtype=np.int32)
+
+        keyword_terms = [i for i, term in enumerate(SCORE_TERMS) if term.source in self._groups]
+        # keyword×term incidence; a keyword listed twice in a group counts twice, as in KeywordMatches.count
+        incidence = np.zeros((len(keywords), len(keyword_terms)), dtype=np.int64)
+        for j, i in enumerate(keyword_terms):
+            for kw in self._groups[SCORE_TERMS[i].source]:
+                if kw.lower() in column:
+                    incidence[column[kw.lower()], j] += 1
+
+        # Row sums of the sparse matrix times the incidence, via prefix sums over the CSR entries
+        prefix = np.zeros((len(self.indices) + 1, len(keyword_terms)), dtype=np.int64)
+        np.cumsum(incidence[self.indices], axis=0, out=prefix[1:])
+        counts[:, keyword_terms] = prefix[self.indptr[1:]] - prefix[self.indptr[:-1]]
+
+        for i, term in enumerate(SCORE_TERMS):
+            if term.source in features:
+                counts[:, i] = features[term.source]
+            elif term.source not in self._groups:
+                raise KeyError(f"No keyword group or feature named {term.source!r}")
+        return counts
+
+    def _score_categories(self) -> "np.ndarray":
+        """Apply ``min(count * weight, cap)`` per term and cap each category sum."""
+        weights = np.array([term.weight for term in SCORE_TERMS])
+        caps = np.array([term.cap for term in SCORE_TERMS])
+        contributions = np.minimum(self.term_counts * weights, caps)
+
+        scores = np.zeros((len(self.papers), len(CATEGORIES)))
+        for column, category in enumerate(CATEGORIES):
+            # Added term by term in rule order, so floating point sums match extract()
+            total = np.zeros(len(self.papers))
+            for i, term in enumerate(SCORE_TERMS):
+                if term.category == category:
+                    total += contributions[:, i]
+            scores[:, column] = np.minimum(total, CATEGORY_CAP)
+        return scores
@@ -5,8 +5,46 @@ import re
 
 from models.paper import Paper
 
+from .keyword_matcher import KeywordMatcher, KeywordMatches
+from .signal_batch import (
+    CATEGORY_CAP,
+    NUMPY_AVAILABLE,
+    PAPER_FEATURES,
+    PATTERN_FEATURES,
+    PHRASE_CATEGORIES,
+    TERMS_BY_CATEGORY,
+    SignalBatch,
+)
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Fixed term lists checked alongside the configurable keywords. Group names
+# are prefixed so they cannot collide with categories in heuristics.json.
+BUILTIN_TERMS = {
+    "_multimodal": ["multimodal", "multi-modal", "cross-modal"],
+    "_emerging_domains": [
+        "climate",
+        "pandemic",
+        "drug discovery",
+        "autonomous",
+        "precision agriculture",
+        "renewable energy",
+        "carbon capture",
+    ],
+    "_expert": ["expert", "specialist", "clinician", "radiologist"],
+    "_methodology": ["annotation protocol", "quality control", "curation process", "selection criteria"],
+    "_quality_focus": ["quality over quantity", "carefully curated", "strategic selection"],
+    "_pretraining": ["pre-train", "pretrain", "foundation model", "self-supervised"],
+    "_regulatory": ["fda", "hipaa", "gdpr", "regulatory", "compliance"],
+    "_multi_stage": ["multi-stage", "two-stage", "validation pipeline"],
+    "_transfer": ["transfer", "fine-tune", "adapt to", "generalize"],
+}
+
+MAJOR_VENUES = ["neurips", "icml", "iclr", "cvpr", "acl", "emnlp"]
+
 
 class SignalExtractor:
     """Extract value signals from papers using keyword heuristics."""
@@ -15,341 +53,184 @@ class SignalExtractor:
         """Initialize with heuristics configuration."""
         self.config = config
         self.keywords = config.get("keywords", {})
+        # Compiled once; each paper is then scanned a single time for all keywords
+        self.matcher = KeywordMatcher({**self.keywords, **BUILTIN_TERMS})
 
     def extract(self, paper: Paper) -> dict[str, dict]:
         """Extract all signals from a paper."""
         text = f"{paper.title} {paper.abstract}".lower()
+        matches = self.matcher.match(text)
 
         signals = {
-            "demand": self._extract_demand_signals(text, paper),
-            "scarcity": self._extract_scarcity_signals(text),
-            "novelty": self._extract_novelty_signals(text),
-            "quality": self._extract_quality_signals(text),
-            "data_efficiency": self._extract_efficiency_signals(text),
-            "performance": self._extract_performance_signals(text),
-            "scale": self._extract_scale_signals(text),
-            "commercial": self._extract_commercial_signals(text),
+            "demand": self._extract_demand_signals(text, paper, matches),
+            "scarcity": self._extract_scarcity_signals(text, matches),
+            "novelty": self._extract_novelty_signals(text, matches),
+            "quality": self._extract_quality_signals(text, matches),
+            "data_efficiency": self._extract_efficiency_signals(text, matches),
+            "performance": self._extract_performance_signals(text, matches),
+            "scale": self._extract_scale_signals(text, matches),
+            "commercial": self._extract_commercial_signals(text, matches),
             "trend": self._extract_trend_signals(paper),
-            "quality_indicators": self._extract_quality_indicators(text),
-            "scaling_potential": self._extract_scaling_potential(text),
+            "quality_indicators": self._extract_quality_indicators(text, matches),
+            "scaling_potential": self._extract_scaling_potential(text, matches),
         }
 
         return signals
 
-    def _extract_demand_signals(self, text: str, paper: Paper) -> dict:
-        """Extract demand-related signals."""
-        score = 0.0
-        detected = []
-
-        # Scarcity complaints
-        scarcity_keywords = self.keywords.get("scarcity", [])
-        scarcity_matches = sum(1 for kw in scarcity_keywords if kw.lower() in text)
-        if scarcity_matches > 0:
-            score += min(scarcity_matches * 2.5, 8.0)
-            detected.append("scarcity_complaint")
-
-        # Synthetic workarounds
-        synthetic_keywords = self.keywords.get("synthetic", [])
-        synthetic_matches = sum(1 for kw in synthetic_keywords if kw.lower() in text)
-        if synthetic_matches > 0:
-            score += min(synthetic_matches * 2.0, 6.0)
-            detected.append("synthetic_workaround")
-
-        return {"score": min(score, 10.0), "detected": detected}
-
-    def _extract_scarcity_signals(self, text: str) -> dict:
-        """Extract scarcity-related signals."""
-        score = 0.0
-        detected = []
-
-        # Collection costs
-        cost_keywords = self.keywords.get("collection_cost", [])
-        cost_matches = sum(1 for kw in cost_keywords if kw.lower() in text)
-        if cost_matches > 0:
-            score += min(cost_matches * 3.0, 9.0)
-            detected.append("collection_cost")
-
-        # Privacy restrictions
-        privacy_keywords = self.keywords.get("privacy", [])
-        privacy_matches = sum(1 for kw in privacy_keywords if kw.lower() in text)
-        if privacy_matches > 0:
-            score += min(privacy_matches * 3.5, 9.0)
-            detected.append("privacy_restriction")
-
-        # Dataset size mentions
-        size_patterns = [
-            r"only \d+[km]? samples",
-            r"limited to \d+[km]? examples",
-            r"small dataset",
-            r"insufficient.*data",
-        ]
-        for pattern in size_patterns:
-            if re.search(pattern, text):
-                score += 3.0
-                detected.append("size_limitation")
-                break
-
-        return {"score": min(score, 10.0), "detected": detected}
-
-    def _extract_novelty_signals(self, text: str) -> dict:
-        """Extract novelty-related signals."""
-        score = 0.0
-        detected = []
-
-        # Novelty keywords
-        novelty_keywords = self.keywords.get("novelty", [])
-        novelty_matches = sum(1 for kw in novelty_keywords if kw.lower() in text)
-        if novelty_matches > 0:
-            score += min(novelty_matches * 2.0, 7.0)
-            detected.append("novelty_markers")
-
-        # Multimodal mentions
-        if any(term in text for term in ["multimodal", "multi-modal", "cross-modal"]):
-            score += 4.0
-            detected.append("multimodal")
-
-        # Emerging domains
-        emerging_domains = [
-            "climate",
-            "pandemic",
-            "drug discovery",
-            "autonomous",
-            "precision agriculture",
-            "renewable energy",
-            "carbon capture",
-        ]
-        for domain in emerging_domains:
-            if domain in text:
-                score += 3.0
-                detected.append(f"emerging_{domain.replace(' ', '_')}")
-                break
-
-        return {"score": min(score, 10.0), "detected": detected}
-
-    def _extract_quality_signals(self, text: str) -> dict:
-        """Extract quality-related signals."""
-        score = 0.0
-        detected = []
-
-        # Quality keywords
-        quality_keywords = self.keywords.get("quality", [])
-        quality_matches = sum(1 for kw in quality_keywords if kw.lower() in text)
-        if quality_matches > 0:
-            score += min(quality_matches * 2.5, 8.0)
-            detected.append("quality_emphasis")
-
-        # Expert involvement
-        if any(term in text for term in ["expert", "specialist", "clinician", "radiologist"]):
-            score += 4.0
-            detected.append("expert_involvement")
-
-        # Methodology emphasis
-        methodology_terms = ["annotation protocol", "quality control", "curation process", "selection criteria"]
-        if any(term in text for term in methodology_terms):
-            score += 3.0
-            detected.append("methodology_emphasis")
-
-        # Quality over quantity explicit statement
-        if any(phrase in text for phrase in ["quality over quantity", "carefully curated", "strategic selection"]):
-            score += 4.0
-            detected.append("explicit_quality_focus")
-
-        return {"score": min(score, 10.0), "detected": detected}
-
-    def _extract_scale_signals(self, text: str) -> dict:
-        """Extract scale-related signals."""
+    def extract_batch(self, papers: list[Paper]) -> SignalBatch:
+        """Extract signals from many papers at once.
+
+        Scans every paper a single time into a sparse paper×keyword matrix
+        plus pattern and metadata flags, then scores all categories with
+        array arithmetic. ``batch[i]`` equals ``extract(papers[i])``.
+
+        Args:
+            papers: Papers to score
+
+        Returns:
+            Batch with a (papers, categories) score array
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("extract_batch requires numpy; install research-data-analyzer[batch]")
+
+        column = {kw: i for i, kw in enumerate(self.matcher.keywords)}
+        indptr = np.zeros(len(papers) + 1, dtype=np.int64)
+        indices: list[int] = []
+        flags = {name: np.zeros(len(papers), dtype=bool) for name in (*PATTERN_FEATURES, *PAPER_FEATURES)}
+
+        for row, paper in enumerate(papers):
+            text = f"{paper.title} {paper.abstract}".lower()
+            indices.extend(column[kw] for kw in self.matcher.match(text).found())
+            indptr[row + 1] = len(indices)
+            for name, group in PATTERN_FEATURES.items():
+                flags[name][row] = group.search(text)
+            for name, value in self._paper_features(paper).items():
+                flags[name][row] = value
+
+        return SignalBatch(self, papers, indptr, np.array(indices, dtype=np.int32), flags)
+
+    def _score_category(
+        self, category: str, text: str, matches: KeywordMatches | None = None, paper: Paper | None = None
+    ) -> dict:
+        """Score one category by its ``SCORE_TERMS``, the rules ``extract_batch`` applies too.
+
+        Each term adds ``min(count * weight, cap)``; the category total is
+        capped at ``CATEGORY_CAP``.
+        """
         score = 0.0
-        detected = []
+        detected: list[str] = []
+        sample_phrases: list[str] = []
+        paper_features = self._paper_features(paper) if paper is not None else {}
+
+        for term in TERMS_BY_CATEGORY[category]:
+            present: list[str] = []
+            if term.source in PATTERN_FEATURES:
+                count = int(PATTERN_FEATURES[term.source].search(text))
+            elif term.source in PAPER_FEATURES:
+                count = int(paper_features.get(term.source, False))
+            else:
+                if matches is None:
+                    matches = self.matcher.match(text)
+                present = matches.present(term.source)
+                count = len(present)
+            if count == 0:
+                continue
+
+            score += min(count * term.weight, term.cap)
+            detected.extend(term.labels(present))
+            if category in PHRASE_CATEGORIES and "{each}" in term.label and matches is not None:
+                for kw in present:
+                    sample_phrases.extend(
+                        self._extract_sample_phrases(text, kw, context_window=30, positions=matches.positions(kw))
+                    )
+
+        signals: dict = {"score": min(score, CATEGORY_CAP), "detected": detected}
+        if category in PHRASE_CATEGORIES:
+            signals["sample_phrases"] = sample_phrases[:3]  # Limit to top 3
+        return signals
 
-        # Scale keywords
-        scale_keywords = self.keywords.get("scale", [])
-        scale_matches = sum(1 for kw in scale_keywords if kw.lower() in text)
-        if scale_matches > 0:
-            score += min(scale_matches * 3.0, 9.0)
-            detected.append("scale_opportunity")
+    def _paper_features(self, paper: Paper) -> dict[str, bool]:
+        """Return the metadata flags of ``PAPER_FEATURES``."""
+        citations = paper.citation_count or 0
+        return {
+            "high_citation": citations > 50,
+            "moderate_citation": 20 < citations <= 50,
+            "major_venue": self._is_major_venue(paper),
+        }
 
-        # Pre-training mentions
-        if any(term in text for term in ["pre-train", "pretrain", "foundation model", "self-supervised"]):
-            score += 5.0
-            detected.append("pretraining_gap")
+    def _extract_demand_signals(self, text: str, paper: Paper, matches: KeywordMatches | None = None) -> dict:
+        """Extract demand-related signals: scarcity complaints and synthetic workarounds."""
+        return self._score_category("demand", text, matches)
 
-        return {"score": min(score, 10.0), "detected": detected}
+    def _extract_scarcity_signals(self, text: str, matches: KeywordMatches | None = None) -> dict:
+        """Extract scarcity-related signals: collection cost, privacy and dataset size limits."""
+        return self._score_category("scarcity", text, matches)
 
-    def _extract_commercial_signals(self, text: str) -> dict:
-        """Extract commercial viability signals."""
-        score = 0.0
-        detected = []
+    def _extract_novelty_signals(self, text: str, matches: KeywordMatches | None = None) -> dict:
+        """Extract novelty-related signals: novelty markers, multimodality and emerging domains."""
+        return self._score_category("novelty", text, matches)
 
-        # Industry keywords
-        industry_keywords = self.keywords.get("industry", [])
-        industry_matches = sum(1 for kw in industry_keywords if kw.lower() in text)
-        if industry_matches > 0:
-            score += min(industry_matches * 3.0, 9.0)
-            detected.append("industry_mention")
+    def _extract_quality_signals(self, text: str, matches: KeywordMatches | None = None) -> dict:
+        """Extract quality-related signals: quality emphasis, experts, methodology and explicit focus."""
+        return self._score_category("quality", text, matches)
 
-        # Regulatory mentions
-        if any(term in text for term in ["fda", "hipaa", "gdpr", "regulatory", "compliance"]):
-            score += 4.0
-            detected.append("regulatory_need")
+    def _extract_scale_signals(self, text: str, matches: KeywordMatches | None = None) -> dict:
+        """Extract scale-related signals: scale opportunities and pre-training gaps."""
+        return self._score_category("scale", text, matches)
 
-        return {"score": min(score, 10.0), "detected": detected}
+    def _extract_commercial_signals(self, text: str, matches: KeywordMatches | None = None) -> dict:
+        """Extract commercial viability signals: industry and regulatory mentions."""
+        return self._score_category("commercial", text, matches)
 
     def _extract_trend_signals(self, paper: Paper) -> dict:
-        """Extract trend-related signals."""
-        score = 0.0
-        detected = []
-
-        # Citation count (if available)
-        if paper.citation_count and paper.citation_count > 50:
-            score += 6.0
-            detected.append("high_citation")
-        elif paper.citation_count and paper.citation_count > 20:
-            score += 4.0
-            detected.append("moderate_citation")
-
-        # Major venues (from source or venue field)
-        major_venues = ["neurips", "icml", "iclr", "cvpr", "acl", "emnlp"]
-        if paper.venue and any(venue in paper.venue.lower() for venue in major_venues):
-            score += 5.0
-            detected.append("major_venue")
-
-        return {"score": min(score, 10.0), "detected": detected}
-
-    def _extract_efficiency_signals(self, text: str) -> dict:
-        """Extract data efficiency signals."""
-        score = 0.0
-        detected = []
-
-        # Efficiency keywords
-        efficiency_keywords = self.keywords.get("data_efficiency", [])
-        efficiency_matches = sum(1 for kw in efficiency_keywords if kw.lower() in text)
-        if efficiency_matches > 0:
-            score += min(efficiency_matches * 3.0, 9.0)
-            detected.append("efficiency_emphasis")
-
-        # Comparative patterns (high value!)
-        comparative_patterns = [
-            r"(\d+)%\s*(improvement|better|gain)",
-            r"only\s+\d+[km]?\s*(samples|examples)",
-            r"outperform.*\d+[km]?\s*(samples|examples)",
-            r"achieve.*with.*fewer",
-            r"despite.*smaller",
-            r"fraction of.*data",
-        ]
-
-        for pattern in comparative_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                score += 5.0
-                detected.append("comparative_efficiency")
-                break
-
-        return {"score": min(score, 10.0), "detected": detected}
-
-    def _extract_performance_signals(self, text: str) -> dict:
-        """Extract performance improvement signals."""
-        score = 0.0
-        detected = []
-
-        # Performance keywords
-        perf_keywords = self.keywords.get("performance_impact", [])
-        perf_matches = sum(1 for kw in perf_keywords if kw.lower() in text)
-        if perf_matches > 0:
-            score += min(perf_matches * 2.0, 6.0)
-            detected.append("performance_claims")
-
-        # Quantified improvements
-        improvement_patterns = [
-            r"(\d+)%\s*improvement",
-            r"(\d+)%\s*better",
-            r"(\d+)%\s*gain",
-            r"state-of-the-art",
-            r"outperform.*baseline",
-        ]
-
-        for pattern in improvement_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                score += 5.0
-                detected.append("quantified_impact")
-                break
-
-        return {"score": min(score, 10.0), "detected": detected}
-
-    def _extract_quality_indicators(self, text: str) -> dict:
-        """Extract quality assurance and validation signals."""
-        score = 0.0
-        detected = []
-        sample_phrases = []
-
-        # Quality indicator keywords
-        quality_keywords = self.keywords.get("quality_indicators", [])
-        for kw in quality_keywords:
-            if kw.lower() in text:
-                score += 2.5
-                detected.append(f"quality_kw_{kw.replace(' ', '_')}")
-                # Extract sample phrase
-                phrase = self._extract_sample_phrases(text, kw, context_window=30)
-                if phrase:
-                    sample_phrases.extend(phrase)
-
-        # Look for inter-annotator agreement metrics
-        if re.search(r"(kappa|agreement|correlation).*\d+\.\d+", text, re.IGNORECASE):
-            score += 4.0
-            detected.append("quantified_agreement")
-
-        # Multi-stage validation
-        if any(term in text for term in ["multi-stage", "two-stage", "validation pipeline"]):
-            score += 3.0
-            detected.append("multi_stage_validation")
-
-        return {
-            "score": min(score, 10.0),
-            "detected": detected,
-            "sample_phrases": sample_phrases[:3],  # Limit to top 3
-        }
-
-    def _extract_scaling_potential(self, text: str) -> dict:
-        """Extract signals about scaling and generalization potential."""
-        score = 0.0
-        detected = []
-        sample_phrases = []
-
-        # Scaling keywords
-        scaling_keywords = self.keywords.get("scaling_potential", [])
-        for kw in scaling_keywords:
-            if kw.lower() in text:
-                score += 2.0
-                detected.append(f"scaling_kw_{kw.replace(' ', '_')}")
-                phrase = self._extract_sample_phrases(text, kw, context_window=30)
-                if phrase:
-                    sample_phrases.extend(phrase)
-
-        # Look for transfer learning mentions
-        if any(term in text for term in ["transfer", "fine-tune", "adapt to", "generalize"]):
-            score += 4.0
-            detected.append("transfer_learning")
-
-        # Cross-domain applicability
-        if re.search(r"(across|multiple|various)\s+(domains|tasks|datasets)", text, re.IGNORECASE):
-            score += 5.0
-            detected.append("cross_domain")
-
-        return {
-            "score": min(score, 10.0),
-            "detected": detected,
-            "sample_phrases": sample_phrases[:3],
-        }
-
-    def _extract_sample_phrases(self, text: str, keyword: str, context_window: int = 30) -> list[str]:
-        """Extract sample phrases containing the keyword with context."""
+        """Extract trend-related signals: citation count and major venues."""
+        return self._score_category("trend", "", paper=paper)
+
+    def _is_major_venue(self, paper: Paper) -> bool:
+        """Return True if the paper appeared at a major ML venue."""
+        return bool(paper.venue) and any(venue in paper.venue.lower() for venue in MAJOR_VENUES)
+
+    def _extract_efficiency_signals(self, text: str, matches: KeywordMatches | None = None) -> dict:
+        """Extract data efficiency signals: efficiency emphasis and comparative claims."""
+        return self._score_category("data_efficiency", text, matches)
+
+    def _extract_performance_signals(self, text: str, matches: KeywordMatches | None = None) -> dict:
+        """Extract performance improvement signals: performance and quantified claims."""
+        return self._score_category("performance", text, matches)
+
+    def _extract_quality_indicators(self, text: str, matches: KeywordMatches | None = None) -> dict:
+        """Extract quality assurance and validation signals, with sample phrases."""
+        return self._score_category("quality_indicators", text, matches)
+
+    def _extract_scaling_potential(self, text: str, matches: KeywordMatches | None = None) -> dict:
+        """Extract signals about scaling and generalization potential, with sample phrases."""
+        return self._score_category("scaling_potential", text, matches)
+
+    def _extract_sample_phrases(
+        self, text: str, keyword: str, context_window: int = 30, positions: list[int] | None = None
+    ) -> list[str]:
+        """Extract sample phrases containing the keyword with context.
+
+        Args:
+            text: Lowercased text
+            keyword: Keyword to show in context
+            context_window: Characters of context on each side
+            positions: Known start offsets of the keyword (from ``KeywordMatcher``);
+                searched for when omitted
+        """
         phrases = []
         keyword_lower = keyword.lower()
+        if positions is None:
+            positions = [m.start() for m in re.finditer(re.escape(keyword_lower), text)] if keyword_lower else []
 
-        # Find all occurrences
-        start = 0
-        while True:
-            idx = text.find(keyword_lower, start)
-            if idx == -1:
-                break
+        # Occurrences are taken left to right without overlap
+        next_start = 0
+        for idx in positions:
+            if idx < next_start:
+                continue
 
             # Extract context around keyword
             context_start = max(0, idx - context_window)
@@ -363,7 +244,7 @@ class SignalExtractor:
                 phrase = phrase + "..."
 
             phrases.append(phrase)
-            start = idx + len(keyword_lower)
+            next_start = idx + len(keyword_lower)
 
             # Limit to prevent excessive extraction
             if len(phrases) >= 3:
@@ -0,0 +1,266 @@
+"""Token, cost and latency accounting for Claude calls."""
+
+import logging
+import math
+import re
+from dataclasses import asdict, dataclass, fields
+from datetime import UTC, datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Message Batches are billed at half the standard price
+BATCH_DISCOUNT = 0.5
+
+_LIMIT_PATTERN = re.compile(r"^\s*\$?\s*(\d+(?:\.\d+)?)\s*(usd|\$|tokens?|t)?\s*$", re.IGNORECASE)
+
+
+@dataclass
+class TokenUsage:
+    """Input and output tokens reported by the Messages API.
+
+    Attributes:
+        requests: Responses accounted
+        input_tokens: Uncached input tokens
+        cache_creation_input_tokens: Input tokens written to the prompt cache
+        cache_read_input_tokens: Input tokens served from the prompt cache
+        output_tokens: Generated tokens
+    """
+
+    requests: int = 0
+    input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    output_tokens: int = 0
+
+    @property
+    def total_input_tokens(self) -> int:
+        """Return all input tokens, cached or not."""
+        return self.input_tokens + self.cache_creation_input_tokens + self.cache_read_input_tokens
+
+    @property
+    def total_tokens(self) -> int:
+        """Return all input and output tokens."""
+        return self.total_input_tokens + self.output_tokens
+
+    @property
+    def cached_fraction(self) -> float:
+        """Return fraction of input tokens served from the prompt cache."""
+        total = self.total_input_tokens
+        return self.cache_read_input_tokens / total if total else 0.0
+
+    def record(self, usage: Any) -> None:
+        """Add the ``usage`` block of one response."""
+        self.requests += 1
+        for name in ("input_tokens", "cache_creation_input_tokens", "cache_read_input_tokens", "output_tokens"):
+            # Cache fields are None when prompt caching did not apply
+            value = getattr(usage, name, None)
+            if isinstance(value, int):
+                setattr(self, name, getattr(self, name) + value)
+
+    def add(self, other: "TokenUsage") -> None:
+        """Add the counters of another usage record."""
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+
+
+@dataclass(frozen=True)
+class ModelPricing:
+    """Standard prices in USD per million tokens."""
+
+    input: float
+    output: float
+    cache_write: float
+    cache_read: float
+
+    def cost(self, usage: TokenUsage) -> float:
+        """Return the cost of ``usage`` in USD."""
+        return (
+            usage.input_tokens * self.input
+            + usage.cache_creation_input_tokens * self.cache_write
+            + usage.cache_read_input_tokens * self.cache_read
+            + usage.output_tokens * self.output
+        ) / 1_000_000
+
+
+MODEL_PRICING = {
+    "claude-3-haiku-20240307": ModelPricing(input=0.25, output=1.25, cache_write=0.30, cache_read=0.03),
+    "claude-3-5-haiku-20241022": ModelPricing(input=0.80, output=4.00, cache_write=1.00, cache_read=0.08),
+    "claude-3-5-sonnet-20241022": ModelPricing(input=3.00, output=15.00, cache_write=3.75, cache_read=0.30),
+}
+
+# Shortest prompt prefix the API caches; shorter cache_control blocks are billed as plain input
+MIN_CACHEABLE_TOKENS = {
+    "claude-3-haiku-20240307": 2048,
+    "claude-3-5-haiku-20241022": 2048,
+    "claude-3-5-sonnet-20241022": 1024,
+}
+DEFAULT_MIN_CACHEABLE_TOKENS = 1024
+
+# Rough average for English text; good enough to compare against cache minimums
+CHARS_PER_TOKEN = 4
+
+
+def min_cacheable_tokens(model: str) -> int:
+    """Return the shortest prefix ``model`` will write to the prompt cache."""
+    return MIN_CACHEABLE_TOKENS.get(model, DEFAULT_MIN_CACHEABLE_TOKENS)
+
+
+def estimate_tokens(text: str) -> int:
+    """Return a rough token count for ``text``."""
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+@dataclass(frozen=True)
+class SpendLimit:
+    """Spending limit in estimated USD or in tokens."""
+
+    usd: float | None = None
+    tokens: int | None = None
+
+    @classmethod
+    def parse(cls, text: str) -> "SpendLimit | None":
+        """Parse a limit such as ``"5"``, ``"$2.50"``, ``"5usd"`` or ``"200000tokens"``.
+
+        Returns:
+            The limit, or None for ``"0"`` (no limit)
+        """
+        match = _LIMIT_PATTERN.match(text)
+        if not match:
+            raise ValueError(f"Invalid spending limit: {text!r} (expected e.g. 5usd or 200000tokens)")
+        amount, unit = float(match.group(1)), (match.group(2) or "usd").lower()
+        if amount == 0:
+            return None
+        return cls(tokens=int(amount)) if unit.startswith("t") else cls(usd=amount)
+
+    def reached(self, usage: TokenUsage, cost_usd: float) -> bool:
+        """Return True if ``usage`` or ``cost_usd`` reaches the limit."""
+        if self.usd is not None:
+            return cost_usd >= self.usd
+        return self.tokens is not None and usage.total_tokens >= self.tokens
+
+    def __str__(self) -> str:
+        """Return a human-readable limit."""
+        return f"${self.usd:.2f}" if self.usd is not None else f"{self.tokens} tokens"
+
+
+class TokenLedger:
+    """Token, cost and latency accounting for one run.
+
+    Every Claude response is recorded with its source, so usage and
+    estimated cost are available per call (debug log), per source and for
+    the whole run. Cost is estimated from ``MODEL_PRICING``; for unknown
+    models only tokens are tracked. Passing the ``soft_limit`` logs a
+    warning once; callers stop starting new evaluations once
+    ``hard_limit_reached`` is True. Calls already in flight still complete,
+    so the hard limit can be overshot by up to the evaluation concurrency.
+    A batch run is one period; monitor mode calls ``reset`` every UTC day.
+    """
+
+    def __init__(
+        self, model: str, *, soft_limit: SpendLimit | None = None, hard_limit: SpendLimit | None = None
+    ) -> None:
+        """Initialize an empty ledger.
+
+        Args:
+            model: Model whose prices estimate the cost
+            soft_limit: Spending at which a warning is logged
+            hard_limit: Spending at which evaluation stops
+        """
+        self.model = model
+        self.pricing = MODEL_PRICING.get(model)
+        self.soft_limit = soft_limit
+        self.hard_limit = hard_limit
+        self.reset()
+
+        if self.pricing is None and any(limit and limit.usd is not None for limit in (soft_limit, hard_limit)):
+            logger.warning(f"No pricing for model {model}; USD spending limits cannot be enforced")
+
+    def reset(self) -> None:
+        """Start a new accounting period: clear all counters and re-arm both limits."""
+        self.total = TokenUsage()
+        self.by_source: dict[str, TokenUsage] = {}
+        self.cost_usd = 0.0
+        self.cost_by_source: dict[str, float] = {}
+        self.cached_responses = 0
+        self.latencies: list[float] = []
+        self.soft_limit_exceeded = False
+
+    def record(
+        self, usage: Any, *, source: str, latency_seconds: float | None = None, discount: float = 1.0
+    ) -> TokenUsage:
+        """Account for the ``usage`` block of one response.
+
+        Args:
+            usage: Response ``usage`` block
+            source: Source of the evaluated paper
+            latency_seconds: Request latency, if measured
+            discount: Price multiplier, e.g. ``BATCH_DISCOUNT``
+
+        Returns:
+            The tokens of this call
+        """
+        call = TokenUsage()
+        call.record(usage)
+        cost = self.pricing.cost(call) * discount if self.pricing else 0.0
+
+        self.total.add(call)
+        self.by_source.setdefault(source, TokenUsage()).add(call)
+        self.cost_usd += cost
+        self.cost_by_source[source] = self.cost_by_source.get(source, 0.0) + cost
+        if latency_seconds is not None:
+            self.latencies.append(latency_seconds)
+        logger.debug(
+            f"Claude call ({source}): {call.total_input_tokens} input / {call.output_tokens} output tokens, "
+            f"${cost:.4f}" + (f", {latency_seconds:.2f}s" if latency_seconds is not None else "")
+        )
+
+        if self.soft_limit and not self.soft_limit_exceeded and self.soft_limit.reached(self.total, self.cost_usd):
+            self.soft_limit_exceeded = True
+            logger.warning(f"Soft LLM spending limit of {self.soft_limit} exceeded (${self.cost_usd:.2f} so far)")
+        return call
+
+    def record_cache_hit(self) -> None:
+        """Count an evaluation answered from the response cache."""
+        self.cached_responses += 1
+
+    def hard_limit_reached(self) -> bool:
+        """Return True once spending reaches the hard limit."""
+        return self.hard_limit is not None and self.hard_limit.reached(self.total, self.cost_usd)
+
+    def latency_percentiles(self) -> dict[str, float]:
+        """Return p50, p90 and p99 request latency in seconds (nearest rank)."""
+        if not self.latencies:
+            return {}
+        ordered = sorted(self.latencies)
+        return {f"p{p}": ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)] for p in (50, 90, 99)}
+
+    def summary(self) -> dict[str, Any]:
+        """Return a JSON-serializable summary of the run's spending."""
+        return {
+            "recorded_at": datetime.now(UTC).isoformat(),
+            "model": self.model,
+            **asdict(self.total),
+            "cached_responses": self.cached_responses,
+            "estimated_cost_usd": round(self.cost_usd, 6) if self.pricing else None,
+            "latency_seconds": {name: round(value, 3) for name, value in self.latency_percentiles().items()},
+            "by_source": {
+                source: {**asdict(usage), "estimated_cost_usd": round(self.cost_by_source[source], 6)}
+                for source, usage in sorted(self.by_source.items())
+            },
+            "soft_limit_exceeded": self.soft_limit_exceeded,
+            "hard_limit_reached": self.hard_limit_reached(),
+        }
+
+    def log_summary(self) -> None:
+        """Log spending for the run and per source."""
+        cost = f"~${self.cost_usd:.4f}" if self.pricing else "cost unknown"
+        latency = ", ".join(f"{name} {value:.2f}s" for name, value in self.latency_percentiles().items())
+        logger.info(
+            f"LLM spend: {self.total.requests} calls ({self.cached_responses} cached responses), "
+            f"{self.total.total_tokens} tokens, {cost}" + (f" | latency {latency}" if latency else "")
+        )
+        for source, usage in sorted(self.by_source.items()):
+            logger.info(
+                f"  - {source}: {usage.requests} calls, {usage.total_tokens} tokens, ${self.cost_by_source[source]:.4f}"
+            )
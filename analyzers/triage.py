@@ -0,0 +1,132 @@
+"""Cheap pre-LLM triage of papers by weighted signal score."""
+
+import json
+import logging
+import math
+from pathlib import Path
+from typing import Any
+
+from models.paper import Paper
+
+logger = logging.getLogger(__name__)
+
+# heuristics.json signal_weights keys → SignalExtractor categories
+WEIGHT_CATEGORIES = {
+    "demand_signals": "demand",
+    "scarcity_signals": "scarcity",
+    "novelty_signals": "novelty",
+    "quality_signals": "quality",
+    "data_efficiency": "data_efficiency",
+    "performance_impact": "performance",
+    "scale_signals": "scale",
+    "commercial_viability": "commercial",
+    "trend_signals": "trend",
+}
+
+
+def _source_key(name: str) -> str:
+    """Normalize a source name, so "SemanticScholar" and "semantic_scholar" match."""
+    return name.lower().replace("_", "")
+
+
+class TriageScorer:
+    """Rank papers by a weighted composite of their signal scores.
+
+    The composite is the ``signal_weights``-weighted mean of the category
+    scores, so it stays on the 0-10 scale. Papers below ``min_score`` are
+    not sent to the LLM; ``top_k`` additionally limits evaluation to the
+    best K papers of a run. ``priority`` scales the composite by how much
+    the paper's source is trusted and orders the evaluation queue.
+    """
+
+    def __init__(
+        self,
+        signal_weights: dict[str, float],
+        *,
+        min_score: float | None = None,
+        top_k: int | None = None,
+        source_trust: dict[str, float] | None = None,
+    ) -> None:
+        """Initialize from the heuristics ``signal_weights``.
+
+        Args:
+            signal_weights: Weight per signal, keyed as in heuristics.json
+            min_score: Composite below which papers are skipped (None keeps all)
+            top_k: Evaluate at most this many papers per run (None for no limit)
+            source_trust: Priority multiplier per source name (unlisted sources use 1.0)
+        """
+        self.weights = {WEIGHT_CATEGORIES.get(name, name): weight for name, weight in signal_weights.items()}
+        self.min_score = min_score
+        self.top_k = top_k
+        self.source_trust = {_source_key(name): trust for name, trust in (source_trust or {}).items()}
+        self._total_weight = sum(self.weights.values()) or 1.0
+
+    @classmethod
+    def from_config(cls, config: dict, **kwargs: Any) -> "TriageScorer":
+        """Create a scorer from the heuristics ``signal_weights`` and ``source_trust``."""
+        return cls(config.get("signal_weights", {}), source_trust=config.get("source_trust"), **kwargs)
+
+    def score(self, signals: dict[str, dict]) -> float:
+        """Return the weighted composite of a paper's signal scores."""
+        total = sum(weight * signals.get(category, {}).get("score", 0.0) for category, weight in self.weights.items())
+        return total / self._total_weight
+
+    def priority(self, paper: Paper, signals: dict[str, dict]) -> float:
+        """Return the evaluation priority of a paper: its composite scaled by source trust."""
+        return self.score(signals) * self.source_trust.get(_source_key(paper.source), 1.0)
+
+    def passes(self, composite: float) -> bool:
+        """Return True if a composite score clears the threshold."""
+        return self.min_score is None or composite >= self.min_score
+
+    def calibrate(
+        self,
+        index_path: str | Path,
+        *,
+        value_score_minimum: float,
+        recall: float = 0.95,
+        min_samples: int = 20,
+    ) -> float | None:
+        """Set ``min_score`` from the composites of past findings.
+
+        The threshold is the highest composite that still lets ``recall`` of
+        the past findings (value score at or above ``value_score_minimum``)
+        through. Entries written before signal scores were recorded in the
+        index are ignored.
+
+        Args:
+            index_path: Findings ``index.jsonl``
+            value_score_minimum: Value score that made a past paper a finding
+            recall: Fraction of past findings the threshold must keep
+            min_samples: Findings with signal scores needed to calibrate
+
+        Returns:
+            The calibrated threshold, or None if there was too little history
+            (``min_score`` is then left unchanged)
+        """
+        path = Path(index_path)
+        composites: list[float] = []
+        if path.exists():
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    signals = entry.get("signals_detected")
+                    if signals and entry.get("value_score", 0.0) >= value_score_minimum:
+                        composites.append(self.score({name: {"score": score} for name, score in signals.items()}))
+
+        if len(composites) < min_samples:
+            logger.warning(
+                f"Triage calibration skipped: {len(composites)} past findings with signal scores "
+                f"in {path} (need {min_samples})"
+            )
+            return None
+
+        composites.sort()
+        self.min_score = composites[len(composites) - max(1, math.ceil(recall * len(composites)))]
+        logger.info(
+            f"Triage threshold calibrated to {self.min_score:.2f} from {len(composites)} past findings "
+            f"(keeps {recall:.0%})"
+        )
+        return self.min_score
@@ -1,160 +1,38 @@
 """AI-powered value evaluation using Claude."""
 
+import asyncio
 import json
 import logging
 import os
+import random
+import time
+import uuid
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
+from typing import Any
 
-from anthropic import Anthropic
+from anthropic import APIConnectionError, APIStatusError, APITimeoutError, AsyncAnthropic
 
 from models.opportunity import OpportunityAssessment
 from models.paper import Paper
+from persistence.response_cache import ResponseCache
 
 from .blocker_detector import BlockerDetector
 from .confidence_calculator import ConfidenceCalculator
+from .token_ledger import SpendLimit, TokenLedger, TokenUsage, estimate_tokens, min_cacheable_tokens
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MODEL = "claude-3-haiku-20240307"
 
-class ValueEvaluator:
-    """Evaluate commercial value using AI."""
-
-    def __init__(self, config: dict) -> None:
-        """Initialize evaluator."""
-        self.config = config
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
-        self.client = Anthropic(api_key=api_key)
-
-    async def evaluate(self, paper: Paper, signals: dict[str, dict], config: dict) -> OpportunityAssessment | None:
-        """Evaluate opportunity with AI and quality controls."""
-        # Calculate aggregate signal scores
-        signal_scores = {category: data["score"] for category, data in signals.items()}
-
-        # Create prompt for Claude
-        prompt = self._create_evaluation_prompt(paper, signals, signal_scores)
-
-        try:
-            # Call Claude
-            response = self.client.messages.create(
-                model="claude-3-haiku-20240307", max_tokens=2000, messages=[{"role": "user", "content": prompt}]
-            )
-
-            # Parse response - handle different content block types
-            result_text = ""
-            for block in response.content:
-                if hasattr(block, "text"):
-                    result_text = block.text  # type: ignore[attr-defined]
-                    break
-
-            data = self._parse_ai_response(result_text)
-
-            if not data:
-                return None
-
-            # Extract or calculate dual scores
-            tech_score = data.get("technical_contribution_score", 0.0)
-            commercial_score = data.get("commercial_viability_score", 0.0)
-
-            # Calculate weighted value_score (30% technical, 70% commercial)
-            value_score = (tech_score * 0.3) + (commercial_score * 0.7)
-
-            # Detect blockers
-            blocker_detector = BlockerDetector()
-
-            # Try structured blockers first
-            blockers = blocker_detector.detect_from_structured(data.get("blockers", []))
-
-            # Fallback to text-based detection if no structured blockers
-            if not blockers and data.get("concerns"):
-                blockers = blocker_detector.detect_from_text(data["concerns"])
-
-            # Calculate confidence with uncertainty detection
-            confidence_calc = ConfidenceCalculator()
-            confidence, uncertainty_sources = confidence_calc.calculate(data)
-
-            # Create assessment with all new fields
-            assessment = OpportunityAssessment(
-                id=self._generate_id(),
-                paper=paper,
-                data_type_name=data.get("data_type_name", "Unknown Dataset Type"),
-                business_context=data.get("business_context", ""),
-                value_score=value_score,
-                confidence_score=confidence,
-                tier="",  # Will be calculated by __post_init__ using effective_value_score
-                signals_detected=signal_scores,
-                detected_at=datetime.now(UTC),
-                target_customers=data.get("target_customers", ""),
-                market_gap=data.get("market_gap", ""),
-                concerns=data.get("concerns", ""),
-                data_efficiency=data.get("data_efficiency", 0.0),
-                source_quality=data.get("source_quality", 0.0),
-                generalizability=data.get("generalizability", 0.0),
-                dataset_description=data.get("dataset_description", ""),
-                data_collection_method=data.get("data_collection_method", ""),
-                replication_feasibility=data.get("replication_feasibility", ""),
-                # Data specification fields
-                data_needed=data.get("data_needed", ""),
-                scale_impact=data.get("scale_impact", ""),
-                # Dual scoring and blocker fields
-                technical_contribution_score=tech_score,
-                commercial_viability_score=commercial_score,
-                blockers=blockers,
-                uncertainty_sources=uncertainty_sources,
-                effective_value_score=0.0,  # Will be calculated by __post_init__
-            )
-
-            # Calculate tier based on effective score (after blocker caps)
-            assessment.tier = assessment.calculate_tier()
-
-            return assessment
-
-        except Exception as e:
-            logger.error(f"Error evaluating paper {paper.id}: {e}")
-            return None
-
-    def _create_evaluation_prompt(self, paper: Paper, signals: dict, signal_scores: dict) -> str:
-        """Create evaluation prompt for Claude with dual scoring."""
-        # Build main signals summary
-        signals_summary = "\n".join(
-            [
-                f"- {category.replace('_', ' ').title()}: {data['score']:.1f}/10 "
-                f"(detected: {', '.join(data['detected']) if data['detected'] else 'none'})"
-                for category, data in signals.items()
-                if data["score"] > 0 and category not in ["quality_indicators", "scaling_potential"]
-            ]
-        )
-
-        # Build enhanced signals with sample phrases
-        enhanced_signals = []
-        for category in ["quality_indicators", "scaling_potential"]:
-            if category in signals and signals[category]["score"] > 0:
-                data = signals[category]
-                enhanced_signals.append(
-                    f"- {category.replace('_', ' ').title()}: {data['score']:.1f}/10 "
-                    f"(detected: {', '.join(data['detected']) if data['detected'] else 'none'})"
-                )
-                if data.get("sample_phrases"):
-                    for phrase in data["sample_phrases"]:
-                        enhanced_signals.append(f'  • "{phrase}"')
-
-        enhanced_summary = "\n".join(enhanced_signals) if enhanced_signals else "None detected"
+# Bump whenever the evaluation prompt changes so cached responses are not reused
+PROMPT_VERSION = "2"
 
-        return f"""You are analyzing research papers to identify market opportunities for creating NEW datasets.
-
-PAPER INFORMATION:
-Title: {paper.title}
-Abstract: {paper.abstract[:1000]}...
-Published: {paper.published_date.strftime("%Y-%m-%d")}
-Citations: {paper.citation_count or "Unknown"}
-Source: {paper.source}
-
-DETECTED SIGNALS:
-{signals_summary}
-
-ENHANCED QUALITY & SCALING SIGNALS:
-{enhanced_summary}
+# Static part of the evaluation prompt, identical for every paper. It is sent as
+# a system block, cached where the model allows a prefix this short; the paper
+# itself follows in a small user message.
+EVALUATION_INSTRUCTIONS = """\
+You are analyzing research papers to identify market opportunities for creating NEW datasets.
 
 CRITICAL FOCUS: DATA SPECIFICATION
 For each opportunity, you MUST clearly specify:
@@ -191,16 +69,16 @@ Evaluate this paper on TWO INDEPENDENT dimensions:
    - LOW: Minor issue easily addressed
 
 Return ONLY valid JSON with this exact structure:
-{{
+{
     "technical_contribution_score": <float 0-10>,
     "commercial_viability_score": <float 0-10>,
 
     "blockers": [
-        {{
+        {
             "category": "<legal|technical|market|economic>",
             "severity": "<high|medium|low>",
             "description": "<specific concern>"
-        }}
+        }
     ],
 
     "data_type_name": "<concise name>",
@@ -229,7 +107,7 @@ needed and scale impact.>",
     "dataset_description": "<describe the specific dataset(s) used in this research>",
     "data_collection_method": "<how did researchers obtain/collect this data>",
     "replication_feasibility": "<low/medium/high feasibility with 2-3 sentence reasoning>"
-}}
+}
 
 DATA PROVENANCE ANALYSIS:
 - Dataset Description: What specific data did they use? (e.g., "10,000 chest X-rays from 3 hospitals")
@@ -256,6 +134,340 @@ SCORING CRITERIA:
 
 Return only the JSON, no other text."""
 
+# 529 is Anthropic's "overloaded" status; the others are transient server errors
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+class ValueEvaluator:
+    """Evaluate commercial value using AI."""
+
+    def __init__(
+        self,
+        config: dict,
+        *,
+        max_concurrency: int = 4,
+        timeout_seconds: float = 60.0,
+        max_retries: int = 5,
+        retry_base_delay: float = 1.0,
+        retry_max_delay: float = 60.0,
+        response_cache: ResponseCache | None = None,
+        soft_limit: SpendLimit | None = None,
+        hard_limit: SpendLimit | None = None,
+        base_url: str | None = None,
+    ) -> None:
+        """Initialize evaluator.
+
+        Args:
+            config: Heuristics configuration
+            max_concurrency: Maximum number of Claude requests in flight
+            timeout_seconds: Timeout for a single Claude request
+            max_retries: Retries on rate limit, overload and transient errors
+            retry_base_delay: Base delay for jittered exponential backoff
+            retry_max_delay: Upper bound for a single backoff delay
+            response_cache: Cache of raw responses consulted before calling Claude
+            soft_limit: Run spending at which a warning is logged
+            hard_limit: Run spending at which evaluation stops
+            base_url: API endpoint override, e.g. a local mock server (default:
+                ``ANTHROPIC_BASE_URL`` or the Anthropic API)
+        """
+        self.config = config
+        api_key = os.getenv("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+        self.model = DEFAULT_MODEL
+        self.timeout_seconds = timeout_seconds
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.response_cache = response_cache
+        self.ledger = TokenLedger(self.model, soft_limit=soft_limit, hard_limit=hard_limit)
+        # Retries are handled here so backoff is jittered and the concurrency slot is released while waiting
+        self.client = AsyncAnthropic(api_key=api_key, base_url=base_url, timeout=timeout_seconds, max_retries=0)
+        if base_url:
+            logger.info(f"Using Claude API endpoint {base_url}")
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    @property
+    def usage(self) -> TokenUsage:
+        """Return the tokens used by this evaluator so far."""
+        return self.ledger.total
+
+    async def aclose(self) -> None:
+        """Close the underlying API client."""
+        await self.client.close()
+
+    async def evaluate(self, paper: Paper, signals: dict[str, dict], config: dict) -> OpportunityAssessment | None:
+        """Evaluate opportunity with AI and quality controls."""
+        # Calculate aggregate signal scores
+        signal_scores = {category: data["score"] for category, data in signals.items()}
+
+        # Create per-paper prompt; the static instructions are sent as a system block
+        prompt = self._create_paper_prompt(paper, signals, signal_scores)
+
+        try:
+            cached = self.cached_response(paper)
+            if cached is not None:
+                logger.debug(f"Using cached evaluation for {paper.id}")
+                self.ledger.record_cache_hit()
+                return self.build_assessment(paper, signal_scores, cached)
+
+            # Call Claude
+            params = self.build_request_params(prompt)
+            started = time.monotonic()
+            response = await self._call_with_retry(
+                lambda: self.client.messages.create(**params),
+                description=paper.id,
+            )
+            self.ledger.record(
+                getattr(response, "usage", None), source=paper.source, latency_seconds=time.monotonic() - started
+            )
+            result_text = self.response_text(response)
+            assessment = self.build_assessment(paper, signal_scores, result_text)
+            if assessment is not None:
+                self.cache_response(paper, result_text)
+            return assessment
+
+        except Exception as e:
+            logger.error(f"Error evaluating paper {paper.id}: {e}")
+            return None
+
+    def cached_response(self, paper: Paper) -> str | None:
+        """Return the cached raw response for a paper, if any."""
+        if self.response_cache is None:
+            return None
+        return self.response_cache.get(ResponseCache.make_key(paper, self.model, PROMPT_VERSION))
+
+    def cache_response(self, paper: Paper, result_text: str) -> None:
+        """Store a raw response that parsed into an assessment."""
+        if self.response_cache is None:
+            return
+        key = ResponseCache.make_key(paper, self.model, PROMPT_VERSION)
+        self.response_cache.put(key, paper, self.model, PROMPT_VERSION, result_text)
+
+    def build_request_params(self, paper_prompt: str) -> dict[str, Any]:
+        """Return Messages API parameters for a per-paper prompt.
+
+        The shared instructions go in a system block. It is marked with
+        ``cache_control`` only when it reaches the model's minimum cacheable
+        length; the instructions (about 1.2K tokens) are below Haiku's 2048, so
+        with the default model they are billed as plain input on every request.
+        """
+        system: dict[str, Any] = {"type": "text", "text": EVALUATION_INSTRUCTIONS}
+        if self.caches_instructions:
+            system["cache_control"] = {"type": "ephemeral"}
+        return {
+            "model": self.model,
+            "max_tokens": 2000,
+            "system": [system],
+            "messages": [{"role": "user", "content": paper_prompt}],
+        }
+
+    @property
+    def caches_instructions(self) -> bool:
+        """Return True if the model will write the instructions to the prompt cache."""
+        return estimate_tokens(EVALUATION_INSTRUCTIONS) >= min_cacheable_tokens(self.model)
+
+    def log_usage(self) -> None:
+        """Log token usage with cached vs. uncached input tokens."""
+        u = self.usage
+        logger.info(
+            f"Claude token usage: {u.requests} responses, {u.total_input_tokens} input tokens "
+            f"({u.cache_read_input_tokens} cache reads, {u.cache_creation_input_tokens} cache writes, "
+            f"{u.input_tokens} uncached; {u.cached_fraction:.0%} cached), {u.output_tokens} output tokens"
+        )
+
+    @staticmethod
+    def response_text(message: Any) -> str:
+        """Return the first text block of a Claude message."""
+        # Handle different content block types
+        for block in message.content:
+            if hasattr(block, "text"):
+                return block.text
+        return ""
+
+    def build_assessment(
+        self, paper: Paper, signal_scores: dict[str, float], result_text: str
+    ) -> OpportunityAssessment | None:
+        """Turn Claude's raw response into an assessment.
+
+        Args:
+            paper: Evaluated paper
+            signal_scores: Aggregate score per signal category
+            result_text: Raw text returned by Claude
+
+        Returns:
+            Assessment, or None if the response could not be parsed
+        """
+        data = self._parse_ai_response(result_text)
+
+        if not data:
+            return None
+
+        # Extract or calculate dual scores
+        tech_score = data.get("technical_contribution_score", 0.0)
+        commercial_score = data.get("commercial_viability_score", 0.0)
+
+        # Calculate weighted value_score (30% technical, 70% commercial)
+        value_score = (tech_score * 0.3) + (commercial_score * 0.7)
+
+        # Detect blockers
+        blocker_detector = BlockerDetector()
+
+        # Try structured blockers first
+        blockers = blocker_detector.detect_from_structured(data.get("blockers", []))
+
+        # Fallback to text-based detection if no structured blockers
+        if not blockers and data.get("concerns"):
+            blockers = blocker_detector.detect_from_text(data["concerns"])
+
+        # Calculate confidence with uncertainty detection
+        confidence_calc = ConfidenceCalculator()
+        confidence, uncertainty_sources = confidence_calc.calculate(data)
+
+        # Create assessment with all new fields
+        assessment = OpportunityAssessment(
+            id=self._generate_id(paper),
+            paper=paper,
+            data_type_name=data.get("data_type_name", "Unknown Dataset Type"),
+            business_context=data.get("business_context", ""),
+            value_score=value_score,
+            confidence_score=confidence,
+            tier="",  # Will be calculated by __post_init__ using effective_value_score
+            signals_detected=signal_scores,
+            detected_at=datetime.now(UTC),
+            target_customers=data.get("target_customers", ""),
+            market_gap=data.get("market_gap", ""),
+            concerns=data.get("concerns", ""),
+            data_efficiency=data.get("data_efficiency", 0.0),
+            source_quality=data.get("source_quality", 0.0),
+            generalizability=data.get("generalizability", 0.0),
+            dataset_description=data.get("dataset_description", ""),
+            data_collection_method=data.get("data_collection_method", ""),
+            replication_feasibility=data.get("replication_feasibility", ""),
+            # Data specification fields
+            data_needed=data.get("data_needed", ""),
+            scale_impact=data.get("scale_impact", ""),
+            # Dual scoring and blocker fields
+            technical_contribution_score=tech_score,
+            commercial_viability_score=commercial_score,
+            blockers=blockers,
+            uncertainty_sources=uncertainty_sources,
+            effective_value_score=0.0,  # Will be calculated by __post_init__
+        )
+
+        # Calculate tier based on effective score (after blocker caps)
+        assessment.tier = assessment.calculate_tier()
+
+        return assessment
+
+    async def _call_with_retry(
+        self, call: Callable[[], Awaitable[Any]], description: str = "", *, idempotent: bool = True
+    ) -> Any:
+        """Run an API call under the concurrency limit, retrying transient failures.
+
+        Args:
+            call: Factory returning a fresh API call coroutine per attempt
+            description: Label used in log messages
+            idempotent: False for calls that must not run twice; timeouts and
+                connection errors, after which the server may already have
+                acted on the request, are then raised instead of retried
+
+        Returns:
+            Result of the API call
+
+        Raises:
+            Exception: The last error if it is not retryable or retries are exhausted
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self._semaphore:
+                    return await call()
+            except Exception as e:
+                if attempt >= self.max_retries or not self._is_retryable(e):
+                    raise
+                if not idempotent and isinstance(e, APIConnectionError):
+                    raise
+                delay = self._retry_delay(attempt, e)
+                logger.warning(
+                    f"Claude request failed for {description} ({type(e).__name__}), "
+                    f"retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries})"
+                )
+                await asyncio.sleep(delay)
+
+        # Should never reach here, but satisfy type checker
+        raise RuntimeError("Retry logic error")
+
+    def _is_retryable(self, error: Exception) -> bool:
+        """Return True for rate limit, overload, timeout and connection errors."""
+        if isinstance(error, APITimeoutError | APIConnectionError):
+            return True
+        if isinstance(error, APIStatusError):
+            if error.status_code in RETRYABLE_STATUS_CODES:
+                return True
+            body = error.body if isinstance(error.body, dict) else {}
+            return body.get("error", {}).get("type") == "overloaded_error"
+        return False
+
+    def _retry_delay(self, attempt: int, error: Exception) -> float:
+        """Return backoff delay, honoring Retry-After when the API provides it."""
+        if isinstance(error, APIStatusError):
+            retry_after = error.response.headers.get("retry-after")
+            try:
+                if retry_after is not None:
+                    return min(float(retry_after), self.retry_max_delay)
+            except ValueError:
+                pass
+        # Full jitter keeps concurrent workers from retrying in lockstep
+        return random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2**attempt))
+
+    def _create_evaluation_prompt(self, paper: Paper, signals: dict, signal_scores: dict) -> str:
+        """Create the full evaluation prompt for Claude with dual scoring.
+
+        Requests send the two parts separately so the instructions can be
+        served from the prompt cache; this joins them for inspection.
+        """
+        return f"{EVALUATION_INSTRUCTIONS}\n\n{self._create_paper_prompt(paper, signals, signal_scores)}"
+
+    def _create_paper_prompt(self, paper: Paper, signals: dict, signal_scores: dict) -> str:
+        """Create the per-paper part of the evaluation prompt."""
+        # Build main signals summary
+        signals_summary = "\n".join(
+            [
+                f"- {category.replace('_', ' ').title()}: {data['score']:.1f}/10 "
+                f"(detected: {', '.join(data['detected']) if data['detected'] else 'none'})"
+                for category, data in signals.items()
+                if data["score"] > 0 and category not in ["quality_indicators", "scaling_potential"]
+            ]
+        )
+
+        # Build enhanced signals with sample phrases
+        enhanced_signals = []
+        for category in ["quality_indicators", "scaling_potential"]:
+            if category in signals and signals[category]["score"] > 0:
+                data = signals[category]
+                enhanced_signals.append(
+                    f"- {category.replace('_', ' ').title()}: {data['score']:.1f}/10 "
+                    f"(detected: {', '.join(data['detected']) if data['detected'] else 'none'})"
+                )
+                if data.get("sample_phrases"):
+                    for phrase in data["sample_phrases"]:
+                        enhanced_signals.append(f'  • "{phrase}"')
+
+        enhanced_summary = "\n".join(enhanced_signals) if enhanced_signals else "None detected"
+
+        return f"""PAPER INFORMATION:
+Title: {paper.title}
+Abstract: {paper.abstract[:1000]}...
+Published: {paper.published_date.strftime("%Y-%m-%d")}
+Citations: {paper.citation_count or "Unknown"}
+Source: {paper.source}
+
+DETECTED SIGNALS:
+{signals_summary}
+
+ENHANCED QUALITY & SCALING SIGNALS:
+{enhanced_summary}"""
+
     def _parse_ai_response(self, text: str) -> dict | None:
         """Parse AI response, handling various formats."""
         try:
@@ -275,7 +487,11 @@ Return only the JSON, no other text."""
             logger.debug(f"Response text: {text}")
             return None
 
-    def _generate_id(self) -> str:
-        """Generate unique finding ID."""
+    def _generate_id(self, paper: Paper) -> str:
+        """Generate unique finding ID.
+
+        The timestamp has one-second resolution and a batch collects many
+        assessments at once, so the paper id and a random suffix keep ids unique.
+        """
         timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-        return f"rdla_{timestamp}"
+        return f"rdla_{timestamp}_{paper.id}_{uuid.uuid4().hex[:8]}"
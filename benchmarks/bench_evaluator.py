@@ -0,0 +1,150 @@
+"""Throughput benchmark of ValueEvaluator against the local Messages API stand-in.
+
+Evaluates synthetic papers through ``MockMessagesServer`` in-process
+(``httpx.ASGITransport``), so no API key is charged. Reports, per
+concurrency level, wall time, papers per second, injected errors and the
+token usage recorded by the ledger. Also reports a rerun served from the
+response cache and one run through Message Batches.
+
+Usage:
+    python benchmarks/bench_evaluator.py [--papers N] [--concurrency 1,4,16] [--latency-median-ms 300]
+        [--overload-rate 0.05] [--malformed-rate 0.01]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+from anthropic import AsyncAnthropic
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from analyzers.batch_evaluator import BatchEvaluator  # noqa: E402
+from analyzers.mock_messages_server import LatencyModel, MockMessagesServer  # noqa: E402
+from analyzers.value_evaluator import ValueEvaluator  # noqa: E402
+from models.paper import Paper  # noqa: E402
+from persistence.response_cache import ResponseCache  # noqa: E402
+
+MOCK_URL = "http://mock-anthropic"
+SIGNALS = {
+    "data_quality": {"score": 6.0, "detected": ["curated", "expert-annotated"]},
+    "scaling_potential": {"score": 4.0, "detected": ["scale"], "sample_phrases": ["larger datasets would help"]},
+}
+
+
+def make_papers(count: int) -> list[Paper]:
+    """Synthetic papers with distinct titles and abstracts."""
+    return [
+        Paper(
+            id=f"bench_{i}",
+            title=f"Curated Dataset {i} for Few-Shot Learning",
+            abstract=f"We present dataset {i} of expert-annotated examples. " * 20,
+            authors=["A. Author"],
+            published_date=datetime(2025, 1, 1, tzinfo=UTC),
+            source="arxiv",
+            url=f"https://arxiv.org/abs/2501.{i:05d}",
+        )
+        for i in range(count)
+    ]
+
+
+def make_evaluator(server: MockMessagesServer, concurrency: int, cache: ResponseCache | None = None) -> ValueEvaluator:
+    """An evaluator pointed at the in-process mock server."""
+    evaluator = ValueEvaluator(
+        {}, max_concurrency=concurrency, retry_base_delay=0.05, response_cache=cache, base_url=MOCK_URL
+    )
+    evaluator.client = AsyncAnthropic(
+        api_key="mock",
+        base_url=MOCK_URL,
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=server)),
+    )
+    return evaluator
+
+
+async def evaluate_all(evaluator: ValueEvaluator, papers: list[Paper]) -> tuple[int, float]:
+    """Evaluate papers concurrently; return the number of assessments and the elapsed time."""
+    start = time.perf_counter()
+    results = await asyncio.gather(*(evaluator.evaluate(paper, SIGNALS, {}) for paper in papers))
+    return sum(result is not None for result in results), time.perf_counter() - start
+
+
+def report(label: str, papers: int, assessed: int, elapsed: float, server: MockMessagesServer) -> None:
+    """Print one result row."""
+    s = server.stats
+    print(
+        f"  {label:16s} {assessed:4d}/{papers} assessed in {elapsed:6.2f}s ({papers / elapsed:7.1f} papers/s), "
+        f"{s.overloaded} overloaded, {s.rate_limited} rate limited, {s.malformed} malformed, "
+        f"{s.input_tokens + s.cache_read_input_tokens + s.cache_creation_input_tokens} input / "
+        f"{s.output_tokens} output tokens"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run every scenario."""
+    os.environ.setdefault("ANTHROPIC_API_KEY", "mock")
+    papers = make_papers(args.papers)
+
+    def server() -> MockMessagesServer:
+        return MockMessagesServer(
+            latency=LatencyModel(args.latency, args.latency_median_ms / 1000, args.latency_sigma),
+            overload_rate=args.overload_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            malformed_rate=args.malformed_rate,
+            retry_after_seconds=0.1,
+            batch_polls=2,
+        )
+
+    print(
+        f"{args.papers} papers, {args.latency} latency (median {args.latency_median_ms:g} ms), "
+        f"{args.overload_rate:.0%} overloaded, {args.rate_limit_rate:.0%} rate limited, "
+        f"{args.malformed_rate:.0%} malformed"
+    )
+    for concurrency in args.concurrency:
+        mock = server()
+        assessed, elapsed = await evaluate_all(make_evaluator(mock, concurrency), papers)
+        report(f"concurrency {concurrency}", len(papers), assessed, elapsed, mock)
+
+    concurrency = max(args.concurrency)
+    with tempfile.TemporaryDirectory() as scratch:
+        cache = ResponseCache(Path(scratch) / "llm_cache.sqlite")
+        await evaluate_all(make_evaluator(server(), concurrency, cache), papers)
+        mock = server()
+        assessed, elapsed = await evaluate_all(make_evaluator(mock, concurrency, cache), papers)
+        report("cached rerun", len(papers), assessed, elapsed, mock)
+        cache.close()
+
+        mock = server()
+        batch_evaluator = BatchEvaluator(make_evaluator(mock, concurrency), Path(scratch), poll_interval_seconds=0)
+        start = time.perf_counter()
+        outcomes = await batch_evaluator.evaluate_many([(paper, SIGNALS) for paper in papers])
+        assessed = sum(assessment is not None for _, assessment in outcomes)
+        report("message batch", len(papers), assessed, time.perf_counter() - start, mock)
+
+
+def main() -> None:
+    """Parse arguments and run."""
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n")[0])
+    parser.add_argument("--papers", type=int, default=200)
+    parser.add_argument(
+        "--concurrency", type=lambda value: [int(v) for v in value.split(",")], default=[1, 4, 16], help="e.g. 1,4,16"
+    )
+    parser.add_argument("--latency", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--latency-median-ms", type=float, default=50)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--overload-rate", type=float, default=0.05)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.02)
+    parser.add_argument("--malformed-rate", type=float, default=0.01)
+    logging.basicConfig(level=logging.ERROR)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
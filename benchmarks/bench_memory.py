@@ -0,0 +1,151 @@
+"""Memory benchmark for the paper and assessment models.
+
+Builds papers the way the scrapers do, from freshly parsed JSON in which
+every source and venue string is a separate object, and reports the bytes
+allocated per paper for:
+
+* ``legacy``: a plain dataclass as ``Paper`` was defined before (per-instance
+  ``__dict__``, list authors, no interning)
+* ``Paper``: the current mutable model (interned ``source``/``venue``)
+* ``PaperRecord``: the slotted, frozen variant (tuple authors)
+* ``PaperBatch``: the columnar container (needs NumPy)
+
+and per assessment for a dict-based vs. the slotted ``OpportunityAssessment``.
+
+Usage:
+    python benchmarks/bench_memory.py [--papers N]
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields, make_dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models.opportunity import OpportunityAssessment  # noqa: E402
+from models.paper import Paper  # noqa: E402
+from models.paper_batch import NUMPY_AVAILABLE, PaperBatch  # noqa: E402
+
+SOURCES = ["arxiv", "semantic_scholar", "openalex", "papers_with_code", "dblp"]
+VENUES = [f"Proceedings of Conference {i}" for i in range(30)]
+
+
+@dataclass
+class LegacyPaper:
+    """``Paper`` as it was defined before the compact representation."""
+
+    id: str
+    title: str
+    abstract: str
+    authors: list[str]
+    published_date: datetime
+    source: str
+    url: str
+    citation_count: int | None = None
+    venue: str | None = None
+    full_text: str | None = None
+    dataset_mentions: list[str] = field(default_factory=list)
+    doi: str | None = None
+    arxiv_id: str | None = None
+
+
+# Same fields as OpportunityAssessment, without slots
+LegacyAssessment = make_dataclass(
+    "LegacyAssessment",
+    [(f.name, f.type, f) for f in fields(OpportunityAssessment)],
+)
+
+
+def scraped_rows(count: int) -> list[dict]:
+    """Return paper dicts parsed from JSON, like a scraper sees them."""
+    rng = random.Random(0)
+    words = [f"word{i}" for i in range(5000)]
+    rows = [
+        {
+            "id": f"{SOURCES[i % 5]}_{i}",
+            "title": " ".join(rng.choices(words, k=10)),
+            "abstract": " ".join(rng.choices(words, k=180)),
+            "authors": [f"Author {rng.randrange(100000)}" for _ in range(rng.randint(2, 8))],
+            "source": SOURCES[i % 5],
+            "url": f"https://example.org/paper/{i}",
+            "citation_count": rng.randrange(500),
+            "venue": rng.choice(VENUES),
+        }
+        for i in range(count)
+    ]
+    return json.loads(json.dumps(rows))
+
+
+def allocated(build: Callable[[], object]) -> int:
+    """Return bytes still allocated by the objects ``build`` returns."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return after - before
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n")[0])
+    parser.add_argument("--papers", type=int, default=20000, help="Papers to build (default: 20000)")
+    args = parser.parse_args()
+
+    published = datetime(2024, 1, 1, tzinfo=UTC)
+
+    def papers(cls: type) -> Callable[[], list]:
+        # Parsing happens inside the measurement, as the text is part of each paper's cost
+        def build() -> list:
+            return [cls(**row, published_date=published) for row in scraped_rows(args.papers)]
+
+        return build
+
+    print(f"Bytes per paper ({args.papers} papers, ~1.3 KB abstract, 2-8 authors):")
+    results = {name: allocated(papers(cls)) / args.papers for name, cls in [("legacy", LegacyPaper), ("Paper", Paper)]}
+    results["PaperRecord"] = allocated(lambda: [p.compact() for p in papers(Paper)()]) / args.papers
+    if NUMPY_AVAILABLE:
+        results["PaperBatch"] = allocated(lambda: PaperBatch.from_papers(papers(Paper)())) / args.papers
+    baseline = results["legacy"]
+    for name, per_paper in results.items():
+        print(f"  {name:12s} {per_paper:8.0f} B  ({per_paper - baseline:+6.0f} B vs legacy)")
+
+    paper = Paper(**scraped_rows(1)[0], published_date=published)
+
+    def assessments(cls: type) -> Callable[[], list]:
+        def build() -> list:
+            return [
+                cls(
+                    id=f"rdla_{i}",
+                    paper=paper,
+                    data_type_name="Dataset",
+                    business_context="",
+                    value_score=7.0,
+                    confidence_score=7.0,
+                    tier="A",
+                    signals_detected={},
+                    detected_at=published,
+                )
+                for i in range(args.papers)
+            ]
+
+        return build
+
+    print("Bytes per assessment (fields only, shared paper):")
+    legacy = allocated(assessments(LegacyAssessment)) / args.papers
+    slotted = allocated(assessments(OpportunityAssessment)) / args.papers
+    print(f"  {'legacy':12s} {legacy:8.0f} B")
+    print(f"  {'slotted':12s} {slotted:8.0f} B  ({slotted - legacy:+6.0f} B)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Micro-benchmark for the precompiled regex patterns.
+
+Compares the previous approach (raw pattern strings passed to ``re.search``
+on every call, unbounded ``.*`` gaps) with the shared pattern registry on
+typical text and on adversarial inputs built from near misses of the
+greedy patterns.
+
+Usage:
+    python benchmarks/bench_patterns.py [--repeat N]
+"""
+
+import argparse
+import re
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from analyzers.blocker_detector import BlockerDetector  # noqa: E402
+from analyzers.confidence_calculator import ConfidenceCalculator  # noqa: E402
+from analyzers.patterns import (  # noqa: E402
+    AGREEMENT_METRIC,
+    COMPARATIVE_EFFICIENCY,
+    QUANTIFIED_IMPROVEMENT,
+    SIZE_LIMITATION,
+    PatternGroup,
+)
+
+TYPICAL = (
+    "We release a curated dataset of annotated clinical notes. Models trained on it reach strong results "
+    "on three benchmarks, and inter-annotator agreement is reported for every label. "
+) * 20
+
+# Each gap pattern starts matching at every repeated prefix and then fails, so an
+# unbounded ``.*`` rescans the rest of the line once per repetition
+ADVERSARIAL = {
+    "blockers": "violates no market no cost no real " * 2000,
+    "confidence": "however but although despite target potential could might " * 1000,
+    "signals": "kappa agreement outperform achieve despite fraction of " * 1000,
+}
+
+
+def legacy_search(patterns: list[str], text: str, flags: int = 0) -> bool:
+    """Search raw pattern strings the way the analyzers did before."""
+    return any(re.search(pattern, text, flags) for pattern in patterns)
+
+
+def pattern_sets() -> dict[str, list[tuple[list[str], int, PatternGroup]]]:
+    """Return (raw patterns, flags, compiled group) per benchmarked area."""
+    blockers = [
+        (list(group.patterns), group.flags, group)
+        for severities in BlockerDetector.BLOCKER_GROUPS.values()
+        for group in severities.values()
+    ]
+    confidence = [
+        (list(group.patterns), group.flags, group) for group in ConfidenceCalculator.UNCERTAINTY_GROUPS.values()
+    ]
+    signals = [
+        (list(group.patterns), group.flags, group)
+        for group in (SIZE_LIMITATION, COMPARATIVE_EFFICIENCY, QUANTIFIED_IMPROVEMENT, AGREEMENT_METRIC)
+    ]
+    return {"blockers": blockers, "confidence": confidence, "signals": signals}
+
+
+def best_of(func: Callable[[], object], repeat: int, number: int) -> float:
+    """Return the fastest time per call in milliseconds."""
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number * 1000
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions; the best is reported")
+    args = parser.parse_args()
+
+    print(f"{'area':<12}{'input':<13}{'legacy ms':>11}{'compiled ms':>13}{'combined ms':>13}{'speedup':>9}")
+    for area, groups in pattern_sets().items():
+        for label, text in (("typical", TYPICAL.lower()), ("adversarial", ADVERSARIAL[area])):
+            number = 200 if label == "typical" else 3
+
+            def legacy(text: str = text, groups: list = groups) -> list[bool]:
+                return [legacy_search(raw, text, flags) for raw, flags, _ in groups]
+
+            def compiled(text: str = text, groups: list = groups) -> list[bool]:
+                return [group.search(text) for _, _, group in groups]
+
+            def combined(text: str = text, groups: list = groups) -> list[bool]:
+                return [group.combined.search(text) is not None for _, _, group in groups]
+
+            assert legacy() == compiled() == combined()
+            legacy_ms = best_of(legacy, args.repeat, number)
+            compiled_ms = best_of(compiled, args.repeat, number)
+            combined_ms = best_of(combined, args.repeat, number)
+            print(
+                f"{area:<12}{label:<13}{legacy_ms:>11.3f}{compiled_ms:>13.3f}{combined_ms:>13.3f}"
+                f"{legacy_ms / compiled_ms:>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Throughput benchmark of the scrapers against the replay stand-in server.
+
+Runs every source that has a cassette through ``ReplayServer`` in-process
+(``httpx.ASGITransport``), with the settings of ``config/sources.json`` and
+base URLs rewritten by ``replay_sources``. Reports requests, papers and
+wall time per round, plus the stand-in's and the rate limiter's counters.
+
+Without ``--cassettes``, cassettes are recorded first from the arXiv and
+Semantic Scholar samples in ``tests/fixtures``. Record real traffic with
+``main.py --record-cassettes DIR`` for representative numbers.
+
+Usage:
+    python benchmarks/bench_replay.py [--cassettes DIR] [--latency-ms 50] [--throttle-every 20]
+        [--keep-rate-limits] [--rounds 3]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from scrapers import CassetteRecorder, close_scrapers, create_scrapers  # noqa: E402
+from scrapers.cassette import load_cassettes  # noqa: E402
+from scrapers.replay_server import ReplayServer, replay_sources  # noqa: E402
+
+SERVER = "http://standin"
+LOOKBACK_DAYS = 100 * 365  # Fixture papers are old; keep everything the cassettes contain
+
+
+async def record_fixtures(sources: dict, directory: Path) -> None:
+    """Record cassettes of arXiv and Semantic Scholar crawls answered from the test fixtures."""
+    fixtures = ROOT / "tests" / "fixtures"
+    pages = {
+        "export.arxiv.org": ("application/atom+xml", (fixtures / "arxiv_sample.xml").read_text()),
+        "api.semanticscholar.org": ("application/json", (fixtures / "s2_sample.json").read_text()),
+    }
+
+    def network(request: httpx.Request) -> httpx.Response:
+        content_type, body = pages[request.url.host]
+        return httpx.Response(200, text=body, headers={"content-type": content_type})
+
+    recorder = CassetteRecorder()
+    config = {name: {**sources[name], "rate_limit_seconds": 0} for name in ("arxiv", "semantic_scholar")}
+    scrapers = create_scrapers(config, recorder=recorder)
+    scrapers[0].session._client = httpx.AsyncClient(transport=httpx.MockTransport(network))
+    for scraper in scrapers:
+        await scraper.fetch_recent_papers(LOOKBACK_DAYS)
+    await close_scrapers(scrapers)
+    recorder.save(directory)
+
+
+async def crawl(sources: dict, server: ReplayServer) -> tuple[int, dict]:
+    """Fetch every enabled source concurrently through the stand-in; return papers and limiter metrics."""
+    scrapers = create_scrapers(replay_sources(sources, SERVER))
+    scrapers[0].session._client = httpx.AsyncClient(transport=httpx.ASGITransport(app=server))
+    results = await asyncio.gather(
+        *(scraper.fetch_recent_papers(LOOKBACK_DAYS) for scraper in scrapers), return_exceptions=True
+    )
+    metrics = scrapers[0].session.rate_limiter.metrics()
+    await close_scrapers(scrapers)
+    for scraper, result in zip(scrapers, results, strict=True):
+        if isinstance(result, BaseException):
+            print(f"  {scraper.source_name} failed: {result!r}")
+    return sum(len(result) for result in results if isinstance(result, list)), metrics
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark rounds."""
+    configured = json.loads((ROOT / "config" / "sources.json").read_text())
+
+    with tempfile.TemporaryDirectory() as scratch:
+        cassette_dir = Path(args.cassettes) if args.cassettes else Path(scratch)
+        if not args.cassettes:
+            await record_fixtures(configured, cassette_dir)
+        cassettes = load_cassettes(cassette_dir)
+
+    sources = {
+        name: {
+            **config,
+            "enabled": name in cassettes,
+            **({} if args.keep_rate_limits else {"rate_limit_seconds": 0}),
+            "retry_initial_delay_seconds": 0.05,
+        }
+        if isinstance(config, dict) and "base_url" in config
+        else config
+        for name, config in configured.items()
+    }
+    recorded = sum(len(cassette.interactions) for cassette in cassettes.values())
+    print(f"Replaying {recorded} recorded responses from {', '.join(sorted(cassettes))}")
+    print(f"Latency {args.latency_ms:g} ms (+{args.jitter_ms:g} ms jitter), 429 every {args.throttle_every or '-'}")
+
+    for round_number in range(1, args.rounds + 1):
+        server = ReplayServer(
+            cassettes,
+            latency_seconds=args.latency_ms / 1000,
+            latency_jitter_seconds=args.jitter_ms / 1000,
+            throttle_every=args.throttle_every,
+            retry_after_seconds=args.retry_after_seconds,
+            ignore_params=frozenset(args.ignore_param),
+            seed=round_number,
+        )
+        start = time.perf_counter()
+        papers, metrics = await crawl(sources, server)
+        elapsed = time.perf_counter() - start
+        stats = server.stats
+        waited = sum(source["waited_seconds"] for source in metrics.values())
+        print(
+            f"  round {round_number}: {stats.requests:5d} requests, {papers:6d} papers in {elapsed:6.2f}s "
+            f"({stats.requests / elapsed:7.1f} req/s), {stats.throttled} throttled, "
+            f"{stats.empty_pages} empty pages, {stats.not_found} unmatched, {waited:.2f}s rate-limit wait"
+        )
+
+
+def main() -> None:
+    """Parse arguments and run."""
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n")[0])
+    parser.add_argument("--cassettes", help="Directory of recorded <source>.json cassettes")
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--throttle-every", type=int, default=0, help="Answer every Nth request with 429")
+    parser.add_argument("--retry-after-seconds", type=float, default=0.1)
+    parser.add_argument(
+        "--ignore-param", action="append", default=["year"], help="Query parameter left out of matching"
+    )
+    parser.add_argument("--keep-rate-limits", action="store_true", help="Use the configured rate limits")
+    parser.add_argument("--rounds", type=int, default=3)
+    logging.basicConfig(level=logging.ERROR)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
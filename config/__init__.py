@@ -19,9 +19,13 @@ def load_heuristics() -> dict[str, Any]:
         return json.load(f)
 
 
-def load_sources() -> dict[str, Any]:
-    """Load sources configuration."""
-    config_path = Path(__file__).parent / "sources.json"
+def load_sources(config_path: str | Path | None = None) -> dict[str, Any]:
+    """Load sources configuration.
+
+    Args:
+        config_path: Path to config file (default: config/sources.json)
+    """
+    config_path = Path(config_path) if config_path else Path(__file__).parent / "sources.json"
     with open(config_path) as f:
         return json.load(f)
 
@@ -12,11 +12,17 @@ from dotenv import load_dotenv
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from research_data_analyzer.analyzers import SignalExtractor, ValueEvaluator
+from research_data_analyzer.analyzers import (
+    BatchEvaluator,
+    SignalExtractor,
+    SpendLimit,
+    TriageScorer,
+    ValueEvaluator,
+)
 from research_data_analyzer.config import load_heuristics, load_quality_config, load_sources
-from research_data_analyzer.monitor import run_batch_analysis, run_continuous_monitor
-from research_data_analyzer.persistence import OutputWriter
-from research_data_analyzer.scrapers import create_scrapers
+from research_data_analyzer.monitor import LLMBudget, PipelineConfig, run_batch_analysis, run_continuous_monitor
+from research_data_analyzer.persistence import CheckpointStore, HttpCache, OutputWriter, PaperRegistry, ResponseCache
+from research_data_analyzer.scrapers import CassetteRecorder, close_scrapers, create_scrapers
 
 
 def setup_logging(level: str = "INFO") -> None:
@@ -31,12 +37,8 @@ def setup_logging(level: str = "INFO") -> None:
     )
 
 
-async def main() -> None:
-    """Main entry point."""
-    # Load environment variables
-    load_dotenv()
-
-    # Parse arguments
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description="Research Data Landscape Analyzer - Identify dataset creation opportunities"
     )
@@ -64,6 +66,210 @@ async def main() -> None:
         default=os.getenv("FINDINGS_DIR", "./findings"),
         help="Output directory for findings",
     )
+    parser.add_argument(
+        "--max-concurrent-sources",
+        type=int,
+        default=int(os.getenv("MAX_CONCURRENT_SOURCES", "5")),
+        help="Maximum number of paper sources fetched concurrently",
+    )
+    parser.add_argument(
+        "--source-timeout-seconds",
+        type=float,
+        default=float(os.getenv("SOURCE_TIMEOUT_SECONDS", "1800")),
+        help="Per-source fetch timeout in seconds (0 disables)",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=int(os.getenv("QUEUE_SIZE", "100")),
+        help="Capacity of each pipeline stage queue in batch mode",
+    )
+    parser.add_argument(
+        "--analysis-workers",
+        type=int,
+        default=int(os.getenv("ANALYSIS_WORKERS", "0")),
+        help="Processes for quality filtering and signal extraction in batch mode (0 runs them in the main process)",
+    )
+    parser.add_argument(
+        "--analysis-chunk-size",
+        type=int,
+        default=int(os.getenv("ANALYSIS_CHUNK_SIZE", "64")),
+        help="Maximum papers sent to an analysis process at once",
+    )
+    parser.add_argument(
+        "--extract-workers",
+        type=int,
+        default=int(os.getenv("EXTRACT_WORKERS", "2")),
+        help="Signal extraction workers in batch mode",
+    )
+    parser.add_argument(
+        "--evaluate-workers",
+        type=int,
+        default=int(os.getenv("EVALUATE_WORKERS", "4")),
+        help="Concurrent AI evaluations in batch mode",
+    )
+    parser.add_argument(
+        "--evaluation-concurrency",
+        type=int,
+        default=int(os.getenv("EVALUATION_CONCURRENCY", "4")),
+        help="Maximum number of Claude requests in flight",
+    )
+    parser.add_argument(
+        "--evaluation-timeout-seconds",
+        type=float,
+        default=float(os.getenv("EVALUATION_TIMEOUT_SECONDS", "60")),
+        help="Timeout for a single Claude request in seconds",
+    )
+    parser.add_argument(
+        "--evaluation-max-retries",
+        type=int,
+        default=int(os.getenv("EVALUATION_MAX_RETRIES", "5")),
+        help="Retries on rate limit, overload and transient Claude errors",
+    )
+    parser.add_argument(
+        "--evaluation-backend",
+        choices=["messages", "batch"],
+        default=os.getenv("EVALUATION_BACKEND", "messages"),
+        help="Evaluate one request per paper (messages) or through Message Batches (batch, batch mode only)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=int(os.getenv("EVALUATION_BATCH_SIZE", "10000")),
+        help="Maximum papers per message batch",
+    )
+    parser.add_argument(
+        "--batch-poll-interval-seconds",
+        type=float,
+        default=float(os.getenv("BATCH_POLL_INTERVAL_SECONDS", "60")),
+        help="Delay between message batch status checks",
+    )
+    parser.add_argument(
+        "--resume-batch-id",
+        type=str,
+        default=None,
+        help="Collect results of a message batch submitted by an interrupted run instead of crawling",
+    )
+    parser.add_argument(
+        "--anthropic-base-url",
+        type=str,
+        default=os.getenv("ANTHROPIC_BASE_URL"),
+        help="Claude API endpoint, e.g. the local mock server for offline load tests",
+    )
+    parser.add_argument(
+        "--llm-cache-path",
+        type=str,
+        default=os.getenv("LLM_CACHE_PATH"),
+        help="SQLite cache of Claude responses (default: <findings-dir>/llm_cache.sqlite)",
+    )
+    parser.add_argument(
+        "--llm-cache-ttl-days",
+        type=float,
+        default=float(os.getenv("LLM_CACHE_TTL_DAYS", "30")),
+        help="Days a cached Claude response stays valid (0 disables expiry)",
+    )
+    parser.add_argument(
+        "--llm-cache-max-entries",
+        type=int,
+        default=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "50000")),
+        help="Maximum cached Claude responses before least recently used are evicted (0 disables)",
+    )
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Always call Claude instead of reusing cached responses",
+    )
+    parser.add_argument(
+        "--http-cache-path",
+        type=str,
+        default=os.getenv("HTTP_CACHE_PATH"),
+        help="SQLite cache of scraper responses (default: <findings-dir>/http_cache.sqlite)",
+    )
+    parser.add_argument(
+        "--http-cache-ttl-seconds",
+        type=float,
+        default=float(os.getenv("HTTP_CACHE_TTL_SECONDS", "3600")),
+        help="Seconds a cached scraper response is reused before revalidation, unless the source sets "
+        "cache_ttl_seconds",
+    )
+    parser.add_argument(
+        "--no-http-cache",
+        action="store_true",
+        help="Always download scraper responses instead of caching them",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Serve scraper responses only from the HTTP cache; uncached requests fail",
+    )
+    parser.add_argument(
+        "--sources-path",
+        type=str,
+        default=os.getenv("SOURCES_PATH"),
+        help="Sources configuration, e.g. one pointing at the replay stand-in server (default: config/sources.json)",
+    )
+    parser.add_argument(
+        "--record-cassettes",
+        type=str,
+        default=os.getenv("RECORD_CASSETTES"),
+        help="Record every scraper response into <source>.json cassettes in this directory (disables the HTTP cache)",
+    )
+    parser.add_argument(
+        "--paper-registry-path",
+        type=str,
+        default=os.getenv("PAPER_REGISTRY_PATH"),
+        help="Registry of processed papers for monitor mode (default: <findings-dir>/processed_papers.sqlite)",
+    )
+    parser.add_argument(
+        "--checkpoint-path",
+        type=str,
+        default=os.getenv("CHECKPOINT_PATH"),
+        help="Per-source crawl checkpoints for monitor mode (default: <findings-dir>/checkpoints.json)",
+    )
+    parser.add_argument(
+        "--triage-min-score",
+        type=float,
+        default=float(os.getenv("TRIAGE_MIN_SCORE", "0")),
+        help="Only evaluate papers whose weighted signal composite (0-10) reaches this score (0 disables)",
+    )
+    parser.add_argument(
+        "--triage-top-k",
+        type=int,
+        default=int(os.getenv("TRIAGE_TOP_K", "0")),
+        help="Only evaluate the K papers with the highest signal composite per batch run (0 disables)",
+    )
+    parser.add_argument(
+        "--triage-calibrate",
+        action="store_true",
+        help="Derive the triage threshold from past findings in <findings-dir>/index.jsonl",
+    )
+    parser.add_argument(
+        "--triage-recall",
+        type=float,
+        default=float(os.getenv("TRIAGE_RECALL", "0.95")),
+        help="Share of past findings the calibrated triage threshold must keep",
+    )
+    parser.add_argument(
+        "--llm-budget",
+        type=LLMBudget.parse,
+        default=os.getenv("LLM_BUDGET", "0"),
+        help="Claude calls (e.g. 200) or tokens (e.g. 50000tokens) per monitor poll; the highest-priority "
+        "papers are evaluated first and the rest deferred to the next poll (0 disables)",
+    )
+    parser.add_argument(
+        "--soft-budget",
+        type=SpendLimit.parse,
+        default=os.getenv("SOFT_BUDGET", "0"),
+        help="Warn once a run's (monitor: a UTC day's) estimated LLM spend reaches this, e.g. 5usd or 2000000tokens "
+        "(0 disables)",
+    )
+    parser.add_argument(
+        "--hard-budget",
+        type=SpendLimit.parse,
+        default=os.getenv("HARD_BUDGET", "0"),
+        help="Stop evaluating once a run's (monitor: a UTC day's) estimated LLM spend reaches this, e.g. 10usd "
+        "(0 disables)",
+    )
     parser.add_argument(
         "--log-level",
         type=str,
@@ -71,7 +277,98 @@ async def main() -> None:
         help="Log level (DEBUG, INFO, WARNING, ERROR)",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def build_response_cache(args: argparse.Namespace) -> ResponseCache | None:
+    """Open the Claude response cache unless it is disabled."""
+    if args.no_llm_cache:
+        return None
+    path = args.llm_cache_path or Path(args.findings_dir) / "llm_cache.sqlite"
+    logging.getLogger(__name__).info(f"Using LLM response cache: {path}")
+    return ResponseCache(
+        path,
+        ttl_seconds=args.llm_cache_ttl_days * 24 * 3600 or None,
+        max_entries=args.llm_cache_max_entries or None,
+    )
+
+
+def build_http_cache(args: argparse.Namespace) -> HttpCache | None:
+    """Open the scraper response cache unless it is disabled."""
+    if args.record_cassettes and not args.offline:
+        logging.getLogger(__name__).info("Recording cassettes, HTTP cache disabled")
+        return None
+    if args.no_http_cache and not args.offline:
+        return None
+    path = args.http_cache_path or Path(args.findings_dir) / "http_cache.sqlite"
+    logging.getLogger(__name__).info(f"Using HTTP cache: {path}{' (offline)' if args.offline else ''}")
+    return HttpCache(path, default_ttl_seconds=args.http_cache_ttl_seconds, offline=args.offline)
+
+
+def build_batch_evaluator(args: argparse.Namespace, value_evaluator: ValueEvaluator) -> BatchEvaluator | None:
+    """Create the Message Batches evaluator if the batch backend is selected."""
+    logger = logging.getLogger(__name__)
+    if args.evaluation_backend != "batch" and not args.resume_batch_id:
+        return None
+    if args.mode != "batch":
+        logger.warning("Message batch evaluation is only used in batch mode; monitor mode uses messages")
+        return None
+    logger.info("Initialized message batch evaluator")
+    return BatchEvaluator(
+        value_evaluator,
+        Path(args.findings_dir) / ".batches",
+        poll_interval_seconds=args.batch_poll_interval_seconds,
+        max_batch_size=args.batch_size,
+    )
+
+
+def build_triage(args: argparse.Namespace, heuristics: dict) -> TriageScorer | None:
+    """Create the pre-LLM triage scorer if any triage option is set."""
+    if not (args.triage_min_score or args.triage_top_k or args.triage_calibrate):
+        return None
+    triage = TriageScorer.from_config(
+        heuristics,
+        min_score=args.triage_min_score or None,
+        top_k=args.triage_top_k or None,
+    )
+    if args.triage_calibrate and not args.triage_min_score:
+        triage.calibrate(
+            Path(args.findings_dir) / "index.jsonl",
+            value_score_minimum=heuristics.get("thresholds", {}).get("value_score_minimum", 6.0),
+            recall=args.triage_recall,
+        )
+    logging.getLogger(__name__).info(f"Triage: min score {triage.min_score}, top K {triage.top_k}")
+    return triage
+
+
+async def close_components(
+    scrapers: list,
+    value_evaluator: ValueEvaluator,
+    http_cache: HttpCache | None,
+    recorder: CassetteRecorder | None,
+    record_dir: str | None,
+) -> None:
+    """Release network clients, flush the response caches and save recorded cassettes."""
+    await close_scrapers(scrapers)
+    if recorder is not None:
+        recorder.save(record_dir)
+    if http_cache is not None:
+        http_cache.log_stats()
+        http_cache.close()
+    await value_evaluator.aclose()
+    value_evaluator.log_usage()
+    if value_evaluator.response_cache is not None:
+        value_evaluator.response_cache.log_stats()
+        value_evaluator.response_cache.close()
+
+
+async def main() -> None:
+    """Main entry point."""
+    # Load environment variables
+    load_dotenv()
+
+    # Parse arguments
+    args = build_arg_parser().parse_args()
 
     # Setup logging
     setup_logging(args.log_level)
@@ -86,7 +383,7 @@ async def main() -> None:
     # Load configurations
     try:
         heuristics = load_heuristics()
-        sources = load_sources()
+        sources = load_sources(args.sources_path)
         quality_config = load_quality_config()
         logger.info("Loaded configurations")
         logger.info(f"Quality filter: {'enabled' if quality_config.enabled else 'disabled'}")
@@ -96,18 +393,31 @@ async def main() -> None:
 
     # Initialize components
     try:
-        scrapers = create_scrapers(sources)
+        http_cache = build_http_cache(args)
+        recorder = CassetteRecorder() if args.record_cassettes else None
+        scrapers = create_scrapers(sources, http_cache, recorder)
         logger.info(f"Initialized {len(scrapers)} scrapers")
 
         signal_extractor = SignalExtractor(heuristics)
         logger.info("Initialized signal extractor")
 
-        value_evaluator = ValueEvaluator(heuristics)
+        value_evaluator = ValueEvaluator(
+            heuristics,
+            max_concurrency=args.evaluation_concurrency,
+            timeout_seconds=args.evaluation_timeout_seconds,
+            max_retries=args.evaluation_max_retries,
+            response_cache=build_response_cache(args),
+            soft_limit=args.soft_budget,
+            hard_limit=args.hard_budget,
+            base_url=args.anthropic_base_url,
+        )
         logger.info("Initialized value evaluator")
 
         output_writer = OutputWriter(args.findings_dir)
         logger.info("Initialized output writer")
 
+        batch_evaluator = build_batch_evaluator(args, value_evaluator)
+
     except Exception as e:
         logger.error(f"Failed to initialize components: {e}")
         sys.exit(1)
@@ -124,6 +434,18 @@ async def main() -> None:
                 lookback_days=args.lookback_days,
                 config=heuristics,
                 quality_config=quality_config,
+                pipeline_config=PipelineConfig(
+                    queue_size=args.queue_size,
+                    extract_workers=args.extract_workers,
+                    evaluate_workers=args.evaluate_workers,
+                    max_concurrent_sources=args.max_concurrent_sources,
+                    source_timeout_seconds=args.source_timeout_seconds,
+                    analysis_workers=args.analysis_workers,
+                    analysis_chunk_size=args.analysis_chunk_size,
+                ),
+                batch_evaluator=batch_evaluator,
+                resume_batch_id=args.resume_batch_id,
+                triage=build_triage(args, heuristics),
             )
         else:  # monitor mode
             logger.info(f"Starting continuous monitoring (interval: {args.poll_interval_hours}h)")
@@ -134,6 +456,11 @@ async def main() -> None:
                 output_writer=output_writer,
                 poll_interval_hours=args.poll_interval_hours,
                 config=heuristics,
+                max_concurrent_sources=args.max_concurrent_sources,
+                source_timeout_seconds=args.source_timeout_seconds,
+                registry=PaperRegistry(args.paper_registry_path or Path(args.findings_dir) / "processed_papers.sqlite"),
+                checkpoints=CheckpointStore(args.checkpoint_path or Path(args.findings_dir) / "checkpoints.json"),
+                llm_budget=args.llm_budget,
             )
 
     except KeyboardInterrupt:
@@ -141,6 +468,8 @@ async def main() -> None:
     except Exception as e:
         logger.error(f"Error during execution: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        await close_components(scrapers, value_evaluator, http_cache, recorder, args.record_cassettes)
 
 
 if __name__ == "__main__":
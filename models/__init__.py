@@ -1,6 +1,8 @@
 """Data models for the Research Data Landscape Analyzer."""
 
+from .checkpoint import SourceCheckpoint
 from .opportunity import OpportunityAssessment
-from .paper import Paper
+from .paper import Paper, PaperRecord
+from .paper_batch import PaperBatch
 
-__all__ = ["Paper", "OpportunityAssessment"]
+__all__ = ["Paper", "PaperRecord", "PaperBatch", "OpportunityAssessment", "SourceCheckpoint"]
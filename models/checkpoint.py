@@ -0,0 +1,57 @@
+"""Crawl checkpoint data model."""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from .paper import Paper
+
+
+def as_utc(value: datetime) -> datetime:
+    """Return an aware UTC datetime, treating naive values as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+@dataclass
+class SourceCheckpoint:
+    """Crawl position of one source.
+
+    Attributes:
+        source: Scraper source name
+        watermark: Newest publication date processed so far (aware UTC)
+        cursor: Scraper-specific position inside an unfinished crawl, e.g.
+            an OpenAlex ``next_cursor``, a Papers with Code page or an arXiv
+            offset. Empty when the last crawl completed.
+        updated_at: When the checkpoint was last saved
+    """
+
+    source: str
+    watermark: datetime
+    cursor: dict[str, Any] = field(default_factory=dict)
+    updated_at: datetime | None = None
+
+    def advance(self, papers: list[Paper]) -> None:
+        """Move the watermark to the newest publication date in ``papers``."""
+        for paper in papers:
+            self.watermark = max(self.watermark, as_utc(paper.published_date))
+
+    def to_dict(self) -> dict:
+        """Serialize to JSON-compatible dict."""
+        return {
+            "source": self.source,
+            "watermark": self.watermark.isoformat(),
+            "cursor": self.cursor,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SourceCheckpoint":
+        """Restore a checkpoint serialized by ``to_dict``."""
+        return cls(
+            source=data["source"],
+            watermark=as_utc(datetime.fromisoformat(data["watermark"])),
+            cursor=data.get("cursor") or {},
+            updated_at=datetime.fromisoformat(data["updated_at"]) if data.get("updated_at") else None,
+        )
@@ -24,7 +24,7 @@ class BlockerCategory(Enum):
     ECONOMIC = "economic"  # Cost structure, pricing viability
 
 
-@dataclass
+@dataclass(slots=True)
 class Blocker:
     """Represents a commercialization blocker."""
 
@@ -37,7 +37,7 @@ class Blocker:
         return {BlockerSeverity.HIGH: 6.0, BlockerSeverity.MEDIUM: 7.5, BlockerSeverity.LOW: 10.0}[self.severity]
 
 
-@dataclass
+@dataclass(slots=True)
 class UncertaintySource:
     """Represents a source of uncertainty in the assessment."""
 
@@ -45,7 +45,7 @@ class UncertaintySource:
     penalty: float  # Points to deduct from confidence (0-10 scale)
 
 
-@dataclass
+@dataclass(slots=True)
 class OpportunityAssessment:
     """Represents a market opportunity finding."""
 
@@ -1,12 +1,22 @@
 """Paper data model."""
 
-from dataclasses import dataclass, field
+import re
+import sys
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
 
+_DOI_PREFIX = re.compile(r"^(?:https?://(?:dx\.)?doi\.org/|doi:)", re.IGNORECASE)
+_ARXIV_ID = re.compile(r"(?<![\w.])(\d{4}\.\d{4,5}|[a-z][a-z.-]*/\d{7})(?:v\d+)?", re.IGNORECASE)
+
 
 @dataclass
 class Paper:
-    """Represents a research paper."""
+    """Represents a research paper.
+
+    ``source`` and ``venue`` are interned, so the many papers from one
+    source or venue share a single string. Use ``compact`` for a slotted,
+    immutable copy when large numbers of papers are kept in memory.
+    """
 
     id: str
     title: str
@@ -19,3 +29,91 @@ class Paper:
     venue: str | None = None
     full_text: str | None = None
     dataset_mentions: list[str] = field(default_factory=list)
+    doi: str | None = None
+    arxiv_id: str | None = None
+
+    def __post_init__(self) -> None:
+        """Intern the low-cardinality strings."""
+        self.source = sys.intern(self.source)
+        if self.venue is not None:
+            self.venue = sys.intern(self.venue)
+
+    def compact(self) -> "PaperRecord":
+        """Return a slotted, frozen copy of this paper."""
+        return PaperRecord(**_field_values(self))
+
+    def to_dict(self) -> dict:
+        """Serialize to JSON-compatible dict."""
+        return {**asdict(self), "published_date": self.published_date.isoformat()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Paper":
+        """Restore a paper serialized by ``to_dict``."""
+        return cls(**{**data, "published_date": datetime.fromisoformat(data["published_date"])})
+
+
+@dataclass(frozen=True, slots=True)
+class PaperRecord:
+    """Immutable, memory-compact paper.
+
+    Has the same fields as ``Paper`` without a per-instance ``__dict__``;
+    authors and dataset mentions are tuples and ``source``/``venue`` are
+    interned. Code that only reads papers accepts either class.
+    """
+
+    id: str
+    title: str
+    abstract: str
+    authors: tuple[str, ...]
+    published_date: datetime
+    source: str
+    url: str
+    citation_count: int | None = None
+    venue: str | None = None
+    full_text: str | None = None
+    dataset_mentions: tuple[str, ...] = ()
+    doi: str | None = None
+    arxiv_id: str | None = None
+
+    def __post_init__(self) -> None:
+        """Store sequences as tuples and intern the low-cardinality strings."""
+        object.__setattr__(self, "authors", tuple(self.authors))
+        object.__setattr__(self, "dataset_mentions", tuple(self.dataset_mentions))
+        object.__setattr__(self, "source", sys.intern(self.source))
+        if self.venue is not None:
+            object.__setattr__(self, "venue", sys.intern(self.venue))
+
+    def to_paper(self) -> Paper:
+        """Return a mutable ``Paper`` with the same fields."""
+        return Paper(
+            **{
+                **_field_values(self),
+                "authors": list(self.authors),
+                "dataset_mentions": list(self.dataset_mentions),
+            }
+        )
+
+
+def _field_values(paper: Paper | PaperRecord) -> dict:
+    """Return the fields of a paper without copying their values."""
+    return {f.name: getattr(paper, f.name) for f in fields(paper)}
+
+
+def normalize_doi(value: str | None) -> str | None:
+    """Return a DOI without resolver prefix, lowercased, or None if empty."""
+    if not value:
+        return None
+    doi = _DOI_PREFIX.sub("", value.strip()).lower()
+    return doi or None
+
+
+def normalize_arxiv_id(value: str | None) -> str | None:
+    """Return the versionless arXiv identifier in an id or URL, or None if there is none.
+
+    Accepts bare ids (``2401.12345v2``), ``arXiv:`` prefixes, abs/pdf URLs
+    and old-style ids (``cs/0112017``).
+    """
+    if not value:
+        return None
+    match = _ARXIV_ID.search(value)
+    return match.group(1).lower() if match else None
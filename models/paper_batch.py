@@ -0,0 +1,364 @@
+"""Columnar container for many papers.
+
+A ``PaperBatch`` holds papers as a few NumPy arrays instead of one Python
+object per paper and field, so bulk stages can select, deduplicate and
+filter with array operations and ship a chunk to a worker process as a
+handful of buffers. Strings are stored as one UTF-8 buffer plus offsets,
+low-cardinality strings (source, venue) as categorical codes.
+"""
+
+import importlib.util
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from .checkpoint import as_utc
+from .paper import Paper, PaperRecord
+
+# NumPy is an optional dependency; only the columnar batch needs it
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def epoch_micros(value: datetime) -> int:
+    """Return microseconds since the epoch, treating naive values as UTC."""
+    return (as_utc(value) - EPOCH) // _MICROSECOND
+
+
+def _gather_ranges(offsets: "np.ndarray", rows: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """Return the offsets and source positions of the ranges ``rows`` select.
+
+    Args:
+        offsets: Range boundaries, length ``len(ranges) + 1``
+        rows: Ranges to gather, in output order
+
+    Returns:
+        (new_offsets, positions): offsets of the gathered ranges and, for
+        every gathered element, its position in the source buffer
+    """
+    starts = offsets[:-1][rows]
+    lengths = offsets[1:][rows] - starts
+    new_offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=new_offsets[1:])
+    positions = np.repeat(starts - new_offsets[:-1], lengths) + np.arange(new_offsets[-1], dtype=np.int64)
+    return new_offsets, positions
+
+
+@dataclass
+class StringColumn:
+    """Strings stored as one UTF-8 buffer and ``len + 1`` byte offsets.
+
+    Attributes:
+        data: Concatenated UTF-8 bytes (uint8)
+        offsets: Start of each string in ``data``, plus the end of the last
+        valid: False where the value is None; None if no value is missing
+    """
+
+    data: "np.ndarray"
+    offsets: "np.ndarray"
+    valid: "np.ndarray | None" = None
+
+    @classmethod
+    def from_strings(cls, values: Sequence[str | None]) -> "StringColumn":
+        """Encode a sequence of strings, None marking missing values."""
+        encoded = [value.encode() if value is not None else b"" for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        valid = np.array([value is not None for value in values], dtype=bool)
+        return cls(np.frombuffer(b"".join(encoded), dtype=np.uint8).copy(), offsets, None if valid.all() else valid)
+
+    def __len__(self) -> int:
+        """Return number of strings."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row: int) -> str | None:
+        """Decode one string."""
+        if self.valid is not None and not self.valid[row]:
+            return None
+        return self.data[self.offsets[row] : self.offsets[row + 1]].tobytes().decode()
+
+    def to_list(self) -> list[str | None]:
+        """Decode every string."""
+        buffer = self.data.tobytes()
+        bounds = self.offsets.tolist()
+        values = [buffer[start:end].decode() for start, end in zip(bounds, bounds[1:], strict=False)]
+        if self.valid is not None:
+            values = [value if valid else None for value, valid in zip(values, self.valid.tolist(), strict=True)]
+        return values  # type: ignore[return-value]
+
+    def byte_lengths(self) -> "np.ndarray":
+        """Return the encoded length of every string (0 for missing values)."""
+        return np.diff(self.offsets)
+
+    def take(self, rows: "np.ndarray") -> "StringColumn":
+        """Return the strings at ``rows``, in that order."""
+        offsets, positions = _gather_ranges(self.offsets, rows)
+        return StringColumn(self.data[positions], offsets, None if self.valid is None else self.valid[rows])
+
+    def to_fixed_width(self) -> "np.ndarray":
+        """Return the strings as a NumPy bytes (``S``) array for sorting and comparison.
+
+        Trailing NUL bytes are not significant in ``S`` arrays, which does not
+        matter for the identifiers this is used on.
+        """
+        lengths = self.byte_lengths()
+        width = max(1, int(lengths.max(initial=0)))
+        padded = np.zeros((len(self), width), dtype=np.uint8)
+        rows = np.repeat(np.arange(len(self)), lengths)
+        columns = np.arange(len(self.data)) - np.repeat(self.offsets[:-1], lengths)
+        padded[rows, columns] = self.data[: self.offsets[-1]]
+        return padded.view(f"S{width}").ravel()
+
+
+@dataclass
+class ListColumn:
+    """Lists of strings: ``len + 1`` offsets into a flat ``StringColumn``."""
+
+    values: StringColumn
+    offsets: "np.ndarray"
+
+    @classmethod
+    def from_lists(cls, lists: Sequence[Sequence[str]]) -> "ListColumn":
+        """Flatten a sequence of string lists."""
+        offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+        np.cumsum([len(values) for values in lists], out=offsets[1:])
+        return cls(StringColumn.from_strings([value for values in lists for value in values]), offsets)
+
+    def __len__(self) -> int:
+        """Return number of lists."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row: int) -> list[str]:
+        """Decode one list."""
+        return [self.values[i] for i in range(self.offsets[row], self.offsets[row + 1])]  # type: ignore[misc]
+
+    def to_list(self) -> list[list[str]]:
+        """Decode every list."""
+        values = self.values.to_list()
+        bounds = self.offsets.tolist()
+        return [values[start:end] for start, end in zip(bounds, bounds[1:], strict=False)]  # type: ignore[misc]
+
+    def take(self, rows: "np.ndarray") -> "ListColumn":
+        """Return the lists at ``rows``, in that order."""
+        offsets, positions = _gather_ranges(self.offsets, rows)
+        return ListColumn(self.values.take(positions), offsets)
+
+
+@dataclass
+class Categorical:
+    """Low-cardinality strings as integer codes into ``categories`` (-1 for None)."""
+
+    codes: "np.ndarray"
+    categories: tuple[str, ...]
+
+    @classmethod
+    def from_values(cls, values: Sequence[str | None]) -> "Categorical":
+        """Encode values, assigning codes in first-seen order."""
+        lookup: dict[str, int] = {}
+        codes = np.array(
+            [-1 if value is None else lookup.setdefault(value, len(lookup)) for value in values], dtype=np.int32
+        )
+        return cls(codes, tuple(lookup))
+
+    def __len__(self) -> int:
+        """Return number of values."""
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> str | None:
+        """Return one value."""
+        code = self.codes[row]
+        return None if code < 0 else self.categories[code]
+
+    def to_list(self) -> list[str | None]:
+        """Return every value."""
+        lookup = [*self.categories, None]  # code -1 indexes the trailing None
+        return [lookup[code] for code in self.codes.tolist()]
+
+    def equals(self, value: str) -> "np.ndarray":
+        """Return a mask of the rows holding ``value``."""
+        if value not in self.categories:
+            return np.zeros(len(self), dtype=bool)
+        return self.codes == self.categories.index(value)
+
+    def take(self, rows: "np.ndarray") -> "Categorical":
+        """Return the values at ``rows``, in that order."""
+        return Categorical(self.codes[rows], self.categories)
+
+
+class PaperBatch:
+    """Papers stored column by column.
+
+    Build with ``from_papers`` and convert back with ``to_papers`` or by
+    indexing; ``take`` selects rows by index array or boolean mask without
+    decoding any strings.
+
+    Attributes:
+        ids, titles, abstracts, urls: Strings
+        full_texts, dois, arxiv_ids: Strings that may be missing
+        authors, dataset_mentions: Lists of strings
+        sources, venues: Categorical strings
+        published: Publication times as int64 microseconds since the epoch (UTC)
+        published_naive: True where the source date had no timezone; such
+            dates are taken as UTC and decode as naive again, aware dates
+            decode in UTC
+        citations: Citation counts as int64 (0 where unknown)
+        citations_known: False where the citation count is unknown
+    """
+
+    def __init__(self, columns: dict) -> None:
+        """Wrap prebuilt columns; use ``from_papers`` to build a batch.
+
+        Args:
+            columns: Column name to column, for every attribute listed above
+        """
+        self.ids: StringColumn = columns["ids"]
+        self.titles: StringColumn = columns["titles"]
+        self.abstracts: StringColumn = columns["abstracts"]
+        self.urls: StringColumn = columns["urls"]
+        self.full_texts: StringColumn = columns["full_texts"]
+        self.dois: StringColumn = columns["dois"]
+        self.arxiv_ids: StringColumn = columns["arxiv_ids"]
+        self.authors: ListColumn = columns["authors"]
+        self.dataset_mentions: ListColumn = columns["dataset_mentions"]
+        self.sources: Categorical = columns["sources"]
+        self.venues: Categorical = columns["venues"]
+        self.published: np.ndarray = columns["published"]
+        self.published_naive: np.ndarray = columns["published_naive"]
+        self.citations: np.ndarray = columns["citations"]
+        self.citations_known: np.ndarray = columns["citations_known"]
+
+    @classmethod
+    def from_papers(cls, papers: Iterable[Paper | PaperRecord]) -> "PaperBatch":
+        """Build a batch in one pass over ``papers``.
+
+        Citation counts given as strings are parsed like the quality filter
+        does: "Unknown" is stored as unknown, anything else with ``int()``.
+
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If a citation count string is not a number
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("PaperBatch requires numpy; install research-data-analyzer[batch]")
+
+        papers = list(papers)
+        published = [paper.published_date for paper in papers]
+        citations = [_citation_count(paper.citation_count) for paper in papers]
+        return cls(
+            {
+                "ids": StringColumn.from_strings([paper.id for paper in papers]),
+                "titles": StringColumn.from_strings([paper.title for paper in papers]),
+                "abstracts": StringColumn.from_strings([paper.abstract for paper in papers]),
+                "urls": StringColumn.from_strings([paper.url for paper in papers]),
+                "full_texts": StringColumn.from_strings([paper.full_text for paper in papers]),
+                "dois": StringColumn.from_strings([paper.doi for paper in papers]),
+                "arxiv_ids": StringColumn.from_strings([paper.arxiv_id for paper in papers]),
+                "authors": ListColumn.from_lists([paper.authors for paper in papers]),
+                "dataset_mentions": ListColumn.from_lists([paper.dataset_mentions for paper in papers]),
+                "sources": Categorical.from_values([paper.source for paper in papers]),
+                "venues": Categorical.from_values([paper.venue for paper in papers]),
+                "published": np.array([epoch_micros(value) for value in published], dtype=np.int64),
+                "published_naive": np.array([value.tzinfo is None for value in published], dtype=bool),
+                "citations": np.array([count or 0 for count in citations], dtype=np.int64),
+                "citations_known": np.array([count is not None for count in citations], dtype=bool),
+            }
+        )
+
+    def __len__(self) -> int:
+        """Return number of papers."""
+        return len(self.citations)
+
+    def __getitem__(self, row: int) -> Paper:
+        """Decode one paper."""
+        published = EPOCH + int(self.published[row]) * _MICROSECOND
+        return Paper(
+            id=self.ids[row],  # type: ignore[arg-type]
+            title=self.titles[row],  # type: ignore[arg-type]
+            abstract=self.abstracts[row],  # type: ignore[arg-type]
+            authors=self.authors[row],
+            published_date=published.replace(tzinfo=None) if self.published_naive[row] else published,
+            source=self.sources[row],  # type: ignore[arg-type]
+            url=self.urls[row],  # type: ignore[arg-type]
+            citation_count=int(self.citations[row]) if self.citations_known[row] else None,
+            venue=self.venues[row],
+            full_text=self.full_texts[row],
+            dataset_mentions=self.dataset_mentions[row],
+            doi=self.dois[row],
+            arxiv_id=self.arxiv_ids[row],
+        )
+
+    def __iter__(self) -> Iterator[Paper]:
+        """Decode the papers one at a time."""
+        return (self[row] for row in range(len(self)))
+
+    def to_papers(self) -> list[Paper]:
+        """Decode every paper, a column at a time."""
+        published = [EPOCH + micros * _MICROSECOND for micros in self.published.tolist()]
+        columns = zip(
+            self.ids.to_list(),
+            self.titles.to_list(),
+            self.abstracts.to_list(),
+            self.authors.to_list(),
+            [
+                value.replace(tzinfo=None) if naive else value
+                for value, naive in zip(published, self.published_naive, strict=True)
+            ],
+            self.sources.to_list(),
+            self.urls.to_list(),
+            [
+                count if known else None
+                for count, known in zip(self.citations.tolist(), self.citations_known, strict=True)
+            ],
+            self.venues.to_list(),
+            self.full_texts.to_list(),
+            self.dataset_mentions.to_list(),
+            self.dois.to_list(),
+            self.arxiv_ids.to_list(),
+            strict=True,
+        )
+        return [Paper(*values) for values in columns]  # Positional, in Paper field order
+
+    def take(self, rows: "np.ndarray | Sequence[int]") -> "PaperBatch":
+        """Return the papers at ``rows`` (indices or a boolean mask), in that order."""
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        rows = rows.astype(np.int64, copy=False)
+        return PaperBatch(
+            {
+                name: column[rows] if isinstance(column, np.ndarray) else column.take(rows)
+                for name, column in vars(self).items()
+            }
+        )
+
+    def duplicate_mask(self) -> "np.ndarray":
+        """Return True for rows whose id, DOI or arXiv id already appeared in an earlier row.
+
+        This is the exact-identifier part of deduplication; fuzzy title matching
+        stays with ``analyzers.paper_resolver.PaperResolver``.
+        """
+        duplicate = np.zeros(len(self), dtype=bool)
+        for column in (self.ids, self.dois, self.arxiv_ids):
+            rows = np.arange(len(self)) if column.valid is None else np.flatnonzero(column.valid)
+            if not len(rows):
+                continue
+            # np.unique returns each value's first index; later occurrences map to it
+            _, first, inverse = np.unique(column.take(rows).to_fixed_width(), return_index=True, return_inverse=True)
+            duplicate[rows] |= first[inverse] != np.arange(len(rows))
+        return duplicate
+
+    def unique(self) -> "PaperBatch":
+        """Return the batch without rows ``duplicate_mask`` flags."""
+        return self.take(~self.duplicate_mask())
+
+
+def _citation_count(value: int | str | None) -> int | None:
+    """Return a citation count as int, or None if unknown."""
+    if value == "Unknown":
+        return None
+    return int(value) if isinstance(value, str) else value
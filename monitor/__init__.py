@@ -2,5 +2,14 @@
 
 from .batch_processor import run_batch_analysis
 from .continuous_monitor import run_continuous_monitor
+from .evaluation_queue import LLMBudget
+from .pipeline import PaperPipeline, PipelineConfig, PipelineStats
 
-__all__ = ["run_batch_analysis", "run_continuous_monitor"]
+__all__ = [
+    "LLMBudget",
+    "run_batch_analysis",
+    "run_continuous_monitor",
+    "PaperPipeline",
+    "PipelineConfig",
+    "PipelineStats",
+]
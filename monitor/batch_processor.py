@@ -2,9 +2,13 @@
 
 import logging
 
-from research_data_analyzer.analyzers import SignalExtractor, ValueEvaluator
-from research_data_analyzer.analyzers.quality_filter import FilterConfig, filter_papers
-from research_data_analyzer.persistence import OutputWriter
+from analyzers import BatchEvaluator, SignalExtractor, ValueEvaluator
+from analyzers.quality_filter import FilterConfig
+from analyzers.triage import TriageScorer
+from persistence import OutputWriter
+
+from .pipeline import PaperPipeline, PipelineConfig, PipelineStats
+from .source_fetcher import log_fetch_summary
 
 logger = logging.getLogger(__name__)
 
@@ -17,83 +21,92 @@ async def run_batch_analysis(
     lookback_days: int,
     config: dict,
     quality_config: FilterConfig,
-) -> None:
-    """Run one-time batch analysis of recent papers."""
+    *,
+    pipeline_config: PipelineConfig | None = None,
+    batch_evaluator: BatchEvaluator | None = None,
+    resume_batch_id: str | None = None,
+    triage: TriageScorer | None = None,
+) -> PipelineStats:
+    """Run one-time batch analysis of recent papers.
+
+    Papers are streamed page by page through the analysis pipeline, so AI
+    evaluation starts while sources are still being crawled. With a
+    ``batch_evaluator`` papers are evaluated through Message Batches; passing
+    ``resume_batch_id`` collects a batch submitted by an interrupted run
+    instead of crawling again. A ``triage`` scorer limits which papers are
+    sent to the LLM. The run's token usage, estimated cost and latency are
+    logged at the end and appended to ``usage.jsonl`` in the findings directory.
+    """
+    pipeline = PaperPipeline(
+        signal_extractor,
+        value_evaluator,
+        output_writer,
+        config,
+        quality_config,
+        pipeline_config=pipeline_config,
+        batch_evaluator=batch_evaluator,
+        triage=triage,
+    )
+
+    if resume_batch_id:
+        logger.info(f"Resuming message batch {resume_batch_id}")
+        stats = await pipeline.resume_batch(resume_batch_id)
+        logger.info(f"Evaluated: {stats.evaluated} ({stats.failed_evaluations} failed)")
+        logger.info(f"Batch resume complete. Found {stats.findings} opportunities.")
+        record_usage_summary(stats, value_evaluator, output_writer)
+        return stats
+
+    if batch_evaluator:
+        for batch_id in batch_evaluator.pending_batch_ids():
+            logger.warning(f"Message batch {batch_id} was never collected; resume it with --resume-batch-id {batch_id}")
+
     logger.info(f"Starting batch analysis (lookback: {lookback_days} days)")
+    stats = await pipeline.run(scrapers, lambda scraper: scraper.iter_recent_papers(lookback_days))
 
-    # Fetch from all sources
-    all_papers = []
-    for scraper in scrapers:
-        try:
-            logger.info(f"Fetching papers from {scraper.source_name}...")
-            papers = await scraper.fetch_recent_papers(lookback_days)
-            all_papers.extend(papers)
-            logger.info(f"Fetched {len(papers)} papers from {scraper.source_name}")
-        except Exception as e:
-            logger.error(f"Error fetching from {scraper.source_name}: {e}")
-            continue
-
-    # Deduplicate by paper ID
-    unique_papers = _deduplicate_papers(all_papers)
-    logger.info(f"Total unique papers: {len(unique_papers)}")
-
-    # Apply quality filter
     logger.info("=" * 60)
-    logger.info("Applying quality filter...")
-    filtered_papers, rejected_papers = filter_papers(unique_papers, quality_config)
-    logger.info(f"Quality filter: {len(filtered_papers)} passed, {len(rejected_papers)} rejected")
+    log_fetch_summary(stats.sources)
+    logger.info(f"Total unique papers: {stats.unique} ({stats.duplicates} duplicates)")
+    logger.info(f"Quality filter: {stats.unique - stats.rejected} passed, {stats.rejected} rejected")
+    for reason_type, count in stats.rejection_reasons.most_common():
+        logger.info(f"  - {reason_type}: {count}")
+    logger.info(f"Weak signals skipped: {stats.weak_signals}")
+    if stats.failed_analyses:
+        logger.info(f"Not analyzed (worker chunk failed): {stats.failed_analyses}")
+    if triage is not None:
+        log_triage_savings(stats, value_evaluator)
+    if stats.over_budget:
+        logger.info(f"Not evaluated (hard spending limit): {stats.over_budget}")
+    logger.info(f"Evaluated: {stats.evaluated} ({stats.failed_evaluations} failed)")
+    record_usage_summary(stats, value_evaluator, output_writer)
     logger.info("=" * 60)
 
-    # Process each paper
-    threshold = config.get("thresholds", {}).get("value_score_minimum", 6.0)
-    findings_count = 0
-
-    for i, paper in enumerate(filtered_papers, 1):
-        logger.info(f"Processing paper {i}/{len(filtered_papers)}: {paper.title[:60]}...")
-
-        try:
-            # Extract signals
-            signals = signal_extractor.extract(paper)
-
-            # Check if any strong signals detected
-            max_signal = max((s["score"] for s in signals.values()), default=0)
-            if max_signal < 5.0:
-                logger.debug(f"Skipping paper (weak signals): {paper.title[:60]}")
-                continue
-
-            # Evaluate with AI
-            assessment = await value_evaluator.evaluate(paper, signals, config)
-
-            if not assessment:
-                logger.warning(f"Failed to evaluate paper: {paper.title[:60]}")
-                continue
-
-            # Save if meets threshold
-            if assessment.value_score >= threshold:
-                output_writer.write_finding(assessment)
-                findings_count += 1
-                logger.info(
-                    f"🔥 [{assessment.tier}] {assessment.data_type_name} "
-                    f"(value: {assessment.value_score:.1f}, confidence: {assessment.confidence_score:.1f})"
-                )
-            else:
-                logger.debug(f"Below threshold ({assessment.value_score:.1f} < {threshold}): {paper.title[:60]}")
-
-        except Exception as e:
-            logger.error(f"Error processing paper {paper.id}: {e}")
-            continue
-
-    logger.info(f"Batch analysis complete. Found {findings_count} opportunities.")
-
-
-def _deduplicate_papers(papers: list) -> list:
-    """Deduplicate papers by ID."""
-    seen_ids = set()
-    unique = []
-
-    for paper in papers:
-        if paper.id not in seen_ids:
-            seen_ids.add(paper.id)
-            unique.append(paper)
-
-    return unique
+    logger.info(f"Batch analysis complete. Found {stats.findings} opportunities.")
+    return stats
+
+
+def log_triage_savings(stats: PipelineStats, value_evaluator: ValueEvaluator) -> None:
+    """Log LLM calls and tokens avoided by triage.
+
+    Tokens are estimated from the average usage of the calls actually made.
+    """
+    usage = value_evaluator.usage
+    if usage.requests:
+        tokens_per_call = (usage.total_input_tokens + usage.output_tokens) / usage.requests
+        estimate = f"~{stats.triaged * tokens_per_call:,.0f} tokens"
+    else:
+        estimate = "token savings unknown (no calls made)"
+    logger.info(f"Triage skipped: {stats.triaged} papers ({stats.triaged} LLM calls, {estimate} avoided)")
+
+
+def record_usage_summary(stats: PipelineStats, value_evaluator: ValueEvaluator, output_writer: OutputWriter) -> None:
+    """Log the run's LLM spending and persist it next to the findings index."""
+    ledger = value_evaluator.ledger
+    ledger.log_summary()
+    summary = {
+        **ledger.summary(),
+        "evaluated": stats.evaluated,
+        "findings": stats.findings,
+        "over_budget": stats.over_budget,
+    }
+    path = output_writer.write_usage_summary(summary)
+    logger.info(f"Usage summary written to {path}")
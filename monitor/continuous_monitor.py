@@ -2,10 +2,15 @@
 
 import asyncio
 import logging
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 
-from analyzers import SignalExtractor, ValueEvaluator
-from persistence import OutputWriter
+from analyzers import SignalExtractor, TriageScorer, ValueEvaluator
+from models.paper import Paper, PaperRecord
+from persistence import CheckpointStore, OutputWriter, PaperOutcome, PaperRegistry
+from scrapers.base import BaseScraper
+
+from .evaluation_queue import EvaluationBacklog, LLMBudget
+from .source_fetcher import fetch_all_sources, log_fetch_summary, time_limited_pages
 
 logger = logging.getLogger(__name__)
 
@@ -17,42 +22,103 @@ async def run_continuous_monitor(
     output_writer: OutputWriter,
     poll_interval_hours: int,
     config: dict,
+    *,
+    max_concurrent_sources: int = 5,
+    source_timeout_seconds: float | None = None,
+    registry: PaperRegistry | None = None,
+    checkpoints: CheckpointStore | None = None,
+    llm_budget: LLMBudget | None = None,
+    triage: TriageScorer | None = None,
 ) -> None:
-    """Run continuous monitoring for new papers."""
+    """Run continuous monitoring for new papers.
+
+    Each source is crawled incrementally from its own checkpoint, which is
+    saved after every processed page, so a restart resumes exactly where
+    the previous process stopped. With a ``registry``, papers processed by
+    an earlier poll or an earlier process are skipped before signal extraction,
+    and papers whose evaluation failed are re-queued at the start of each poll.
+
+    With an ``llm_budget`` each poll first scores all new papers, then
+    evaluates the candidates in priority order (``triage`` composite scaled
+    by source trust) until the budget is spent. The rest are deferred to the
+    next poll, where they compete with its new papers. With a ``registry``
+    deferred candidates are stored there too and re-queued after a restart.
+
+    The evaluator's spending limits apply per UTC day: when the day changes,
+    the day's usage is appended to ``usage.jsonl`` and the ledger is reset.
+    Once the hard limit is reached, pages are no longer evaluated and the
+    source checkpoints stay where they are, so the same papers are fetched
+    again once the limit resets. With an ``llm_budget`` the unevaluated
+    candidates stay in the backlog instead, which a ``registry`` keeps
+    across restarts.
+    """
     logger.info(f"Starting continuous monitoring (poll interval: {poll_interval_hours}h)")
 
-    last_check = datetime.now(UTC) - timedelta(days=1)  # Start with last 24h
+    checkpoints = checkpoints or CheckpointStore(None)
+    backlog = EvaluationBacklog(triage or TriageScorer.from_config(config))
+
+    async def poll_source(scraper: BaseScraper) -> list[PaperRecord]:
+        # New sources start with the last 24h
+        checkpoint = checkpoints.get(scraper.source_name, datetime.now(UTC) - timedelta(days=1))
+        logger.info(f"Checking {scraper.source_name} for new papers since {checkpoint.watermark:%Y-%m-%d %H:%M:%S}")
+
+        # Only compact records are kept for the rest of the crawl
+        papers: list[PaperRecord] = []
+        async for page in time_limited_pages(scraper.iter_new_since(checkpoint), source_timeout_seconds):
+            if llm_budget is None:
+                if not await _process_papers(
+                    page, signal_extractor, value_evaluator, output_writer, config, registry=registry
+                ):
+                    # Keep the page behind the checkpoint so it is fetched again after the limit resets
+                    logger.warning(f"Not advancing {scraper.source_name} past papers left unevaluated")
+                    break
+            else:
+                for paper, signals in _score_papers(page, signal_extractor, registry=registry):
+                    # Stored before the checkpoint moves past it, so a restart does not lose it
+                    if registry is not None:
+                        registry.defer(paper)
+                    backlog.push(paper, signals)
+            checkpoint.advance(page)
+            checkpoints.save(checkpoint)
+            papers.extend(paper.compact() for paper in page)
+        checkpoints.save(checkpoint)
+        return papers
 
+    # Candidates deferred by an earlier process are behind their source's checkpoint
+    deferred = registry.deferred_papers() if registry is not None and llm_budget is not None else []
+    if deferred:
+        logger.info(f"Re-queuing {len(deferred)} papers deferred by an earlier run")
+        for paper, signals in _score_papers(deferred, signal_extractor, registry=registry):
+            backlog.push(paper, signals)
+
+    spend_day = datetime.now(UTC).date()
     while True:
-        logger.info(f"Checking for new papers since {last_check.strftime('%Y-%m-%d %H:%M:%S')}")
-
-        # Fetch new papers from all sources
-        all_papers = []
-        for scraper in scrapers:
-            try:
-                papers = await scraper.fetch_new_since(last_check)
-                all_papers.extend(papers)
-                if papers:
-                    logger.info(f"Found {len(papers)} new papers from {scraper.source_name}")
-            except Exception as e:
-                logger.error(f"Error fetching from {scraper.source_name}: {e}")
-                continue
-
-        if not all_papers:
+        today = datetime.now(UTC).date()
+        if today != spend_day:
+            _close_spend_day(spend_day, value_evaluator, output_writer)
+            spend_day = today
+
+        # Failed papers are behind their source's checkpoint and will not be fetched again
+        retries = registry.failed_papers() if registry is not None else []
+        if retries:
+            logger.info(f"Retrying {len(retries)} papers whose evaluation failed")
+            if llm_budget is None:
+                await _process_papers(
+                    retries, signal_extractor, value_evaluator, output_writer, config, registry=registry
+                )
+            else:
+                for paper, signals in _score_papers(retries, signal_extractor, registry=registry):
+                    backlog.push(paper, signals)
+
+        # Crawl and process all sources concurrently; the source timeout is applied per
+        # page in poll_source, so evaluation time is not counted
+        results = await fetch_all_sources(scrapers, poll_source, max_concurrency=max_concurrent_sources)
+        if not any(result.paper_count for result in results):
             logger.info("No new papers found")
-        else:
-            # Process new papers
-            await _process_papers(
-                all_papers,
-                signal_extractor,
-                value_evaluator,
-                output_writer,
-                config,
-            )
-
-            # Update last_check to newest paper date
-            for paper in all_papers:
-                last_check = max(last_check, paper.published_date)
+        log_fetch_summary(results)
+
+        if llm_budget is not None:
+            await _evaluate_backlog(backlog, llm_budget, value_evaluator, output_writer, config, registry=registry)
 
         # Sleep until next poll
         logger.info(f"Sleeping for {poll_interval_hours} hours...")
@@ -65,27 +131,130 @@ async def _process_papers(
     value_evaluator: ValueEvaluator,
     output_writer: OutputWriter,
     config: dict,
-) -> None:
-    """Process a batch of papers."""
-    threshold = config.get("thresholds", {}).get("value_score_minimum", 6.0)
+    *,
+    registry: PaperRegistry | None = None,
+) -> bool:
+    """Process a batch of papers.
+
+    Returns:
+        False if the hard spending limit stopped evaluation before every candidate was evaluated
+    """
+    for paper, signals in _score_papers(papers, signal_extractor, registry=registry):
+        if value_evaluator.ledger.hard_limit_reached():
+            logger.warning(f"Hard LLM spending limit of {value_evaluator.ledger.hard_limit} reached; not evaluating")
+            return False
+        await _evaluate_paper(paper, signals, value_evaluator, output_writer, config, registry=registry)
+    return True
+
+
+def _close_spend_day(day: date, value_evaluator: ValueEvaluator, output_writer: OutputWriter) -> None:
+    """Record a finished day's LLM spending and start the next day's limits from zero."""
+    ledger = value_evaluator.ledger
+    ledger.log_summary()
+    output_writer.write_usage_summary({**ledger.summary(), "day": day.isoformat()})
+    ledger.reset()
+    logger.info(f"LLM spending limits reset for {datetime.now(UTC):%Y-%m-%d}")
+
+
+def _score_papers(
+    papers: list,
+    signal_extractor: SignalExtractor,
+    *,
+    registry: PaperRegistry | None = None,
+) -> list[tuple[Paper, dict[str, dict]]]:
+    """Extract signals and return the papers worth evaluating.
+
+    Papers with only weak signals are recorded as processed here; the
+    returned candidates are recorded once they are evaluated.
+    """
+    candidates = []
+    skipped = 0
 
     for paper in papers:
+        if registry is not None and registry.is_processed(paper):
+            skipped += 1
+            continue
+
         try:
-            # Extract signals
             signals = signal_extractor.extract(paper)
 
             # Quick filter
             max_signal = max((s["score"] for s in signals.values()), default=0)
-            if max_signal < 5.0:
-                continue
-
-            # Evaluate
-            assessment = await value_evaluator.evaluate(paper, signals, config)
-
-            if assessment and assessment.value_score >= threshold:
-                output_writer.write_finding(assessment)
-                logger.info(f"🔥 [{assessment.tier}] {assessment.data_type_name} (value: {assessment.value_score:.1f})")
+            if max_signal >= 5.0:
+                candidates.append((paper, signals))
+            elif registry is not None:
+                registry.record(paper, PaperOutcome.WEAK_SIGNALS)
 
         except Exception as e:
             logger.error(f"Error processing paper {paper.id}: {e}")
             continue
+
+    if skipped:
+        logger.info(f"Skipped {skipped} already processed papers")
+    return candidates
+
+
+async def _evaluate_paper(
+    paper: Paper,
+    signals: dict[str, dict],
+    value_evaluator: ValueEvaluator,
+    output_writer: OutputWriter,
+    config: dict,
+    *,
+    registry: PaperRegistry | None = None,
+) -> None:
+    """Evaluate one candidate, write it if it is a finding and record the outcome."""
+    threshold = config.get("thresholds", {}).get("value_score_minimum", 6.0)
+
+    try:
+        assessment = await value_evaluator.evaluate(paper, signals, config)
+
+        if not assessment:
+            outcome, assessment_id = PaperOutcome.FAILED, None
+        elif assessment.value_score >= threshold:
+            output_writer.write_finding(assessment)
+            logger.info(f"🔥 [{assessment.tier}] {assessment.data_type_name} (value: {assessment.value_score:.1f})")
+            outcome, assessment_id = PaperOutcome.FINDING, assessment.id
+        else:
+            outcome, assessment_id = PaperOutcome.BELOW_THRESHOLD, assessment.id
+
+        if registry is not None:
+            registry.record(paper, outcome, assessment_id)
+
+    except Exception as e:
+        logger.error(f"Error processing paper {paper.id}: {e}")
+        if registry is not None:
+            # The source checkpoint has moved past the paper; failed_papers brings it back
+            registry.record(paper, PaperOutcome.FAILED)
+
+
+async def _evaluate_backlog(
+    backlog: EvaluationBacklog,
+    budget: LLMBudget,
+    value_evaluator: ValueEvaluator,
+    output_writer: OutputWriter,
+    config: dict,
+    *,
+    registry: PaperRegistry | None = None,
+) -> None:
+    """Evaluate backlog candidates best first until the poll's budget is spent."""
+    budget.start(value_evaluator.usage)
+    evaluated = 0
+    ledger = value_evaluator.ledger
+    while backlog and not budget.exhausted(value_evaluator.usage) and not ledger.hard_limit_reached():
+        paper, signals = backlog.pop()
+        await _evaluate_paper(paper, signals, value_evaluator, output_writer, config, registry=registry)
+        evaluated += 1
+
+    if backlog and ledger.hard_limit_reached():
+        kept = "kept in the registry" if registry is not None else "lost if the process stops"
+        logger.warning(
+            f"Hard LLM spending limit of {ledger.hard_limit} reached after {evaluated} papers; "
+            f"deferring {len(backlog)} until it resets ({kept})"
+        )
+    elif backlog:
+        logger.info(
+            f"LLM budget of {budget} reached after {evaluated} papers; deferring {len(backlog)} to the next poll"
+        )
+    else:
+        logger.info(f"Evaluated {evaluated} papers within the LLM budget of {budget}")
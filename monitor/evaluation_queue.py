@@ -0,0 +1,138 @@
+"""Priority ordering and budgets for AI evaluation.
+
+When the LLM rate limit or budget is the bottleneck, the order in which
+papers are evaluated decides which ones get evaluated at all. Both the
+streaming pipeline and monitor mode therefore hand candidates to the
+evaluator best first, ranked by ``TriageScorer.priority``.
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from analyzers.token_ledger import TokenUsage
+from analyzers.triage import TriageScorer
+from models.paper import Paper, PaperRecord
+
+_BUDGET_PATTERN = re.compile(r"^\s*(\d+)\s*(calls?|tokens?|t)?\s*$", re.IGNORECASE)
+
+
+class PriorityStageQueue(asyncio.Queue):
+    """Bounded ``asyncio.Queue`` that hands out the highest-priority item first.
+
+    Items with equal priority leave in arrival order. The ``sentinel`` that
+    marks the end of input always sorts last, so consumers drain every
+    queued item before they see it.
+    """
+
+    def __init__(self, maxsize: int, priority: Callable[[Any], float], sentinel: object) -> None:
+        """Initialize the queue.
+
+        Args:
+            maxsize: Queue capacity (0 for unbounded)
+            priority: Returns the priority of an item; higher leaves first
+            sentinel: End-of-input marker
+        """
+        self._priority = priority
+        self._sentinel = sentinel
+        self._seq = itertools.count()
+        super().__init__(maxsize)
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: list[tuple[float, int, Any]] = []
+
+    def _put(self, item: Any) -> None:
+        key = math.inf if item is self._sentinel else -self._priority(item)
+        heapq.heappush(self._queue, (key, next(self._seq), item))
+
+    def _get(self) -> Any:
+        return heapq.heappop(self._queue)[2]
+
+
+class EvaluationBacklog:
+    """Candidates waiting for evaluation, best priority first.
+
+    Candidates that did not fit into one poll's budget stay in the backlog
+    and compete with the next poll's papers. They are held as compact
+    ``PaperRecord``s and returned as ``Paper``s.
+    """
+
+    def __init__(self, ranker: TriageScorer) -> None:
+        """Initialize an empty backlog.
+
+        Args:
+            ranker: Scorer whose ``priority`` orders the backlog
+        """
+        self.ranker = ranker
+        self._heap: list[tuple[float, int, PaperRecord, dict[str, dict]]] = []
+        self._ids: set[str] = set()
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        """Return number of waiting candidates."""
+        return len(self._heap)
+
+    def push(self, paper: Paper, signals: dict[str, dict]) -> None:
+        """Add a candidate unless it is already waiting."""
+        if paper.id in self._ids:
+            return
+        self._ids.add(paper.id)
+        heapq.heappush(self._heap, (-self.ranker.priority(paper, signals), next(self._seq), paper.compact(), signals))
+
+    def pop(self) -> tuple[Paper, dict[str, dict]]:
+        """Remove and return the highest-priority candidate."""
+        _, _, record, signals = heapq.heappop(self._heap)
+        self._ids.discard(record.id)
+        return record.to_paper(), signals
+
+
+@dataclass
+class LLMBudget:
+    """Evaluation budget per monitor poll.
+
+    Attributes:
+        calls: Maximum Claude requests per poll (None for no limit)
+        tokens: Maximum input plus output tokens per poll (None for no limit)
+    """
+
+    calls: int | None = None
+    tokens: int | None = None
+    _start: TokenUsage = field(default_factory=TokenUsage, repr=False)
+
+    @classmethod
+    def parse(cls, text: str) -> "LLMBudget | None":
+        """Parse a budget such as ``"200"`` (calls) or ``"50000tokens"``.
+
+        Returns:
+            The budget, or None for ``"0"`` (no budget)
+        """
+        match = _BUDGET_PATTERN.match(text)
+        if not match:
+            raise ValueError(f"Invalid LLM budget: {text!r} (expected e.g. 200 or 50000tokens)")
+        amount, unit = int(match.group(1)), (match.group(2) or "calls").lower()
+        if amount == 0:
+            return None
+        return cls(tokens=amount) if unit.startswith("t") else cls(calls=amount)
+
+    def start(self, usage: TokenUsage) -> None:
+        """Begin a poll; spending is measured from the current ``usage``."""
+        self._start = TokenUsage(**vars(usage))
+
+    def exhausted(self, usage: TokenUsage) -> bool:
+        """Return True if the requests or tokens spent since ``start`` reach the budget.
+
+        Cached responses cost nothing, so they never count against the budget.
+        """
+        if self.calls is not None and usage.requests - self._start.requests >= self.calls:
+            return True
+        spent = usage.total_tokens - self._start.total_tokens
+        return self.tokens is not None and spent >= self.tokens
+
+    def __str__(self) -> str:
+        """Return a human-readable budget."""
+        return f"{self.calls} calls" if self.calls is not None else f"{self.tokens} tokens"
@@ -0,0 +1,537 @@
+"""Streaming paper pipeline with bounded queues.
+
+Papers flow through fetch → dedup → quality filter → signal extraction →
+triage → AI evaluation → output, with a bounded ``asyncio.Queue`` between stages.
+A full queue blocks the stage feeding it, so a fast scraper cannot run
+ahead of the LLM evaluator and memory stays bounded regardless of the
+lookback window. Evaluation starts as soon as the first page is parsed.
+Dedup resolves the same paper across sources (DOI, arXiv id, near-duplicate
+title), so it is evaluated once.
+
+With a ``BatchEvaluator`` the evaluate stage instead groups papers into
+Message Batches, trading latency for cost on large backfills. With
+``analysis_workers`` set, filtering and signal extraction run in a process
+pool on chunks of papers, keeping that CPU work off the event loop. With a
+``TriageScorer`` only papers whose weighted signal composite clears its
+threshold (or ranks in its top K) reach the LLM. The evaluate queue is a
+priority queue: when the LLM is the bottleneck, the waiting candidate with
+the highest triage composite (scaled by source trust) is evaluated first.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from collections import Counter
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from analyzers import BatchEvaluator, SignalExtractor, ValueEvaluator
+from analyzers.analysis_pool import AnalysisPool
+from analyzers.paper_resolver import PaperResolver
+from analyzers.quality_filter import FilterConfig, passes_quality_filter
+from analyzers.triage import TriageScorer
+from models.paper import Paper
+from persistence import OutputWriter
+
+from .evaluation_queue import PriorityStageQueue
+from .source_fetcher import SourceFetchResult, SourceT
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of a stage's input; workers pass it on to their siblings
+_DONE = object()
+
+STAGES = ("dedup", "filter", "extract", "triage", "evaluate", "write")
+
+
+@dataclass
+class PipelineConfig:
+    """Pipeline sizing.
+
+    Attributes:
+        queue_size: Capacity of each inter-stage queue
+        filter_workers: Quality filter workers
+        extract_workers: Signal extraction workers
+        evaluate_workers: Concurrent AI evaluations
+        write_workers: Output writer workers
+        max_concurrent_sources: Maximum number of sources crawled at once
+        source_timeout_seconds: Per-source fetch timeout (None or 0 disables)
+        min_signal_score: Papers whose strongest signal is below this are skipped
+        progress_interval_seconds: How often queue depths are logged (0 disables)
+        analysis_workers: Processes for filtering and signal extraction (0 runs them on the event loop)
+        analysis_chunk_size: Maximum papers sent to an analysis process at once
+    """
+
+    queue_size: int = 100
+    filter_workers: int = 1
+    extract_workers: int = 2
+    evaluate_workers: int = 4
+    write_workers: int = 1
+    max_concurrent_sources: int = 5
+    source_timeout_seconds: float | None = None
+    min_signal_score: float = 5.0
+    progress_interval_seconds: float = 30.0
+    analysis_workers: int = 0
+    analysis_chunk_size: int = 64
+
+
+@dataclass
+class PipelineStats:
+    """Counters collected while the pipeline runs."""
+
+    sources: list[SourceFetchResult] = field(default_factory=list)
+    fetched: int = 0
+    duplicates: int = 0
+    rejected: int = 0
+    rejection_reasons: Counter = field(default_factory=Counter)
+    weak_signals: int = 0
+    triaged: int = 0
+    over_budget: int = 0
+    evaluated: int = 0
+    failed_evaluations: int = 0
+    below_threshold: int = 0
+    findings: int = 0
+    errors: int = 0  # Failed stage calls: one per paper, message batch or analysis chunk
+    failed_analyses: int = 0  # Papers in analysis chunks that failed
+
+    @property
+    def unique(self) -> int:
+        """Return number of papers that survived deduplication."""
+        return self.fetched - self.duplicates
+
+
+class PaperPipeline:
+    """Run papers through the analysis stages concurrently."""
+
+    def __init__(
+        self,
+        signal_extractor: SignalExtractor,
+        value_evaluator: ValueEvaluator,
+        output_writer: OutputWriter,
+        config: dict,
+        quality_config: FilterConfig,
+        *,
+        pipeline_config: PipelineConfig | None = None,
+        batch_evaluator: BatchEvaluator | None = None,
+        triage: TriageScorer | None = None,
+    ) -> None:
+        """Initialize pipeline components.
+
+        Args:
+            signal_extractor: Keyword signal extractor
+            value_evaluator: AI evaluator
+            output_writer: Findings writer
+            config: Heuristics configuration
+            quality_config: Quality filter configuration
+            pipeline_config: Queue and worker sizing
+            batch_evaluator: Evaluate through Message Batches instead of one request per paper
+            triage: Only evaluate papers this scorer selects; also orders the
+                evaluate queue (defaults to a scorer built from ``config``)
+        """
+        self.signal_extractor = signal_extractor
+        self.value_evaluator = value_evaluator
+        self.output_writer = output_writer
+        self.config = config
+        self.quality_config = quality_config
+        self.pipeline_config = pipeline_config or PipelineConfig()
+        self.batch_evaluator = batch_evaluator
+        self.triage = triage
+        self.ranker = triage or TriageScorer.from_config(config)
+        self.threshold = config.get("thresholds", {}).get("value_score_minimum", 6.0)
+
+        self.stats = PipelineStats()
+        self._queues: dict[str, asyncio.Queue] = {}
+        self._resolver = PaperResolver()
+
+    def queue_depths(self) -> dict[str, int]:
+        """Return the number of items waiting in front of each stage."""
+        return {name: queue.qsize() for name, queue in self._queues.items()}
+
+    async def run(
+        self,
+        scrapers: Sequence[SourceT],
+        pages: Callable[[SourceT], AsyncGenerator[list[Paper], None]],
+    ) -> PipelineStats:
+        """Crawl all scrapers and process every paper to completion.
+
+        Args:
+            scrapers: Sources to crawl
+            pages: Page iterator factory run per scraper, e.g.
+                ``lambda s: s.iter_recent_papers(days)``
+
+        Returns:
+            Pipeline statistics
+        """
+        cfg = self.pipeline_config
+        self.stats = PipelineStats()
+        self._resolver = PaperResolver()
+        self._queues = {name: asyncio.Queue(maxsize=cfg.queue_size) for name in STAGES}
+        self._queues["evaluate"] = PriorityStageQueue(
+            cfg.queue_size, lambda item: self.ranker.priority(*item), sentinel=_DONE
+        )
+        q = self._queues
+        pool = (
+            AnalysisPool(
+                self.signal_extractor.config,
+                self.quality_config,
+                workers=cfg.analysis_workers,
+                chunk_size=cfg.analysis_chunk_size,
+            )
+            if cfg.analysis_workers > 0
+            else None
+        )
+
+        analysis = (
+            [self._pool_stage(q["filter"], q["triage"], pool)]
+            if pool is not None
+            else [
+                self._stage(q["filter"], q["extract"], cfg.filter_workers, self._filter),
+                self._stage(q["extract"], q["triage"], cfg.extract_workers, self._extract),
+            ]
+        )
+        stages = [
+            self._stage(q["dedup"], q["filter"], 1, self._dedup),
+            *analysis,
+            self._triage_stage(q["triage"], q["evaluate"]),
+            self._batch_stage(q["evaluate"], q["write"], self.batch_evaluator)
+            if self.batch_evaluator
+            else self._stage(q["evaluate"], q["write"], cfg.evaluate_workers, self._evaluate),
+            self._stage(q["write"], None, cfg.write_workers, self._write),
+        ]
+        progress = asyncio.create_task(self._log_progress())
+        try:
+            await asyncio.gather(self._fetch_all(scrapers, pages), *stages)
+        finally:
+            progress.cancel()
+            if pool is not None:
+                pool.close()
+
+        return self.stats
+
+    async def resume_batch(self, batch_id: str) -> PipelineStats:
+        """Collect a previously submitted Message Batch and write its findings.
+
+        Args:
+            batch_id: Id of a batch submitted by an earlier run
+
+        Returns:
+            Pipeline statistics for the collected batch
+        """
+        if self.batch_evaluator is None:
+            raise ValueError("Resuming a message batch requires a batch evaluator")
+        self.stats = PipelineStats()
+        for paper, assessment in await self.batch_evaluator.collect(batch_id):
+            finding = self._accept(paper, assessment)
+            if finding is not None:
+                await self._write(finding)
+        return self.stats
+
+    async def _fetch_all(
+        self,
+        scrapers: Sequence[SourceT],
+        pages: Callable[[SourceT], AsyncGenerator[list[Paper], None]],
+    ) -> None:
+        """Feed papers from every source into the dedup queue."""
+        cfg = self.pipeline_config
+        semaphore = asyncio.Semaphore(max(1, cfg.max_concurrent_sources))
+        outbox = self._queues["dedup"]
+
+        async def fetch_one(scraper: SourceT) -> None:
+            async with semaphore:
+                result = SourceFetchResult(source=scraper.source_name)
+                self.stats.sources.append(result)
+                started = time.monotonic()
+                logger.info(f"Fetching papers from {scraper.source_name}...")
+                try:
+                    await self._drain_source(pages(scraper), result, outbox)
+                    logger.info(f"Fetched {result.paper_count} papers from {scraper.source_name}")
+                except TimeoutError:
+                    result.timed_out = True
+                    result.error = f"timed out after {cfg.source_timeout_seconds}s"
+                    logger.error(f"Error fetching from {scraper.source_name}: {result.error}")
+                except Exception as e:
+                    result.error = str(e) or type(e).__name__
+                    logger.error(f"Error fetching from {scraper.source_name}: {e}")
+                result.elapsed_seconds = time.monotonic() - started
+
+        try:
+            await asyncio.gather(*(fetch_one(scraper) for scraper in scrapers))
+        finally:
+            await outbox.put(_DONE)
+
+    async def _drain_source(
+        self, iterator: AsyncGenerator[list[Paper], None], result: SourceFetchResult, outbox: asyncio.Queue
+    ) -> None:
+        """Push every page from one source downstream.
+
+        The per-source timeout only counts time spent waiting on the source;
+        time blocked on a full queue (backpressure) extends the deadline.
+        """
+        loop = asyncio.get_running_loop()
+        timeout = self.pipeline_config.source_timeout_seconds
+        deadline = loop.time() + timeout if timeout else None
+
+        try:
+            while True:
+                try:
+                    async with asyncio.timeout_at(deadline):
+                        page = await anext(iterator)
+                except StopAsyncIteration:
+                    return
+
+                result.paper_count += len(page)
+                self.stats.fetched += len(page)
+                blocked_since = loop.time()
+                for paper in page:
+                    await outbox.put(paper)
+                if deadline is not None:
+                    deadline += loop.time() - blocked_since
+        finally:
+            await iterator.aclose()
+
+    async def _stage(
+        self,
+        inbox: asyncio.Queue,
+        outbox: asyncio.Queue | None,
+        workers: int,
+        handle: Callable[[Any], Awaitable[Any]],
+    ) -> None:
+        """Run ``workers`` consumers of ``inbox``, forwarding non-None results."""
+
+        async def worker() -> None:
+            while True:
+                item = await inbox.get()
+                if item is _DONE:
+                    await inbox.put(_DONE)
+                    return
+                try:
+                    result = await handle(item)
+                except Exception as e:
+                    self.stats.errors += 1
+                    logger.error(f"Error processing item in pipeline: {e}")
+                    continue
+                if result is not None and outbox is not None:
+                    await outbox.put(result)
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(max(1, workers))))
+        finally:
+            if outbox is not None:
+                await outbox.put(_DONE)
+
+    async def _batch_stage(self, inbox: asyncio.Queue, outbox: asyncio.Queue, batch_evaluator: BatchEvaluator) -> None:
+        """Group evaluation inputs into Message Batches and forward accepted findings.
+
+        A batch is submitted as soon as it is full, so crawling continues while
+        earlier batches are processed; the remainder is submitted at end of input.
+        """
+
+        async def run_batch(items: list[tuple[Paper, dict[str, dict]]]) -> None:
+            if self.value_evaluator.ledger.hard_limit_reached():
+                for paper, _ in items:
+                    self._skip_over_budget(paper)
+                return
+            try:
+                outcomes = await batch_evaluator.evaluate_many(items)
+            except Exception as e:
+                self.stats.errors += 1
+                self.stats.failed_evaluations += len(items)
+                logger.error(f"Error evaluating message batch of {len(items)} papers: {e}")
+                return
+            for paper, assessment in outcomes:
+                finding = self._accept(paper, assessment)
+                if finding is not None:
+                    await outbox.put(finding)
+
+        pending: list[tuple[Paper, dict[str, dict]]] = []
+        batches: list[asyncio.Task] = []
+        try:
+            while (item := await inbox.get()) is not _DONE:
+                pending.append(item)
+                if len(pending) >= batch_evaluator.max_batch_size:
+                    batches.append(asyncio.create_task(run_batch(pending)))
+                    pending = []
+            if pending:
+                batches.append(asyncio.create_task(run_batch(pending)))
+            await asyncio.gather(*batches)
+        finally:
+            for task in batches:
+                task.cancel()
+            await outbox.put(_DONE)
+
+    async def _pool_stage(self, inbox: asyncio.Queue, outbox: asyncio.Queue, pool: AnalysisPool) -> None:
+        """Filter and extract chunks of papers in worker processes.
+
+        Each consumer takes whatever is queued, up to the chunk size, so a
+        chunk never waits for more papers to arrive.
+        """
+        min_signal_score = self.pipeline_config.min_signal_score
+
+        async def worker() -> None:
+            done = False
+            while not done:
+                chunk: list[Paper] = []
+                item = await inbox.get()
+                while item is not _DONE:
+                    chunk.append(item)
+                    if len(chunk) >= pool.chunk_size or inbox.empty():
+                        break
+                    item = inbox.get_nowait()
+                if item is _DONE:
+                    await inbox.put(_DONE)
+                    done = True
+                if not chunk:
+                    continue
+
+                try:
+                    results = await pool.analyze(chunk, min_signal_score)
+                except Exception as e:
+                    self.stats.errors += 1
+                    self.stats.failed_analyses += len(chunk)
+                    logger.error(f"Error analyzing chunk of {len(chunk)} papers: {e}")
+                    continue
+                for paper, result in zip(chunk, results, strict=True):
+                    if result.rejection is not None:
+                        self._reject(paper, result.rejection)
+                    elif result.signals is None:
+                        self._skip_weak(paper)
+                    else:
+                        await outbox.put((paper, result.signals))
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(pool.workers)))
+        finally:
+            await outbox.put(_DONE)
+
+    async def _triage_stage(self, inbox: asyncio.Queue, outbox: asyncio.Queue) -> None:
+        """Forward candidates whose triage composite clears the threshold.
+
+        With a top-K limit the best K candidates are held back until the
+        input ends and then forwarded best first.
+        """
+        triage = self.triage
+        best: list[tuple[float, int, tuple[Paper, dict[str, dict]]]] = []
+        try:
+            seq = 0
+            while (item := await inbox.get()) is not _DONE:
+                if triage is None:
+                    await outbox.put(item)
+                    continue
+                paper, signals = item
+                composite = triage.score(signals)
+                if not triage.passes(composite):
+                    self._skip_triaged(paper, composite)
+                elif triage.top_k is None:
+                    await outbox.put(item)
+                else:
+                    # Min-heap of the K best; the sequence number breaks ties by arrival
+                    entry = (composite, -seq, item)
+                    seq += 1
+                    if len(best) < triage.top_k:
+                        heapq.heappush(best, entry)
+                    else:
+                        composite, _, (paper, _) = heapq.heappushpop(best, entry)
+                        self._skip_triaged(paper, composite)
+            for _, _, item in sorted(best, reverse=True):
+                await outbox.put(item)
+        finally:
+            await outbox.put(_DONE)
+
+    async def _dedup(self, paper: Paper) -> Paper | None:
+        """Drop papers already seen in this run, from any source."""
+        resolved = self._resolver.add(paper)
+        if resolved is None:
+            self.stats.duplicates += 1
+        return resolved
+
+    async def _filter(self, paper: Paper) -> Paper | None:
+        """Apply the quality filter."""
+        passes, reason = passes_quality_filter(paper, self.quality_config)
+        if not passes:
+            self._reject(paper, reason)
+            return None
+        logger.debug(f"✓ {paper.title[:60]}... - {reason}")
+        return paper
+
+    def _reject(self, paper: Paper, reason: str) -> None:
+        """Count a paper rejected by the quality filter."""
+        self.stats.rejected += 1
+        self.stats.rejection_reasons[reason.split("(", 1)[0].strip()] += 1
+        logger.debug(f"✗ {paper.title[:60]}... - {reason}")
+
+    def _skip_triaged(self, paper: Paper, composite: float) -> None:
+        """Count a paper that triage kept from the LLM."""
+        self.stats.triaged += 1
+        logger.debug(f"Skipping paper (triage score {composite:.2f}): {paper.title[:60]}")
+
+    def _skip_over_budget(self, paper: Paper) -> None:
+        """Count a paper not evaluated because the hard spending limit was reached."""
+        if not self.stats.over_budget:
+            logger.warning(
+                f"Hard LLM spending limit of {self.value_evaluator.ledger.hard_limit} reached; stopping evaluation"
+            )
+        self.stats.over_budget += 1
+        logger.debug(f"Skipping paper (over budget): {paper.title[:60]}")
+
+    def _skip_weak(self, paper: Paper) -> None:
+        """Count a paper skipped for weak signals."""
+        self.stats.weak_signals += 1
+        logger.debug(f"Skipping paper (weak signals): {paper.title[:60]}")
+
+    async def _extract(self, paper: Paper) -> tuple[Paper, dict[str, dict]] | None:
+        """Extract signals and skip papers with only weak signals."""
+        signals = self.signal_extractor.extract(paper)
+
+        max_signal = max((s["score"] for s in signals.values()), default=0)
+        if max_signal < self.pipeline_config.min_signal_score:
+            self._skip_weak(paper)
+            return None
+        return paper, signals
+
+    async def _evaluate(self, item: tuple[Paper, dict[str, dict]]) -> Any:
+        """Evaluate a paper with AI and keep assessments above threshold."""
+        paper, signals = item
+        if self.value_evaluator.ledger.hard_limit_reached():
+            self._skip_over_budget(paper)
+            return None
+        logger.info(f"Evaluating: {paper.title[:60]}...")
+        assessment = await self.value_evaluator.evaluate(paper, signals, self.config)
+        return self._accept(paper, assessment)
+
+    def _accept(self, paper: Paper, assessment: Any) -> Any:
+        """Count an evaluation outcome and return the assessment if it is a finding."""
+        if not assessment:
+            self.stats.failed_evaluations += 1
+            logger.warning(f"Failed to evaluate paper: {paper.title[:60]}")
+            return None
+
+        self.stats.evaluated += 1
+        if assessment.value_score < self.threshold:
+            self.stats.below_threshold += 1
+            logger.debug(f"Below threshold ({assessment.value_score:.1f} < {self.threshold}): {paper.title[:60]}")
+            return None
+        return assessment
+
+    async def _write(self, assessment: Any) -> None:
+        """Write a finding to disk."""
+        self.output_writer.write_finding(assessment)
+        self.stats.findings += 1
+        logger.info(
+            f"🔥 [{assessment.tier}] {assessment.data_type_name} "
+            f"(value: {assessment.value_score:.1f}, confidence: {assessment.confidence_score:.1f})"
+        )
+
+    async def _log_progress(self) -> None:
+        """Periodically log queue depths and counters."""
+        interval = self.pipeline_config.progress_interval_seconds
+        if interval <= 0:
+            return
+        while True:
+            await asyncio.sleep(interval)
+            depths = ", ".join(f"{name}={depth}" for name, depth in self.queue_depths().items())
+            logger.info(
+                f"Pipeline: fetched={self.stats.fetched} evaluated={self.stats.evaluated} "
+                f"findings={self.stats.findings} | queues: {depths}"
+            )
@@ -0,0 +1,138 @@
+"""Concurrent fetching across paper sources."""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Protocol, TypeVar
+
+from models.paper import Paper, PaperRecord
+
+logger = logging.getLogger(__name__)
+
+
+class NamedSource(Protocol):
+    """A paper source such as a ``BaseScraper``; only its name is used here."""
+
+    @property
+    def source_name(self) -> str:
+        """Return the source name used in results and logs."""
+        ...
+
+
+SourceT = TypeVar("SourceT", bound=NamedSource)
+
+
+@dataclass
+class SourceFetchResult:
+    """Outcome of fetching papers from one source.
+
+    Attributes:
+        source: Scraper source name
+        papers: Papers returned by the source (empty on failure or when streamed)
+        paper_count: Number of papers returned by the source
+        error: Error message if the fetch failed or timed out
+        timed_out: Whether the per-source timeout was hit
+        elapsed_seconds: Wall-clock time spent on this source
+    """
+
+    source: str
+    papers: Sequence[Paper | PaperRecord] = field(default_factory=list)
+    paper_count: int = 0
+    error: str | None = None
+    timed_out: bool = False
+    elapsed_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the source was fetched without error."""
+        return self.error is None
+
+
+async def fetch_all_sources(
+    scrapers: Sequence[SourceT],
+    fetch: Callable[[SourceT], Awaitable[Sequence[Paper | PaperRecord]]],
+    max_concurrency: int = 5,
+    timeout_seconds: float | None = None,
+) -> list[SourceFetchResult]:
+    """Fetch from all sources concurrently.
+
+    Each scraper keeps its own rate limiting; this only overlaps the waits
+    of different sources. A slow or failing source is reported in its own
+    result and never blocks or cancels the others.
+
+    Args:
+        scrapers: Scrapers to fetch from
+        fetch: Coroutine factory run per scraper, e.g.
+            ``lambda s: s.fetch_recent_papers(days)``
+        max_concurrency: Maximum number of sources fetched at once
+        timeout_seconds: Per-source timeout (None or 0 disables)
+
+    Returns:
+        One result per scraper, in scraper order
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def fetch_one(scraper: SourceT) -> SourceFetchResult:
+        async with semaphore:
+            result = SourceFetchResult(source=scraper.source_name)
+            started = time.monotonic()
+            logger.info(f"Fetching papers from {scraper.source_name}...")
+            try:
+                async with asyncio.timeout(timeout_seconds or None):
+                    result.papers = await fetch(scraper)
+                result.paper_count = len(result.papers)
+                logger.info(f"Fetched {len(result.papers)} papers from {scraper.source_name}")
+            except TimeoutError as e:
+                result.timed_out = True
+                result.error = str(e) or f"timed out after {timeout_seconds}s"
+                logger.error(f"Error fetching from {scraper.source_name}: {result.error}")
+            except Exception as e:
+                result.error = str(e) or type(e).__name__
+                logger.error(f"Error fetching from {scraper.source_name}: {e}")
+            result.elapsed_seconds = time.monotonic() - started
+            return result
+
+    return list(await asyncio.gather(*(fetch_one(scraper) for scraper in scrapers)))
+
+
+async def time_limited_pages(
+    pages: AsyncGenerator[list[Paper], None], timeout_seconds: float | None
+) -> AsyncGenerator[list[Paper], None]:
+    """Yield pages from a source, timing out only on time spent waiting for it.
+
+    Time the consumer spends processing a page (e.g. evaluating its papers)
+    does not count, so a slow evaluation never cancels a finished fetch.
+
+    Args:
+        pages: Page iterator of one source
+        timeout_seconds: Total time allowed for fetching (None or 0 disables)
+
+    Raises:
+        TimeoutError: If fetching takes longer than ``timeout_seconds``
+    """
+    loop = asyncio.get_running_loop()
+    remaining = timeout_seconds or None
+    try:
+        while True:
+            started = loop.time()
+            try:
+                async with asyncio.timeout(remaining):
+                    page = await anext(pages)
+            except StopAsyncIteration:
+                return
+            except TimeoutError:
+                raise TimeoutError(f"timed out after {timeout_seconds}s") from None
+            if remaining is not None:
+                remaining = max(0.0, remaining - (loop.time() - started))
+            yield page
+    finally:
+        await pages.aclose()
+
+
+def log_fetch_summary(results: list[SourceFetchResult]) -> None:
+    """Log a per-source summary of fetch results."""
+    for result in results:
+        status = "ok" if result.ok else f"FAILED ({result.error})"
+        logger.info(f"  - {result.source}: {result.paper_count} papers in {result.elapsed_seconds:.1f}s [{status}]")
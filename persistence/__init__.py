@@ -1,5 +1,18 @@
 """Persistence components."""
 
+from .checkpoint_store import CheckpointStore
+from .http_cache import HttpCache, HttpCacheStats
 from .output_writer import OutputWriter
+from .paper_registry import PaperOutcome, PaperRegistry
+from .response_cache import CacheStats, ResponseCache
 
-__all__ = ["OutputWriter"]
+__all__ = [
+    "CacheStats",
+    "CheckpointStore",
+    "HttpCache",
+    "HttpCacheStats",
+    "OutputWriter",
+    "PaperOutcome",
+    "PaperRegistry",
+    "ResponseCache",
+]
@@ -0,0 +1,54 @@
+"""Durable per-source crawl checkpoints."""
+
+import json
+import logging
+from datetime import UTC, datetime
+from pathlib import Path
+
+from models.checkpoint import SourceCheckpoint, as_utc
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointStore:
+    """JSON file holding one checkpoint per source.
+
+    The file is rewritten atomically on every save, so a crash leaves
+    either the previous or the new state. With ``path=None`` checkpoints
+    are only kept in memory.
+    """
+
+    def __init__(self, path: str | Path | None) -> None:
+        """Load checkpoints from ``path`` if it exists.
+
+        Args:
+            path: JSON file, or None for an in-memory store
+        """
+        self.path = Path(path) if path else None
+        self._checkpoints: dict[str, SourceCheckpoint] = {}
+
+        if self.path and self.path.exists():
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            for entry in data.get("sources", []):
+                checkpoint = SourceCheckpoint.from_dict(entry)
+                self._checkpoints[checkpoint.source] = checkpoint
+            logger.info(f"Loaded checkpoints for {len(self._checkpoints)} sources from {self.path}")
+
+    def get(self, source: str, default_watermark: datetime) -> SourceCheckpoint:
+        """Return the checkpoint of a source, creating it at ``default_watermark``."""
+        if source not in self._checkpoints:
+            self._checkpoints[source] = SourceCheckpoint(source=source, watermark=as_utc(default_watermark))
+        return self._checkpoints[source]
+
+    def save(self, checkpoint: SourceCheckpoint) -> None:
+        """Persist a checkpoint together with all others."""
+        checkpoint.updated_at = datetime.now(UTC)
+        self._checkpoints[checkpoint.source] = checkpoint
+        if self.path is None:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"sources": [cp.to_dict() for cp in self._checkpoints.values()]}
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        tmp.replace(self.path)
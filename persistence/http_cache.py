@@ -0,0 +1,219 @@
+"""Disk-backed cache of scraper HTTP responses."""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bodies (
+    digest TEXT PRIMARY KEY,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    source TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    digest TEXT NOT NULL REFERENCES bodies (digest),
+    stored_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_stored_at ON responses (stored_at);
+"""
+
+# Response headers kept with a cached body; transfer headers no longer apply to the decoded body
+_KEPT_HEADERS = ("content-type", "etag", "last-modified")
+
+
+@dataclass
+class HttpCacheStats:
+    """Counters for one HTTP cache instance.
+
+    Attributes:
+        hits: Responses served from cache without a request
+        revalidated: Stale entries confirmed unchanged by a 304 response
+        misses: Lookups that needed a full response
+        writes: Responses stored
+    """
+
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    writes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Return fraction of lookups answered without downloading a body."""
+        lookups = self.hits + self.revalidated + self.misses
+        return (self.hits + self.revalidated) / lookups if lookups else 0.0
+
+
+@dataclass
+class CachedResponse:
+    """A stored response.
+
+    Attributes:
+        url: Request URL
+        status: HTTP status code
+        headers: Content-Type and validator headers
+        body: Decoded response body
+        stored_at: Unix time the response was stored or last revalidated
+    """
+
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    stored_at: float
+
+    @property
+    def etag(self) -> str | None:
+        """Return the ETag validator, if the server sent one."""
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        """Return the Last-Modified validator, if the server sent one."""
+        return self.headers.get("last-modified")
+
+    def validators(self) -> dict[str, str]:
+        """Return conditional request headers that revalidate this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> httpx.Response:
+        """Rebuild an ``httpx.Response`` for the scrapers."""
+        return httpx.Response(
+            self.status, headers=self.headers, content=self.body, request=httpx.Request("GET", self.url)
+        )
+
+
+class HttpCache:
+    """SQLite cache of scraper responses keyed by request URL.
+
+    Bodies are stored zlib-compressed and addressed by their SHA-256, so
+    identical pages returned for different requests are stored once. An
+    entry is fresh for its source's TTL; after that it is revalidated with
+    ``If-None-Match``/``If-Modified-Since`` when the server sent validators.
+    In offline mode every lookup is answered from the cache, fresh or not.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        default_ttl_seconds: float = 3600.0,
+        offline: bool = False,
+        max_age_seconds: float | None = 30 * 24 * 3600,
+    ) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file
+            default_ttl_seconds: Freshness lifetime for sources without their own TTL
+            offline: Never send requests; serve cached responses regardless of age
+            max_age_seconds: Entries older than this are evicted (None disables)
+        """
+        self.path = Path(path)
+        self.default_ttl_seconds = default_ttl_seconds
+        self.offline = offline
+        self.max_age_seconds = max_age_seconds
+        self.source_ttls: dict[str, float] = {}
+        self.stats = HttpCacheStats()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+        self.evict()
+
+    @staticmethod
+    def make_key(url: str, params: Any = None) -> str:
+        """Return cache key for a GET request with optional query parameters."""
+        return hashlib.sha256(str(httpx.URL(url, params=params)).encode("utf-8")).hexdigest()
+
+    def set_ttl(self, source: str, ttl_seconds: float) -> None:
+        """Set how long responses for ``source`` are served without revalidation."""
+        self.source_ttls[source] = ttl_seconds
+
+    def is_fresh(self, entry: CachedResponse, source: str) -> bool:
+        """Return True if ``entry`` can be served without contacting the server."""
+        return self.offline or time.time() - entry.stored_at < self.source_ttls.get(source, self.default_ttl_seconds)
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the stored response for a key, fresh or not."""
+        row = self._conn.execute(
+            "SELECT r.url, r.status, r.headers, b.data, r.stored_at "
+            "FROM responses r JOIN bodies b ON b.digest = r.digest WHERE r.key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        url, status, headers, data, stored_at = row
+        return CachedResponse(url, status, json.loads(headers), zlib.decompress(data), stored_at)
+
+    def put(self, key: str, source: str, response: httpx.Response) -> CachedResponse:
+        """Store a response body and its validators."""
+        body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+        headers = {name: response.headers[name] for name in _KEPT_HEADERS if name in response.headers}
+        url = str(response.request.url)
+        now = time.time()
+        with self._conn:
+            self._conn.execute("INSERT OR IGNORE INTO bodies VALUES (?, ?)", (digest, zlib.compress(body)))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, url, source, response.status_code, json.dumps(headers), digest, now),
+            )
+        self.stats.writes += 1
+        return CachedResponse(url, response.status_code, headers, body, now)
+
+    def touch(self, key: str) -> None:
+        """Restart an entry's freshness lifetime after a successful revalidation."""
+        with self._conn:
+            self._conn.execute("UPDATE responses SET stored_at = ? WHERE key = ?", (time.time(), key))
+
+    def evict(self) -> int:
+        """Remove entries older than ``max_age_seconds`` and bodies no entry refers to.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        with self._conn:
+            if self.max_age_seconds is not None:
+                cursor = self._conn.execute(
+                    "DELETE FROM responses WHERE stored_at < ?", (time.time() - self.max_age_seconds,)
+                )
+                removed = cursor.rowcount
+            self._conn.execute("DELETE FROM bodies WHERE digest NOT IN (SELECT digest FROM responses)")
+        return removed
+
+    def __len__(self) -> int:
+        """Return number of stored entries."""
+        return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def log_stats(self) -> None:
+        """Log hit/miss statistics."""
+        s = self.stats
+        logger.info(
+            f"HTTP cache: {s.hits} hits, {s.revalidated} revalidated, {s.misses} misses "
+            f"({s.hit_rate:.0%} hit rate), {s.writes} writes, {len(self)} entries"
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -63,12 +63,20 @@ class OutputWriter:
             "replication_feasibility": assessment.replication_feasibility,
             "paper_url": assessment.paper.url,
             "paper_title": assessment.paper.title,
+            "signals_detected": assessment.signals_detected,
             "detected_at": assessment.detected_at.isoformat(),
         }
 
         with open(index_file, "a", encoding="utf-8") as f:
             f.write(json.dumps(entry) + "\n")
 
+    def write_usage_summary(self, summary: dict) -> Path:
+        """Append a run's LLM spending summary to ``usage.jsonl`` next to the index."""
+        usage_file = self.base_dir / "usage.jsonl"
+        with open(usage_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(summary) + "\n")
+        return usage_file
+
     def _sanitize_filename(self, name: str) -> str:
         """Sanitize name for use in filename."""
         # Remove/replace problematic characters
@@ -0,0 +1,151 @@
+"""Persistent registry of papers that were already processed."""
+
+import hashlib
+import json
+import logging
+import sqlite3
+from datetime import UTC, datetime
+from enum import Enum
+from pathlib import Path
+
+from models.paper import Paper
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS processed_papers (
+    paper_id TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    assessment_id TEXT,
+    processed_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS failed_papers (
+    paper_id TEXT PRIMARY KEY,
+    paper TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    failed_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS deferred_papers (
+    paper_id TEXT PRIMARY KEY,
+    paper TEXT NOT NULL,
+    deferred_at TEXT NOT NULL
+);
+"""
+
+# Evaluations per paper before a failing paper is no longer re-queued
+MAX_EVALUATION_ATTEMPTS = 3
+
+
+class PaperOutcome(Enum):
+    """Result of processing one paper."""
+
+    WEAK_SIGNALS = "weak_signals"  # Skipped before AI evaluation
+    FAILED = "failed"  # AI evaluation failed; re-queued by ``failed_papers`` until attempts run out
+    BELOW_THRESHOLD = "below_threshold"
+    FINDING = "finding"
+
+
+def content_hash(paper: Paper) -> str:
+    """Return hash of the paper fields that affect evaluation."""
+    digest = hashlib.sha256()
+    for part in (paper.title, paper.abstract):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class PaperRegistry:
+    """SQLite record of processed papers with an in-memory index.
+
+    The index maps paper id to content hash and is loaded once at startup,
+    so membership checks never touch the database. A paper counts as
+    processed only if its title and abstract are unchanged and its
+    evaluation did not fail.
+
+    Failed papers are stored whole, because the source checkpoint has
+    already moved past them; ``failed_papers`` returns them for another
+    attempt. For the same reason, candidates waiting in an LLM budget
+    backlog are stored by ``defer`` until their outcome is recorded, and
+    ``deferred_papers`` returns them after a restart.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open (or create) the registry and load the index.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+
+        rows = self._conn.execute(
+            "SELECT paper_id, content_hash FROM processed_papers WHERE outcome != ?", (PaperOutcome.FAILED.value,)
+        )
+        self._index: dict[str, str] = dict(rows)
+        logger.info(f"Loaded {len(self._index)} processed papers from {self.path}")
+
+    def __len__(self) -> int:
+        """Return number of papers that will be skipped."""
+        return len(self._index)
+
+    def is_processed(self, paper: Paper) -> bool:
+        """Return True if the paper was processed before and has not changed."""
+        return self._index.get(paper.id) == content_hash(paper)
+
+    def record(self, paper: Paper, outcome: PaperOutcome, assessment_id: str | None = None) -> None:
+        """Record the outcome of processing a paper.
+
+        Args:
+            paper: Processed paper
+            outcome: Processing result
+            assessment_id: Id of the written finding, if any
+        """
+        paper_hash = content_hash(paper)
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO processed_papers VALUES (?, ?, ?, ?, ?)",
+                (paper.id, paper_hash, outcome.value, assessment_id, datetime.now(UTC).isoformat()),
+            )
+            if outcome is PaperOutcome.FAILED:
+                self._conn.execute(
+                    """
+                    INSERT INTO failed_papers VALUES (?, ?, 1, ?)
+                    ON CONFLICT (paper_id) DO UPDATE
+                    SET paper = excluded.paper, attempts = attempts + 1, failed_at = excluded.failed_at
+                    """,
+                    (paper.id, json.dumps(paper.to_dict()), datetime.now(UTC).isoformat()),
+                )
+            else:
+                self._conn.execute("DELETE FROM failed_papers WHERE paper_id = ?", (paper.id,))
+            self._conn.execute("DELETE FROM deferred_papers WHERE paper_id = ?", (paper.id,))
+        if outcome is PaperOutcome.FAILED:
+            self._index.pop(paper.id, None)
+        else:
+            self._index[paper.id] = paper_hash
+
+    def failed_papers(self, max_attempts: int = MAX_EVALUATION_ATTEMPTS) -> list[Paper]:
+        """Return papers whose evaluation failed fewer than ``max_attempts`` times, oldest failure first."""
+        rows = self._conn.execute(
+            "SELECT paper FROM failed_papers WHERE attempts < ? ORDER BY failed_at", (max_attempts,)
+        )
+        return [Paper.from_dict(json.loads(paper)) for (paper,) in rows]
+
+    def defer(self, paper: Paper) -> None:
+        """Store a candidate that waits for evaluation until its outcome is recorded."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO deferred_papers VALUES (?, ?, ?)",
+                (paper.id, json.dumps(paper.to_dict()), datetime.now(UTC).isoformat()),
+            )
+
+    def deferred_papers(self) -> list[Paper]:
+        """Return candidates deferred without a recorded outcome, oldest first."""
+        rows = self._conn.execute("SELECT paper FROM deferred_papers ORDER BY deferred_at")
+        return [Paper.from_dict(json.loads(paper)) for (paper,) in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
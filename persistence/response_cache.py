@@ -0,0 +1,148 @@
+"""Disk-backed cache of raw LLM responses."""
+
+import hashlib
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from models.paper import Paper
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    paper_id TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses (accessed_at);
+"""
+
+
+@dataclass
+class CacheStats:
+    """Counters for one cache instance."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Return fraction of lookups served from cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """SQLite cache of raw Claude responses keyed by paper content.
+
+    The key covers paper id, title and abstract, the model name and the
+    prompt template version, so editing a paper or the prompt invalidates
+    its entry. Raw response text is stored, so parsing, blocker detection
+    and confidence calibration can be re-run locally without API calls.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        ttl_seconds: float | None = 30 * 24 * 3600,
+        max_entries: int | None = 50_000,
+    ) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file
+            ttl_seconds: Entries older than this are ignored and evicted (None disables)
+            max_entries: Least recently used entries beyond this are evicted (None disables)
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+        self.evict()
+
+    @staticmethod
+    def make_key(paper: Paper, model: str, prompt_version: str) -> str:
+        """Return cache key for a paper evaluated with a model and prompt version."""
+        digest = hashlib.sha256()
+        for part in (paper.id, paper.title, paper.abstract, model, prompt_version):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return cached response text, or None on miss or expiry."""
+        row = self._conn.execute("SELECT response, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+        now = time.time()
+        if row is None or (self.ttl_seconds is not None and now - row[1] > self.ttl_seconds):
+            self.stats.misses += 1
+            return None
+
+        with self._conn:
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        self.stats.hits += 1
+        return row[0]
+
+    def put(self, key: str, paper: Paper, model: str, prompt_version: str, response: str) -> None:
+        """Store raw response text and evict entries beyond the size limit."""
+        now = time.time()
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, paper.id, model, prompt_version, response, now, now),
+            )
+        self.stats.writes += 1
+        if self.max_entries is not None and self.stats.writes % 100 == 0:
+            self.evict()
+
+    def evict(self) -> int:
+        """Remove expired entries and least recently used entries beyond ``max_entries``.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        with self._conn:
+            if self.ttl_seconds is not None:
+                cursor = self._conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+                )
+                removed += cursor.rowcount
+            if self.max_entries is not None:
+                cursor = self._conn.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+                removed += cursor.rowcount
+        self.stats.evictions += removed
+        return removed
+
+    def __len__(self) -> int:
+        """Return number of stored entries."""
+        return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def log_stats(self) -> None:
+        """Log hit/miss statistics."""
+        s = self.stats
+        logger.info(
+            f"LLM response cache: {s.hits} hits, {s.misses} misses ({s.hit_rate:.0%} hit rate), "
+            f"{s.writes} writes, {s.evictions} evictions, {len(self)} entries"
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
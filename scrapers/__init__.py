@@ -1,35 +1,55 @@
 """Paper scrapers."""
 
+from persistence.http_cache import HttpCache
+
 from .arxiv_scraper import ArxivScraper
 from .base import BaseScraper
+from .cassette import CassetteRecorder
 from .dblp_scraper import DBLPScraper
 from .openalex_scraper import OpenAlexScraper
 from .papers_with_code_scraper import PapersWithCodeScraper
+from .resilience import FetchError, SourceUnavailableError
 from .semantic_scholar_scraper import SemanticScholarScraper
+from .session import ScraperSession
+
 
+def create_scrapers(
+    sources_config: dict, http_cache: HttpCache | None = None, recorder: CassetteRecorder | None = None
+) -> list[BaseScraper]:
+    """Create enabled scrapers from configuration.
 
-def create_scrapers(sources_config: dict) -> list[BaseScraper]:
-    """Create enabled scrapers from configuration."""
+    All scrapers share one pooled HTTP session built from the optional
+    ``http`` block, the optional response cache and traffic recorder;
+    release the session with ``close_scrapers`` at shutdown.
+    """
+    session = ScraperSession(sources_config.get("http", {}), cache=http_cache, recorder=recorder)
     scrapers = []
 
     if sources_config.get("arxiv", {}).get("enabled", False):
-        scrapers.append(ArxivScraper(sources_config["arxiv"]))
+        scrapers.append(ArxivScraper(sources_config["arxiv"], session))
 
     if sources_config.get("semantic_scholar", {}).get("enabled", False):
-        scrapers.append(SemanticScholarScraper(sources_config["semantic_scholar"]))
+        scrapers.append(SemanticScholarScraper(sources_config["semantic_scholar"], session))
 
     if sources_config.get("openalex", {}).get("enabled", False):
-        scrapers.append(OpenAlexScraper(sources_config["openalex"]))
+        scrapers.append(OpenAlexScraper(sources_config["openalex"], session))
 
     if sources_config.get("papers_with_code", {}).get("enabled", False):
-        scrapers.append(PapersWithCodeScraper(sources_config["papers_with_code"]))
+        scrapers.append(PapersWithCodeScraper(sources_config["papers_with_code"], session))
 
     if sources_config.get("dblp", {}).get("enabled", False):
-        scrapers.append(DBLPScraper(sources_config["dblp"]))
+        scrapers.append(DBLPScraper(sources_config["dblp"], session))
 
     return scrapers
 
 
+async def close_scrapers(scrapers: list[BaseScraper]) -> None:
+    """Close the HTTP sessions used by scrapers, each exactly once."""
+    sessions = {id(scraper.session): scraper.session for scraper in scrapers}
+    for session in sessions.values():
+        await session.aclose()
+
+
 __all__ = [
     "BaseScraper",
     "ArxivScraper",
@@ -37,5 +57,10 @@ __all__ = [
     "OpenAlexScraper",
     "SemanticScholarScraper",
     "PapersWithCodeScraper",
+    "ScraperSession",
+    "CassetteRecorder",
+    "FetchError",
+    "SourceUnavailableError",
     "create_scrapers",
+    "close_scrapers",
 ]
@@ -2,16 +2,19 @@
 
 import logging
 import xml.etree.ElementTree as ET
+from collections.abc import AsyncGenerator
 from datetime import UTC, datetime, timedelta
 
-import httpx
-
-from models.paper import Paper
+from models.checkpoint import SourceCheckpoint
+from models.paper import Paper, normalize_arxiv_id, normalize_doi
 
 from .base import BaseScraper
+from .resilience import FetchError
 
 logger = logging.getLogger(__name__)
 
+ARXIV_PAGE_SIZE = 100
+
 
 class ArxivScraper(BaseScraper):
     """Scraper for arXiv papers."""
@@ -24,16 +27,19 @@ class ArxivScraper(BaseScraper):
     async def fetch_recent_papers(self, days: int) -> list[Paper]:
         """Fetch papers from last N days."""
         papers = []
+        async for page in self.iter_recent_papers(days):
+            papers.extend(page)
+
+        logger.info(f"Fetched {len(papers)} papers from arXiv")
+        return papers
+
+    async def iter_recent_papers(self, days: int) -> AsyncGenerator[list[Paper], None]:
+        """Yield papers from last N days, one category at a time."""
         categories = self.config.get("categories", ["cs.AI"])
 
         for category in categories:
             logger.info(f"Fetching arXiv papers from {category} (last {days} days)")
-            category_papers = await self._fetch_category_papers(category, days)
-            papers.extend(category_papers)
-            await self._rate_limit()
-
-        logger.info(f"Fetched {len(papers)} papers from arXiv")
-        return papers
+            yield await self._fetch_category_papers(category, days)
 
     async def fetch_new_since(self, last_check: datetime) -> list[Paper]:
         """Fetch papers since timestamp."""
@@ -41,33 +47,69 @@ class ArxivScraper(BaseScraper):
         days = (datetime.now(UTC) - last_check).days + 1
         return await self.fetch_recent_papers(days)
 
-    async def _fetch_category_papers(self, category: str, days: int) -> list[Paper]:
+    async def iter_new_since(self, checkpoint: SourceCheckpoint) -> AsyncGenerator[list[Paper], None]:
+        """Yield papers since the checkpoint, resuming at the stored category and offset.
+
+        Results are sorted newest first, so each category is paged until a
+        page contains papers older than the checkpoint.
+        """
+        categories = self.config.get("categories", ["cs.AI"])
+        max_pages = self.config.get("max_pages", 10)
+        cursor = checkpoint.cursor
+        since = datetime.fromisoformat(cursor["since"]) if cursor else checkpoint.watermark
+        days = (datetime.now(UTC) - since).days + 1
+        start_category = categories.index(cursor["category"]) if cursor.get("category") in categories else 0
+
+        for index in range(start_category, len(categories)):
+            category = categories[index]
+            start = cursor.get("start", 0) if index == start_category else 0
+            logger.info(f"Fetching arXiv papers from {category} since {since:%Y-%m-%d} (offset {start})")
+
+            for _ in range(max_pages):
+                papers = await self._fetch_category_papers(category, days, start=start, cutoff_date=since)
+                start += ARXIV_PAGE_SIZE
+                checkpoint.cursor = {"since": since.isoformat(), "category": category, "start": start}
+                yield papers
+                if len(papers) < ARXIV_PAGE_SIZE:
+                    break
+
+        checkpoint.cursor = {}
+
+    async def _fetch_category_papers(
+        self, category: str, days: int, start: int = 0, cutoff_date: datetime | None = None
+    ) -> list[Paper]:
         """Fetch papers for a specific category."""
         base_url = self.config["base_url"]
-        max_results = 100
+        max_results = ARXIV_PAGE_SIZE
 
         query = f"cat:{category}"
         url = f"{base_url}?search_query={query}&sortBy=submittedDate&sortOrder=descending&max_results={max_results}"
+        if start:
+            url += f"&start={start}"
 
-        try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(url)
-                response.raise_for_status()
+        async def make_request():
+            response = await self._get(url)
+            response.raise_for_status()
+            return response
 
-                return self._parse_arxiv_response(response.text, days)
+        try:
+            response = await self._retry_with_backoff(make_request)
+            return self._parse_arxiv_response(response.text, days, cutoff_date)
+        except FetchError:
+            raise
         except Exception as e:
             logger.error(f"Error fetching arXiv papers for {category}: {e}")
             return []
 
-    def _parse_arxiv_response(self, xml_text: str, days: int) -> list[Paper]:
-        """Parse arXiv API XML response."""
+    def _parse_arxiv_response(self, xml_text: str, days: int, cutoff_date: datetime | None = None) -> list[Paper]:
+        """Parse arXiv API XML response, keeping papers after ``cutoff_date`` (default: last N days)."""
 
         papers = []
-        cutoff_date = datetime.now(UTC) - timedelta(days=days)
+        cutoff_date = cutoff_date or datetime.now(UTC) - timedelta(days=days)
 
         try:
             root = ET.fromstring(xml_text)
-            ns = {"atom": "http://www.w3.org/2005/Atom"}
+            ns = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
 
             entries = root.findall("atom:entry", ns)
             logger.debug(f"ArXiv response contains {len(entries)} entries")
@@ -95,6 +137,7 @@ class ArxivScraper(BaseScraper):
                             authors.append(name_elem.text)
 
                     url = f"https://arxiv.org/abs/{arxiv_id}"
+                    doi_elem = entry.find("arxiv:doi", ns)
 
                     paper = Paper(
                         id=f"arxiv_{arxiv_id}",
@@ -104,6 +147,8 @@ class ArxivScraper(BaseScraper):
                         published_date=published_date.replace(tzinfo=None),
                         source="arxiv",
                         url=url,
+                        doi=normalize_doi(doi_elem.text if doi_elem is not None else None),
+                        arxiv_id=normalize_arxiv_id(arxiv_id),
                     )
                     papers.append(paper)
 
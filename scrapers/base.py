@@ -3,14 +3,26 @@
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from datetime import UTC, datetime
-from typing import TypeVar
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from datetime import datetime
+from typing import Any, TypeVar
 
 import httpx
 
+from models.checkpoint import SourceCheckpoint
 from models.paper import Paper
 
+from .resilience import (
+    CircuitBreaker,
+    FetchError,
+    RetryPolicy,
+    SourceUnavailableError,
+    hedged,
+    is_transient_error,
+    retry_after_seconds,
+)
+from .session import ScraperSession
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -19,47 +31,126 @@ T = TypeVar("T")
 class BaseScraper(ABC):
     """Abstract base class for all paper scrapers."""
 
-    def __init__(self, config: dict) -> None:
-        """Initialize scraper with configuration."""
+    def __init__(self, config: dict, session: ScraperSession | None = None) -> None:
+        """Initialize scraper with configuration.
+
+        Args:
+            config: Source configuration
+            session: Shared HTTP session; a private one is created if omitted
+        """
         self.config = config
         self.rate_limit_seconds = config.get("rate_limit_seconds", 1)
-        self.last_request_time: datetime | None = None
+        self.session = session or ScraperSession()
+        self._owns_session = session is None
+        if config.get("base_url"):
+            self.session.rate_limiter.configure(
+                config["base_url"], self.rate_limit_seconds, config.get("rate_limit_burst", 1)
+            )
+        if self.session.cache is not None and "cache_ttl_seconds" in config:
+            self.session.cache.set_ttl(self.source_name, config["cache_ttl_seconds"])
+        self.retry_policy = RetryPolicy(
+            max_retries=config.get("max_retries", 3),
+            initial_delay=config.get("retry_initial_delay_seconds", 1.0),
+            max_delay=config.get("retry_max_delay_seconds", 60.0),
+        )
+        self.circuit_breaker = CircuitBreaker(
+            self.source_name,
+            failure_threshold=config.get("circuit_failure_threshold", 5),
+            reset_timeout_seconds=config.get("circuit_reset_seconds", 60.0),
+        )
+        self.hedge_after_seconds: float | None = config.get("hedge_after_seconds")
+
+    async def _get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Issue a rate-limited GET request through the shared HTTP session.
+
+        Fails fast with ``SourceUnavailableError`` while the source's circuit
+        is open. Connection failures and 5xx responses count towards opening
+        it. If ``hedge_after_seconds`` is configured, a request still pending
+        after that long is sent a second time and the first answer wins.
+        """
+        self.circuit_breaker.before_request()
+
+        def request() -> Awaitable[httpx.Response]:
+            return self.session.get(url, source=self.source_name, **kwargs)
+
+        try:
+            if self.hedge_after_seconds:
+                response = await hedged(request, self.hedge_after_seconds)
+            else:
+                response = await request()
+        except BaseException as e:
+            if is_transient_error(e):
+                self.circuit_breaker.record_failure()
+            else:
+                # No response (cancelled, invalid URL, ...): the source's health is unknown,
+                # so neither close the circuit nor block later probes
+                self.circuit_breaker.release_probe()
+            raise
+
+        if response.status_code >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+        return response
+
+    async def aclose(self) -> None:
+        """Release the HTTP session if this scraper created it."""
+        if self._owns_session:
+            await self.session.aclose()
 
     async def _rate_limit(self) -> None:
-        """Enforce rate limiting."""
-        if self.last_request_time:
-            elapsed = (datetime.now(UTC) - self.last_request_time).total_seconds()
-            if elapsed < self.rate_limit_seconds:
-                await asyncio.sleep(self.rate_limit_seconds - elapsed)
-        self.last_request_time = datetime.now(UTC)
+        """Take a token from this source's host bucket.
+
+        Requests made through ``_get`` are limited automatically; this is
+        for subclasses that issue requests with their own client.
+        """
+        if self.config.get("base_url"):
+            await self.session.rate_limiter.acquire(self.config["base_url"], self.source_name)
+
+    async def _retry_with_backoff(
+        self, func: Callable[[], Awaitable[T]], max_retries: int | None = None, initial_delay: float | None = None
+    ) -> T:
+        """Retry a function with jittered exponential backoff on transient errors.
 
-    async def _retry_with_backoff(self, func: Callable[[], T], max_retries: int = 3, initial_delay: float = 1.0) -> T:
-        """Retry a function with exponential backoff for rate limit errors.
+        Timeouts, connection errors, 429 and 5xx responses are retried after
+        a random delay below an exponentially growing cap, or after the
+        server's ``Retry-After`` if that is longer. Other errors, and an
+        open circuit, are raised immediately.
 
         Args:
             func: Async function to retry
-            max_retries: Maximum number of retry attempts
-            initial_delay: Initial delay in seconds (doubles each retry)
+            max_retries: Maximum number of retry attempts (default from config)
+            initial_delay: Backoff cap of the first retry in seconds (default from config)
 
         Returns:
             Result from the function
 
         Raises:
-            Exception: If all retries are exhausted
+            FetchError: If the last attempt failed with a transient error
         """
-
-        delay = initial_delay
-
-        for attempt in range(max_retries + 1):
+        policy = self.retry_policy
+        if max_retries is not None or initial_delay is not None:
+            policy = RetryPolicy(
+                max_retries=policy.max_retries if max_retries is None else max_retries,
+                initial_delay=policy.initial_delay if initial_delay is None else initial_delay,
+                max_delay=policy.max_delay,
+            )
+
+        for attempt in range(policy.max_retries + 1):
             try:
                 return await func()
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 429 and attempt < max_retries:
-                    logger.warning(f"Rate limit hit (429), retrying in {delay}s (attempt {attempt + 1}/{max_retries})")
-                    await asyncio.sleep(delay)
-                    delay *= 2  # Exponential backoff
-                else:
+            except SourceUnavailableError:
+                raise
+            except Exception as e:
+                if not is_transient_error(e):
                     raise
+                if attempt == policy.max_retries:
+                    raise FetchError(f"{self.source_name} request failed after {attempt + 1} attempts: {e}") from e
+                delay = policy.backoff(attempt, retry_after_seconds(e))
+                logger.warning(
+                    f"{self.source_name}: {e!r}, retrying in {delay:.1f}s (attempt {attempt + 1}/{policy.max_retries})"
+                )
+                await asyncio.sleep(delay)
 
         # Should never reach here, but satisfy type checker
         raise RuntimeError("Retry logic error")
@@ -74,6 +165,26 @@ class BaseScraper(ABC):
         """Fetch papers published since timestamp."""
         pass
 
+    async def iter_recent_papers(self, days: int) -> AsyncGenerator[list[Paper], None]:
+        """Yield papers from last N days one page at a time.
+
+        Lets downstream stages start before the whole crawl finishes.
+        Scrapers with paginated APIs override this; the default yields
+        the full result of ``fetch_recent_papers`` as a single page.
+        """
+        yield await self.fetch_recent_papers(days)
+
+    async def iter_new_since(self, checkpoint: SourceCheckpoint) -> AsyncGenerator[list[Paper], None]:
+        """Yield papers published since the checkpoint one page at a time.
+
+        Scrapers that can resume an interrupted crawl store their position
+        in ``checkpoint.cursor`` before yielding each page and clear it when
+        the crawl completes; the caller saves the checkpoint after each page
+        is processed. The default refetches everything since the watermark
+        as a single page.
+        """
+        yield await self.fetch_new_since(checkpoint.watermark)
+
     @property
     @abstractmethod
     def source_name(self) -> str:
@@ -0,0 +1,133 @@
+"""Recording of scraper HTTP traffic into cassette files.
+
+A cassette holds the responses one source returned during a run, one JSON
+file per source. ``CassetteRecorder`` is attached to a ``ScraperSession``
+and captures every response received from the network (cache hits and 304
+revalidations are not recorded). ``ReplayServer`` in ``replay_server``
+serves cassettes back to the scrapers.
+
+Only the request path and query string are recorded, never request
+headers, so API keys sent as headers do not end up in cassettes.
+"""
+
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Response headers worth replaying; the rest describe the original transfer
+_RECORDED_HEADERS = ("content-type", "etag", "last-modified", "retry-after")
+
+
+def normalize_query(query: str, ignore: frozenset[str] = frozenset()) -> str:
+    """Return a query string with parameters sorted, so parameter order does not matter."""
+    params = [(key, value) for key, value in parse_qsl(query, keep_blank_values=True) if key not in ignore]
+    return urlencode(sorted(params))
+
+
+@dataclass
+class Interaction:
+    """One recorded request and its response.
+
+    Attributes:
+        path: Request path on the source's host
+        query: Normalized query string
+        status: HTTP status code
+        headers: Content-Type, validator and Retry-After headers
+        body: Response body text
+    """
+
+    path: str
+    query: str
+    status: int
+    headers: dict[str, str]
+    body: str
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> "Interaction":
+        """Capture a received response."""
+        url = response.request.url
+        return cls(
+            path=url.path,
+            query=normalize_query(url.query.decode("ascii")),
+            status=response.status_code,
+            headers={name: response.headers[name] for name in _RECORDED_HEADERS if name in response.headers},
+            body=response.text,
+        )
+
+
+@dataclass
+class Cassette:
+    """Recorded traffic of one source.
+
+    Attributes:
+        source: Source name
+        interactions: Responses in the order they were received
+        recorded_at: ISO timestamp of the recording
+    """
+
+    source: str
+    interactions: list[Interaction] = field(default_factory=list)
+    recorded_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Cassette":
+        """Read a cassette file."""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            source=data["source"],
+            interactions=[Interaction(**item) for item in data["interactions"]],
+            recorded_at=data.get("recorded_at", ""),
+        )
+
+    def save(self, path: str | Path) -> None:
+        """Write the cassette as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f, indent=2, ensure_ascii=False)
+
+
+def load_cassettes(directory: str | Path) -> dict[str, Cassette]:
+    """Load every ``*.json`` cassette in a directory, keyed by source."""
+    cassettes = {}
+    for path in sorted(Path(directory).glob("*.json")):
+        cassette = Cassette.load(path)
+        cassettes[cassette.source] = cassette
+    return cassettes
+
+
+class CassetteRecorder:
+    """Collects responses per source during a run."""
+
+    def __init__(self) -> None:
+        """Initialize with no recordings."""
+        self.cassettes: dict[str, Cassette] = {}
+
+    def record(self, source: str, response: httpx.Response) -> None:
+        """Add a response received for ``source``."""
+        if response.status_code == 304:
+            return
+        cassette = self.cassettes.setdefault(source, Cassette(source))
+        cassette.interactions.append(Interaction.from_response(response))
+
+    def save(self, directory: str | Path) -> list[Path]:
+        """Write one ``<source>.json`` cassette per recorded source.
+
+        Returns:
+            Paths of the written files
+        """
+        paths = []
+        for source, cassette in self.cassettes.items():
+            path = Path(directory) / f"{source}.json"
+            cassette.save(path)
+            paths.append(path)
+            logger.info(f"Recorded {len(cassette.interactions)} {source} responses to {path}")
+        return paths
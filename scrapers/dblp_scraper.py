@@ -1,13 +1,13 @@
 """DBLP Computer Science Bibliography scraper."""
 
 import logging
+from collections.abc import AsyncGenerator
 from datetime import UTC, datetime, timedelta
 
-import httpx
-
-from models.paper import Paper
+from models.paper import Paper, normalize_arxiv_id, normalize_doi
 
 from .base import BaseScraper
+from .resilience import FetchError
 
 logger = logging.getLogger(__name__)
 
@@ -22,11 +22,20 @@ class DBLPScraper(BaseScraper):
 
     async def fetch_recent_papers(self, days: int) -> list[Paper]:
         """Fetch papers from last N days by searching configured venues."""
-        papers = []
+        filtered_papers = []
+        async for page in self.iter_recent_papers(days):
+            filtered_papers.extend(page)
+
+        logger.info(f"Fetched {len(filtered_papers)} papers from DBLP (deduplicated, filtered by date)")
+        return filtered_papers
+
+    async def iter_recent_papers(self, days: int) -> AsyncGenerator[list[Paper], None]:
+        """Yield papers from last N days, one venue/year search at a time."""
         venues = self.config.get("venues", ["NeurIPS", "ICLR", "ICML"])
 
         current_year = datetime.now(UTC).year
         cutoff_date = datetime.now(UTC) - timedelta(days=days)
+        cutoff_naive = cutoff_date.replace(tzinfo=None)
 
         years_to_search = []
         for year in range(cutoff_date.year, current_year + 1):
@@ -41,18 +50,14 @@ class DBLPScraper(BaseScraper):
                 logger.debug(f"Searching DBLP: venue={venue}, year={year}")
                 venue_papers = await self._search_venue(venue, year)
 
+                page = []
                 for paper in venue_papers:
                     if paper.id not in seen_ids:
-                        papers.append(paper)
                         seen_ids.add(paper.id)
+                        if paper.published_date >= cutoff_naive:
+                            page.append(paper)
 
-                await self._rate_limit()
-
-        cutoff_naive = cutoff_date.replace(tzinfo=None)
-        filtered_papers = [p for p in papers if p.published_date >= cutoff_naive]
-
-        logger.info(f"Fetched {len(filtered_papers)} papers from DBLP (deduplicated, filtered by date)")
-        return filtered_papers
+                yield page
 
     async def fetch_new_since(self, last_check: datetime) -> list[Paper]:
         """Fetch papers since timestamp."""
@@ -68,18 +73,19 @@ class DBLPScraper(BaseScraper):
         url = f"{base_url}?q={query}&format=json&h={max_hits}"
 
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
 
-                async def make_request():
-                    response = await client.get(url)
-                    response.raise_for_status()
-                    return response
+            async def make_request():
+                response = await self._get(url)
+                response.raise_for_status()
+                return response
 
-                response = await self._retry_with_backoff(make_request)
-                data = response.json()
+            response = await self._retry_with_backoff(make_request)
+            data = response.json()
 
-                return self._parse_response(data, venue)
+            return self._parse_response(data, venue)
 
+        except FetchError:
+            raise
         except Exception as e:
             logger.error(f"Error fetching DBLP papers for {venue} {year}: {e}")
             return []
@@ -171,6 +177,8 @@ class DBLPScraper(BaseScraper):
                 source="dblp",
                 url=url,
                 venue=venue_name,
+                doi=normalize_doi(info.get("doi")),
+                arxiv_id=self._arxiv_id_from_ee(info.get("ee")),
             )
 
             return paper
@@ -178,3 +186,12 @@ class DBLPScraper(BaseScraper):
         except Exception as e:
             logger.warning(f"Error parsing DBLP hit: {e}")
             return None
+
+    @staticmethod
+    def _arxiv_id_from_ee(ee: str | list[str] | None) -> str | None:
+        """Return the arXiv id among a record's electronic edition links, if any."""
+        links = [ee] if isinstance(ee, str) else ee or []
+        for link in links:
+            if "arxiv.org" in link:
+                return normalize_arxiv_id(link)
+        return None
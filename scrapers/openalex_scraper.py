@@ -1,13 +1,16 @@
 """OpenAlex paper scraper."""
 
 import logging
+from collections.abc import AsyncGenerator
 from datetime import UTC, datetime, timedelta
 
 import httpx
 
-from models.paper import Paper
+from models.checkpoint import SourceCheckpoint
+from models.paper import Paper, normalize_arxiv_id, normalize_doi
 
 from .base import BaseScraper
+from .resilience import FetchError
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +32,14 @@ class OpenAlexScraper(BaseScraper):
         logger.info(f"Fetched {len(papers)} papers from OpenAlex")
         return papers
 
+    async def iter_recent_papers(self, days: int) -> AsyncGenerator[list[Paper], None]:
+        """Yield papers from last N days, one cursor page at a time."""
+        from_date = (datetime.now(UTC) - timedelta(days=days)).strftime("%Y-%m-%d")
+        filters = {"from_publication_date": from_date}
+        logger.info(f"Fetching OpenAlex papers from {from_date} ({days} days)")
+        async for page in self._iter_works(filters):
+            yield page
+
     async def fetch_new_since(self, last_check: datetime) -> list[Paper]:
         """Fetch papers since timestamp."""
         from_date = last_check.strftime("%Y-%m-%d")
@@ -36,6 +47,18 @@ class OpenAlexScraper(BaseScraper):
         logger.info(f"Fetching OpenAlex papers since {from_date}")
         return await self._fetch_works(filters)
 
+    async def iter_new_since(self, checkpoint: SourceCheckpoint) -> AsyncGenerator[list[Paper], None]:
+        """Yield papers since the checkpoint, resuming from the stored cursor."""
+        cursor = checkpoint.cursor
+        from_date = cursor.get("from_date") or checkpoint.watermark.strftime("%Y-%m-%d")
+        logger.info(f"Fetching OpenAlex papers since {from_date}")
+
+        filters = {"from_publication_date": from_date}
+        async for papers, next_cursor in self._iter_work_pages(filters, cursor.get("next_cursor", "*")):
+            checkpoint.cursor = {"from_date": from_date, "next_cursor": next_cursor} if next_cursor else {}
+            yield papers
+        checkpoint.cursor = {}
+
     def _reconstruct_abstract(self, inverted_index: dict) -> str:
         """Reconstruct abstract from inverted index.
 
@@ -66,6 +89,35 @@ class OpenAlexScraper(BaseScraper):
         Returns:
             List of parsed papers
         """
+        papers = []
+        async for page in self._iter_works(filters):
+            papers.extend(page)
+        return papers
+
+    async def _iter_works(self, filters: dict) -> AsyncGenerator[list[Paper], None]:
+        """Yield parsed works page by page, following the OpenAlex cursor.
+
+        Args:
+            filters: Dictionary of filter parameters
+
+        Yields:
+            Papers parsed from each results page
+        """
+        async for papers, _ in self._iter_work_pages(filters):
+            yield papers
+
+    async def _iter_work_pages(
+        self, filters: dict, cursor: str = "*"
+    ) -> AsyncGenerator[tuple[list[Paper], str | None], None]:
+        """Yield parsed works page by page together with the cursor of the next page.
+
+        Args:
+            filters: Dictionary of filter parameters
+            cursor: Cursor to start from ("*" for the first page)
+
+        Yields:
+            Papers parsed from each results page and the next cursor (None on the last page)
+        """
         base_url = self.config["base_url"]
         email = self.config.get("email", "")
         concepts = self.config.get("concepts", [])
@@ -82,52 +134,50 @@ class OpenAlexScraper(BaseScraper):
 
         headers = {"User-Agent": f"ResearchDataAnalyzer/1.0 (mailto:{email})"}
 
-        papers = []
-        cursor = "*"
         per_page = 100
 
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            while True:
-                await self._rate_limit()
+        while True:
+            url = f"{base_url}/works"
+            params = {"filter": filter_string, "per-page": per_page, "cursor": cursor}
 
-                url = f"{base_url}/works"
-                params = {"filter": filter_string, "per-page": per_page, "cursor": cursor}
+            try:
 
-                try:
+                async def make_request(request_url: str = url, request_params: dict = params) -> httpx.Response:
+                    response = await self._get(request_url, params=request_params, headers=headers)
+                    response.raise_for_status()
+                    return response
 
-                    async def make_request(request_url: str = url, request_params: dict = params) -> httpx.Response:
-                        response = await client.get(request_url, params=request_params, headers=headers)
-                        response.raise_for_status()
-                        return response
+                response = await self._retry_with_backoff(make_request)
+                data = response.json()
 
-                    response = await self._retry_with_backoff(make_request)
-                    data = response.json()
+            except FetchError:
+                raise
+            except Exception as e:
+                logger.error(f"Error fetching OpenAlex works: {e}")
+                break
 
-                    results = data.get("results", [])
-                    if not results:
-                        break
+            results = data.get("results", [])
+            if not results:
+                break
 
-                    for work in results:
-                        try:
-                            paper = self._parse_work(work)
-                            if paper:
-                                papers.append(paper)
-                        except Exception as e:
-                            logger.warning(f"Error parsing OpenAlex work: {e}")
-                            continue
+            papers = []
+            for work in results:
+                try:
+                    paper = self._parse_work(work)
+                    if paper:
+                        papers.append(paper)
+                except Exception as e:
+                    logger.warning(f"Error parsing OpenAlex work: {e}")
+                    continue
 
-                    meta = data.get("meta", {})
-                    next_cursor = meta.get("next_cursor")
-                    if not next_cursor:
-                        break
+            meta = data.get("meta", {})
+            next_cursor = meta.get("next_cursor")
+            yield papers, next_cursor
 
-                    cursor = next_cursor
+            if not next_cursor:
+                break
 
-                except Exception as e:
-                    logger.error(f"Error fetching OpenAlex works: {e}")
-                    break
-
-        return papers
+            cursor = next_cursor
 
     def _parse_work(self, work: dict) -> Paper | None:
         """Parse OpenAlex work into Paper.
@@ -191,4 +241,15 @@ class OpenAlexScraper(BaseScraper):
             url=url,
             citation_count=citation_count,
             venue=venue,
+            doi=normalize_doi(doi),
+            arxiv_id=self._arxiv_id_from_locations(work),
         )
+
+    @staticmethod
+    def _arxiv_id_from_locations(work: dict) -> str | None:
+        """Return the arXiv id of a work hosted on arXiv, if any."""
+        for location in work.get("locations") or []:
+            landing_page = (location or {}).get("landing_page_url") or ""
+            if "arxiv.org" in landing_page:
+                return normalize_arxiv_id(landing_page)
+        return None
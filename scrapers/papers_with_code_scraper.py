@@ -2,15 +2,16 @@
 
 import logging
 import os
+from collections.abc import AsyncGenerator
 from datetime import UTC, datetime, timedelta
 from functools import partial
 from json import JSONDecodeError
 
-import httpx
-
-from models.paper import Paper
+from models.checkpoint import SourceCheckpoint
+from models.paper import Paper, normalize_arxiv_id
 
 from .base import BaseScraper
+from .resilience import FetchError
 
 logger = logging.getLogger(__name__)
 
@@ -25,37 +26,59 @@ class PapersWithCodeScraper(BaseScraper):
 
     async def fetch_recent_papers(self, days: int) -> list[Paper]:
         """Fetch papers from last N days."""
+        all_papers = []
+
+        try:
+            async for papers in self.iter_recent_papers(days):
+                all_papers.extend(papers)
+
+        except Exception as e:
+            logger.error(f"Error fetching Papers with Code papers: {e}")
+
+        logger.info(f"Fetched {len(all_papers)} papers from Papers with Code")
+        return all_papers
+
+    async def iter_recent_papers(self, days: int) -> AsyncGenerator[list[Paper], None]:
+        """Yield papers from last N days, one API page at a time."""
         logger.info(f"Fetching Papers with Code papers (last {days} days)")
 
         cutoff_date = datetime.now(UTC) - timedelta(days=days)
-        all_papers = []
+        async for _, papers in self._iter_pages(cutoff_date):
+            yield papers
 
-        try:
-            # Fetch papers in pages
-            page = 1
-            max_pages = self.config.get("max_pages", 10)
-            items_per_page = self.config.get("max_results_per_page", 50)
+    async def iter_new_since(self, checkpoint: SourceCheckpoint) -> AsyncGenerator[list[Paper], None]:
+        """Yield papers since the checkpoint, resuming at the stored page."""
+        cursor = checkpoint.cursor
+        since = datetime.fromisoformat(cursor["since"]) if cursor else checkpoint.watermark
+        start_page = cursor.get("page", 1)
+        logger.info(f"Fetching Papers with Code papers since {since:%Y-%m-%d} from page {start_page}")
 
-            while page <= max_pages:
-                papers = await self._fetch_page(page, items_per_page, cutoff_date)
+        async for page, papers in self._iter_pages(since, start_page):
+            checkpoint.cursor = {"since": since.isoformat(), "page": page + 1}
+            yield papers
+        checkpoint.cursor = {}
 
-                if not papers:
-                    break
+    async def _iter_pages(
+        self, cutoff_date: datetime, start_page: int = 1
+    ) -> AsyncGenerator[tuple[int, list[Paper]], None]:
+        """Yield page numbers with the papers parsed from them."""
+        page = start_page
+        max_pages = self.config.get("max_pages", 10)
+        items_per_page = self.config.get("max_results_per_page", 50)
 
-                all_papers.extend(papers)
+        while page <= max_pages:
+            papers = await self._fetch_page(page, items_per_page, cutoff_date)
 
-                # If we got fewer papers than requested, we've reached the end
-                if len(papers) < items_per_page:
-                    break
+            if not papers:
+                break
 
-                page += 1
-                await self._rate_limit()
+            yield page, papers
 
-        except Exception as e:
-            logger.error(f"Error fetching Papers with Code papers: {e}")
+            # If we got fewer papers than requested, we've reached the end
+            if len(papers) < items_per_page:
+                break
 
-        logger.info(f"Fetched {len(all_papers)} papers from Papers with Code")
-        return all_papers
+            page += 1
 
     async def fetch_new_since(self, last_check: datetime) -> list[Paper]:
         """Fetch papers since timestamp."""
@@ -64,43 +87,36 @@ class PapersWithCodeScraper(BaseScraper):
 
     async def _fetch_from_api(self, url: str) -> dict:
         """Fetch data from Papers with Code API."""
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            headers = {}
-            api_key = os.getenv("PAPERS_WITH_CODE_API_KEY")
-            if api_key:
-                headers["Authorization"] = f"Token {api_key}"
-                logger.debug("Using Papers with Code API key for authentication")
-            else:
-                logger.debug(
-                    "No PAPERS_WITH_CODE_API_KEY found. API may be rate-limited or return HTML instead of JSON."
-                )
-
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-
-            content_type = response.headers.get("content-type", "")
-            if "application/json" not in content_type:
-                error_preview = response.text[:500]
-                logger.error(f"Expected JSON, got '{content_type}'. Response preview: {error_preview}")
-                if "text/html" in content_type:
-                    logger.error(
-                        "API returned HTML instead of JSON. "
-                        "This likely means authentication is required. "
-                        "Get an API key from https://paperswithcode.com/api/v1/docs/ "
-                        "and set PAPERS_WITH_CODE_API_KEY environment variable."
-                    )
-                raise ValueError(
-                    f"API returned {content_type} instead of JSON. May require API key for authentication."
+        headers = {}
+        api_key = os.getenv("PAPERS_WITH_CODE_API_KEY")
+        if api_key:
+            headers["Authorization"] = f"Token {api_key}"
+            logger.debug("Using Papers with Code API key for authentication")
+        else:
+            logger.debug("No PAPERS_WITH_CODE_API_KEY found. API may be rate-limited or return HTML instead of JSON.")
+
+        response = await self._get(url, headers=headers)
+        response.raise_for_status()
+
+        content_type = response.headers.get("content-type", "")
+        if "application/json" not in content_type:
+            error_preview = response.text[:500]
+            logger.error(f"Expected JSON, got '{content_type}'. Response preview: {error_preview}")
+            if "text/html" in content_type:
+                logger.error(
+                    "API returned HTML instead of JSON. "
+                    "This likely means authentication is required. "
+                    "Get an API key from https://paperswithcode.com/api/v1/docs/ "
+                    "and set PAPERS_WITH_CODE_API_KEY environment variable."
                 )
+            raise ValueError(f"API returned {content_type} instead of JSON. May require API key for authentication.")
 
-            try:
-                return response.json()
-            except JSONDecodeError as e:
-                error_preview = response.text[:500]
-                logger.error(f"Failed to decode JSON response: {e}. Response preview: {error_preview}")
-                raise ValueError(
-                    f"Invalid JSON response from API: {e}. Response may be malformed or incomplete."
-                ) from e
+        try:
+            return response.json()
+        except JSONDecodeError as e:
+            error_preview = response.text[:500]
+            logger.error(f"Failed to decode JSON response: {e}. Response preview: {error_preview}")
+            raise ValueError(f"Invalid JSON response from API: {e}. Response may be malformed or incomplete.") from e
 
     async def _fetch_page(self, page: int, items_per_page: int, cutoff_date: datetime) -> list[Paper]:
         """Fetch a single page of papers."""
@@ -114,6 +130,8 @@ class PapersWithCodeScraper(BaseScraper):
             papers = self._parse_papers_response(data, cutoff_date)
             return papers
 
+        except FetchError:
+            raise
         except Exception as e:
             logger.error(f"Error fetching page {page}: {e}")
             return []
@@ -126,7 +144,6 @@ class PapersWithCodeScraper(BaseScraper):
         try:
             fetch_func = partial(self._fetch_from_api, url)
             data = await self._retry_with_backoff(fetch_func)
-            await self._rate_limit()
             return data
 
         except Exception as e:
@@ -144,7 +161,6 @@ class PapersWithCodeScraper(BaseScraper):
         try:
             fetch_func = partial(self._fetch_from_api, url)
             data = await self._retry_with_backoff(fetch_func)
-            await self._rate_limit()
 
             datasets = []
             for item in data.get("results", []):
@@ -172,7 +188,6 @@ class PapersWithCodeScraper(BaseScraper):
         try:
             fetch_func = partial(self._fetch_from_api, url)
             data = await self._retry_with_backoff(fetch_func)
-            await self._rate_limit()
 
             benchmarks = []
             for item in data.get("results", []):
@@ -245,6 +260,7 @@ class PapersWithCodeScraper(BaseScraper):
                     published_date=published_date.replace(tzinfo=None),
                     source="papers_with_code",
                     url=url,
+                    arxiv_id=normalize_arxiv_id(item.get("arxiv_id")),
                 )
                 papers.append(paper)
 
@@ -0,0 +1,223 @@
+"""Per-host token-bucket rate limiting for scraper requests.
+
+Every request takes a token from the bucket of its host before it is sent.
+Buckets are shared by all scrapers and coroutines using the same
+``ScraperSession``, and waiting happens under a per-bucket lock, so
+concurrent callers queue in order instead of racing past a shared
+timestamp. Buckets adapt to the server: ``Retry-After`` and exhausted
+``X-RateLimit-Remaining`` pause the host, a 429 halves the refill rate,
+and successful responses restore it step by step.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Adaptive throttling: multiplicative decrease on 429, additive increase on success
+BACKOFF_FACTOR = 0.5
+RECOVERY_STEP = 0.1  # Fraction of the configured rate restored per successful response
+MIN_RATE_FRACTION = 1 / 16
+
+# X-RateLimit-Reset values above this are absolute epoch timestamps, not seconds
+_EPOCH_THRESHOLD = 1e9
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """Return the seconds to wait from a ``Retry-After`` value (delay or HTTP date)."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - (now or time.time()))
+    except (TypeError, ValueError):
+        return None
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> float | None:
+    """Return a numeric header value, or None if missing or malformed."""
+    value = headers.get(name)
+    if not isinstance(value, str):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+@dataclass
+class RateLimitStats:
+    """Limiter activity of one source.
+
+    Attributes:
+        requests: Tokens taken
+        waited_seconds: Total time spent waiting for tokens
+        max_wait_seconds: Longest single wait
+        throttled: 429 responses received
+    """
+
+    requests: int = 0
+    waited_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    throttled: int = 0
+
+    def to_dict(self) -> dict:
+        """Serialize to JSON-compatible dict."""
+        return {
+            "requests": self.requests,
+            "waited_seconds": round(self.waited_seconds, 3),
+            "mean_wait_seconds": round(self.waited_seconds / self.requests, 3) if self.requests else 0.0,
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+            "throttled": self.throttled,
+        }
+
+
+class TokenBucket:
+    """Token bucket for one host.
+
+    Holds up to ``burst`` tokens, refilled at ``current_rate`` tokens per
+    second. ``current_rate`` starts at the configured ``rate`` and adapts to
+    server feedback without ever exceeding it. A ``rate`` of None means
+    unlimited, though server-requested pauses are still honored.
+    """
+
+    def __init__(self, rate: float | None, burst: int = 1) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Configured tokens per second, or None for no limit
+            burst: Bucket capacity, i.e. requests allowed back to back
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.current_rate = rate
+        self.tokens = float(self.burst)
+        self.blocked_until = 0.0
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        """Wait for and take one token.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if self.blocked_until > now:
+                    delay = self.blocked_until - now
+                else:
+                    self._refill(now)
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return waited
+                    delay = (1 - self.tokens) / self.current_rate  # type: ignore[operator]
+                await asyncio.sleep(delay)
+                waited += delay
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Adapt to a response's status and rate limit headers."""
+        now = time.monotonic()
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        if retry_after is not None:
+            self._block(now + retry_after)
+
+        remaining = _header_float(headers, "X-RateLimit-Remaining")
+        reset = _header_float(headers, "X-RateLimit-Reset")
+        if reset is not None and reset > _EPOCH_THRESHOLD:
+            reset = max(0.0, reset - time.time())
+        if remaining is not None and remaining < 1 and reset is not None:
+            self._block(now + reset)
+
+        if self.rate is None:
+            return
+        if status_code == 429:
+            self.current_rate = max(self.rate * MIN_RATE_FRACTION, self.current_rate * BACKOFF_FACTOR)  # type: ignore[operator]
+            self.tokens = min(self.tokens, 0.0)
+            logger.debug(f"429 received, refill rate lowered to {self.current_rate:.3f}/s")
+        elif remaining is not None and reset:
+            # Spread what is left of the server's window over the time until it resets
+            self.current_rate = max(self.rate * MIN_RATE_FRACTION, min(self.rate, remaining / reset))
+        elif status_code < 400:
+            self.current_rate = min(self.rate, self.current_rate + self.rate * RECOVERY_STEP)  # type: ignore[operator]
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update."""
+        if self.current_rate is None:
+            self.tokens = float(self.burst)
+        else:
+            self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.current_rate)
+        self._updated = now
+
+    def _block(self, until: float) -> None:
+        """Pause the host until ``until`` (monotonic time)."""
+        if until > self.blocked_until:
+            self.blocked_until = until
+            self.tokens = min(self.tokens, 0.0)
+            self._updated = max(self._updated, until)
+
+
+class HostRateLimiter:
+    """Token buckets keyed by host, with wait statistics per source."""
+
+    def __init__(self) -> None:
+        """Initialize with no configured hosts."""
+        self._buckets: dict[str, TokenBucket] = {}
+        self._stats: dict[str, RateLimitStats] = {}
+
+    def configure(self, url: str, interval_seconds: float, burst: int = 1) -> None:
+        """Limit a host to one request per ``interval_seconds`` with bursts of ``burst``.
+
+        If several sources share a host, the strictest limit wins. An
+        interval of 0 leaves the host unlimited.
+        """
+        rate = 1 / interval_seconds if interval_seconds > 0 else None
+        host = httpx.URL(url).host
+        existing = self._buckets.get(host)
+        if existing is not None and _as_rate(existing.rate) <= _as_rate(rate):
+            return
+        self._buckets[host] = TokenBucket(rate, burst)
+
+    def bucket(self, url: str) -> TokenBucket:
+        """Return the bucket for a URL's host, unlimited if not configured."""
+        host = httpx.URL(url).host
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(None)
+        return bucket
+
+    async def acquire(self, url: str, source: str) -> float:
+        """Wait for a token for ``url``'s host, recording the wait under ``source``."""
+        waited = await self.bucket(url).acquire()
+        stats = self._stats.setdefault(source, RateLimitStats())
+        stats.requests += 1
+        stats.waited_seconds += waited
+        stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
+        return waited
+
+    def observe(self, url: str, source: str, response: httpx.Response) -> None:
+        """Feed a response back to its host's bucket."""
+        self.bucket(url).observe(response.status_code, response.headers)
+        if response.status_code == 429:
+            self._stats.setdefault(source, RateLimitStats()).throttled += 1
+
+    def metrics(self) -> dict[str, dict]:
+        """Return wait statistics per source."""
+        return {source: stats.to_dict() for source, stats in self._stats.items()}
+
+
+def _as_rate(rate: float | None) -> float:
+    """Return a rate with None (unlimited) as infinity."""
+    return math.inf if rate is None else rate
@@ -0,0 +1,256 @@
+"""Local stand-in server that replays recorded scraper traffic.
+
+``ReplayServer`` is a plain ASGI application serving the cassettes written
+by ``CassetteRecorder``. Each source is mounted under its name, followed by
+the path of its real API: arXiv requests for
+``http://export.arxiv.org/api/query`` are answered at
+``http://<host>:<port>/arxiv/api/query``. ``replay_sources`` rewrites a
+sources configuration to point there.
+
+Latency and HTTP 429 responses can be injected to exercise the rate
+limiter and retries. Requests for pages beyond the recording get an empty
+page in the source's format, so paginated crawls end as they would on the
+real API.
+
+Usage:
+    python -m research_data_analyzer.scrapers.replay_server --cassettes DIR \\
+        [--port 8765] [--latency-ms 50] [--throttle-every 20] [--write-sources PATH]
+
+Running the server needs uvicorn (``research-data-analyzer[replay]``); the
+application itself can also be used in-process with ``httpx.ASGITransport``.
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import logging
+import random
+from collections.abc import Awaitable, Callable, MutableMapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from .cassette import Cassette, Interaction, load_cassettes, normalize_query
+
+logger = logging.getLogger(__name__)
+
+UVICORN_AVAILABLE = importlib.util.find_spec("uvicorn") is not None
+
+# Last page of each source's API, served for pages beyond the recording
+EMPTY_PAGES: dict[str, tuple[str, str]] = {
+    "arxiv": (
+        "application/atom+xml",
+        '<?xml version="1.0" encoding="UTF-8"?>\n<feed xmlns="http://www.w3.org/2005/Atom"></feed>\n',
+    ),
+    "semantic_scholar": ("application/json", json.dumps({"total": 0, "offset": 0, "data": []})),
+    "openalex": ("application/json", json.dumps({"meta": {"count": 0, "next_cursor": None}, "results": []})),
+    "papers_with_code": ("application/json", json.dumps({"count": 0, "next": None, "results": []})),
+    "dblp": ("application/json", json.dumps({"result": {"hits": {"@total": "0", "hit": []}}})),
+}
+
+Scope = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[MutableMapping[str, Any]]]
+Send = Callable[[MutableMapping[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class ReplayStats:
+    """Requests handled by a replay server.
+
+    Attributes:
+        requests: Requests received
+        replayed: Answered with a recorded response
+        not_modified: Answered 304 to a matching If-None-Match
+        empty_pages: Answered with an empty page beyond the recording
+        throttled: Answered 429 by injection
+        not_found: Paths with no recording
+    """
+
+    requests: int = 0
+    replayed: int = 0
+    not_modified: int = 0
+    empty_pages: int = 0
+    throttled: int = 0
+    not_found: int = 0
+
+    def to_dict(self) -> dict:
+        """Serialize to JSON-compatible dict."""
+        return dict(self.__dict__)
+
+
+class ReplayServer:
+    """ASGI application answering scraper requests from cassettes."""
+
+    def __init__(
+        self,
+        cassettes: dict[str, Cassette],
+        *,
+        latency_seconds: float = 0.0,
+        latency_jitter_seconds: float = 0.0,
+        throttle_every: int = 0,
+        retry_after_seconds: float = 1.0,
+        ignore_params: frozenset[str] = frozenset(),
+        seed: int = 0,
+    ) -> None:
+        """Index cassettes for lookup.
+
+        Args:
+            cassettes: Recorded traffic keyed by source name
+            latency_seconds: Delay added before every response
+            latency_jitter_seconds: Upper bound of a random extra delay
+            throttle_every: Answer every Nth request with 429 (0 disables)
+            retry_after_seconds: Retry-After sent with injected 429 responses
+            ignore_params: Query parameters left out of matching, e.g. ``year``
+                for queries built from the current date
+            seed: Seed of the latency jitter
+        """
+        self.latency_seconds = latency_seconds
+        self.latency_jitter_seconds = latency_jitter_seconds
+        self.throttle_every = throttle_every
+        self.retry_after_seconds = retry_after_seconds
+        self.ignore_params = ignore_params
+        self.stats = ReplayStats()
+        self._random = random.Random(seed)
+        self._responses: dict[tuple[str, str, str], list[Interaction]] = {}
+        self._paths: set[tuple[str, str]] = set()
+        self._replay_counts: dict[tuple[str, str, str], int] = {}
+        for source, cassette in cassettes.items():
+            for interaction in cassette.interactions:
+                key = (source, interaction.path, normalize_query(interaction.query, ignore_params))
+                self._responses.setdefault(key, []).append(interaction)
+                self._paths.add((source, interaction.path))
+
+    @classmethod
+    def from_directory(cls, directory: str | Path, **kwargs: Any) -> "ReplayServer":
+        """Create a server for every cassette in a directory."""
+        return cls(load_cassettes(directory), **kwargs)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one ASGI connection."""
+        if scope["type"] == "lifespan":
+            while (await receive())["type"] != "lifespan.shutdown":
+                await send({"type": "lifespan.startup.complete"})
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+        if scope["type"] != "http":
+            return
+
+        headers = {name.decode("latin-1").lower(): value.decode("latin-1") for name, value in scope["headers"]}
+        status, response_headers, body = await self.respond(
+            scope["path"], scope["query_string"].decode("latin-1"), headers
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (name.encode("latin-1"), value.encode("latin-1")) for name, value in response_headers.items()
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    async def respond(self, path: str, query: str, headers: dict[str, str]) -> tuple[int, dict[str, str], bytes]:
+        """Return status, headers and body for a request.
+
+        Args:
+            path: Request path, starting with the source name
+            query: Raw query string
+            headers: Request headers with lower-case names
+        """
+        self.stats.requests += 1
+        number = self.stats.requests
+        delay = self.latency_seconds + self._random.uniform(0, self.latency_jitter_seconds)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if self.throttle_every and number % self.throttle_every == 0:
+            self.stats.throttled += 1
+            return 429, {"retry-after": f"{self.retry_after_seconds:g}"}, b""
+
+        source, _, api_path = path.lstrip("/").partition("/")
+        api_path = f"/{api_path}"
+        key = (source, api_path, normalize_query(query, self.ignore_params))
+        recorded = self._responses.get(key)
+        if recorded:
+            # Repeated requests step through repeated recordings, then stay on the last
+            count = self._replay_counts.get(key, 0)
+            self._replay_counts[key] = count + 1
+            interaction = recorded[min(count, len(recorded) - 1)]
+            etag = interaction.headers.get("etag")
+            if etag and headers.get("if-none-match") == etag:
+                self.stats.not_modified += 1
+                return 304, {"etag": etag}, b""
+            self.stats.replayed += 1
+            return interaction.status, dict(interaction.headers), interaction.body.encode("utf-8")
+
+        if (source, api_path) in self._paths and source in EMPTY_PAGES:
+            self.stats.empty_pages += 1
+            content_type, body = EMPTY_PAGES[source]
+            return 200, {"content-type": content_type}, body.encode("utf-8")
+
+        self.stats.not_found += 1
+        logger.warning(f"No recording for {path}?{query}")
+        return 404, {"content-type": "text/plain"}, b"not recorded"
+
+
+def replay_sources(sources_config: dict, server_url: str) -> dict:
+    """Return a copy of a sources configuration with every ``base_url`` on the stand-in server."""
+    server_url = server_url.rstrip("/")
+    rewritten = {}
+    for name, config in sources_config.items():
+        if isinstance(config, dict) and config.get("base_url"):
+            path = httpx.URL(config["base_url"]).path.rstrip("/")
+            rewritten[name] = {**config, "base_url": f"{server_url}/{name}{path}"}
+        else:
+            rewritten[name] = config
+    return rewritten
+
+
+def main() -> None:
+    """Run the stand-in server."""
+    parser = argparse.ArgumentParser(description="Replay recorded scraper traffic on a local server")
+    parser.add_argument("--cassettes", required=True, help="Directory of <source>.json cassettes")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Upper bound of a random extra delay")
+    parser.add_argument("--throttle-every", type=int, default=0, help="Answer every Nth request with 429")
+    parser.add_argument("--retry-after-seconds", type=float, default=1.0, help="Retry-After of injected 429s")
+    parser.add_argument(
+        "--ignore-param", action="append", default=[], help="Query parameter left out of matching (repeatable)"
+    )
+    parser.add_argument("--write-sources", help="Write a sources.json pointing every source at this server")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    if args.write_sources:
+        sources_path = Path(__file__).resolve().parent.parent / "config" / "sources.json"
+        sources = replay_sources(json.loads(sources_path.read_text()), f"http://{args.host}:{args.port}")
+        Path(args.write_sources).write_text(json.dumps(sources, indent=2) + "\n")
+        logger.info(f"Wrote stand-in sources configuration to {args.write_sources}")
+
+    if not UVICORN_AVAILABLE:
+        raise ImportError("The stand-in server requires uvicorn; install research-data-analyzer[replay]")
+    # Imported here, not at module level, so the server classes work without the extra
+    uvicorn = importlib.import_module("uvicorn")
+
+    app = ReplayServer.from_directory(
+        args.cassettes,
+        latency_seconds=args.latency_ms / 1000,
+        latency_jitter_seconds=args.jitter_ms / 1000,
+        throttle_every=args.throttle_every,
+        retry_after_seconds=args.retry_after_seconds,
+        ignore_params=frozenset(args.ignore_param),
+    )
+    try:
+        uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+    finally:
+        logger.info(f"Replay statistics: {app.stats.to_dict()}")
+
+
+if __name__ == "__main__":
+    main()
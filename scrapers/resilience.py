@@ -0,0 +1,178 @@
+"""Retry, circuit breaking and request hedging for scrapers.
+
+Transient failures (timeouts, connection errors, HTTP 429 and 5xx) are
+retried with jittered exponential backoff that honors ``Retry-After``. A
+per-source ``CircuitBreaker`` stops sending requests to a source that keeps
+failing and lets a single probe through once its cool-down has passed.
+``hedged`` optionally duplicates a request that is slower than usual and
+returns whichever copy answers first.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import Enum
+from typing import TypeVar
+
+import httpx
+
+from .rate_limiter import parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Connection-level failures worth retrying; protocol misuse and bad URLs are not
+TRANSIENT_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+
+class FetchError(RuntimeError):
+    """A request to a source failed after all retries."""
+
+
+class SourceUnavailableError(FetchError):
+    """A source's circuit is open, so requests fail without being sent."""
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Return True for failures that a later retry may not hit."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, TRANSIENT_ERRORS)
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """Return the ``Retry-After`` delay of a failed response, if any."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return parse_retry_after(error.response.headers.get("Retry-After"))
+    return None
+
+
+@dataclass
+class RetryPolicy:
+    """Jittered exponential backoff.
+
+    Attributes:
+        max_retries: Retries after the first attempt
+        initial_delay: Backoff cap of the first retry in seconds
+        max_delay: Upper bound of any backoff cap
+    """
+
+    max_retries: int = 3
+    initial_delay: float = 1.0
+    max_delay: float = 60.0
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        """Return the delay before retry ``attempt`` (0-based).
+
+        Uses "full jitter": a uniform draw below the exponential cap, so
+        clients that failed together do not retry together. A server's
+        ``Retry-After`` is a lower bound.
+        """
+        delay = random.uniform(0, min(self.max_delay, self.initial_delay * 2**attempt))
+        return max(delay, retry_after or 0.0)
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"  # Requests flow normally
+    OPEN = "open"  # Requests fail fast
+    HALF_OPEN = "half_open"  # One probe request decides whether to close again
+
+
+class CircuitBreaker:
+    """Fail fast while a source is down.
+
+    After ``failure_threshold`` consecutive failed requests the circuit
+    opens and requests raise ``SourceUnavailableError`` without being sent.
+    After ``reset_timeout_seconds`` one probe request is let through; its
+    success closes the circuit, its failure opens it for another period.
+    """
+
+    def __init__(self, source: str, failure_threshold: int = 5, reset_timeout_seconds: float = 60.0) -> None:
+        """Initialize a closed circuit.
+
+        Args:
+            source: Source name used in errors and logs
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout_seconds: Time the circuit stays open before a probe
+        """
+        self.source = source
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def before_request(self) -> None:
+        """Let a request through or raise ``SourceUnavailableError``."""
+        if self.state == CircuitState.CLOSED:
+            return
+        if self.state == CircuitState.OPEN:
+            remaining = self._opened_at + self.reset_timeout_seconds - time.monotonic()
+            if remaining > 0:
+                raise SourceUnavailableError(f"{self.source} circuit open, retry in {remaining:.0f}s")
+            self.state = CircuitState.HALF_OPEN
+        if self._probe_in_flight:
+            raise SourceUnavailableError(f"{self.source} circuit half-open, probe in flight")
+        self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        """Count a request that reached a working source."""
+        if self.state != CircuitState.CLOSED:
+            logger.info(f"{self.source} recovered, closing circuit")
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Forget a request that ended without an outcome, e.g. because it was cancelled.
+
+        A half-open circuit then lets the next request through as its probe.
+        """
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a request that failed because the source is unhealthy."""
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state == CircuitState.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != CircuitState.OPEN:
+                logger.warning(
+                    f"{self.source} failed {self.consecutive_failures} times in a row, "
+                    f"failing fast for {self.reset_timeout_seconds:.0f}s"
+                )
+            self.state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+
+
+async def hedged(call: Callable[[], Awaitable[T]], hedge_after_seconds: float) -> T:
+    """Run ``call``; if it is still pending after ``hedge_after_seconds``, run it again.
+
+    Returns the first successful result and cancels the other attempt. If
+    both fail, the first attempt's error is raised.
+    """
+    first = asyncio.ensure_future(call())
+    done, _ = await asyncio.wait({first}, timeout=hedge_after_seconds)
+    if done:
+        return first.result()
+
+    logger.debug(f"Request slower than {hedge_after_seconds}s, sending a hedged copy")
+    pending = {first, asyncio.ensure_future(call())}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+        return first.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
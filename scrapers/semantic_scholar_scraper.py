@@ -2,14 +2,14 @@
 
 import logging
 import os
+from collections.abc import AsyncGenerator
 from datetime import UTC, datetime, timedelta
 from functools import partial
 
-import httpx
-
-from models.paper import Paper
+from models.paper import Paper, normalize_arxiv_id, normalize_doi
 
 from .base import BaseScraper
+from .resilience import FetchError
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +24,15 @@ class SemanticScholarScraper(BaseScraper):
 
     async def fetch_recent_papers(self, days: int) -> list[Paper]:
         """Fetch papers from last N days."""
+        unique_papers = []
+        async for papers in self.iter_recent_papers(days):
+            unique_papers.extend(papers)
+
+        logger.info(f"Fetched {len(unique_papers)} papers from Semantic Scholar")
+        return unique_papers
+
+    async def iter_recent_papers(self, days: int) -> AsyncGenerator[list[Paper], None]:
+        """Yield papers from last N days, one search query at a time."""
         logger.info(f"Fetching Semantic Scholar papers (last {days} days)")
 
         # Calculate which years to search based on lookback period
@@ -37,22 +46,16 @@ class SemanticScholarScraper(BaseScraper):
             years_to_search.insert(0, cutoff_year)  # Add earlier year first
             logger.info(f"Lookback spans multiple years: searching {cutoff_year} and {current_year}")
 
-        # Search all relevant years
-        all_papers = []
-        for year in years_to_search:
-            papers = await self._search_papers(year, days)
-            all_papers.extend(papers)
-
-        # Deduplicate across years
+        # Search all relevant years, deduplicating across queries and years
         seen_ids = set()
-        unique_papers = []
-        for paper in all_papers:
-            if paper.id not in seen_ids:
-                seen_ids.add(paper.id)
-                unique_papers.append(paper)
-
-        logger.info(f"Fetched {len(unique_papers)} papers from Semantic Scholar")
-        return unique_papers
+        for year in years_to_search:
+            async for papers in self._iter_search_pages(year, days):
+                page = []
+                for paper in papers:
+                    if paper.id not in seen_ids:
+                        seen_ids.add(paper.id)
+                        page.append(paper)
+                yield page
 
     async def fetch_new_since(self, last_check: datetime) -> list[Paper]:
         """Fetch papers since timestamp."""
@@ -61,13 +64,12 @@ class SemanticScholarScraper(BaseScraper):
 
     async def _fetch_from_api(self, url: str, headers: dict) -> dict:
         """Fetch data from Semantic Scholar API."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        response = await self._get(url, headers=headers)
+        response.raise_for_status()
+        return response.json()
 
-    async def _search_papers(self, year: int, days: int) -> list[Paper]:
-        """Search for recent AI/ML papers."""
+    async def _iter_search_pages(self, year: int, days: int) -> AsyncGenerator[list[Paper], None]:
+        """Yield parsed results for each dataset-focused search query."""
         base_url = self.config["base_url"]
         fields = ",".join(self.config["fields"])
 
@@ -82,7 +84,6 @@ class SemanticScholarScraper(BaseScraper):
         ]
 
         logger.info(f"Searching Semantic Scholar with {len(queries)} queries")
-        all_papers = []
         cutoff_date = datetime.now(UTC) - timedelta(days=days)
 
         headers = {}
@@ -98,23 +99,14 @@ class SemanticScholarScraper(BaseScraper):
                 fetch_func = partial(self._fetch_from_api, url, headers)
                 data = await self._retry_with_backoff(fetch_func)
                 papers = self._parse_semantic_scholar_response(data, cutoff_date)
-                all_papers.extend(papers)
-
-                await self._rate_limit()
 
+            except FetchError:
+                raise
             except Exception as e:
                 logger.error(f"Error searching Semantic Scholar for '{query}': {e}")
                 continue
 
-        # Deduplicate by paper ID
-        seen_ids = set()
-        unique_papers = []
-        for paper in all_papers:
-            if paper.id not in seen_ids:
-                seen_ids.add(paper.id)
-                unique_papers.append(paper)
-
-        return unique_papers
+            yield papers
 
     def _parse_semantic_scholar_response(self, data: dict, cutoff_date: datetime) -> list[Paper]:
         """Parse Semantic Scholar API response."""
@@ -147,7 +139,7 @@ class SemanticScholarScraper(BaseScraper):
                 citation_count = item.get("citationCount", 0)
 
                 # Build URL
-                external_ids = item.get("externalIds", {})
+                external_ids = item.get("externalIds") or {}
                 url = item.get("url", "")
                 if not url and "ArXiv" in external_ids:
                     url = f"https://arxiv.org/abs/{external_ids['ArXiv']}"
@@ -163,6 +155,8 @@ class SemanticScholarScraper(BaseScraper):
                     source="semantic_scholar",
                     url=url,
                     citation_count=citation_count,
+                    doi=normalize_doi(external_ids.get("DOI")),
+                    arxiv_id=normalize_arxiv_id(external_ids.get("ArXiv")),
                 )
                 papers.append(paper)
 
@@ -0,0 +1,175 @@
+"""Shared HTTP session for paper scrapers."""
+
+import asyncio
+import importlib.util
+import logging
+from typing import Any
+
+import httpx
+
+from persistence.http_cache import HttpCache
+
+from .cassette import CassetteRecorder
+from .rate_limiter import HostRateLimiter
+from .resilience import FetchError
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional ``h2`` package; fall back to HTTP/1.1 keep-alive without it
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class ScraperSession:
+    """Long-lived pooled HTTP client shared by all scrapers.
+
+    One ``httpx.AsyncClient`` is created lazily on first use and reused for
+    every request, so connections stay alive across pages, queries and
+    sources instead of paying a TCP+TLS handshake per call. httpx negotiates
+    gzip/deflate automatically, and brotli when the ``brotli`` package is
+    installed.
+
+    Requests are paced by ``rate_limiter``, whose per-host token buckets the
+    scrapers configure from their ``rate_limit_seconds`` settings. With a
+    ``cache``, fresh cached responses are returned without a request and
+    stale ones are revalidated with conditional requests. With a
+    ``recorder``, every response received from the network is captured for
+    replay.
+    """
+
+    def __init__(
+        self, config: dict | None = None, cache: HttpCache | None = None, recorder: CassetteRecorder | None = None
+    ) -> None:
+        """Initialize session from the ``http`` block of sources configuration.
+
+        Args:
+            config: Optional settings (timeout_seconds, max_connections,
+                max_keepalive_connections, keepalive_expiry_seconds,
+                max_connections_per_host, http2)
+            cache: Optional on-disk response cache
+            recorder: Optional recorder of received responses
+        """
+        config = config or {}
+        self.timeout_seconds = config.get("timeout_seconds", 30.0)
+        self.max_connections = config.get("max_connections", 20)
+        self.max_keepalive_connections = config.get("max_keepalive_connections", 10)
+        self.keepalive_expiry_seconds = config.get("keepalive_expiry_seconds", 30.0)
+        self.max_connections_per_host = config.get("max_connections_per_host", 4)
+        self.http2 = config.get("http2", True) and HTTP2_AVAILABLE
+
+        self._client: httpx.AsyncClient | None = None
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self.rate_limiter = HostRateLimiter()
+        self.cache = cache
+        self.recorder = recorder
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Return the pooled client, creating it on first use."""
+        if self._client is None:
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry_seconds,
+            )
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_seconds,
+                limits=limits,
+                http2=self.http2,
+                follow_redirects=True,
+            )
+            logger.debug(f"Opened pooled HTTP client (http2={self.http2}, max_connections={self.max_connections})")
+        return self._client
+
+    @property
+    def is_closed(self) -> bool:
+        """Return True if no client is open."""
+        return self._client is None
+
+    async def get(self, url: str, *, source: str = "unknown", **kwargs: Any) -> httpx.Response:
+        """Issue a GET request through the pooled client.
+
+        Each request first takes a token from its host's rate limiter bucket,
+        and the response is fed back so the bucket can adapt. Concurrent
+        requests to the same host are capped at ``max_connections_per_host``
+        so one busy source cannot take over the pool. Requests answered from
+        the cache skip both.
+
+        Args:
+            url: Request URL
+            source: Source name the limiter's wait statistics and cache TTL belong to
+            **kwargs: Passed through to ``httpx.AsyncClient.get``
+
+        Returns:
+            HTTP response
+
+        Raises:
+            FetchError: In offline mode, if the response is not cached
+        """
+        if self.cache is not None:
+            return await self._cached_get(self.cache, url, source, **kwargs)
+        return await self._send(url, source, **kwargs)
+
+    async def _cached_get(self, cache: HttpCache, url: str, source: str, **kwargs: Any) -> httpx.Response:
+        """Answer from the cache, revalidate a stale entry, or fetch and store."""
+        key = cache.make_key(url, kwargs.get("params"))
+        entry = cache.get(key)
+        if entry is not None and cache.is_fresh(entry, source):
+            cache.stats.hits += 1
+            return entry.to_response()
+        if cache.offline:
+            cache.stats.misses += 1
+            raise FetchError(f"{url} is not cached (offline mode)")
+
+        if entry is not None:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **entry.validators()}
+        response = await self._send(url, source, **kwargs)
+        if entry is not None and response.status_code == 304:
+            cache.touch(key)
+            cache.stats.revalidated += 1
+            return entry.to_response()
+
+        cache.stats.misses += 1
+        if response.status_code == 200 and "no-store" not in response.headers.get("cache-control", ""):
+            cache.put(key, source, response)
+        return response
+
+    async def _send(self, url: str, source: str, **kwargs: Any) -> httpx.Response:
+        """Send a rate-limited GET request."""
+        await self.rate_limiter.acquire(url, source)
+        async with self._host_semaphore(url):
+            response = await self.client.get(url, **kwargs)
+        self.rate_limiter.observe(url, source, response)
+        if self.recorder is not None:
+            self.recorder.record(source, response)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the pooled client and release its connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.debug("Closed pooled HTTP client")
+        for source, stats in self.rate_limiter.metrics().items():
+            if stats["waited_seconds"] or stats["throttled"]:
+                logger.info(
+                    f"Rate limiting {source}: {stats['requests']} requests, "
+                    f"waited {stats['waited_seconds']:.1f}s (max {stats['max_wait_seconds']:.1f}s), "
+                    f"{stats['throttled']} throttled"
+                )
+
+    async def __aenter__(self) -> "ScraperSession":
+        """Enter async context."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close session on context exit."""
+        await self.aclose()
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Return the per-host concurrency semaphore for a URL."""
+        host = httpx.URL(url).host
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
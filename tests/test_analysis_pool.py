@@ -0,0 +1,123 @@
+"""Tests for the process pool analysis stage."""
+
+import asyncio
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from analyzers import analysis_pool
+from analyzers.analysis_pool import analyze_chunk
+from analyzers.quality_filter import FilterConfig
+from analyzers.signal_extractor import SignalExtractor
+from models.paper import Paper
+from monitor import pipeline as pipeline_module
+from monitor.pipeline import PaperPipeline, PipelineConfig
+
+from .test_pipeline import FakeEvaluator, FakeWriter, PagedScraper
+
+HEURISTICS = json.loads((Path(__file__).parent.parent / "config" / "heuristics.json").read_text())
+
+STRONG_ABSTRACT = "Data scarcity and expensive annotation with privacy constraints; we use synthetic data."
+
+
+def make_papers(sample_paper: Paper) -> list[Paper]:
+    """Papers that are strong, weak, and rejected by the quality filter."""
+    return [
+        replace(sample_paper, id="strong", abstract=STRONG_ABSTRACT, source="arxiv", citation_count=None),
+        replace(sample_paper, id="weak", title="A note", abstract="We study things.", venue=None, citation_count=None),
+        replace(sample_paper, id="rejected", title="Uncited Survey", source="openalex", citation_count=None),
+    ]
+
+
+def test_analyze_chunk_matches_pipeline_rules(sample_paper: Paper, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Rejected papers carry a reason, weak papers no signals, strong papers full signals."""
+    monkeypatch.setattr(analysis_pool, "_extractor", SignalExtractor(HEURISTICS))
+    monkeypatch.setattr(analysis_pool, "_quality_config", FilterConfig())
+    papers = make_papers(sample_paper)
+
+    strong, weak, rejected = analyze_chunk(papers, min_signal_score=5.0)
+
+    assert strong.signals == SignalExtractor(HEURISTICS).extract(papers[0])
+    assert strong.max_signal >= 5.0
+    assert weak.rejection is None
+    assert weak.signals is None
+    assert rejected.rejection == "Citation count unavailable"
+
+
+def test_analyze_chunk_filters_as_batch_or_per_paper(sample_paper: Paper, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The PaperBatch filter and the per-paper fallback reject the same papers with the same reasons."""
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(analysis_pool, "_extractor", SignalExtractor(HEURISTICS))
+    monkeypatch.setattr(analysis_pool, "_quality_config", FilterConfig())
+    papers = [
+        *make_papers(sample_paper),
+        replace(sample_paper, id="few", citation_count=2),
+        replace(sample_paper, id="many", citation_count=500),
+    ]
+
+    batched = analyze_chunk(papers, min_signal_score=5.0)
+    monkeypatch.setattr(analysis_pool, "NUMPY_AVAILABLE", False)
+    per_paper = analyze_chunk(papers, min_signal_score=5.0)
+
+    assert [result.rejection for result in batched] == [result.rejection for result in per_paper]
+    assert [result.rejection is None for result in batched] == [True, True, False, False, True]
+
+
+def test_analyze_chunk_requires_initialized_worker(sample_paper: Paper) -> None:
+    """Calling outside a worker fails loudly instead of scoring with no config."""
+    with pytest.raises(RuntimeError):
+        analyze_chunk([sample_paper], min_signal_score=5.0)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_with_analysis_workers(sample_paper: Paper) -> None:
+    """Worker processes filter and extract; results reach evaluation as before."""
+    papers = make_papers(sample_paper)
+    evaluator = FakeEvaluator()
+    writer = FakeWriter()
+    pipeline = PaperPipeline(
+        SignalExtractor(HEURISTICS),
+        evaluator,  # type: ignore[arg-type]
+        writer,  # type: ignore[arg-type]
+        {"thresholds": {"value_score_minimum": 6.0}},
+        FilterConfig(),
+        pipeline_config=PipelineConfig(progress_interval_seconds=0, analysis_workers=2, analysis_chunk_size=2),
+    )
+
+    stats = await pipeline.run([PagedScraper("mixed", [papers])], lambda s: s.iter_recent_papers(7))
+
+    assert evaluator.evaluated == ["strong"]
+    assert stats.rejected == 1
+    assert stats.weak_signals == 1
+    assert stats.findings == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_counts_one_error(sample_paper: Paper) -> None:
+    """A failed chunk is one stage error, like a failed message batch; its papers are counted separately."""
+
+    class FailingPool:
+        workers = 1
+        chunk_size = 2
+
+        async def analyze(self, papers: list[Paper], min_signal_score: float) -> list:
+            raise RuntimeError("worker died")
+
+    pipeline = PaperPipeline(
+        SignalExtractor(HEURISTICS),
+        FakeEvaluator(),  # type: ignore[arg-type]
+        FakeWriter(),  # type: ignore[arg-type]
+        {},
+        FilterConfig(),
+    )
+    inbox: asyncio.Queue = asyncio.Queue()
+    for paper in make_papers(sample_paper):
+        inbox.put_nowait(paper)
+    inbox.put_nowait(pipeline_module._DONE)
+
+    await pipeline._pool_stage(inbox, asyncio.Queue(), FailingPool())  # type: ignore[arg-type]
+
+    assert pipeline.stats.errors == 2
+    assert pipeline.stats.failed_analyses == 3
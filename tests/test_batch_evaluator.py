@@ -0,0 +1,191 @@
+"""Tests for Message Batches evaluation against a local stand-in server."""
+
+import json
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+from anthropic import APITimeoutError, AsyncAnthropic
+
+from analyzers.batch_evaluator import BatchEvaluator
+from analyzers.value_evaluator import ValueEvaluator
+from models.paper import Paper
+
+RESPONSE = {
+    "data_type_name": "Medical Imaging Dataset",
+    "technical_contribution_score": 8.0,
+    "commercial_viability_score": 9.0,
+    "confidence": 8.0,
+}
+
+
+class FakeBatchesAPI:
+    """ASGI app implementing the Message Batches endpoints in memory."""
+
+    def __init__(self, polls_before_end: int = 1) -> None:
+        self.polls_before_end = polls_before_end
+        self.batches: dict[str, dict] = {}
+        self.created = 0
+
+    def _batch(self, batch_id: str) -> dict:
+        state = self.batches[batch_id]
+        ended = state["polls"] >= self.polls_before_end
+        pending = len(state["requests"])
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {
+                "processing": 0 if ended else pending,
+                "succeeded": pending - 1 if ended else 0,
+                "errored": 1 if ended else 0,
+                "canceled": 0,
+                "expired": 0,
+            },
+            "created_at": "2025-01-01T00:00:00Z",
+            "expires_at": "2025-01-02T00:00:00Z",
+            "ended_at": "2025-01-01T01:00:00Z" if ended else None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": f"http://testserver/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+    def _results(self, batch_id: str) -> bytes:
+        lines = []
+        for i, request in enumerate(self.batches[batch_id]["requests"]):
+            if i == 0:
+                # The first request fails so error mapping is exercised
+                result = {"type": "errored", "error": {"type": "error", "error": {"type": "api_error"}}}
+            else:
+                text = json.dumps({**RESPONSE, "data_type_name": request["custom_id"]})
+                result = {
+                    "type": "succeeded",
+                    "message": {
+                        "id": f"msg_{i}",
+                        "type": "message",
+                        "role": "assistant",
+                        "model": request["params"]["model"],
+                        "content": [{"type": "text", "text": text}],
+                        "stop_reason": "end_turn",
+                        "stop_sequence": None,
+                        "usage": {"input_tokens": 10, "output_tokens": 10},
+                    },
+                }
+            lines.append(json.dumps({"custom_id": request["custom_id"], "result": result}))
+        return "\n".join(lines).encode()
+
+    async def __call__(self, scope: MutableMapping[str, Any], receive, send) -> None:
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        path = scope["path"]
+        if scope["method"] == "POST" and path == "/v1/messages/batches":
+            self.created += 1
+            batch_id = f"msgbatch_{self.created}"
+            self.batches[batch_id] = {"requests": json.loads(body)["requests"], "polls": 0}
+            status, payload = 200, json.dumps(self._batch(batch_id)).encode()
+        elif path.endswith("/results"):
+            status, payload = 200, self._results(path.split("/")[-2])
+        else:
+            batch_id = path.rsplit("/", 1)[-1]
+            self.batches[batch_id]["polls"] += 1
+            status, payload = 200, json.dumps(self._batch(batch_id)).encode()
+
+        await send(
+            {"type": "http.response.start", "status": status, "headers": [(b"content-type", b"application/json")]}
+        )
+        await send({"type": "http.response.body", "body": payload})
+
+
+def make_batch_evaluator(api: FakeBatchesAPI, state_dir: Path) -> BatchEvaluator:
+    """Create a batch evaluator talking to the stand-in server."""
+    with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test_key"}):
+        evaluator = ValueEvaluator({})
+    evaluator.client = AsyncAnthropic(
+        api_key="test_key",
+        base_url="http://testserver",
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=api)),
+    )
+    return BatchEvaluator(evaluator, state_dir, poll_interval_seconds=0)
+
+
+def make_papers(sample_paper: Paper, count: int) -> list[Paper]:
+    """Create distinct copies of the sample paper."""
+    return [Paper(**{**sample_paper.__dict__, "id": f"paper_{i}"}) for i in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_evaluate_many_maps_results_to_papers(
+    tmp_path: Path, sample_paper: Paper, sample_signals: dict[str, dict]
+) -> None:
+    """Succeeded results become assessments and errored results become None."""
+    api = FakeBatchesAPI(polls_before_end=2)
+    batch_evaluator = make_batch_evaluator(api, tmp_path)
+    papers = make_papers(sample_paper, 3)
+
+    outcomes = await batch_evaluator.evaluate_many([(paper, sample_signals) for paper in papers])
+
+    assert [paper.id for paper, _ in outcomes] == ["paper_0", "paper_1", "paper_2"]
+    assert outcomes[0][1] is None
+    assert outcomes[1][1] is not None
+    assert outcomes[1][1].data_type_name == "paper-1"
+    assert outcomes[1][1].paper.published_date == sample_paper.published_date
+    assert outcomes[2][1] is not None
+    assert outcomes[1][1].id != outcomes[2][1].id
+    assert batch_evaluator.pending_batch_ids() == []
+
+
+@pytest.mark.asyncio
+async def test_submitted_batch_can_be_resumed(
+    tmp_path: Path, sample_paper: Paper, sample_signals: dict[str, dict]
+) -> None:
+    """A batch submitted by one process can be collected by another."""
+    api = FakeBatchesAPI()
+    papers = make_papers(sample_paper, 2)
+
+    batch_id = await make_batch_evaluator(api, tmp_path).submit([(paper, sample_signals) for paper in papers])
+
+    restarted = make_batch_evaluator(api, tmp_path)
+    assert restarted.pending_batch_ids() == [batch_id]
+
+    outcomes = await restarted.collect(batch_id)
+
+    assert [paper.id for paper, _ in outcomes] == ["paper_0", "paper_1"]
+    assert outcomes[1][1] is not None
+    assert restarted.pending_batch_ids() == []
+    assert api.created == 1
+
+
+@pytest.mark.asyncio
+async def test_create_is_not_retried_after_a_timeout(
+    tmp_path: Path, sample_paper: Paper, sample_signals: dict[str, dict]
+) -> None:
+    """A create that timed out may have been accepted, so it is not sent again."""
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    batch_evaluator = make_batch_evaluator(FakeBatchesAPI(), tmp_path)
+    batch_evaluator.evaluator.client = AsyncAnthropic(
+        api_key="test_key",
+        base_url="http://testserver",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    batch_evaluator.evaluator.retry_base_delay = 0
+
+    with pytest.raises(APITimeoutError):
+        await batch_evaluator.submit([(paper, sample_signals) for paper in make_papers(sample_paper, 2)])
+
+    assert attempts == 1
+    assert batch_evaluator.pending_batch_ids() == []
@@ -0,0 +1,189 @@
+"""Tests for per-source crawl checkpoints."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from analyzers.token_ledger import SpendLimit, TokenLedger
+from models.checkpoint import SourceCheckpoint
+from models.paper import Paper
+from monitor.continuous_monitor import run_continuous_monitor
+from persistence.checkpoint_store import CheckpointStore
+from persistence.paper_registry import PaperRegistry
+from scrapers.openalex_scraper import OpenAlexScraper
+
+
+def make_paper(paper_id: str, published: datetime) -> Paper:
+    """Create a minimal paper."""
+    return Paper(
+        id=paper_id,
+        title=paper_id,
+        abstract="Abstract",
+        authors=[],
+        published_date=published,
+        source="test",
+        url="",
+    )
+
+
+def make_work(work_id: str, date: str) -> dict:
+    """Create a minimal OpenAlex work."""
+    return {
+        "id": f"https://openalex.org/{work_id}",
+        "title": work_id,
+        "abstract_inverted_index": {"Abstract": [0]},
+        "publication_date": date,
+    }
+
+
+def test_watermark_mixes_naive_and_aware_dates() -> None:
+    """Naive publication dates are treated as UTC when advancing the watermark."""
+    checkpoint = SourceCheckpoint(source="arxiv", watermark=datetime(2025, 1, 1, tzinfo=UTC))
+
+    naive = datetime(2025, 1, 3)  # noqa: DTZ001 - arXiv and DBLP papers carry naive dates
+    checkpoint.advance([make_paper("a", naive), make_paper("b", datetime(2025, 1, 2, tzinfo=UTC))])
+
+    assert checkpoint.watermark == datetime(2025, 1, 3, tzinfo=UTC)
+
+
+def test_store_round_trip(tmp_path: Path) -> None:
+    """Saved checkpoints, including cursors, are restored by a new store."""
+    path = tmp_path / "checkpoints.json"
+    store = CheckpointStore(path)
+    checkpoint = store.get("openalex", datetime(2025, 1, 1, tzinfo=UTC))
+    checkpoint.cursor = {"from_date": "2025-01-01", "next_cursor": "abc"}
+    store.save(checkpoint)
+
+    restored = CheckpointStore(path).get("openalex", datetime(2030, 1, 1, tzinfo=UTC))
+
+    assert restored.watermark == datetime(2025, 1, 1, tzinfo=UTC)
+    assert restored.cursor == {"from_date": "2025-01-01", "next_cursor": "abc"}
+    assert restored.updated_at is not None
+
+
+@pytest.mark.asyncio
+async def test_openalex_resumes_from_stored_cursor() -> None:
+    """An interrupted OpenAlex crawl continues at the saved next_cursor."""
+    pages = {
+        "*": {"results": [make_work("W1", "2025-01-02")], "meta": {"next_cursor": "page2"}},
+        "page2": {"results": [make_work("W2", "2025-01-03")], "meta": {"next_cursor": None}},
+    }
+    requested: list[str] = []
+
+    async def fake_get(url: str, params: dict, headers: dict) -> httpx.Response:
+        requested.append(params["cursor"])
+        return httpx.Response(200, json=pages[params["cursor"]], request=httpx.Request("GET", url))
+
+    scraper = OpenAlexScraper({"base_url": "https://api.openalex.org", "rate_limit_seconds": 0})
+    checkpoint = SourceCheckpoint(source="openalex", watermark=datetime(2025, 1, 1, tzinfo=UTC))
+
+    with patch.object(scraper, "_get", side_effect=fake_get):
+        # First process stops after one page
+        async for page in scraper.iter_new_since(checkpoint):
+            checkpoint.advance(page)
+            break
+        assert checkpoint.cursor == {"from_date": "2025-01-01", "next_cursor": "page2"}
+
+        # Restarted process resumes at page 2
+        resumed = [page async for page in scraper.iter_new_since(checkpoint)]
+
+    assert requested == ["*", "page2"]
+    assert [paper.id for page in resumed for paper in page] == ["openalex_W2"]
+    assert checkpoint.cursor == {}
+
+
+@pytest.mark.asyncio
+async def test_monitor_saves_checkpoint_per_source(tmp_path: Path) -> None:
+    """Each source advances and persists its own watermark."""
+
+    class FakeScraper:
+        def __init__(self, name: str, published: datetime) -> None:
+            self.name = name
+            self.published = published
+
+        @property
+        def source_name(self) -> str:
+            return self.name
+
+        async def iter_new_since(self, checkpoint: SourceCheckpoint):
+            yield [make_paper(f"{self.name}_1", self.published)]
+
+    fast = FakeScraper("fast", datetime(2025, 3, 1, tzinfo=UTC))
+    slow = FakeScraper("slow", datetime(2025, 1, 15, tzinfo=UTC))
+    store = CheckpointStore(tmp_path / "checkpoints.json")
+    store.get("fast", datetime(2025, 1, 1, tzinfo=UTC))
+    store.get("slow", datetime(2025, 1, 1, tzinfo=UTC))
+    extractor = Mock()
+    extractor.extract.return_value = {}
+
+    scrapers: list = [fast, slow]
+
+    # Stop after the first poll
+    with patch("monitor.continuous_monitor.asyncio.sleep", AsyncMock(side_effect=asyncio.CancelledError)):
+        with pytest.raises(asyncio.CancelledError):
+            await run_continuous_monitor(scrapers, extractor, Mock(), Mock(), 1, {}, checkpoints=store)
+
+    restored = CheckpointStore(tmp_path / "checkpoints.json")
+    assert restored.get("fast", datetime.now(UTC)).watermark == datetime(2025, 3, 1, tzinfo=UTC)
+    assert restored.get("slow", datetime.now(UTC)).watermark == datetime(2025, 1, 15, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_hard_limit_keeps_unevaluated_papers_behind_the_checkpoint(
+    tmp_path: Path, sample_assessment, sample_signals: dict[str, dict]
+) -> None:
+    """Papers left by the hard limit are fetched and evaluated again once the next day resets it."""
+    published = datetime(2025, 1, 10, tzinfo=UTC)
+    page = [make_paper("a", published), make_paper("b", published)]
+
+    class OnePageScraper:
+        source_name = "test"
+
+        async def iter_new_since(self, checkpoint: SourceCheckpoint):
+            yield page
+
+    clock = {"now": datetime(2025, 1, 10, 12, tzinfo=UTC)}
+
+    class Clock(datetime):
+        @classmethod
+        def now(cls, tz=None) -> datetime:
+            return clock["now"]
+
+    polls = []
+
+    async def sleep(seconds: float) -> None:
+        polls.append(seconds)
+        if len(polls) == 2:
+            raise asyncio.CancelledError
+        clock["now"] += timedelta(days=1)
+
+    ledger = TokenLedger("test-model", hard_limit=SpendLimit(tokens=10))
+    evaluated: list[str] = []
+
+    async def evaluate(paper: Paper, signals: dict, config: dict):
+        evaluated.append(paper.id)
+        ledger.record(Mock(input_tokens=10, output_tokens=0), source="test")
+        return sample_assessment
+
+    extractor = Mock()
+    extractor.extract.return_value = sample_signals
+    evaluator = Mock(ledger=ledger, evaluate=evaluate)
+    writer = Mock()
+    store = CheckpointStore(tmp_path / "checkpoints.json")
+    store.get("test", datetime(2025, 1, 1, tzinfo=UTC))
+    registry = PaperRegistry(tmp_path / "registry.sqlite")
+
+    with patch("monitor.continuous_monitor.datetime", Clock), patch("monitor.continuous_monitor.asyncio.sleep", sleep):
+        with pytest.raises(asyncio.CancelledError):
+            await run_continuous_monitor(
+                [OnePageScraper()], extractor, evaluator, writer, 1, {}, checkpoints=store, registry=registry
+            )
+
+    assert evaluated == ["a", "b"]
+    writer.write_usage_summary.assert_called_once()
+    assert writer.write_usage_summary.call_args.args[0]["day"] == "2025-01-10"
+    assert CheckpointStore(tmp_path / "checkpoints.json").get("test", datetime.now(UTC)).watermark == published
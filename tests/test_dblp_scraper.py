@@ -1,8 +1,9 @@
 """Tests for DBLP scraper."""
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
 
 from scrapers.dblp_scraper import DBLPScraper
@@ -146,6 +147,24 @@ def test_parse_hit_single_author(scraper):
     assert paper.authors[0] == "Single Author"
 
 
+def test_parse_hit_identifiers(scraper):
+    """Test DOI and arXiv id are read from the record and its electronic editions."""
+    hit = {
+        "info": {
+            "title": "Identified Paper",
+            "year": "2024",
+            "key": "journals/corr/abs-2401-12345",
+            "doi": "10.48550/ARXIV.2401.12345",
+            "ee": ["https://doi.org/10.48550/arXiv.2401.12345", "https://arxiv.org/abs/2401.12345"],
+        }
+    }
+
+    paper = scraper._parse_hit(hit, "CoRR")
+    assert paper is not None
+    assert paper.doi == "10.48550/arxiv.2401.12345"
+    assert paper.arxiv_id == "2401.12345"
+
+
 def test_parse_response(scraper, sample_dblp_response):
     """Test parsing DBLP API response."""
     papers = scraper._parse_response(sample_dblp_response, "NeurIPS")
@@ -202,14 +221,15 @@ async def test_fetch_new_since(scraper):
 
 @pytest.mark.asyncio
 async def test_rate_limiting(scraper):
-    """Test rate limiting is applied."""
-    with patch.object(scraper, "_rate_limit", new_callable=AsyncMock) as mock_limit:
-        with patch.object(scraper, "_search_venue", new_callable=AsyncMock) as mock_search:
-            mock_search.return_value = []
-
+    """Test every venue request takes a token from the DBLP host bucket."""
+    response = httpx.Response(200, json={"result": {}}, request=httpx.Request("GET", scraper.config["base_url"]))
+    client = Mock(get=AsyncMock(return_value=response))
+    with patch.object(scraper.session.rate_limiter, "acquire", new_callable=AsyncMock) as mock_acquire:
+        with patch.object(scraper.session, "_client", client):
             await scraper.fetch_recent_papers(days=30)
 
-            assert mock_limit.call_count > 0
+    assert mock_acquire.call_count == client.get.call_count > 0
+    assert mock_acquire.call_args.args[1] == "dblp"
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,138 @@
+"""Tests for priority-ordered, budgeted evaluation."""
+
+import asyncio
+from dataclasses import replace
+from types import SimpleNamespace
+
+import pytest
+
+from analyzers.token_ledger import TokenLedger, TokenUsage
+from analyzers.triage import TriageScorer
+from models.paper import Paper, PaperRecord
+from monitor.continuous_monitor import _evaluate_backlog
+from monitor.evaluation_queue import EvaluationBacklog, LLMBudget, PriorityStageQueue
+
+from .test_pipeline import make_paper
+
+DONE = object()
+
+
+class BudgetedEvaluator:
+    """Evaluator that spends one request and 1000 tokens per paper."""
+
+    def __init__(self) -> None:
+        self.ledger = TokenLedger("test-model")
+        self.evaluated: list[str] = []
+
+    @property
+    def usage(self) -> TokenUsage:
+        return self.ledger.total
+
+    async def evaluate(self, paper: Paper, signals: dict, config: dict) -> None:
+        self.ledger.record(SimpleNamespace(input_tokens=900, output_tokens=100), source=paper.source)
+        self.evaluated.append(paper.id)
+
+
+def demand(score: float) -> dict[str, dict]:
+    """Signals with a single demand score."""
+    return {"demand": {"score": score, "detected": []}}
+
+
+@pytest.mark.asyncio
+async def test_queue_serves_highest_priority_and_sentinel_last() -> None:
+    """Items leave best first, ties in arrival order, and the end marker after all items."""
+    queue = PriorityStageQueue(0, lambda item: item[1], sentinel=DONE)
+    for item in [("a", 1.0), ("b", 5.0), DONE, ("c", 5.0), ("d", 3.0)]:
+        await queue.put(item)
+
+    served = [queue.get_nowait() for _ in range(5)]
+
+    assert served == [("b", 5.0), ("c", 5.0), ("d", 3.0), ("a", 1.0), DONE]
+
+
+@pytest.mark.asyncio
+async def test_queue_stays_bounded() -> None:
+    """A full priority queue blocks producers like any asyncio.Queue."""
+    queue = PriorityStageQueue(1, lambda item: item, sentinel=DONE)
+    await queue.put(1.0)
+
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(queue.put(2.0), timeout=0.05)
+
+
+def test_priority_scales_composite_by_source_trust() -> None:
+    """Less trusted sources rank below equally scored papers from trusted ones."""
+    ranker = TriageScorer({"demand_signals": 1.0}, source_trust={"dblp": 0.5, "semantic_scholar": 0.8})
+    paper = make_paper("p")
+
+    assert ranker.priority(replace(paper, source="arxiv"), demand(8.0)) == pytest.approx(8.0)
+    assert ranker.priority(replace(paper, source="dblp"), demand(8.0)) == pytest.approx(4.0)
+    assert ranker.priority(replace(paper, source="SemanticScholar"), demand(5.0)) == pytest.approx(4.0)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("0", None),
+        ("200", LLMBudget(calls=200)),
+        ("3 calls", LLMBudget(calls=3)),
+        ("50000tokens", LLMBudget(tokens=50000)),
+        ("50000T", LLMBudget(tokens=50000)),
+    ],
+)
+def test_parse_budget(text: str, expected: LLMBudget | None) -> None:
+    """Plain numbers count calls; a token suffix counts tokens."""
+    assert LLMBudget.parse(text) == expected
+
+
+def test_parse_rejects_unknown_units() -> None:
+    """Typos fail instead of silently disabling the budget."""
+    with pytest.raises(ValueError):
+        LLMBudget.parse("5 dollars")
+
+
+@pytest.mark.asyncio
+async def test_backlog_evaluates_best_first_and_defers_rest() -> None:
+    """A call budget evaluates the strongest candidates and keeps the rest for the next poll."""
+    backlog = EvaluationBacklog(TriageScorer({"demand_signals": 1.0}))
+    for paper_id, score in [("p_low", 5.0), ("p_high", 9.0), ("p_mid", 7.0)]:
+        backlog.push(make_paper(paper_id), demand(score))
+    backlog.push(make_paper("p_high"), demand(9.0))  # Already waiting
+    evaluator = BudgetedEvaluator()
+
+    await _evaluate_backlog(backlog, LLMBudget(calls=2), evaluator, None, {})  # type: ignore[arg-type]
+
+    assert evaluator.evaluated == ["p_high", "p_mid"]
+    assert len(backlog) == 1
+
+    # Next poll: a new, weaker paper still waits behind the deferred one
+    backlog.push(make_paper("p_new"), demand(1.0))
+    await _evaluate_backlog(backlog, LLMBudget(calls=1), evaluator, None, {})  # type: ignore[arg-type]
+
+    assert evaluator.evaluated[2:] == ["p_low"]
+
+
+def test_backlog_holds_compact_records() -> None:
+    """Waiting candidates are stored as PaperRecords and handed out as equal Papers."""
+    backlog = EvaluationBacklog(TriageScorer({"demand_signals": 1.0}))
+    paper = make_paper("p_1")
+    backlog.push(paper, demand(5.0))
+
+    assert isinstance(backlog._heap[0][2], PaperRecord)
+    popped, signals = backlog.pop()
+    assert popped == paper
+    assert signals == demand(5.0)
+
+
+@pytest.mark.asyncio
+async def test_token_budget_counts_tokens_spent_this_poll() -> None:
+    """Tokens spent before the poll do not count; evaluation stops once the budget is reached."""
+    backlog = EvaluationBacklog(TriageScorer({"demand_signals": 1.0}))
+    for i in range(5):
+        backlog.push(make_paper(f"p_{i}"), demand(float(i)))
+    evaluator = BudgetedEvaluator()
+    evaluator.usage.input_tokens = 10_000
+
+    await _evaluate_backlog(backlog, LLMBudget(tokens=2500), evaluator, None, {})  # type: ignore[arg-type]
+
+    assert evaluator.evaluated == ["p_4", "p_3", "p_2"]
@@ -0,0 +1,120 @@
+"""Tests for the on-disk scraper response cache."""
+
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from persistence.http_cache import HttpCache
+from scrapers import FetchError, create_scrapers
+from scrapers.session import ScraperSession
+
+API = "https://api.example.org/works"
+PAGE = {"results": [{"id": "W1", "title": "A dataset paper"}]}
+
+
+class FakeServer:
+    """Mock transport answering conditional requests like a server supporting ETags."""
+
+    def __init__(self, etag: str | None = '"v1"') -> None:
+        self.etag = etag
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.etag and request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304)
+        headers = {"ETag": self.etag} if self.etag else {}
+        return httpx.Response(200, json=PAGE, headers=headers)
+
+
+def make_session(cache: HttpCache, server: FakeServer) -> ScraperSession:
+    """A session whose client is served by ``server``."""
+    session = ScraperSession(cache=cache)
+    session._client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    return session
+
+
+@pytest.mark.asyncio
+async def test_fresh_responses_are_served_without_a_request(tmp_path: Path) -> None:
+    """A repeated request within the TTL is answered from disk, across cache instances."""
+    server = FakeServer()
+    cache = HttpCache(tmp_path / "http.sqlite")
+    first = await make_session(cache, server).get(API, params={"page": 1})
+    cache.close()
+
+    reopened = HttpCache(tmp_path / "http.sqlite")
+    second = await make_session(reopened, server).get(API, params={"page": 1})
+
+    assert second.json() == first.json() == PAGE
+    assert second.headers["content-type"] == "application/json"
+    assert len(server.requests) == 1
+    assert reopened.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_are_revalidated_with_etag(tmp_path: Path) -> None:
+    """After the TTL, If-None-Match is sent and a 304 reuses the stored body."""
+    server = FakeServer()
+    cache = HttpCache(tmp_path / "http.sqlite", default_ttl_seconds=60)
+    session = make_session(cache, server)
+    await session.get(API)
+
+    with patch("persistence.http_cache.time.time", return_value=time.time() + 120):
+        response = await session.get(API)
+
+    assert server.requests[1].headers["If-None-Match"] == '"v1"'
+    assert response.status_code == 200
+    assert response.json() == PAGE
+    assert cache.stats.revalidated == 1
+
+
+@pytest.mark.asyncio
+async def test_ttl_is_per_source(tmp_path: Path) -> None:
+    """A source's cache_ttl_seconds overrides the default TTL."""
+    cache = HttpCache(tmp_path / "http.sqlite", default_ttl_seconds=3600)
+    scrapers = create_scrapers(
+        {"dblp": {"enabled": True, "base_url": "https://dblp.org/search/publ/api", "cache_ttl_seconds": 0}},
+        http_cache=cache,
+    )
+    server = FakeServer(etag=None)
+    scrapers[0].session._client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+
+    await scrapers[0]._get(API)
+    await scrapers[0]._get(API)
+    await scrapers[0].session.get(API, source="openalex")
+
+    assert len(server.requests) == 2
+    assert cache.source_ttls == {"dblp": 0}
+
+
+@pytest.mark.asyncio
+async def test_offline_mode_serves_stale_entries_and_fails_on_misses(tmp_path: Path) -> None:
+    """Offline, cached responses are returned regardless of age and nothing is sent."""
+    server = FakeServer()
+    await make_session(HttpCache(tmp_path / "http.sqlite"), server).get(API)
+
+    offline = HttpCache(tmp_path / "http.sqlite", default_ttl_seconds=0, offline=True)
+    session = make_session(offline, server)
+
+    assert (await session.get(API)).json() == PAGE
+    with pytest.raises(FetchError):
+        await session.get(API, params={"page": 2})
+    assert len(server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_identical_bodies_are_stored_once_and_errors_are_not_cached(tmp_path: Path) -> None:
+    """Bodies are content-addressed; non-200 responses are passed through uncached."""
+    cache = HttpCache(tmp_path / "http.sqlite")
+    session = make_session(cache, FakeServer())
+    await session.get(API, params={"page": 1})
+    await session.get(API, params={"page": 2})
+
+    session._client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(503)))
+    assert (await session.get(API, params={"page": 3})).status_code == 503
+
+    assert len(cache) == 2
+    assert cache._conn.execute("SELECT COUNT(*) FROM bodies").fetchone()[0] == 1
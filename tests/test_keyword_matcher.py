@@ -0,0 +1,87 @@
+"""Tests for the single-pass keyword matcher."""
+
+import json
+import random
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from analyzers import keyword_matcher
+from analyzers.keyword_matcher import KeywordMatcher
+from analyzers.signal_extractor import BUILTIN_TERMS, SignalExtractor
+from models.paper import Paper
+
+HEURISTICS_PATH = Path(__file__).parent.parent / "config" / "heuristics.json"
+
+BACKENDS = [
+    pytest.param(True, marks=pytest.mark.skipif(not keyword_matcher.AHOCORASICK_AVAILABLE, reason="no pyahocorasick")),
+    False,
+]
+
+
+def substring_positions(text: str, keyword: str) -> list[int]:
+    """Return every start offset of keyword in text, including overlapping ones."""
+    return [i for i in range(len(text)) if text.startswith(keyword, i)]
+
+
+@pytest.mark.parametrize("use_automaton", BACKENDS)
+def test_matches_same_as_substring_search(use_automaton: bool) -> None:
+    """Every keyword is found exactly where a substring search finds it."""
+    groups = {"a": ["he", "she", "hers", "his"], "b": ["HE", "ers", "s"], "c": ["aaa", "a"]}
+    rng = random.Random(7)
+    texts = ["ushers", "aaaaa", "", "she sells his hers"] + [
+        "".join(rng.choice("aehirs ") for _ in range(60)) for _ in range(50)
+    ]
+
+    with patch.object(keyword_matcher, "AHOCORASICK_AVAILABLE", use_automaton):
+        matcher = KeywordMatcher(groups)
+        for text in texts:
+            matches = matcher.match(text)
+            for keyword in matcher.keywords:
+                assert matches.positions(keyword) == substring_positions(text, keyword)
+                assert (keyword in matches) == (keyword in text)
+            for name, keywords in groups.items():
+                assert matches.count(name) == sum(1 for kw in keywords if kw.lower() in text)
+
+
+def test_group_queries_keep_group_order() -> None:
+    """present() lists hits in the order the group defines them."""
+    matcher = KeywordMatcher({"domains": ["pandemic", "climate"], "empty": []})
+    matches = matcher.match("climate and pandemic")
+
+    assert matches.present("domains") == ["pandemic", "climate"]
+    assert matches.any("domains")
+    assert not matches.any("empty")
+    assert matches.count("missing") == 0
+
+
+@pytest.mark.parametrize("use_automaton", BACKENDS)
+def test_extractor_output_unchanged(use_automaton: bool) -> None:
+    """Signals equal a per-keyword substring scan of the same text."""
+    config = json.loads(HEURISTICS_PATH.read_text())
+    keywords = [kw for group in config["keywords"].values() for kw in group]
+    keywords += [kw for group in BUILTIN_TERMS.values() for kw in group]
+    rng = random.Random(11)
+    abstract = ". ".join(" ".join(rng.sample(keywords, 6)) for _ in range(5))
+    paper = Paper(
+        id="p",
+        title="Title",
+        abstract=abstract,
+        authors=[],
+        published_date=datetime(2025, 1, 1, tzinfo=UTC),
+        source="test",
+        url="",
+    )
+
+    with patch.object(keyword_matcher, "AHOCORASICK_AVAILABLE", use_automaton):
+        extractor = SignalExtractor(config)
+        signals = extractor.extract(paper)
+
+    text = f"{paper.title} {paper.abstract}".lower()
+    for category, prefix in [("quality_indicators", "quality_kw"), ("scaling_potential", "scaling_kw")]:
+        expected = [f"{prefix}_{kw.replace(' ', '_')}" for kw in config["keywords"][category] if kw.lower() in text]
+        assert [d for d in signals[category]["detected"] if d.startswith(prefix)] == expected
+    for phrase in signals["quality_indicators"]["sample_phrases"]:
+        assert phrase.strip(".") in text
@@ -0,0 +1,162 @@
+"""Tests for the local Messages API stand-in."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+from anthropic import AsyncAnthropic
+
+from analyzers.batch_evaluator import BatchEvaluator
+from analyzers.mock_messages_server import LatencyModel, MockMessagesServer, generate_evaluation
+from analyzers.value_evaluator import ValueEvaluator
+from models.paper import Paper
+
+MOCK_URL = "http://mock-anthropic"
+
+
+def make_evaluator(server: MockMessagesServer, **kwargs) -> ValueEvaluator:
+    """An evaluator whose base URL points at the in-process mock server."""
+    with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test_key"}):
+        evaluator = ValueEvaluator({}, base_url=MOCK_URL, retry_base_delay=0, **kwargs)
+    evaluator.client = AsyncAnthropic(
+        api_key="test_key",
+        base_url=MOCK_URL,
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=server)),
+    )
+    return evaluator
+
+
+def make_papers(sample_paper: Paper, count: int) -> list[Paper]:
+    """Create distinct copies of the sample paper."""
+    return [Paper(**{**sample_paper.__dict__, "id": f"p{i}", "title": f"Paper {i} dataset"}) for i in range(count)]
+
+
+def test_base_url_override() -> None:
+    """The evaluator's client talks to the configured endpoint."""
+    with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test_key"}):
+        evaluator = ValueEvaluator({}, base_url="http://127.0.0.1:8766")
+
+    assert str(evaluator.client.base_url).startswith("http://127.0.0.1:8766")
+
+
+def test_evaluations_are_schema_valid_and_deterministic() -> None:
+    """The same prompt always yields the same evaluation with every requested field."""
+    evaluation = generate_evaluation("Title: Medical Imaging Dataset\nAbstract: ...")
+
+    assert evaluation == generate_evaluation("Title: Medical Imaging Dataset\nAbstract: ...")
+    assert evaluation != generate_evaluation("Title: Robot Grasping Corpus\nAbstract: ...")
+    assert evaluation["data_type_name"] == "Medical Imaging Dataset"
+    assert 0 <= evaluation["technical_contribution_score"] <= 10
+    assert {b["category"] for b in evaluation["blockers"]} <= {"legal", "technical", "market", "economic"}
+
+
+@pytest.mark.asyncio
+async def test_evaluator_round_trip_with_token_usage(sample_paper: Paper, sample_signals: dict[str, dict]) -> None:
+    """Assessments are built from mock answers, and usage reaches the token ledger."""
+    server = MockMessagesServer(latency=LatencyModel("uniform", 0.01))
+    evaluator = make_evaluator(server)
+
+    first = await evaluator.evaluate(sample_paper, sample_signals, {})
+    again = await make_evaluator(MockMessagesServer()).evaluate(sample_paper, sample_signals, {})
+
+    assert first is not None and again is not None
+    assert first.technical_contribution_score == again.technical_contribution_score
+    assert evaluator.usage.requests == 1
+    assert evaluator.usage.output_tokens == server.stats.output_tokens > 0
+
+
+@pytest.mark.asyncio
+async def test_injected_errors_are_retried_deterministically(
+    sample_paper: Paper, sample_signals: dict[str, dict]
+) -> None:
+    """429 and 529 answers are retried; the same papers fail the same attempts on every run."""
+    papers = make_papers(sample_paper, 20)
+
+    async def run() -> MockMessagesServer:
+        server = MockMessagesServer(overload_rate=0.3, rate_limit_rate=0.1, retry_after_seconds=0)
+        evaluator = make_evaluator(server, max_retries=10)
+        assessments = [await evaluator.evaluate(paper, sample_signals, {}) for paper in reversed(papers)]
+        assert all(assessments)
+        return server
+
+    first, second = await run(), await run()
+
+    assert first.stats.overloaded + first.stats.rate_limited > 0
+    assert first.stats.to_dict() == second.stats.to_dict()
+
+
+@pytest.mark.asyncio
+async def test_malformed_answers_fail_to_parse(sample_paper: Paper, sample_signals: dict[str, dict]) -> None:
+    """Truncated JSON reaches the evaluator's parse failure path."""
+    server = MockMessagesServer(malformed_rate=1.0)
+
+    assert await make_evaluator(server).evaluate(sample_paper, sample_signals, {}) is None
+    assert server.stats.malformed == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_system_prompt_is_read_after_first_write(
+    sample_paper: Paper, sample_signals: dict[str, dict]
+) -> None:
+    """The cache_control system block is reported as a cache write, then as cache reads."""
+    evaluator = make_evaluator(MockMessagesServer())
+    evaluator.model = "claude-3-5-sonnet-20241022"  # Haiku 3 instructions are too short to be marked
+
+    for paper in make_papers(sample_paper, 3):
+        await evaluator.evaluate(paper, sample_signals, {})
+
+    usage = evaluator.usage
+    assert usage.cache_creation_input_tokens > 0
+    assert usage.cache_read_input_tokens == 2 * usage.cache_creation_input_tokens
+
+
+@pytest.mark.asyncio
+async def test_cache_minimum_follows_the_requested_model() -> None:
+    """A marked prefix below the model's minimum is billed as plain input, as the API does."""
+    server = MockMessagesServer()
+    evaluator = make_evaluator(server)
+    evaluator.model = "claude-3-5-sonnet-20241022"
+    params = evaluator.build_request_params("Title: Medical Imaging Dataset")
+
+    await server.create_message(params)
+    await server.create_message({**params, "model": "claude-3-5-haiku-20241022"})
+
+    assert server.stats.cache_creation_input_tokens > 0
+    assert server.stats.cache_read_input_tokens == 0
+
+
+@pytest.mark.asyncio
+async def test_message_batches_end_to_end(tmp_path: Path, sample_paper: Paper, sample_signals: dict[str, dict]) -> None:
+    """BatchEvaluator submits, polls and collects through the mock server."""
+    server = MockMessagesServer(batch_polls=2)
+    batch_evaluator = BatchEvaluator(make_evaluator(server), tmp_path, poll_interval_seconds=0)
+    papers = make_papers(sample_paper, 3)
+
+    outcomes = await batch_evaluator.evaluate_many([(paper, sample_signals) for paper in papers])
+
+    assert [paper.id for paper, _ in outcomes] == ["p0", "p1", "p2"]
+    assert all(assessment is not None for _, assessment in outcomes)
+    assert server.stats.batches == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_request_counts_match_results() -> None:
+    """Overloaded batch items are reported as errored in the batch's request counts."""
+    server = MockMessagesServer(overload_rate=0.5)
+    requests = [
+        {"custom_id": f"p{i}", "params": {"model": "m", "messages": [{"role": "user", "content": f"Title: {i}"}]}}
+        for i in range(20)
+    ]
+
+    batch = server.create_batch(requests)
+    assert batch["request_counts"]["processing"] == 20
+    counts = server.retrieve_batch(batch["id"])["request_counts"]
+    results = [json.loads(line)["result"]["type"] for line in server.batch_results(batch["id"]).splitlines()]
+
+    assert counts["processing"] == 0
+    assert counts["errored"] == results.count("errored") == server.stats.overloaded > 0
+    assert counts["succeeded"] == results.count("succeeded") > 0
+    assert server.stats.requests == 20
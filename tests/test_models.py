@@ -1,11 +1,12 @@
 """Tests for data models."""
 
+from dataclasses import FrozenInstanceError
 from datetime import UTC, datetime
 
 import pytest
 
 from models.opportunity import OpportunityAssessment
-from models.paper import Paper
+from models.paper import Paper, PaperRecord
 
 
 class TestPaper:
@@ -56,6 +57,30 @@ class TestPaper:
         assert paper.published_date == now
         assert paper.published_date.tzinfo is not None
 
+    def test_compact_round_trip(self, sample_paper: Paper) -> None:
+        """Test that a compact record keeps every field and converts back."""
+        record = sample_paper.compact()
+
+        assert isinstance(record, PaperRecord)
+        assert record.authors == tuple(sample_paper.authors)
+        assert not hasattr(record, "__dict__")
+        assert record.to_paper() == sample_paper
+
+    def test_compact_record_is_frozen(self, sample_paper: Paper) -> None:
+        """Test that PaperRecord rejects mutation."""
+        record = sample_paper.compact()
+
+        with pytest.raises(FrozenInstanceError):
+            record.title = "Changed"  # type: ignore[misc]
+
+    def test_source_and_venue_are_interned(self, sample_paper: Paper) -> None:
+        """Test that papers from one source share the source string."""
+        source = "".join(["ar", "xiv"])
+        other = Paper(**{**sample_paper.__dict__, "source": source, "venue": "".join(["Neur", "IPS"])})
+
+        assert other.source is Paper(**{**sample_paper.__dict__, "source": "arxiv"}).source
+        assert other.compact().venue is Paper(**{**sample_paper.__dict__, "venue": "NeurIPS"}).venue
+
 
 class TestOpportunityAssessment:
     """Tests for OpportunityAssessment model."""
@@ -0,0 +1,91 @@
+"""Tests for the columnar paper batch."""
+
+import pickle
+from dataclasses import replace
+from datetime import UTC, datetime
+
+import pytest
+
+from models.paper import Paper
+
+np = pytest.importorskip("numpy")
+
+from models.paper_batch import PaperBatch  # noqa: E402
+
+
+def make_papers(sample_paper: Paper) -> list[Paper]:
+    """Papers covering missing values, naive dates and non-ASCII text."""
+    return [
+        sample_paper,
+        replace(
+            sample_paper,
+            id="dblp_conf/x/1",
+            title="Données médicales — few-shot",
+            authors=[],
+            published_date=datetime(2023, 5, 2, 13, 30),  # noqa: DTZ001
+            source="dblp",
+            citation_count=None,
+            venue=None,
+            doi="10.1/x",
+        ),
+        replace(
+            sample_paper,
+            id="s2_1",
+            abstract="",
+            source="semantic_scholar",
+            dataset_mentions=["ImageNet", "COCO"],
+            full_text="Full text.",
+            arxiv_id="2501.12345",
+        ),
+    ]
+
+
+def test_round_trip_is_lossless(sample_paper: Paper) -> None:
+    """Converting to a batch and back returns equal papers, also after pickling."""
+    papers = make_papers(sample_paper)
+    batch = PaperBatch.from_papers(papers)
+
+    assert len(batch) == 3
+    assert batch.to_papers() == papers
+    assert [batch[i] for i in range(3)] == papers
+    assert pickle.loads(pickle.dumps(batch)).to_papers() == papers
+    assert batch[1].published_date.tzinfo is None
+
+
+def test_columns_hold_arrays(sample_paper: Paper) -> None:
+    """Timestamps, citation counts and sources are plain arrays."""
+    batch = PaperBatch.from_papers(make_papers(sample_paper))
+
+    assert batch.published.dtype == np.int64
+    assert batch.published[0] == int(datetime(2025, 1, 10, tzinfo=UTC).timestamp()) * 1_000_000
+    assert batch.citations.tolist() == [15, 0, 15]
+    assert batch.citations_known.tolist() == [True, False, True]
+    assert batch.sources.categories == ("arxiv", "dblp", "semantic_scholar")
+    assert batch.sources.equals("dblp").tolist() == [False, True, False]
+    assert batch.abstracts.byte_lengths()[2] == 0
+
+
+def test_take_selects_rows_without_decoding(sample_paper: Paper) -> None:
+    """Index arrays reorder, boolean masks filter."""
+    papers = make_papers(sample_paper)
+    batch = PaperBatch.from_papers(papers)
+
+    assert batch.take([2, 0]).to_papers() == [papers[2], papers[0]]
+    assert batch.take(batch.citations_known).to_papers() == [papers[0], papers[2]]
+    assert batch.take(np.zeros(3, dtype=bool)).to_papers() == []
+
+
+def test_unique_drops_exact_identifier_duplicates(sample_paper: Paper) -> None:
+    """Later rows sharing an id, DOI or arXiv id with an earlier row are dropped."""
+    papers = [
+        replace(sample_paper, id="a", doi="10.1/x"),
+        replace(sample_paper, id="b", arxiv_id="2501.1"),
+        replace(sample_paper, id="a"),
+        replace(sample_paper, id="c", doi="10.1/x"),
+        replace(sample_paper, id="d", arxiv_id="2501.1"),
+        replace(sample_paper, id="e"),
+    ]
+    batch = PaperBatch.from_papers(papers)
+
+    assert batch.duplicate_mask().tolist() == [False, False, True, True, True, False]
+    assert [paper.id for paper in batch.unique()] == ["a", "b", "e"]
@@ -0,0 +1,238 @@
+"""Tests for the persistent processed-paper registry."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from analyzers.token_ledger import SpendLimit, TokenLedger
+from models.paper import Paper
+from monitor.continuous_monitor import _process_papers, run_continuous_monitor
+from monitor.evaluation_queue import LLMBudget
+from persistence.paper_registry import MAX_EVALUATION_ATTEMPTS, PaperOutcome, PaperRegistry
+
+
+def test_registry_survives_restart(tmp_path: Path, sample_paper: Paper) -> None:
+    """Recorded papers are skipped by a new registry on the same file."""
+    path = tmp_path / "registry.sqlite"
+    registry = PaperRegistry(path)
+    assert not registry.is_processed(sample_paper)
+
+    registry.record(sample_paper, PaperOutcome.FINDING, "rdla_1")
+    registry.close()
+
+    reopened = PaperRegistry(path)
+    assert reopened.is_processed(sample_paper)
+    assert len(reopened) == 1
+
+
+def test_changed_content_is_reprocessed(tmp_path: Path, sample_paper: Paper) -> None:
+    """A paper whose abstract changed is not considered processed."""
+    registry = PaperRegistry(tmp_path / "registry.sqlite")
+    registry.record(sample_paper, PaperOutcome.BELOW_THRESHOLD, "rdla_1")
+
+    revised = Paper(**{**sample_paper.__dict__, "abstract": "Revised abstract"})
+
+    assert not registry.is_processed(revised)
+
+
+def test_failed_evaluations_are_retried(tmp_path: Path, sample_paper: Paper) -> None:
+    """Failed evaluations are recorded but not skipped, before or after restart."""
+    path = tmp_path / "registry.sqlite"
+    registry = PaperRegistry(path)
+    registry.record(sample_paper, PaperOutcome.FAILED)
+
+    assert not registry.is_processed(sample_paper)
+    assert not PaperRegistry(path).is_processed(sample_paper)
+
+
+def test_failed_papers_are_requeued_until_attempts_run_out(tmp_path: Path, sample_paper: Paper) -> None:
+    """Failed papers come back whole until they succeed or fail too often."""
+    path = tmp_path / "registry.sqlite"
+    registry = PaperRegistry(path)
+    registry.record(sample_paper, PaperOutcome.FAILED)
+
+    assert PaperRegistry(path).failed_papers() == [sample_paper]
+
+    for _ in range(MAX_EVALUATION_ATTEMPTS - 1):
+        registry.record(sample_paper, PaperOutcome.FAILED)
+    assert registry.failed_papers() == []
+
+    registry.record(sample_paper, PaperOutcome.FINDING, "rdla_1")
+    assert registry.failed_papers(max_attempts=100) == []
+
+
+def test_deferred_papers_are_kept_until_an_outcome_is_recorded(tmp_path: Path, sample_paper: Paper) -> None:
+    """Deferred candidates survive a restart and are dropped once evaluated."""
+    path = tmp_path / "registry.sqlite"
+    registry = PaperRegistry(path)
+    registry.defer(sample_paper)
+    registry.defer(sample_paper)
+
+    assert PaperRegistry(path).deferred_papers() == [sample_paper]
+    assert not registry.is_processed(sample_paper)
+
+    registry.record(sample_paper, PaperOutcome.FAILED)
+    assert registry.deferred_papers() == []
+    assert registry.failed_papers() == [sample_paper]
+
+
+@pytest.mark.asyncio
+async def test_monitor_skips_processed_papers(
+    tmp_path: Path, sample_paper: Paper, sample_assessment, sample_signals: dict[str, dict]
+) -> None:
+    """Papers seen by an earlier poll never reach signal extraction again."""
+    registry = PaperRegistry(tmp_path / "registry.sqlite")
+    extractor = Mock()
+    extractor.extract.return_value = sample_signals
+    evaluator = Mock()
+    evaluator.evaluate = AsyncMock(return_value=sample_assessment)
+    evaluator.ledger = TokenLedger("test-model")
+    writer = Mock()
+
+    for _ in range(2):
+        await _process_papers([sample_paper], extractor, evaluator, writer, {}, registry=registry)
+
+    assert extractor.extract.call_count == 1
+    assert evaluator.evaluate.await_count == 1
+    writer.write_finding.assert_called_once_with(sample_assessment)
+    assert registry.is_processed(sample_paper)
+
+
+@pytest.mark.asyncio
+async def test_paper_is_requeued_when_writing_its_finding_fails(
+    tmp_path: Path, sample_paper: Paper, sample_assessment, sample_signals: dict[str, dict]
+) -> None:
+    """An error after evaluation records the paper as failed instead of dropping it."""
+    registry = PaperRegistry(tmp_path / "registry.sqlite")
+    extractor = Mock()
+    extractor.extract.return_value = sample_signals
+    evaluator = Mock()
+    evaluator.evaluate = AsyncMock(return_value=sample_assessment)
+    evaluator.ledger = TokenLedger("test-model")
+    writer = Mock()
+    writer.write_finding.side_effect = OSError("disk full")
+
+    await _process_papers([sample_paper], extractor, evaluator, writer, {}, registry=registry)
+
+    assert not registry.is_processed(sample_paper)
+    assert registry.failed_papers() == [sample_paper]
+
+
+@pytest.mark.asyncio
+async def test_monitor_retries_failed_papers_on_the_next_poll(
+    tmp_path: Path, sample_paper: Paper, sample_assessment, sample_signals: dict[str, dict]
+) -> None:
+    """A paper whose evaluation failed is evaluated again although its source moved past it."""
+
+    class OnePageScraper:
+        source_name = "test"
+        pages = [[sample_paper]]
+
+        async def iter_new_since(self, checkpoint):
+            for page in self.pages:
+                yield page
+            self.pages = []
+
+    registry = PaperRegistry(tmp_path / "registry.sqlite")
+    extractor = Mock()
+    extractor.extract.return_value = sample_signals
+    evaluator = Mock()
+    evaluator.evaluate = AsyncMock(side_effect=[None, sample_assessment])
+    evaluator.ledger = TokenLedger("test-model")
+    writer = Mock()
+
+    sleep = AsyncMock(side_effect=[None, asyncio.CancelledError])
+    with patch("monitor.continuous_monitor.asyncio.sleep", sleep), pytest.raises(asyncio.CancelledError):
+        await run_continuous_monitor([OnePageScraper()], extractor, evaluator, writer, 1, {}, registry=registry)
+
+    assert evaluator.evaluate.await_count == 2
+    writer.write_finding.assert_called_once_with(sample_assessment)
+    assert registry.is_processed(sample_paper)
+    assert registry.failed_papers() == []
+
+
+class OncePagedScraper:
+    """Yields its pages on the first crawl only."""
+
+    source_name = "test"
+
+    def __init__(self, pages: list[list[Paper]]) -> None:
+        self.pages = pages
+
+    async def iter_new_since(self, checkpoint):
+        for page in self.pages:
+            yield page
+        self.pages = []
+
+
+@pytest.mark.asyncio
+async def test_budget_deferred_papers_survive_a_restart(
+    tmp_path: Path, sample_paper: Paper, sample_assessment, sample_signals: dict[str, dict]
+) -> None:
+    """Candidates left in the backlog when the process stops are evaluated by the next process."""
+    path = tmp_path / "registry.sqlite"
+    extractor = Mock()
+    extractor.extract.return_value = sample_signals
+    evaluator = Mock()
+    evaluator.evaluate = AsyncMock(return_value=sample_assessment)
+    evaluator.ledger = TokenLedger("test-model")
+    evaluator.usage = evaluator.ledger.total
+    writer = Mock()
+
+    async def run(scraper: OncePagedScraper, budget: LLMBudget) -> None:
+        registry = PaperRegistry(path)
+        sleep = AsyncMock(side_effect=asyncio.CancelledError)
+        with patch("monitor.continuous_monitor.asyncio.sleep", sleep), pytest.raises(asyncio.CancelledError):
+            await run_continuous_monitor(
+                [scraper], extractor, evaluator, writer, 1, {}, registry=registry, llm_budget=budget
+            )
+        registry.close()
+
+    await run(OncePagedScraper([[sample_paper]]), LLMBudget(calls=0))
+    assert evaluator.evaluate.await_count == 0
+    assert PaperRegistry(path).deferred_papers() == [sample_paper]
+
+    # The source checkpoint has moved past the paper; only the registry brings it back
+    await run(OncePagedScraper([]), LLMBudget(calls=5))
+    assert evaluator.evaluate.await_count == 1
+    writer.write_finding.assert_called_once_with(sample_assessment)
+    assert PaperRegistry(path).deferred_papers() == []
+
+
+@pytest.mark.asyncio
+async def test_hard_limit_deferrals_survive_a_restart(
+    tmp_path: Path, sample_paper: Paper, sample_assessment, sample_signals: dict[str, dict]
+) -> None:
+    """Budget-mode candidates left by the hard limit are evaluated by the next process."""
+    path = tmp_path / "registry.sqlite"
+    papers = [Paper(**{**sample_paper.__dict__, "id": paper_id}) for paper_id in ("a", "b")]
+    evaluated: list[str] = []
+
+    def make_evaluator() -> Mock:
+        ledger = TokenLedger("test-model", hard_limit=SpendLimit(tokens=10))
+
+        async def evaluate(paper: Paper, signals: dict, config: dict):
+            evaluated.append(paper.id)
+            ledger.record(Mock(input_tokens=10, output_tokens=0), source="test")
+            return sample_assessment
+
+        return Mock(ledger=ledger, usage=ledger.total, evaluate=evaluate)
+
+    extractor = Mock()
+    extractor.extract.return_value = sample_signals
+    runs: list[list[str]] = []
+
+    for scraper in (OncePagedScraper([papers]), OncePagedScraper([])):
+        registry = PaperRegistry(path)
+        sleep = AsyncMock(side_effect=asyncio.CancelledError)
+        with patch("monitor.continuous_monitor.asyncio.sleep", sleep), pytest.raises(asyncio.CancelledError):
+            await run_continuous_monitor(
+                [scraper], extractor, make_evaluator(), Mock(), 1, {}, registry=registry, llm_budget=LLMBudget(calls=5)
+            )
+        registry.close()
+        runs.append(list(evaluated))
+
+    assert runs == [["a"], ["a", "b"]]
+    assert PaperRegistry(path).deferred_papers() == []
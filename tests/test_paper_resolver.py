@@ -0,0 +1,163 @@
+"""Tests for cross-source paper identity resolution."""
+
+import random
+import time
+from dataclasses import replace
+from datetime import datetime
+
+import pytest
+
+from analyzers import paper_resolver
+from analyzers.paper_resolver import PaperResolver, merge_papers, minhash_signature, normalize_title
+from models.paper import Paper, normalize_arxiv_id, normalize_doi
+
+from .test_pipeline import FakeEvaluator, FakeWriter, PagedScraper, make_pipeline
+
+TITLE = "Few-Shot Medical Image Segmentation with Limited Expert Annotations"
+
+
+def make_record(paper_id: str, source: str, **fields) -> Paper:
+    """Create one source's record of the same underlying paper."""
+    defaults = {
+        "title": TITLE,
+        "abstract": "",
+        "authors": ["Jane Doe", "John Smith"],
+        "published_date": datetime(2024, 3, 1),  # noqa: DTZ001
+        "url": "",
+    }
+    return Paper(id=paper_id, source=source, **{**defaults, **fields})
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2401.12345v3", "2401.12345"),
+        ("arXiv:2401.12345", "2401.12345"),
+        ("https://arxiv.org/pdf/cs/0112017v1", "cs/0112017"),
+        ("10.1145/3292500.3330701", None),
+        (None, None),
+    ],
+)
+def test_normalize_arxiv_id(value: str | None, expected: str | None) -> None:
+    """Versions, prefixes and URLs reduce to the bare id; DOIs are not mistaken for ids."""
+    assert normalize_arxiv_id(value) == expected
+
+
+def test_normalize_doi() -> None:
+    """Resolver prefixes are stripped and case is folded."""
+    assert normalize_doi("https://doi.org/10.1145/ABC.1") == "10.1145/abc.1"
+    assert normalize_doi("doi:10.1145/abc.1") == "10.1145/abc.1"
+    assert normalize_doi("") is None
+
+
+def test_merge_keeps_best_abstract_and_max_citations() -> None:
+    """Merged records combine the strongest fields of both sources."""
+    primary = make_record("dblp_1", "dblp", citation_count=3, venue="MICCAI")
+    other = make_record("s2_1", "semantic_scholar", abstract="Full abstract.", citation_count=40, doi="10.1/x")
+
+    merged = merge_papers(primary, other)
+
+    assert merged.id == "dblp_1"
+    assert merged.abstract == "Full abstract."
+    assert merged.citation_count == 40
+    assert merged.venue == "MICCAI"
+    assert merged.doi == "10.1/x"
+
+
+def test_resolve_by_identifiers_and_title() -> None:
+    """Records sharing a DOI, an arXiv id or a near-identical title collapse into one."""
+    records = [
+        make_record("arxiv_2403.00001", "arxiv", abstract="Preprint abstract.", arxiv_id="2403.00001"),
+        make_record("s2_abc", "semantic_scholar", citation_count=12, arxiv_id="2403.00001", doi="10.1/seg"),
+        make_record("openalex_W1", "openalex", citation_count=15, doi="10.1/seg"),
+        make_record("pwc_seg", "papers_with_code", title=TITLE.upper() + "."),
+        make_record("dblp_conf_x", "dblp", title="Few-shot medical image segmentation with limited expert annotations"),
+        make_record("arxiv_other", "arxiv", title="Self-Supervised Pretraining for Remote Sensing Imagery"),
+    ]
+
+    resolved = PaperResolver().resolve(records)
+
+    assert [paper.id for paper in resolved] == ["arxiv_2403.00001", "arxiv_other"]
+    assert resolved[0].citation_count == 15
+    assert resolved[0].doi == "10.1/seg"
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"authors": ["Someone Else"]},
+        {"published_date": datetime(2019, 1, 1)},  # noqa: DTZ001
+        {"doi": "10.1/different"},
+        {"title": "Few-Shot Medical Image Classification with Abundant Crowd Labels"},
+    ],
+)
+def test_similar_titles_need_consistent_metadata(change: dict) -> None:
+    """Fuzzy title matches are rejected on conflicting authors, years, DOIs or dissimilar titles."""
+    first = make_record("arxiv_1", "arxiv", doi="10.1/seg")
+    second = replace(make_record("dblp_1", "dblp"), **change)
+
+    assert len(PaperResolver().resolve([first, second])) == 2
+
+
+def test_short_generic_titles_are_not_fuzzy_matched() -> None:
+    """Titles like "Introduction" only match on identifiers."""
+    papers = [make_record("a", "dblp", title="Introduction"), make_record("b", "dblp", title="Introduction")]
+
+    assert len(PaperResolver().resolve(papers)) == 2
+
+
+def test_add_reforwards_once_when_abstract_arrives() -> None:
+    """A record first seen without abstract is handed out again once a duplicate supplies one."""
+    resolver = PaperResolver()
+
+    assert resolver.add(make_record("dblp_1", "dblp")) is not None
+    improved = resolver.add(make_record("arxiv_1", "arxiv", abstract="Now with abstract."))
+    again = resolver.add(make_record("s2_1", "semantic_scholar", abstract="Longer abstract than the preprint's."))
+
+    assert improved is not None
+    assert improved.id == "dblp_1"
+    assert improved.abstract == "Now with abstract."
+    assert again is None
+
+
+def test_signature_is_identical_with_and_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The pure-Python fallback produces the same signatures."""
+    pytest.importorskip("numpy")
+    title = normalize_title(TITLE)
+    with_numpy = minhash_signature(title)
+    monkeypatch.setattr(paper_resolver, "NUMPY_AVAILABLE", False)
+
+    assert minhash_signature(title) == with_numpy
+
+
+def test_resolution_scales_near_linearly() -> None:
+    """Four times the papers take roughly four times as long, not sixteen."""
+    rng = random.Random(0)
+    words = [f"term{i}" for i in range(2000)]
+
+    def elapsed(n: int) -> float:
+        papers = [make_record(f"p{i}", "arxiv", title=" ".join(rng.sample(words, 8))) for i in range(n)]
+        started = time.perf_counter()
+        resolved = PaperResolver().resolve(papers)
+        assert len(resolved) == n
+        return time.perf_counter() - started
+
+    small, large = elapsed(1000), elapsed(4000)
+
+    assert large < small * 8
+
+
+@pytest.mark.asyncio
+async def test_pipeline_evaluates_cross_source_duplicates_once() -> None:
+    """The dedup stage drops the same paper arriving from another source."""
+    evaluator = FakeEvaluator()
+    scrapers = [
+        PagedScraper("arxiv", [[make_record("arxiv_1", "arxiv", abstract="Abstract", arxiv_id="2403.00001")]]),
+        PagedScraper("s2", [[make_record("s2_1", "semantic_scholar", abstract="Abstract", arxiv_id="2403.00001")]]),
+    ]
+    pipeline = make_pipeline(evaluator, FakeWriter())
+
+    stats = await pipeline.run(scrapers, lambda s: s.iter_recent_papers(7))
+
+    assert len(evaluator.evaluated) == 1
+    assert stats.duplicates == 1
@@ -2,8 +2,7 @@
 
 import os
 from datetime import UTC, datetime
-from json import JSONDecodeError
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import httpx
 import pytest
@@ -11,6 +10,18 @@ import pytest
 from scrapers.papers_with_code_scraper import PapersWithCodeScraper
 
 
+def serve(scraper: PapersWithCodeScraper, response: httpx.Response) -> list[httpx.Request]:
+    """Answer the scraper's requests with ``response``; return the requests received."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return response
+
+    scraper.session._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return requests
+
+
 class TestPapersWithCodeScraper:
     """Tests for Papers with Code scraper."""
 
@@ -81,15 +92,12 @@ class TestPapersWithCodeScraper:
         """Test Papers with Code fetch with no results."""
         empty_response = {"count": 0, "next": None, "previous": None, "results": []}
 
-        with patch("httpx.AsyncClient.get") as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = empty_response
-            mock_response.status_code = 200
-            mock_get.return_value = mock_response
+        requests = serve(scraper, httpx.Response(200, json=empty_response))
 
-            papers = await scraper.fetch_recent_papers(days=7)
+        papers = await scraper.fetch_recent_papers(days=7)
 
-            assert len(papers) == 0
+        assert len(papers) == 0
+        assert len(requests) == 1
 
     @pytest.mark.asyncio
     async def test_fetch_network_error(self, scraper: PapersWithCodeScraper) -> None:
@@ -190,81 +198,38 @@ class TestPapersWithCodeScraper:
     @pytest.mark.asyncio
     async def test_html_response_error(self, scraper: PapersWithCodeScraper) -> None:
         """Test proper error handling when API returns HTML instead of JSON."""
-        mock_response = Mock()
-        mock_response.headers = {"content-type": "text/html"}
-        mock_response.text = "<html><body>Login required</body></html>"
-        mock_response.raise_for_status = Mock()
-
-        mock_client_instance = Mock()
-        mock_client_instance.get = AsyncMock(return_value=mock_response)
+        html = b"<html><body>Login required</body></html>"
+        serve(scraper, httpx.Response(200, content=html, headers={"content-type": "text/html"}))
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
-
-            with pytest.raises(ValueError, match="API returned text/html instead of JSON"):
-                await scraper._fetch_from_api("https://test.com")
+        with pytest.raises(ValueError, match="API returned text/html instead of JSON"):
+            await scraper._fetch_from_api("https://test.com")
 
     @pytest.mark.asyncio
     async def test_invalid_json_response_error(self, scraper: PapersWithCodeScraper) -> None:
         """Test proper error handling when API returns invalid JSON."""
-        mock_response = Mock()
-        mock_response.headers = {"content-type": "application/json"}
-        mock_response.text = "not valid json"
-        mock_response.json.side_effect = JSONDecodeError("Expecting value", "doc", 0)
-        mock_response.raise_for_status = Mock()
-
-        mock_client_instance = Mock()
-        mock_client_instance.get = AsyncMock(return_value=mock_response)
+        serve(scraper, httpx.Response(200, content=b"not valid json", headers={"content-type": "application/json"}))
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
-
-            with pytest.raises(ValueError, match="Invalid JSON response from API"):
-                await scraper._fetch_from_api("https://test.com")
+        with pytest.raises(ValueError, match="Invalid JSON response from API"):
+            await scraper._fetch_from_api("https://test.com")
 
     @pytest.mark.asyncio
     async def test_api_key_usage(self, scraper: PapersWithCodeScraper) -> None:
         """Test that API key is used when available."""
-        mock_response = Mock()
-        mock_response.headers = {"content-type": "application/json"}
-        mock_response.json.return_value = {"results": []}
-        mock_response.raise_for_status = Mock()
-
-        mock_client_instance = Mock()
-        mock_get = AsyncMock(return_value=mock_response)
-        mock_client_instance.get = mock_get
-
-        with (
-            patch("httpx.AsyncClient") as mock_client,
-            patch.dict(os.environ, {"PAPERS_WITH_CODE_API_KEY": "test-key-123"}),
-        ):
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+        requests = serve(scraper, httpx.Response(200, json={"results": []}))
 
+        with patch.dict(os.environ, {"PAPERS_WITH_CODE_API_KEY": "test-key-123"}):
             await scraper._fetch_from_api("https://test.com")
 
-            mock_get.assert_called_once()
-            call_kwargs = mock_get.call_args.kwargs
-            assert "headers" in call_kwargs
-            assert call_kwargs["headers"]["Authorization"] == "Token test-key-123"
+        assert len(requests) == 1
+        assert requests[0].headers["Authorization"] == "Token test-key-123"
 
     @pytest.mark.asyncio
     async def test_no_api_key(self, scraper: PapersWithCodeScraper) -> None:
         """Test that request works without API key (may be rate-limited)."""
-        mock_response = Mock()
-        mock_response.headers = {"content-type": "application/json"}
-        mock_response.json.return_value = {"results": []}
-        mock_response.raise_for_status = Mock()
-
-        mock_client_instance = Mock()
-        mock_get = AsyncMock(return_value=mock_response)
-        mock_client_instance.get = mock_get
-
-        with patch("httpx.AsyncClient") as mock_client, patch.dict(os.environ, {}, clear=True):
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+        requests = serve(scraper, httpx.Response(200, json={"results": []}))
 
+        with patch.dict(os.environ, {}, clear=True):
             await scraper._fetch_from_api("https://test.com")
 
-            mock_get.assert_called_once()
-            call_kwargs = mock_get.call_args.kwargs
-            assert "headers" in call_kwargs
-            assert call_kwargs["headers"] == {}
+        assert len(requests) == 1
+        assert "Authorization" not in requests[0].headers
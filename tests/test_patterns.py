@@ -0,0 +1,79 @@
+"""Tests for the precompiled pattern registry."""
+
+import re
+
+from analyzers.blocker_detector import BlockerDetector
+from analyzers.confidence_calculator import ConfidenceCalculator
+from analyzers.patterns import MAX_GAP_CHARS, PatternGroup, bound_gaps
+from models.opportunity import BlockerCategory, BlockerSeverity
+
+
+def test_bound_gaps_limits_distance() -> None:
+    """Bounded gaps match nearby terms but not terms beyond the limit."""
+    pattern = re.compile(bound_gaps(r"violates.*law"))
+
+    assert pattern.search("this violates privacy law")
+    assert not pattern.search("violates " + "x" * (MAX_GAP_CHARS + 1) + "law")
+
+
+def test_first_keeps_priority_order() -> None:
+    """first() reports the earliest listed pattern, not the leftmost hit."""
+    group = PatternGroup([r"second", r"first"])
+
+    assert group.first("first then second") == 0
+    assert group.first("nothing") is None
+    assert group.search("first")
+
+
+def test_finditer_names_each_alternative() -> None:
+    """The combined alternation reports which pattern produced each hit."""
+    group = PatternGroup([r"(\d+)%\s*gain", r"state-of-the-art"])
+
+    hits = group.finditer("a 12% gain over state-of-the-art models")
+
+    assert [(index, match.group()) for index, match in hits] == [(0, "12% gain"), (1, "state-of-the-art")]
+
+
+def test_analyzer_groups_are_compiled_once() -> None:
+    """Blocker and uncertainty patterns are compiled at import, not per call."""
+    legal_high = BlockerDetector.BLOCKER_GROUPS[BlockerCategory.LEGAL][BlockerSeverity.HIGH]
+
+    assert legal_high.patterns == tuple(BlockerDetector.BLOCKER_PATTERNS[BlockerCategory.LEGAL][BlockerSeverity.HIGH])
+    assert BlockerDetector().BLOCKER_GROUPS is BlockerDetector().BLOCKER_GROUPS
+    assert set(ConfidenceCalculator.UNCERTAINTY_GROUPS) == set(ConfidenceCalculator.UNCERTAINTY_INDICATORS)
+
+
+def test_bounded_gap_misses_terms_far_apart() -> None:
+    """``insufficient.*data`` no longer matches when the terms are over MAX_GAP_CHARS apart."""
+    calculator = ConfidenceCalculator()
+    near = "Insufficient labelled data for rare classes"
+    far = "Insufficient " + "x" * (MAX_GAP_CHARS + 1) + " data"
+
+    _, near_sources = calculator.calculate({"enhanced_dimensions": ["x"], "concerns": near})
+    _, far_sources = calculator.calculate({"enhanced_dimensions": ["x"], "concerns": far})
+
+    assert any(source.description == near for source in near_sources)
+    assert not far_sources
+
+
+def test_blocker_detection_unchanged_on_adversarial_text() -> None:
+    """Near misses of greedy patterns do not hide a later real match."""
+    detector = BlockerDetector()
+    concerns = "violates no market no cost no real " * 2000 + ". This violates export law."
+
+    blockers = detector.detect_from_text(concerns)
+
+    legal = [b for b in blockers if b.category == BlockerCategory.LEGAL]
+    assert legal[0].severity == BlockerSeverity.HIGH
+    assert legal[0].description == "This violates export law"
+
+
+def test_confidence_indicators_ignore_case() -> None:
+    """Uncertainty indicators match regardless of case."""
+    calculator = ConfidenceCalculator()
+
+    _, sources = calculator.calculate(
+        {"enhanced_dimensions": ["x"], "concerns": "However, the risk is SIGNIFICANT for buyers."}
+    )
+
+    assert any(source.description == "However, the risk is SIGNIFICANT for buyers" for source in sources)
@@ -0,0 +1,183 @@
+"""Tests for the streaming paper pipeline."""
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+
+from analyzers.quality_filter import FilterConfig
+from analyzers.token_ledger import TokenLedger
+from models.opportunity import OpportunityAssessment
+from models.paper import Paper
+from monitor.pipeline import PaperPipeline, PipelineConfig
+
+
+def make_paper(paper_id: str, source: str = "arxiv") -> Paper:
+    """Create a minimal paper."""
+    return Paper(
+        id=paper_id,
+        title=f"Paper {paper_id}",
+        abstract="Abstract",
+        authors=[],
+        published_date=datetime.now(UTC),
+        source=source,
+        url="",
+    )
+
+
+class PagedScraper:
+    """Scraper stand-in that yields pre-built pages."""
+
+    def __init__(self, name: str, pages: list[list[Paper]], gate: asyncio.Event | None = None) -> None:
+        self.name = name
+        self.pages = pages
+        self.gate = gate
+
+    @property
+    def source_name(self) -> str:
+        return self.name
+
+    async def iter_recent_papers(self, days: int):
+        for i, page in enumerate(self.pages):
+            if i > 0 and self.gate is not None:
+                await self.gate.wait()
+            yield page
+
+
+class FakeExtractor:
+    """Signal extractor returning a fixed strong signal."""
+
+    def extract(self, paper: Paper) -> dict[str, dict]:
+        return {"demand": {"score": 8.0, "detected": ["scarcity_complaint"]}}
+
+
+class FakeEvaluator:
+    """Evaluator recording calls and optionally signalling the first one."""
+
+    def __init__(self, first_call: asyncio.Event | None = None) -> None:
+        self.first_call = first_call
+        self.evaluated: list[str] = []
+        self.ledger = TokenLedger("test-model")
+
+    async def evaluate(self, paper: Paper, signals: dict, config: dict) -> OpportunityAssessment:
+        self.evaluated.append(paper.id)
+        if self.first_call is not None:
+            self.first_call.set()
+        return OpportunityAssessment(
+            id=f"rdla_{paper.id}",
+            paper=paper,
+            data_type_name="Dataset",
+            business_context="",
+            value_score=8.0,
+            confidence_score=8.0,
+            tier="A",
+            signals_detected={"demand": 8.0},
+            detected_at=datetime.now(UTC),
+        )
+
+
+class FakeWriter:
+    """Output writer collecting findings in memory."""
+
+    def __init__(self) -> None:
+        self.written: list[OpportunityAssessment] = []
+
+    def write_finding(self, assessment: OpportunityAssessment) -> None:
+        self.written.append(assessment)
+
+
+def make_pipeline(evaluator: FakeEvaluator, writer: FakeWriter, **config) -> PaperPipeline:
+    """Build a pipeline from fakes."""
+    return PaperPipeline(
+        FakeExtractor(),  # type: ignore[arg-type]
+        evaluator,  # type: ignore[arg-type]
+        writer,  # type: ignore[arg-type]
+        {"thresholds": {"value_score_minimum": 6.0}},
+        FilterConfig(enabled=False),
+        pipeline_config=PipelineConfig(progress_interval_seconds=0, **config),
+    )
+
+
+@pytest.mark.asyncio
+async def test_pipeline_processes_and_deduplicates() -> None:
+    """Every unique paper is evaluated and written exactly once."""
+    scrapers = [
+        PagedScraper("arxiv", [[make_paper("a1"), make_paper("a2")], [make_paper("a3")]]),
+        PagedScraper("dblp", [[make_paper("a1", "dblp"), make_paper("d1", "dblp")]]),
+    ]
+    evaluator = FakeEvaluator()
+    writer = FakeWriter()
+
+    stats = await make_pipeline(evaluator, writer, queue_size=1).run(scrapers, lambda s: s.iter_recent_papers(7))
+
+    assert sorted(evaluator.evaluated) == ["a1", "a2", "a3", "d1"]
+    assert stats.fetched == 5
+    assert stats.duplicates == 1
+    assert stats.findings == 4
+    assert len(writer.written) == 4
+    assert all(source.ok for source in stats.sources)
+
+
+@pytest.mark.asyncio
+async def test_evaluation_starts_before_fetch_completes() -> None:
+    """The second page is only released after the first paper was evaluated."""
+    first_call = asyncio.Event()
+    scrapers = [PagedScraper("arxiv", [[make_paper("a1")], [make_paper("a2")]], gate=first_call)]
+    evaluator = FakeEvaluator(first_call)
+
+    stats = await asyncio.wait_for(
+        make_pipeline(evaluator, FakeWriter()).run(scrapers, lambda s: s.iter_recent_papers(7)),
+        timeout=5,
+    )
+
+    assert evaluator.evaluated == ["a1", "a2"]
+    assert stats.findings == 2
+
+
+@pytest.mark.asyncio
+async def test_failing_source_does_not_stop_pipeline() -> None:
+    """Errors from one source are recorded while other sources complete."""
+
+    class BrokenScraper(PagedScraper):
+        async def iter_recent_papers(self, days: int):
+            yield [make_paper("b1", "broken")]
+            raise RuntimeError("connection reset")
+
+    scrapers = [BrokenScraper("broken", []), PagedScraper("arxiv", [[make_paper("a1")]])]
+    evaluator = FakeEvaluator()
+
+    stats = await make_pipeline(evaluator, FakeWriter()).run(scrapers, lambda s: s.iter_recent_papers(7))
+
+    by_source = {source.source: source for source in stats.sources}
+    assert by_source["broken"].error == "connection reset"
+    assert by_source["arxiv"].ok
+    assert sorted(evaluator.evaluated) == ["a1", "b1"]
+
+
+@pytest.mark.asyncio
+async def test_batch_backend_groups_papers_into_batches() -> None:
+    """With a batch evaluator, papers are evaluated in groups of max_batch_size."""
+
+    class FakeBatchEvaluator:
+        max_batch_size = 2
+
+        def __init__(self) -> None:
+            self.batches: list[list[str]] = []
+
+        async def evaluate_many(self, items: list) -> list:
+            self.batches.append([paper.id for paper, _ in items])
+            return [(paper, await FakeEvaluator().evaluate(paper, signals, {})) for paper, signals in items]
+
+    scrapers = [PagedScraper("arxiv", [[make_paper("a1"), make_paper("a2"), make_paper("a3")]])]
+    batch_evaluator = FakeBatchEvaluator()
+    evaluator = FakeEvaluator()
+    writer = FakeWriter()
+    pipeline = make_pipeline(evaluator, writer)
+    pipeline.batch_evaluator = batch_evaluator  # type: ignore[assignment]
+
+    stats = await pipeline.run(scrapers, lambda s: s.iter_recent_papers(7))
+
+    assert sorted(map(len, batch_evaluator.batches)) == [1, 2]
+    assert evaluator.evaluated == []
+    assert stats.findings == 3
+    assert len(writer.written) == 3
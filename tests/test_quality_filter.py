@@ -0,0 +1,98 @@
+"""Tests for the age-adjusted quality filter."""
+
+import random
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from analyzers import quality_filter
+from analyzers.quality_filter import FilterConfig, filter_batch, filter_papers, passes_quality_filter
+from models.paper import Paper
+from models.paper_batch import PaperBatch
+
+NOW = datetime(2026, 3, 15, 12, 0, tzinfo=UTC)
+YEAR = timedelta(days=365.25)
+
+
+def random_paper(rng: random.Random, index: int) -> Paper:
+    """A paper whose age often lies within a day of an age-bin edge."""
+    if rng.random() < 0.5:
+        age = rng.choice([0, 1, 2, 5]) * YEAR + timedelta(days=rng.choice([-1, 0, 1]), microseconds=rng.randint(-5, 5))
+    else:
+        age = timedelta(days=rng.uniform(-30, 9 * 365))
+    published = NOW - age
+    if rng.random() < 0.3:
+        published = published.replace(tzinfo=None)
+    elif rng.random() < 0.3:
+        published = published.astimezone(timezone(timedelta(hours=rng.randint(-12, 14))))
+
+    citations = rng.choice([None, "Unknown", rng.randint(0, 40), str(rng.randint(0, 40)), 0])
+    return Paper(
+        id=f"p{index}",
+        title=f"Paper {index}",
+        abstract="",
+        authors=[],
+        published_date=published,
+        source=rng.choice(["arxiv", "semantic_scholar", "openalex", "dblp"]),
+        url="",
+        citation_count=citations,  # type: ignore[arg-type]
+    )
+
+
+def random_config(rng: random.Random) -> FilterConfig:
+    """A configuration, sometimes with only some age bins configured."""
+    thresholds = {key: rng.randint(0, 30) for key in ("0-1", "1-2", "2-5", "5+") if rng.random() < 0.7}
+    return FilterConfig(
+        enabled=rng.random() < 0.9,
+        min_citations_absolute=rng.randint(0, 8),
+        citation_thresholds=thresholds or None,
+        allow_unknown_citations=rng.random() < 0.3,
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_batch_filter_matches_per_paper_filter(seed: int) -> None:
+    """filter_batch makes the same decision, with the same reason, as passes_quality_filter."""
+    pytest.importorskip("numpy")
+
+    rng = random.Random(seed)
+    papers = [random_paper(rng, i) for i in range(200)]
+    config = random_config(rng)
+
+    decisions = filter_batch(PaperBatch.from_papers(papers), config, NOW)
+
+    for row, paper in enumerate(papers):
+        assert (bool(decisions.passed[row]), decisions.reason(row)) == passes_quality_filter(paper, config, NOW)
+
+
+def test_filter_papers_formats_reasons_for_rejected_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    """filter_papers splits like the per-paper filter and only formats rejection reasons."""
+    rng = random.Random(0)
+    papers = [random_paper(rng, i) for i in range(200)]
+    config = FilterConfig()
+    expected = [passes_quality_filter(paper, config, NOW) for paper in papers]
+
+    formatted: list[str] = []
+    reason = quality_filter.quality_reason
+
+    def counting_reason(*args, **kwargs) -> str:
+        formatted.append(reason(*args, **kwargs))
+        return formatted[-1]
+
+    monkeypatch.setattr(quality_filter, "quality_reason", counting_reason)
+    passed, rejected = filter_papers(papers, config, NOW)
+
+    assert passed == [paper for paper, (passes, _) in zip(papers, expected, strict=True) if passes]
+    assert [r for _, r in rejected] == [r for passes, r in expected if not passes]
+    assert len(formatted) == len(rejected)
+
+
+def test_age_thresholds_step_at_bin_edges() -> None:
+    """Ages count whole days: 365 days is under a year (0-1 threshold), 366 days is not (1-2)."""
+    config = FilterConfig(min_citations_absolute=0)
+    paper = random_paper(random.Random(0), 0)
+    young = Paper(**{**paper.__dict__, "citation_count": 5, "published_date": NOW - timedelta(days=365)})
+    old = Paper(**{**paper.__dict__, "citation_count": 5, "published_date": NOW - timedelta(days=366)})
+
+    assert passes_quality_filter(young, config, NOW)[0]
+    assert passes_quality_filter(old, config, NOW) == (False, "Below age-adjusted threshold for 1.0yr paper (5 < 10)")
@@ -0,0 +1,132 @@
+"""Tests for per-host token-bucket rate limiting."""
+
+import asyncio
+import time
+from email.utils import formatdate
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from scrapers import create_scrapers
+from scrapers.rate_limiter import HostRateLimiter, TokenBucket, parse_retry_after
+from scrapers.session import ScraperSession
+
+API = "https://api.example.org/search"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_are_spaced_by_the_refill_rate() -> None:
+    """Coroutines racing for one bucket queue up instead of passing together."""
+    bucket = TokenBucket(rate=20.0, burst=1)
+    granted: list[float] = []
+
+    async def request() -> None:
+        await bucket.acquire()
+        granted.append(time.monotonic())
+
+    await asyncio.gather(*(request() for _ in range(4)))
+
+    gaps = [later - earlier for earlier, later in zip(granted, granted[1:], strict=False)]
+    assert min(gaps) >= 0.045
+
+
+@pytest.mark.asyncio
+async def test_burst_allowance_is_served_without_waiting() -> None:
+    """A full bucket hands out ``burst`` tokens at once."""
+    bucket = TokenBucket(rate=1.0, burst=3)
+
+    waits = [await bucket.acquire() for _ in range(3)]
+
+    assert waits == [0.0, 0.0, 0.0]
+    assert bucket.tokens < 1
+
+
+def test_429_halves_rate_and_success_recovers() -> None:
+    """Multiplicative decrease on 429, additive recovery up to the configured rate."""
+    bucket = TokenBucket(rate=10.0)
+
+    bucket.observe(429, {})
+    bucket.observe(429, {})
+    assert bucket.current_rate == pytest.approx(2.5)
+
+    for _ in range(20):
+        bucket.observe(200, {})
+    assert bucket.current_rate == pytest.approx(10.0)
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_the_host() -> None:
+    """A Retry-After delay blocks every caller, even on an unlimited host."""
+    bucket = TokenBucket(rate=None)
+    bucket.observe(429, {"Retry-After": "0.1"})
+
+    waited = await bucket.acquire()
+
+    assert waited >= 0.09
+
+
+def test_exhausted_quota_pauses_until_reset_and_low_quota_slows_down() -> None:
+    """X-RateLimit headers pause the host at zero and spread the rest of the window."""
+    bucket = TokenBucket(rate=10.0)
+
+    bucket.observe(200, {"X-RateLimit-Remaining": "4", "X-RateLimit-Reset": "2"})
+    assert bucket.current_rate == pytest.approx(2.0)
+
+    bucket.observe(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"})
+    assert bucket.blocked_until > time.monotonic() + 29
+
+
+def test_parse_retry_after() -> None:
+    """Delays in seconds and HTTP dates are understood; junk is ignored."""
+    now = time.time()
+
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(formatdate(now + 60, usegmt=True), now=now) == pytest.approx(60, abs=1)
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_strictest_limit_wins_for_a_shared_host() -> None:
+    """Two sources on one host share a bucket with the slower rate."""
+    limiter = HostRateLimiter()
+    limiter.configure(API, interval_seconds=1)
+    limiter.configure("https://api.example.org/other", interval_seconds=3)
+    limiter.configure(API, interval_seconds=0)
+
+    assert limiter.bucket(API).rate == pytest.approx(1 / 3)
+
+
+def test_scrapers_sharing_a_session_share_host_buckets() -> None:
+    """Scrapers built together pace their hosts through one limiter."""
+    scrapers = create_scrapers(
+        {
+            "arxiv": {"enabled": True, "base_url": "http://export.arxiv.org/api/query", "rate_limit_seconds": 3},
+            "dblp": {"enabled": True, "base_url": "https://dblp.org/search/publ/api", "rate_limit_burst": 2},
+        }
+    )
+    limiter = scrapers[0].session.rate_limiter
+
+    assert limiter is scrapers[1].session.rate_limiter
+    assert limiter.bucket("http://export.arxiv.org/api/query?start=100").rate == pytest.approx(1 / 3)
+    assert limiter.bucket("https://dblp.org/search/publ/api").burst == 2
+
+
+@pytest.mark.asyncio
+async def test_session_records_waits_and_throttling_per_source() -> None:
+    """Responses feed the bucket, and metrics are kept per source."""
+    session = ScraperSession()
+    session.rate_limiter.configure(API, interval_seconds=0.05)
+    throttled = httpx.Response(429, headers={"Retry-After": "0"}, request=httpx.Request("GET", API))
+    session._client = Mock(get=AsyncMock(return_value=throttled))
+
+    for _ in range(3):
+        await session.get(API, source="openalex")
+
+    metrics = session.rate_limiter.metrics()["openalex"]
+    assert metrics["requests"] == 3
+    assert metrics["throttled"] == 3
+    assert metrics["waited_seconds"] > 0
+    current_rate = session.rate_limiter.bucket(API).current_rate
+    assert current_rate is not None
+    assert current_rate < 20
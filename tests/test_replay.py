@@ -0,0 +1,114 @@
+"""Tests for cassette recording and the replay stand-in server."""
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+from scrapers import CassetteRecorder, create_scrapers
+from scrapers.cassette import Cassette, Interaction, load_cassettes
+from scrapers.replay_server import ReplayServer, replay_sources
+
+SOURCES = {
+    "arxiv": {
+        "enabled": True,
+        "categories": ["cs.AI", "cs.CL"],
+        "rate_limit_seconds": 0,
+        "retry_initial_delay_seconds": 0.01,
+        "base_url": "http://export.arxiv.org/api/query",
+    },
+}
+SERVER = "http://standin"
+
+
+async def record(tmp_path: Path, arxiv_sample_xml: str) -> dict[str, Cassette]:
+    """Crawl arXiv against a fake network, record it and return the saved cassettes."""
+
+    def network(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, text=arxiv_sample_xml, headers={"content-type": "application/atom+xml", "etag": '"a1"'}
+        )
+
+    recorder = CassetteRecorder()
+    scrapers = create_scrapers(SOURCES, recorder=recorder)
+    scrapers[0].session._client = httpx.AsyncClient(transport=httpx.MockTransport(network))
+    await scrapers[0].fetch_recent_papers(days=100_000)
+    recorder.save(tmp_path)
+    return load_cassettes(tmp_path)
+
+
+def standin_scrapers(server: ReplayServer) -> list:
+    """Scrapers configured for the stand-in server, served in-process."""
+    scrapers = create_scrapers(replay_sources(SOURCES, SERVER))
+    scrapers[0].session._client = httpx.AsyncClient(transport=httpx.ASGITransport(app=server))
+    return scrapers
+
+
+@pytest.mark.asyncio
+async def test_recorded_crawl_replays_to_the_same_papers(tmp_path: Path, arxiv_sample_xml: str) -> None:
+    """Each request is recorded once, and replaying yields the papers of the live crawl."""
+    cassettes = await record(tmp_path, arxiv_sample_xml)
+
+    assert list(cassettes) == ["arxiv"]
+    interactions = cassettes["arxiv"].interactions
+    assert [i.path for i in interactions] == ["/api/query", "/api/query"]
+    assert "cat%3Acs.CL" in interactions[1].query
+    assert interactions[0].headers == {"content-type": "application/atom+xml", "etag": '"a1"'}
+
+    server = ReplayServer(cassettes)
+    papers = await standin_scrapers(server)[0].fetch_recent_papers(days=100_000)
+
+    assert len(papers) == 4
+    assert server.stats.replayed == 2
+
+
+@pytest.mark.asyncio
+async def test_injected_429s_are_retried_after_retry_after(tmp_path: Path, arxiv_sample_xml: str) -> None:
+    """Every other request is throttled; retries still complete the crawl and the limiter sees the 429s."""
+    server = ReplayServer(await record(tmp_path, arxiv_sample_xml), throttle_every=2, retry_after_seconds=0)
+    scraper = standin_scrapers(server)[0]
+
+    papers = await scraper.fetch_recent_papers(days=100_000)
+
+    assert len(papers) == 4
+    assert server.stats.throttled == 1
+    assert scraper.session.rate_limiter.metrics()["arxiv"]["throttled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unrecorded_pages_are_empty_and_unknown_paths_missing() -> None:
+    """Pages past the recording end the crawl; conditional requests get 304; other paths 404."""
+    cassette = Cassette(
+        "openalex",
+        [Interaction("/works", "cursor=%2A", 200, {"content-type": "application/json", "etag": '"w1"'}, "{}")],
+    )
+    server = ReplayServer({"openalex": cassette}, latency_seconds=0.01)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=server), base_url=SERVER) as client:
+        assert (await client.get("/openalex/works", params={"cursor": "*"})).json() == {}
+        last_page = await client.get("/openalex/works", params={"cursor": "abc"})
+        not_modified = await client.get("/openalex/works?cursor=*", headers={"If-None-Match": '"w1"'})
+        missing = await client.get("/openalex/authors")
+
+    assert last_page.json()["meta"]["next_cursor"] is None
+    assert not_modified.status_code == 304
+    assert missing.status_code == 404
+    assert server.stats.to_dict() == {
+        "requests": 4,
+        "replayed": 1,
+        "not_modified": 1,
+        "empty_pages": 1,
+        "throttled": 0,
+        "not_found": 1,
+    }
+
+
+def test_replay_sources_mounts_each_source_under_its_name() -> None:
+    """base_urls keep their API path behind the source's prefix; other settings are untouched."""
+    sources = replay_sources(
+        {"http": {"timeout_seconds": 5}, "semantic_scholar": {"base_url": "https://api.semanticscholar.org/graph/v1"}},
+        "http://127.0.0.1:8765/",
+    )
+
+    assert sources["semantic_scholar"]["base_url"] == "http://127.0.0.1:8765/semantic_scholar/graph/v1"
+    assert sources["http"] == {"timeout_seconds": 5}
@@ -0,0 +1,212 @@
+"""Tests for retries, circuit breaking and hedged requests."""
+
+import asyncio
+import random
+import time
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from scrapers import FetchError, SourceUnavailableError
+from scrapers.dblp_scraper import DBLPScraper
+from scrapers.resilience import CircuitBreaker, CircuitState, RetryPolicy, hedged, is_transient_error
+
+API = "https://dblp.org/search/publ/api"
+REQUEST = httpx.Request("GET", API)
+
+
+def make_scraper(client_get: AsyncMock, **config) -> DBLPScraper:
+    """A DBLP scraper with no rate limit, fast retries and a mocked HTTP client."""
+    scraper = DBLPScraper(
+        {"base_url": API, "rate_limit_seconds": 0, "retry_initial_delay_seconds": 0.01, **config},
+    )
+    scraper.session._client = Mock(get=client_get)
+    return scraper
+
+
+def response(status: int, **headers: str) -> httpx.Response:
+    """An empty DBLP result with the given status."""
+    return httpx.Response(status, json={"result": {"hits": {"hit": []}}}, headers=headers, request=REQUEST)
+
+
+def test_backoff_is_jittered_below_the_exponential_cap() -> None:
+    """Delays are spread over [0, cap], the cap doubles per attempt up to max_delay."""
+    random.seed(0)
+    policy = RetryPolicy(initial_delay=1.0, max_delay=5.0)
+
+    for attempt, cap in enumerate([1, 2, 4, 5, 5]):
+        delays = [policy.backoff(attempt) for _ in range(200)]
+        assert 0 <= min(delays) and max(delays) <= cap
+        assert max(delays) - min(delays) > cap / 2
+
+    assert policy.backoff(0, retry_after=30) == 30
+
+
+def test_transient_errors() -> None:
+    """Timeouts, connection failures, 429 and 5xx are transient; 4xx and bad URLs are not."""
+
+    def status_error(status: int) -> httpx.HTTPStatusError:
+        return httpx.HTTPStatusError("", request=REQUEST, response=httpx.Response(status, request=REQUEST))
+
+    assert is_transient_error(httpx.ReadTimeout("slow"))
+    assert is_transient_error(httpx.ConnectError("refused"))
+    assert is_transient_error(status_error(429))
+    assert is_transient_error(status_error(503))
+    assert not is_transient_error(status_error(404))
+    assert not is_transient_error(httpx.UnsupportedProtocol("ftp"))
+    assert not is_transient_error(ValueError("bad json"))
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried_until_success() -> None:
+    """A timeout and a 503 are retried; the third attempt's papers are returned."""
+    get = AsyncMock(side_effect=[httpx.ReadTimeout("slow"), response(503), response(200)])
+    scraper = make_scraper(get)
+
+    assert await scraper._search_venue("ICLR", 2025) == []
+    assert get.await_count == 3
+    assert scraper.circuit_breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honored() -> None:
+    """A 429's Retry-After delays the retry even when the backoff cap is tiny."""
+    get = AsyncMock(side_effect=[response(429, **{"Retry-After": "0.2"}), response(200)])
+    scraper = make_scraper(get)
+
+    start = time.monotonic()
+    await scraper._search_venue("ICLR", 2025)
+
+    assert time.monotonic() - start >= 0.19
+    assert get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_propagate_instead_of_dropping_the_page() -> None:
+    """After the last retry the failure reaches the caller rather than an empty page."""
+    get = AsyncMock(return_value=response(502))
+    scraper = make_scraper(get, max_retries=2)
+
+    with pytest.raises(FetchError):
+        await scraper._search_venue("ICLR", 2025)
+    assert get.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried() -> None:
+    """A 404 is neither retried nor counted against the source's health."""
+    get = AsyncMock(return_value=response(404))
+    scraper = make_scraper(get, circuit_failure_threshold=1)
+
+    assert await scraper._search_venue("ICLR", 2025) == []
+    assert get.await_count == 1
+    assert scraper.circuit_breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_until_a_probe_succeeds() -> None:
+    """Consecutive failures open the circuit; after the cool-down one probe closes it."""
+    get = AsyncMock(return_value=response(503))
+    scraper = make_scraper(get, max_retries=0, circuit_failure_threshold=2, circuit_reset_seconds=0.05)
+
+    for _ in range(2):
+        with pytest.raises(FetchError):
+            await scraper._search_venue("ICLR", 2025)
+    with pytest.raises(SourceUnavailableError):
+        await scraper._search_venue("ICLR", 2025)
+    assert get.await_count == 2
+
+    await asyncio.sleep(0.06)
+    get.return_value = response(200)
+    assert await scraper._search_venue("ICLR", 2025) == []
+    assert scraper.circuit_breaker.state == CircuitState.CLOSED
+
+
+def test_half_open_circuit_lets_one_probe_through() -> None:
+    """While the probe is in flight other requests fail fast; a failed probe reopens the circuit."""
+    breaker = CircuitBreaker("dblp", failure_threshold=1, reset_timeout_seconds=0)
+    breaker.record_failure()
+
+    breaker.before_request()
+    assert breaker.state == CircuitState.HALF_OPEN
+    with pytest.raises(SourceUnavailableError):
+        breaker.before_request()
+
+    breaker.reset_timeout_seconds = 60
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(SourceUnavailableError):
+        breaker.before_request()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_does_not_block_the_next_one() -> None:
+    """A probe cancelled mid-request releases the half-open circuit for the next request."""
+    started = asyncio.Event()
+
+    async def hang(*args: object, **kwargs: object) -> httpx.Response:
+        started.set()
+        await asyncio.sleep(60)
+        return response(200)
+
+    scraper = make_scraper(AsyncMock(side_effect=hang), circuit_failure_threshold=1, circuit_reset_seconds=0)
+    scraper.circuit_breaker.record_failure()
+
+    probe = asyncio.create_task(scraper._get(API))
+    await started.wait()
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+    assert scraper.circuit_breaker.state == CircuitState.HALF_OPEN
+
+    scraper.session._client = Mock(get=AsyncMock(return_value=response(200)))
+    await scraper._get(API)
+    assert scraper.circuit_breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_request_error_without_response_does_not_close_the_circuit() -> None:
+    """A non-transient error before any response leaves a half-open circuit for the next probe."""
+    get = AsyncMock(side_effect=httpx.InvalidURL("bad url"))
+    scraper = make_scraper(get, circuit_failure_threshold=1, circuit_reset_seconds=0)
+    scraper.circuit_breaker.record_failure()
+
+    with pytest.raises(httpx.InvalidURL):
+        await scraper._get(API)
+    assert scraper.circuit_breaker.state == CircuitState.HALF_OPEN
+    assert scraper.circuit_breaker.consecutive_failures == 1
+
+    scraper.session._client = Mock(get=AsyncMock(return_value=response(200)))
+    await scraper._get(API)
+    assert scraper.circuit_breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_returns_the_faster_copy() -> None:
+    """A slow first attempt is overtaken by the hedge, and the loser is cancelled."""
+    delays = iter([1.0, 0.01])
+    cancelled = []
+
+    async def call() -> float:
+        delay = next(delays)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(delay)
+            raise
+        return delay
+
+    start = time.monotonic()
+    assert await hedged(call, hedge_after_seconds=0.02) == 0.01
+    assert time.monotonic() - start < 0.5
+    assert cancelled == [1.0]
+
+
+@pytest.mark.asyncio
+async def test_fast_requests_are_not_hedged() -> None:
+    """Requests answering before the hedge delay are sent once."""
+    call = AsyncMock(return_value="page")
+
+    assert await hedged(call, hedge_after_seconds=0.5) == "page"
+    assert call.await_count == 1
@@ -0,0 +1,92 @@
+"""Tests for the persistent LLM response cache."""
+
+import json
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from analyzers.value_evaluator import ValueEvaluator
+from models.paper import Paper
+from persistence.response_cache import ResponseCache
+
+
+def test_key_depends_on_content_model_and_prompt_version(sample_paper: Paper) -> None:
+    """Changing the abstract, model or prompt version produces a new key."""
+    key = ResponseCache.make_key(sample_paper, "model-a", "1")
+    edited = Paper(**{**sample_paper.__dict__, "abstract": "Revised abstract"})
+
+    assert key == ResponseCache.make_key(sample_paper, "model-a", "1")
+    assert key != ResponseCache.make_key(edited, "model-a", "1")
+    assert key != ResponseCache.make_key(sample_paper, "model-b", "1")
+    assert key != ResponseCache.make_key(sample_paper, "model-a", "2")
+
+
+def test_hit_miss_and_persistence(tmp_path: Path, sample_paper: Paper) -> None:
+    """Stored responses survive reopening the database and are counted."""
+    path = tmp_path / "cache.sqlite"
+    key = ResponseCache.make_key(sample_paper, "model", "1")
+
+    cache = ResponseCache(path)
+    assert cache.get(key) is None
+    cache.put(key, sample_paper, "model", "1", '{"value_score": 8}')
+    cache.close()
+
+    reopened = ResponseCache(path)
+    assert reopened.get(key) == '{"value_score": 8}'
+    assert reopened.stats.hits == 1
+    assert reopened.stats.hit_rate == 1.0
+
+
+def test_expired_entries_are_misses_and_evicted(tmp_path: Path, sample_paper: Paper) -> None:
+    """Entries older than the TTL are not returned and are removed by evict()."""
+    cache = ResponseCache(tmp_path / "cache.sqlite", ttl_seconds=60)
+    key = ResponseCache.make_key(sample_paper, "model", "1")
+    cache.put(key, sample_paper, "model", "1", "{}")
+
+    with patch("persistence.response_cache.time.time", return_value=time.time() + 120):
+        assert cache.get(key) is None
+        assert cache.evict() == 1
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path, sample_paper: Paper) -> None:
+    """Only max_entries most recently used entries are kept."""
+    cache = ResponseCache(tmp_path / "cache.sqlite", ttl_seconds=None, max_entries=2)
+    keys = [ResponseCache.make_key(sample_paper, "model", str(i)) for i in range(3)]
+    for i, key in enumerate(keys):
+        with patch("persistence.response_cache.time.time", return_value=1_000_000_000.0 + i):
+            cache.put(key, sample_paper, "model", str(i), "{}")
+
+    cache.evict()
+
+    assert len(cache) == 2
+    assert cache.get(keys[0]) is None
+
+
+@pytest.mark.asyncio
+async def test_evaluator_reuses_cached_response(
+    tmp_path: Path, sample_paper: Paper, sample_signals: dict[str, dict]
+) -> None:
+    """The second evaluation of an unchanged paper does not call Claude."""
+    content = Mock()
+    content.text = json.dumps({"technical_contribution_score": 8.0, "commercial_viability_score": 8.0})
+    message = Mock()
+    message.content = [content]
+    client = Mock()
+    client.messages.create = AsyncMock(return_value=message)
+
+    with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test_key"}):
+        evaluator = ValueEvaluator({}, response_cache=ResponseCache(tmp_path / "cache.sqlite"))
+    evaluator.client = client
+
+    first = await evaluator.evaluate(sample_paper, sample_signals, {})
+    second = await evaluator.evaluate(sample_paper, sample_signals, {})
+
+    assert first is not None
+    assert second is not None
+    assert second.value_score == first.value_score
+    assert client.messages.create.await_count == 1
+    assert evaluator.response_cache is not None
+    assert evaluator.response_cache.stats.hits == 1
@@ -0,0 +1,64 @@
+"""Tests for the shared scraper HTTP session."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from scrapers import close_scrapers, create_scrapers
+from scrapers.session import ScraperSession
+
+
+@pytest.fixture
+def sources_config() -> dict:
+    """Minimal sources configuration with two enabled scrapers."""
+    return {
+        "http": {"max_connections": 5, "max_connections_per_host": 2, "http2": False},
+        "arxiv": {"enabled": True, "base_url": "http://export.arxiv.org/api/query", "categories": ["cs.AI"]},
+        "dblp": {"enabled": True, "base_url": "https://dblp.org/search/publ/api", "venues": ["NeurIPS"]},
+        "openalex": {"enabled": False},
+    }
+
+
+def test_create_scrapers_shares_one_session(sources_config: dict) -> None:
+    """All scrapers created together use the same pooled session."""
+    scrapers = create_scrapers(sources_config)
+
+    assert len(scrapers) == 2
+    assert scrapers[0].session is scrapers[1].session
+    assert scrapers[0].session.max_connections_per_host == 2
+
+
+def test_client_is_created_once() -> None:
+    """The pooled client is created lazily and reused."""
+    session = ScraperSession({"http2": False})
+
+    assert session.is_closed
+    assert session.client is session.client
+    assert not session.is_closed
+
+
+@pytest.mark.asyncio
+async def test_close_scrapers_closes_shared_session(sources_config: dict) -> None:
+    """close_scrapers releases the shared client."""
+    scrapers = create_scrapers(sources_config)
+    session = scrapers[0].session
+    _ = session.client
+
+    await close_scrapers(scrapers)
+
+    assert session.is_closed
+
+
+@pytest.mark.asyncio
+async def test_get_reuses_client_across_requests() -> None:
+    """Consecutive requests go through the same client instance."""
+    session = ScraperSession()
+    mock_client = Mock()
+    mock_client.get = AsyncMock(return_value=Mock(status_code=200))
+    session._client = mock_client
+
+    await session.get("https://api.openalex.org/works", params={"page": 1})
+    await session.get("https://api.openalex.org/works", params={"page": 2})
+
+    assert mock_client.get.await_count == 2
+    assert mock_client.get.call_args.kwargs == {"params": {"page": 2}}
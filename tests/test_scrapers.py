@@ -254,6 +254,26 @@ class TestOpenAlexScraper:
         assert paper.url == "https://doi.org/10.1234/test"
         assert paper.citation_count == 42
         assert paper.venue == "Nature"
+        assert paper.doi == "10.1234/test"
+        assert paper.arxiv_id is None
+
+    def test_parse_work_arxiv_location(self, scraper: OpenAlexScraper) -> None:
+        """Test the arXiv id is taken from an arXiv landing page."""
+        work = {
+            "id": "https://openalex.org/W123",
+            "title": "Preprint",
+            "abstract_inverted_index": {"test": [0]},
+            "publication_date": "2025-01-01",
+            "locations": [
+                {"landing_page_url": "https://doi.org/10.1234/test"},
+                {"landing_page_url": "http://arxiv.org/abs/2501.01234v2"},
+            ],
+        }
+
+        paper = scraper._parse_work(work)
+
+        assert paper is not None
+        assert paper.arxiv_id == "2501.01234"
 
     def test_parse_work_missing_title(self, scraper: OpenAlexScraper) -> None:
         """Test parsing work without title returns None."""
@@ -0,0 +1,106 @@
+"""Tests for batched signal extraction."""
+
+import json
+import random
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from analyzers import signal_extractor
+from analyzers.signal_batch import CATEGORIES, SCORE_TERMS
+from analyzers.signal_extractor import BUILTIN_TERMS, SignalExtractor
+from models.paper import Paper
+
+np = pytest.importorskip("numpy")
+
+HEURISTICS_PATH = Path(__file__).parent.parent / "config" / "heuristics.json"
+
+PHRASES = [
+    "only 500 samples",
+    "a 12% improvement",
+    "cohen's kappa of 0.81",
+    "across multiple domains",
+    "outperforms the baseline",
+    "a small dataset",
+]
+
+
+@pytest.fixture
+def extractor() -> SignalExtractor:
+    """Extractor with the shipped heuristics."""
+    return SignalExtractor(json.loads(HEURISTICS_PATH.read_text()))
+
+
+def random_papers(extractor: SignalExtractor, sample_paper: Paper, count: int) -> list[Paper]:
+    """Create papers mixing keywords, pattern phrases and metadata."""
+    terms = [kw for group in extractor.keywords.values() for kw in group]
+    terms += [kw for group in BUILTIN_TERMS.values() for kw in group] + PHRASES
+    rng = random.Random(5)
+    papers = []
+    for i in range(count):
+        words = rng.sample(terms, rng.randint(0, 12)) + ["we", "study", "data"] * 5
+        rng.shuffle(words)
+        papers.append(
+            replace(
+                sample_paper,
+                id=f"p{i}",
+                abstract=" ".join(words),
+                citation_count=rng.choice([None, 0, 20, 21, 50, 51]),
+                venue=rng.choice([None, "", "ICLR 2025", "arXiv"]),
+            )
+        )
+    return papers
+
+
+def test_batch_matches_single_extraction(extractor: SignalExtractor, sample_paper: Paper) -> None:
+    """Every batch row equals extract() of the same paper, scores included."""
+    papers = [sample_paper, *random_papers(extractor, sample_paper, 300)]
+
+    batch = extractor.extract_batch(papers)
+
+    assert batch.scores.shape == (len(papers), len(CATEGORIES))
+    for row, paper in enumerate(papers):
+        expected = extractor.extract(paper)
+        assert batch[row] == expected
+        assert batch.scores[row].tolist() == [expected[category]["score"] for category in CATEGORIES]
+
+
+def test_parity_covers_every_rule(extractor: SignalExtractor, sample_paper: Paper) -> None:
+    """Every scoring rule fires somewhere in the corpus and both paths agree on each category."""
+    papers = random_papers(extractor, sample_paper, 300)
+
+    batch = extractor.extract_batch(papers)
+
+    assert (batch.term_counts > 0).any(axis=0).tolist() == [True] * len(SCORE_TERMS)
+    for row, paper in enumerate(papers):
+        text = f"{paper.title} {paper.abstract}".lower()
+        assert extractor._extract_trend_signals(paper) == batch[row]["trend"]
+        assert extractor._extract_scaling_potential(text) == batch[row]["scaling_potential"]
+        assert extractor._extract_novelty_signals(text) == batch[row]["novelty"]
+
+
+def test_score_column(extractor: SignalExtractor, sample_paper: Paper) -> None:
+    """score() returns one category for all papers."""
+    papers = random_papers(extractor, sample_paper, 20)
+
+    batch = extractor.extract_batch(papers)
+
+    assert batch.score("trend").tolist() == [extractor.extract(paper)["trend"]["score"] for paper in papers]
+    assert len(list(batch)) == len(papers)
+
+
+def test_empty_batch(extractor: SignalExtractor) -> None:
+    """An empty corpus gives an empty score array."""
+    batch = extractor.extract_batch([])
+
+    assert batch.scores.shape == (0, len(CATEGORIES))
+    assert len(batch) == 0
+
+
+def test_requires_numpy(extractor: SignalExtractor, sample_paper: Paper) -> None:
+    """Without NumPy the batch API fails with an install hint."""
+    with patch.object(signal_extractor, "NUMPY_AVAILABLE", False):
+        with pytest.raises(ImportError, match="numpy"):
+            extractor.extract_batch([sample_paper])
@@ -0,0 +1,117 @@
+"""Tests for concurrent cross-source fetching."""
+
+import asyncio
+import time
+from datetime import UTC, datetime
+
+import pytest
+
+from models.paper import Paper
+from monitor.source_fetcher import fetch_all_sources, time_limited_pages
+
+
+class FakeScraper:
+    """Scraper stand-in with a configurable delay and outcome."""
+
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False) -> None:
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.active = 0
+        self.max_active = 0
+
+    @property
+    def source_name(self) -> str:
+        return self.name
+
+    async def fetch_recent_papers(self, days: int) -> list[Paper]:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self.name} unavailable")
+        return [
+            Paper(
+                id=f"{self.name}_1",
+                title="Paper",
+                abstract="Abstract",
+                authors=[],
+                published_date=datetime.now(UTC),
+                source=self.name,
+                url="",
+            )
+        ]
+
+
+@pytest.mark.asyncio
+async def test_sources_are_fetched_concurrently() -> None:
+    """Total time is bounded by the slowest source, not the sum."""
+    scrapers = [FakeScraper("a", delay=0.2), FakeScraper("b", delay=0.2), FakeScraper("c", delay=0.2)]
+
+    started = time.monotonic()
+    results = await fetch_all_sources(scrapers, lambda s: s.fetch_recent_papers(7))
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.5
+    assert [r.source for r in results] == ["a", "b", "c"]
+    assert all(r.ok and len(r.papers) == 1 for r in results)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_is_respected() -> None:
+    """With a cap of one, sources run one after another."""
+    scrapers = [FakeScraper("a", delay=0.1), FakeScraper("b", delay=0.1)]
+
+    started = time.monotonic()
+    await fetch_all_sources(scrapers, lambda s: s.fetch_recent_papers(7), max_concurrency=1)
+
+    assert time.monotonic() - started >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_errors_and_timeouts_are_isolated() -> None:
+    """A failing and a slow source do not affect healthy ones."""
+    scrapers = [FakeScraper("ok"), FakeScraper("broken", fail=True), FakeScraper("slow", delay=5.0)]
+
+    results = await fetch_all_sources(scrapers, lambda s: s.fetch_recent_papers(7), timeout_seconds=0.2)
+    by_source = {r.source: r for r in results}
+
+    assert by_source["ok"].ok
+    assert len(by_source["ok"].papers) == 1
+    assert by_source["broken"].error == "broken unavailable"
+    assert by_source["slow"].timed_out
+    assert by_source["slow"].papers == []
+
+
+async def slow_pages(count: int, delay: float):
+    """Yield ``count`` one-paper pages, each after ``delay`` seconds."""
+    for _ in range(count):
+        yield await FakeScraper("paged", delay=delay).fetch_recent_papers(7)
+
+
+@pytest.mark.asyncio
+async def test_page_timeout_excludes_processing_time() -> None:
+    """Only time spent waiting for pages counts; slow processing between pages does not."""
+
+    async def fetch(scraper: FakeScraper) -> list[Paper]:
+        papers = []
+        async for page in time_limited_pages(slow_pages(3, 0.05), 0.3):
+            await asyncio.sleep(0.2)  # e.g. evaluating the page
+            papers.extend(page)
+        return papers
+
+    results = await fetch_all_sources([FakeScraper("paged")], fetch)
+
+    assert results[0].ok
+    assert results[0].paper_count == 3
+
+
+@pytest.mark.asyncio
+async def test_page_timeout_reports_slow_source() -> None:
+    """Fetching longer than the timeout fails the source with the configured limit."""
+
+    async def fetch(scraper: FakeScraper) -> list[Paper]:
+        return [paper async for page in time_limited_pages(slow_pages(3, 0.1), 0.15) for paper in page]
+
+    results = await fetch_all_sources([FakeScraper("paged")], fetch)
+
+    assert results[0].timed_out
+    assert results[0].error == "timed out after 0.15s"
@@ -0,0 +1,146 @@
+"""Tests for token and cost accounting."""
+
+import json
+import logging
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from analyzers.quality_filter import FilterConfig
+from analyzers.token_ledger import BATCH_DISCOUNT, SpendLimit, TokenLedger
+from models.opportunity import OpportunityAssessment
+from models.paper import Paper
+from monitor.batch_processor import run_batch_analysis
+from monitor.pipeline import PipelineConfig
+from persistence.output_writer import OutputWriter
+
+from .test_pipeline import FakeEvaluator, FakeExtractor, PagedScraper, make_paper
+
+HAIKU = "claude-3-haiku-20240307"
+
+
+def usage(input_tokens: int = 0, output_tokens: int = 0, cache_read: int | None = None) -> SimpleNamespace:
+    """Response usage block."""
+    return SimpleNamespace(
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cache_creation_input_tokens=None,
+        cache_read_input_tokens=cache_read,
+    )
+
+
+class SpendingEvaluator(FakeEvaluator):
+    """Fake evaluator that records 1000 tokens per call."""
+
+    async def evaluate(self, paper: Paper, signals: dict, config: dict) -> OpportunityAssessment:
+        self.ledger.record(usage(900, 100), source=paper.source, latency_seconds=1.0)
+        return await super().evaluate(paper, signals, config)
+
+
+def test_ledger_accounts_per_source_with_cost() -> None:
+    """Tokens and estimated cost are totalled per source and for the run."""
+    ledger = TokenLedger(HAIKU)
+
+    ledger.record(usage(1_000_000, 0), source="arxiv")
+    ledger.record(usage(0, 1_000_000, cache_read=1_000_000), source="dblp")
+    ledger.record(usage(1_000_000, 0), source="dblp", discount=BATCH_DISCOUNT)
+    ledger.record_cache_hit()
+
+    summary = ledger.summary()
+    assert summary["requests"] == 3
+    assert summary["cache_read_input_tokens"] == 1_000_000
+    assert summary["cached_responses"] == 1
+    assert summary["estimated_cost_usd"] == pytest.approx(0.25 + 1.25 + 0.03 + 0.125)
+    assert summary["by_source"]["arxiv"]["estimated_cost_usd"] == pytest.approx(0.25)
+    assert summary["by_source"]["dblp"]["requests"] == 2
+
+
+def test_unknown_model_tracks_tokens_only() -> None:
+    """Without pricing the cost is reported as unknown rather than zero."""
+    ledger = TokenLedger("some-future-model")
+    ledger.record(usage(10, 10), source="arxiv")
+
+    assert ledger.summary()["estimated_cost_usd"] is None
+    assert ledger.total.total_tokens == 20
+
+
+def test_latency_percentiles_use_nearest_rank() -> None:
+    """Percentiles are taken from measured latencies only."""
+    ledger = TokenLedger(HAIKU)
+    for seconds in range(1, 101):
+        ledger.record(usage(1, 1), source="arxiv", latency_seconds=float(seconds))
+    ledger.record(usage(1, 1), source="arxiv")  # Batch results carry no latency
+
+    assert ledger.latency_percentiles() == {"p50": 50.0, "p90": 90.0, "p99": 99.0}
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("0", None),
+        ("5", SpendLimit(usd=5.0)),
+        ("$2.50", SpendLimit(usd=2.5)),
+        ("10usd", SpendLimit(usd=10.0)),
+        ("200000tokens", SpendLimit(tokens=200000)),
+    ],
+)
+def test_parse_spend_limit(text: str, expected: SpendLimit | None) -> None:
+    """Plain numbers are USD; a token suffix limits tokens."""
+    assert SpendLimit.parse(text) == expected
+
+
+def test_soft_limit_warns_once(caplog: pytest.LogCaptureFixture) -> None:
+    """Crossing the soft limit logs one warning and does not stop evaluation."""
+    ledger = TokenLedger(HAIKU, soft_limit=SpendLimit(tokens=1500))
+
+    with caplog.at_level(logging.WARNING, logger="analyzers.token_ledger"):
+        for _ in range(3):
+            ledger.record(usage(900, 100), source="arxiv")
+
+    assert ledger.soft_limit_exceeded
+    assert not ledger.hard_limit_reached()
+    assert len([r for r in caplog.records if "Soft LLM spending limit" in r.message]) == 1
+
+
+def test_reset_starts_a_new_period() -> None:
+    """reset() clears spending, so both limits apply afresh."""
+    ledger = TokenLedger(HAIKU, soft_limit=SpendLimit(tokens=500), hard_limit=SpendLimit(tokens=1000))
+    ledger.record(usage(900, 100), source="arxiv")
+    assert ledger.soft_limit_exceeded and ledger.hard_limit_reached()
+
+    ledger.reset()
+
+    assert ledger.total.total_tokens == 0
+    assert ledger.by_source == {}
+    assert not ledger.soft_limit_exceeded
+    assert not ledger.hard_limit_reached()
+
+
+@pytest.mark.asyncio
+async def test_hard_limit_stops_evaluation_and_summary_is_persisted(tmp_path: Path) -> None:
+    """Evaluation stops at the hard limit and the run summary lands next to index.jsonl."""
+    evaluator = SpendingEvaluator()
+    evaluator.ledger = TokenLedger(HAIKU, hard_limit=SpendLimit(tokens=2500))
+    papers = [make_paper(f"a{i}") for i in range(5)]
+
+    stats = await run_batch_analysis(
+        [PagedScraper("arxiv", [papers])],
+        FakeExtractor(),  # type: ignore[arg-type]
+        evaluator,  # type: ignore[arg-type]
+        OutputWriter(str(tmp_path)),
+        7,
+        {"thresholds": {"value_score_minimum": 6.0}},
+        FilterConfig(enabled=False),
+        pipeline_config=PipelineConfig(progress_interval_seconds=0, evaluate_workers=1),
+    )
+
+    assert stats.evaluated == 3
+    assert stats.over_budget == 2
+    assert (tmp_path / "index.jsonl").exists()
+    summary = json.loads((tmp_path / "usage.jsonl").read_text())
+    assert summary["requests"] == 3
+    assert summary["hard_limit_reached"]
+    assert summary["over_budget"] == 2
+    assert summary["by_source"]["arxiv"]["output_tokens"] == 300
+    assert summary["latency_seconds"]["p50"] == 1.0
@@ -0,0 +1,106 @@
+"""Tests for pre-LLM triage."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from analyzers.quality_filter import FilterConfig
+from analyzers.triage import TriageScorer
+from models.opportunity import OpportunityAssessment
+from models.paper import Paper
+from monitor.pipeline import PaperPipeline, PipelineConfig
+from persistence.output_writer import OutputWriter
+
+from .test_pipeline import FakeEvaluator, FakeWriter, PagedScraper, make_paper
+
+WEIGHTS = {"demand_signals": 0.75, "trend_signals": 0.25}
+
+
+class ScoredExtractor:
+    """Extractor whose demand score is encoded in the paper id."""
+
+    def extract(self, paper: Paper) -> dict[str, dict]:
+        return {"demand": {"score": float(paper.id.split("_")[1]), "detected": []}}
+
+
+def make_pipeline(evaluator: FakeEvaluator, triage: TriageScorer) -> PaperPipeline:
+    """Pipeline with triage and fakes."""
+    return PaperPipeline(
+        ScoredExtractor(),  # type: ignore[arg-type]
+        evaluator,  # type: ignore[arg-type]
+        FakeWriter(),  # type: ignore[arg-type]
+        {"thresholds": {"value_score_minimum": 6.0}},
+        FilterConfig(enabled=False),
+        pipeline_config=PipelineConfig(progress_interval_seconds=0, min_signal_score=0.0),
+        triage=triage,
+    )
+
+
+def test_composite_is_weighted_mean() -> None:
+    """Weights map onto extractor categories and the result stays on the 0-10 scale."""
+    triage = TriageScorer(WEIGHTS)
+
+    assert triage.score({"demand": {"score": 8.0}, "trend": {"score": 4.0}}) == pytest.approx(7.0)
+    assert triage.score({}) == 0.0
+
+
+def test_calibrate_keeps_recall_of_past_findings(tmp_path: Path) -> None:
+    """The threshold lets the requested share of past findings through."""
+    index = tmp_path / "index.jsonl"
+    entries = [{"value_score": 7.0, "signals_detected": {"demand": float(i), "trend": float(i)}} for i in range(1, 21)]
+    entries.append({"value_score": 7.0})  # Written before signal scores were indexed
+    entries.append({"value_score": 3.0, "signals_detected": {"demand": 0.0}})  # Below the finding threshold
+    index.write_text("\n".join(json.dumps(e) for e in entries) + "\n")
+    triage = TriageScorer(WEIGHTS)
+
+    threshold = triage.calibrate(index, value_score_minimum=6.0, recall=0.9)
+
+    assert threshold == pytest.approx(3.0)
+    assert triage.min_score == threshold
+
+
+def test_calibrate_needs_enough_history(tmp_path: Path) -> None:
+    """Too few findings leave the configured threshold untouched."""
+    triage = TriageScorer(WEIGHTS, min_score=4.0)
+
+    assert triage.calibrate(tmp_path / "missing.jsonl", value_score_minimum=6.0) is None
+    assert triage.min_score == 4.0
+
+
+@pytest.mark.asyncio
+async def test_pipeline_skips_papers_below_threshold() -> None:
+    """Only papers clearing the composite threshold are evaluated."""
+    evaluator = FakeEvaluator()
+    papers = [make_paper(f"p_{score}") for score in (2, 9, 6)]
+
+    stats = await make_pipeline(evaluator, TriageScorer(WEIGHTS, min_score=4.0)).run(
+        [PagedScraper("s", [papers])], lambda s: s.iter_recent_papers(7)
+    )
+
+    assert sorted(evaluator.evaluated) == ["p_6", "p_9"]
+    assert stats.triaged == 1
+
+
+@pytest.mark.asyncio
+async def test_pipeline_evaluates_top_k_best_first() -> None:
+    """With top K only the K highest composites reach the evaluator."""
+    evaluator = FakeEvaluator()
+    papers = [make_paper(f"p_{score}") for score in (3, 9, 1, 7, 5)]
+
+    stats = await make_pipeline(evaluator, TriageScorer(WEIGHTS, top_k=2)).run(
+        [PagedScraper("s", [papers])], lambda s: s.iter_recent_papers(7)
+    )
+
+    assert evaluator.evaluated == ["p_9", "p_7"]
+    assert stats.triaged == 3
+
+
+def test_index_records_signal_scores(tmp_path: Path, sample_assessment: OpportunityAssessment) -> None:
+    """Findings keep their signal scores so later runs can calibrate triage."""
+    sample_assessment.tier = "A"
+    OutputWriter(str(tmp_path)).write_finding(sample_assessment)
+
+    entry = json.loads((tmp_path / "index.jsonl").read_text())
+
+    assert entry["signals_detected"] == sample_assessment.signals_detected
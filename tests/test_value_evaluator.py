@@ -1,12 +1,14 @@
 """Tests for AI-powered value evaluation."""
 
+import asyncio
 import json
-import time
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
+from anthropic import APIStatusError, BadRequestError, RateLimitError
 
-from analyzers.value_evaluator import ValueEvaluator
+from analyzers.value_evaluator import EVALUATION_INSTRUCTIONS, TokenUsage, ValueEvaluator
 from models.paper import Paper
 
 
@@ -24,7 +26,7 @@ class TestValueEvaluator:
     def evaluator(self, config: dict) -> ValueEvaluator:
         """Create ValueEvaluator instance."""
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test_key"}):
-            return ValueEvaluator(config)
+            return ValueEvaluator(config, retry_base_delay=0.001)
 
     @pytest.mark.asyncio
     async def test_evaluate_success(
@@ -44,13 +46,13 @@ class TestValueEvaluator:
             "generalizability": 7.5,
         }
 
-        with patch("anthropic.Anthropic") as mock_anthropic:
+        with patch("anthropic.AsyncAnthropic") as mock_anthropic:
             mock_client = Mock()
             mock_message = Mock()
             mock_content = Mock()
             mock_content.text = json.dumps(mock_response_data)
             mock_message.content = [mock_content]
-            mock_client.messages.create.return_value = mock_message
+            mock_client.messages.create = AsyncMock(return_value=mock_message)
             mock_anthropic.return_value = mock_client
 
             # Recreate evaluator with mocked client
@@ -74,9 +76,9 @@ class TestValueEvaluator:
         self, evaluator: ValueEvaluator, sample_paper: Paper, sample_signals: dict[str, dict], config: dict
     ) -> None:
         """Test evaluation handling API errors."""
-        with patch("anthropic.Anthropic") as mock_anthropic:
+        with patch("anthropic.AsyncAnthropic") as mock_anthropic:
             mock_client = Mock()
-            mock_client.messages.create.side_effect = Exception("API Error")
+            mock_client.messages.create = AsyncMock(side_effect=Exception("API Error"))
             mock_anthropic.return_value = mock_client
 
             with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test_key"}):
@@ -92,13 +94,13 @@ class TestValueEvaluator:
         self, evaluator: ValueEvaluator, sample_paper: Paper, sample_signals: dict[str, dict], config: dict
     ) -> None:
         """Test evaluation with invalid JSON response."""
-        with patch("anthropic.Anthropic") as mock_anthropic:
+        with patch("anthropic.AsyncAnthropic") as mock_anthropic:
             mock_client = Mock()
             mock_message = Mock()
             mock_content = Mock()
             mock_content.text = "This is not valid JSON"
             mock_message.content = [mock_content]
-            mock_client.messages.create.return_value = mock_message
+            mock_client.messages.create = AsyncMock(return_value=mock_message)
             mock_anthropic.return_value = mock_client
 
             with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test_key"}):
@@ -109,6 +111,60 @@ class TestValueEvaluator:
 
             assert assessment is None
 
+    @pytest.mark.asyncio
+    async def test_retries_rate_limit_then_succeeds(self, evaluator: ValueEvaluator) -> None:
+        """Rate-limited requests are retried until they succeed."""
+        response = httpx.Response(429, request=httpx.Request("POST", "https://api.anthropic.com/v1/messages"))
+        rate_limited = RateLimitError("rate limited", response=response, body=None)
+        call = AsyncMock(side_effect=[rate_limited, rate_limited, "ok"])
+
+        result = await evaluator._call_with_retry(call)
+
+        assert result == "ok"
+        assert call.await_count == 3
+
+    def test_overloaded_errors_are_retryable(self, evaluator: ValueEvaluator) -> None:
+        """529 responses and overloaded_error bodies are treated as retryable."""
+        request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        status_529 = APIStatusError("overloaded", response=httpx.Response(529, request=request), body=None)
+        overloaded_body = APIStatusError(
+            "overloaded",
+            response=httpx.Response(400, request=request),
+            body={"error": {"type": "overloaded_error"}},
+        )
+
+        assert evaluator._is_retryable(status_529)
+        assert evaluator._is_retryable(overloaded_body)
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_is_raised(self, evaluator: ValueEvaluator) -> None:
+        """Client errors fail immediately without retrying."""
+        response = httpx.Response(400, request=httpx.Request("POST", "https://api.anthropic.com/v1/messages"))
+        call = AsyncMock(side_effect=BadRequestError("bad request", response=response, body=None))
+
+        with pytest.raises(BadRequestError):
+            await evaluator._call_with_retry(call)
+        assert call.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self, config: dict) -> None:
+        """No more than max_concurrency requests are in flight at once."""
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test_key"}):
+            evaluator = ValueEvaluator(config, max_concurrency=2)
+        active = 0
+        max_active = 0
+
+        async def call() -> None:
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        await asyncio.gather(*(evaluator._call_with_retry(call) for _ in range(6)))
+
+        assert max_active == 2
+
     def test_parse_ai_response_valid_json(self, evaluator: ValueEvaluator) -> None:
         """Test parsing valid JSON response."""
         response_text = json.dumps({"value_score": 8.0, "confidence": 7.5})
@@ -153,17 +209,55 @@ class TestValueEvaluator:
         assert "source_quality" in prompt
         assert "generalizability" in prompt
 
-    def test_generate_id(self, evaluator: ValueEvaluator) -> None:
-        """Test ID generation format."""
-        id1 = evaluator._generate_id()
-        time.sleep(0.01)  # Ensure different timestamp
-        id2 = evaluator._generate_id()
-
-        assert id1.startswith("rdla_")
-        assert id2.startswith("rdla_")
-        # IDs should be unique (unless generated at exact same microsecond)
-        # Just verify format is correct
-        assert len(id1) > 5
+    def test_request_params_cache_static_instructions(
+        self, evaluator: ValueEvaluator, sample_paper: Paper, sample_signals: dict[str, dict]
+    ) -> None:
+        """Instructions go in a cached system block; the user message holds only the paper."""
+        signal_scores = {category: data["score"] for category, data in sample_signals.items()}
+        paper_prompt = evaluator._create_paper_prompt(sample_paper, sample_signals, signal_scores)
+        evaluator.model = "claude-3-5-sonnet-20241022"
+
+        params = evaluator.build_request_params(paper_prompt)
+
+        assert params["system"] == [
+            {"type": "text", "text": EVALUATION_INSTRUCTIONS, "cache_control": {"type": "ephemeral"}}
+        ]
+        assert params["messages"] == [{"role": "user", "content": paper_prompt}]
+        assert sample_paper.title in paper_prompt
+        assert "SCORING CRITERIA" not in paper_prompt
+        assert len(paper_prompt) < len(EVALUATION_INSTRUCTIONS)
+
+    def test_instructions_below_cache_minimum_are_not_marked(self, evaluator: ValueEvaluator) -> None:
+        """Haiku 3 needs a 2048-token prefix; the shorter instructions are sent without cache_control."""
+        params = evaluator.build_request_params("paper")
+
+        assert evaluator.model == "claude-3-haiku-20240307"
+        assert not evaluator.caches_instructions
+        assert params["system"] == [{"type": "text", "text": EVALUATION_INSTRUCTIONS}]
+
+    def test_token_usage_separates_cached_input(self) -> None:
+        """Cache reads and writes are tracked apart from uncached input tokens."""
+        usage = TokenUsage()
+        usage.record(
+            Mock(input_tokens=200, cache_creation_input_tokens=1500, cache_read_input_tokens=None, output_tokens=300)
+        )
+        usage.record(
+            Mock(input_tokens=200, cache_creation_input_tokens=None, cache_read_input_tokens=1500, output_tokens=300)
+        )
+
+        assert usage.requests == 2
+        assert usage.input_tokens == 400
+        assert usage.cache_creation_input_tokens == 1500
+        assert usage.cache_read_input_tokens == 1500
+        assert usage.total_input_tokens == 3400
+        assert usage.cached_fraction == pytest.approx(1500 / 3400)
+
+    def test_generate_id(self, evaluator: ValueEvaluator, sample_paper: Paper) -> None:
+        """IDs are unique even within the same second and for the same paper."""
+        ids = {evaluator._generate_id(sample_paper) for _ in range(100)}
+
+        assert len(ids) == 100
+        assert all(i.startswith("rdla_") and sample_paper.id in i for i in ids)
 
     def test_missing_api_key(self) -> None:
         """Test that missing API key raises error."""